@@ -1,7 +1,9 @@
 """Artifact management CLI commands.
 
 This module provides CLI commands for OCI registry artifact operations:
+    floe artifact cache: Inspect and garbage-collect the local artifact cache
     floe artifact pull: Pull CompiledArtifacts from OCI registry
+    floe artifact prefetch: Prefetch artifacts into the local cache
     floe artifact push: Push CompiledArtifacts to OCI registry
     floe artifact sign: Sign artifacts with Sigstore
     floe artifact verify: Verify artifact signatures
@@ -9,7 +11,9 @@ This module provides CLI commands for OCI registry artifact operations:
     floe artifact sbom: Generate, attach, and view SBOMs
 
 Example:
+    $ floe artifact cache gc --max-size-gb 20
     $ floe artifact pull -r oci://harbor.example.com/floe -t v1.0.0 --environment production
+    $ floe artifact prefetch -r oci://harbor.example.com/floe -e prod --watch
     $ floe artifact push --artifact target/compiled_artifacts.json --registry ghcr.io/org/floe
     $ floe artifact sign -r oci://harbor.example.com/floe -t v1.0.0
     $ floe artifact verify -r oci://harbor.example.com/floe -t v1.0.0
@@ -26,7 +30,9 @@ from __future__ import annotations
 
 import click
 
+from floe_core.cli.artifact.cache import cache_group
 from floe_core.cli.artifact.inspect import inspect_command
+from floe_core.cli.artifact.prefetch import prefetch_command
 from floe_core.cli.artifact.pull import pull_command
 from floe_core.cli.artifact.push import push_command
 from floe_core.cli.artifact.sbom import sbom_command
@@ -48,7 +54,9 @@ def artifact() -> None:
 
 
 # Register subcommands
+artifact.add_command(cache_group)
 artifact.add_command(inspect_command)
+artifact.add_command(prefetch_command)
 artifact.add_command(pull_command)
 artifact.add_command(push_command)
 artifact.add_command(sbom_command)
@@ -0,0 +1,148 @@
+"""Artifact cache maintenance CLI commands.
+
+Requirements: FR-015, FR-016
+
+This module provides the `floe artifact cache` command group for inspecting
+and maintaining the local OCI artifact cache:
+    floe artifact cache gc: Remove expired and superseded entries and evict
+        down to the size limit
+    floe artifact cache stats: Show cache size and entry counts
+
+`gc` runs without blocking processes that are reading from or writing to
+the cache, so it is safe to run from a cron job or sidecar.
+
+Example:
+    $ floe artifact cache gc --path /var/cache/floe/oci --max-size-gb 20
+
+    $ floe artifact cache stats
+
+See Also:
+    - specs/08a-oci-client/spec.md: OCI Client specification
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from floe_core.cli.utils import ExitCode, error_exit, info, success
+from floe_core.schemas.oci import CacheConfig
+
+if TYPE_CHECKING:
+    from floe_core.oci.cache import CacheManager
+
+_DEFAULT_CACHE = CacheConfig()
+
+_PATH_OPTION = click.option(
+    "--path",
+    "-p",
+    "cache_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=_DEFAULT_CACHE.path,
+    show_default=True,
+    help="Cache directory.",
+)
+
+
+@click.group(
+    name="cache",
+    help="Inspect and maintain the local artifact cache.",
+)
+def cache_group() -> None:
+    """Artifact cache command group."""
+    pass
+
+
+@cache_group.command(
+    name="gc",
+    help="""\b
+Garbage-collect the local artifact cache.
+
+Removes expired entries and entries superseded by a newer pull of the
+same mutable tag. If the cache is still larger than --max-size-gb,
+evicts large, idle, rarely used artifacts first until it is below 90%
+of the limit. Mutable tags used within the last hour are kept.
+
+Readers and writers of the cache are not blocked while gc runs.
+
+Examples:
+    $ floe artifact cache gc
+
+    $ floe artifact cache gc --path /var/cache/floe/oci --max-size-gb 20
+""",
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
+@_PATH_OPTION
+@click.option(
+    "--max-size-gb",
+    type=click.IntRange(min=1),
+    default=_DEFAULT_CACHE.max_size_gb,
+    show_default=True,
+    help="Maximum cache size in gigabytes.",
+)
+def gc_command(cache_path: Path, max_size_gb: int) -> None:
+    """Garbage-collect the local artifact cache."""
+    from floe_core.oci.cache import BYTES_PER_GB
+
+    manager = _open_cache(CacheConfig(path=cache_path, max_size_gb=max_size_gb))
+    info(f"Collecting garbage in {cache_path}...")
+    try:
+        result = manager.gc()
+    except Exception as e:
+        error_exit(f"Cache gc failed: {e}", exit_code=ExitCode.GENERAL_ERROR)
+    finally:
+        manager.close()
+
+    removed = result["expired"] + result["superseded"] + result["evicted"]
+    success(
+        f"Removed {removed} entries ({result['expired']} expired, "
+        f"{result['superseded']} superseded, {result['evicted']} evicted), "
+        f"freed {result['freed_bytes'] / BYTES_PER_GB:.2f} GB; "
+        f"{result['remaining_entries']} entries, "
+        f"{result['remaining_bytes'] / BYTES_PER_GB:.2f} GB remain"
+    )
+
+
+@cache_group.command(
+    name="stats",
+    help="""\b
+Show local artifact cache statistics.
+
+Examples:
+    $ floe artifact cache stats
+""",
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
+@_PATH_OPTION
+def stats_command(cache_path: Path) -> None:
+    """Show local artifact cache statistics."""
+    manager = _open_cache(CacheConfig(path=cache_path))
+    try:
+        stats = manager.stats()
+    except Exception as e:
+        error_exit(f"Cache stats failed: {e}", exit_code=ExitCode.GENERAL_ERROR)
+    finally:
+        manager.close()
+
+    success(f"Path:           {stats['path']}")
+    success(f"Entries:        {stats['entry_count']}")
+    success(f"  Immutable:    {stats['immutable_count']}")
+    success(f"  Mutable:      {stats['mutable_count']}")
+    success(f"  Expired:      {stats['expired_count']}")
+    success(f"Size:           {stats['total_size_gb']:.2f} GB")
+    success(f"Last updated:   {stats['last_updated']}")
+
+
+def _open_cache(config: CacheConfig) -> CacheManager:
+    """Open the cache at config.path, exiting with an error on failure."""
+    from floe_core.oci.cache import CacheManager
+
+    try:
+        return CacheManager(config)
+    except Exception as e:
+        error_exit(f"Cannot open cache: {e}", exit_code=ExitCode.GENERAL_ERROR)
+
+
+__all__: list[str] = ["cache_group"]
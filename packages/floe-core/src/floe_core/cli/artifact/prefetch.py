@@ -0,0 +1,180 @@
+"""Artifact prefetch CLI command.
+
+Requirements: FR-013, FR-014, FR-015
+
+This module provides the `floe artifact prefetch` command for pulling
+CompiledArtifacts into the local cache ahead of time, so that later pulls
+(e.g., when a Dagster pod starts) are served without registry round trips.
+
+Example:
+    $ floe artifact prefetch -r oci://harbor.example.com/floe -e prod
+
+    $ floe artifact prefetch -r oci://harbor.example.com/floe -e prod --watch
+
+Environment Variables:
+    FLOE_REGISTRY_USERNAME: Registry username for basic auth
+    FLOE_REGISTRY_PASSWORD: Registry password for basic auth
+    FLOE_REGISTRY_TOKEN: Bearer token for token auth
+
+See Also:
+    - specs/08a-oci-client/spec.md: OCI Client specification
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from floe_core.cli.utils import ExitCode, error_exit, info, success, warn
+from floe_core.oci.cache import DEFAULT_REFRESH_INTERVAL_SECONDS, DEFAULT_WARM_WORKERS
+
+if TYPE_CHECKING:
+    from floe_core.oci.cache import WarmResult
+
+
+@click.command(
+    name="prefetch",
+    help="""\b
+Prefetch artifacts into the local cache.
+
+Lists the registry's tags, keeps those matching --tag-pattern and
+ending in -<environment> for one of the --environment values, and pulls
+them into the local cache concurrently. Tags already cached are skipped,
+so an interrupted prefetch resumes where it stopped. Content is verified
+against each environment's signature policy before it is cached.
+
+With --watch, keeps running and refreshes the cache every --interval
+seconds so mutable tags such as latest-prod stay fresh.
+
+Authentication is resolved from environment variables:
+  FLOE_REGISTRY_USERNAME / FLOE_REGISTRY_PASSWORD (basic auth)
+  FLOE_REGISTRY_TOKEN (bearer token auth)
+  AWS credentials (for ECR, uses IAM/IRSA)
+
+Examples:
+    $ floe artifact prefetch -r oci://harbor.example.com/floe -e prod
+
+    $ floe artifact prefetch -r oci://harbor.example.com/floe \\
+        -t "v2.*" -e staging -e prod --workers 8
+
+    $ floe artifact prefetch -r oci://harbor.example.com/floe -e prod \\
+        --watch --interval 120
+""",
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
+@click.option(
+    "--registry",
+    "-r",
+    type=str,
+    required=True,
+    help="OCI registry URI (e.g., oci://harbor.example.com/namespace).",
+)
+@click.option(
+    "--tag-pattern",
+    "-t",
+    type=str,
+    default=None,
+    help="Glob pattern tags must match (e.g., 'v1.*'). Defaults to all tags.",
+)
+@click.option(
+    "--environment",
+    "-e",
+    "environments",
+    type=str,
+    multiple=True,
+    help="Environment whose tags to prefetch (repeatable, e.g., -e staging -e prod).",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WARM_WORKERS,
+    show_default=True,
+    help="Maximum number of artifacts pulled at once.",
+)
+@click.option(
+    "--manifest",
+    "-m",
+    type=click.Path(exists=True),
+    default=None,
+    help="Path to manifest.yaml with verification policy configuration.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep running and refresh the cache every --interval seconds.",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_REFRESH_INTERVAL_SECONDS,
+    show_default=True,
+    help="Seconds between refreshes with --watch.",
+)
+def prefetch_command(
+    registry: str,
+    tag_pattern: str | None,
+    environments: tuple[str, ...],
+    workers: int,
+    manifest: str | None,
+    watch: bool,
+    interval: float,
+) -> None:
+    """Prefetch artifacts into the local cache."""
+    from floe_core.cli.artifact.pull import _build_registry_config
+    from floe_core.oci import OCIClient
+
+    registry_config = _build_registry_config(registry, manifest)
+    try:
+        client = OCIClient.from_registry_config(registry_config)
+    except Exception as e:
+        error_exit(f"Prefetch failed: {e}", exit_code=ExitCode.GENERAL_ERROR)
+
+    target = f"{registry} ({', '.join(environments)})" if environments else registry
+    info(f"Prefetching from {target}...")
+
+    if watch:
+        refresher = client.cache_refresher(
+            filter_pattern=tag_pattern,
+            environments=list(environments) or None,
+            max_workers=workers,
+            interval_seconds=interval,
+        )
+        info(f"Refreshing every {interval:g}s; press Ctrl+C to stop")
+        try:
+            refresher.run_forever()
+        except KeyboardInterrupt:
+            refresher.stop()
+        if refresher.last_result is not None:
+            _report(refresher.last_result)
+        return
+
+    try:
+        result = client.prefetch(
+            filter_pattern=tag_pattern,
+            environments=list(environments) or None,
+            max_workers=workers,
+        )
+    except Exception as e:
+        error_exit(f"Prefetch failed: {e}", exit_code=ExitCode.GENERAL_ERROR)
+
+    _report(result)
+    if result.errors:
+        error_exit(
+            f"Failed to prefetch {result.failed_tags} of {result.total_tags} artifacts",
+            exit_code=ExitCode.GENERAL_ERROR,
+        )
+
+
+def _report(result: WarmResult) -> None:
+    """Print a prefetch summary and per-tag failures."""
+    for tag, error in sorted(result.errors.items()):
+        warn(f"{tag}: {error}")
+    success(
+        f"Prefetched {result.total_tags} artifacts: {len(result.fetched)} fetched, "
+        f"{len(result.renewed)} renewed, {len(result.cached)} already cached"
+    )
+
+
+__all__: list[str] = ["prefetch_command"]
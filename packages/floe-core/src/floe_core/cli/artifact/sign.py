@@ -144,13 +144,14 @@ def _build_key_based_signing_config(key_ref: str) -> SigningConfig:
     """Build SigningConfig for key-based signing from CLI options."""
     import os
 
+    from floe_core.oci.key_signing import requires_cosign
     from floe_core.oci.signing import check_cosign_available
     from floe_core.schemas.secrets import SecretReference, SecretSource
     from floe_core.schemas.signing import SigningConfig
 
-    if not check_cosign_available():
+    if requires_cosign(key_ref) and not check_cosign_available():
         error_exit(
-            "cosign CLI not found. Key-based signing requires cosign. "
+            "cosign CLI not found. Key-based signing with this key requires cosign. "
             "Install with: brew install cosign (macOS) or "
             "https://github.com/sigstore/cosign#installation",
             exit_code=ExitCode.GENERAL_ERROR,
@@ -239,13 +239,14 @@ def _build_key_based_verification_policy(
     """Build VerificationPolicy for key-based verification from CLI options."""
     import os
 
+    from floe_core.oci.key_signing import requires_cosign
     from floe_core.oci.verification import check_cosign_available
     from floe_core.schemas.secrets import SecretReference, SecretSource
     from floe_core.schemas.signing import VerificationPolicy
 
-    if not check_cosign_available():
+    if requires_cosign(key_ref, public=True) and not check_cosign_available():
         error_exit(
-            "cosign CLI not found. Key-based verification requires cosign. "
+            "cosign CLI not found. Key-based verification with this key requires cosign. "
             "Install with: brew install cosign (macOS) or "
             "https://github.com/sigstore/cosign#installation",
             exit_code=ExitCode.GENERAL_ERROR,
@@ -10,22 +10,26 @@ This module implements the `floe platform compile` command which:
 - Compiles them into CompiledArtifacts
 - Runs policy enforcement
 - Exports enforcement report in various formats
+- Compiles many products against one manifest in batch mode
 
 Example:
     $ floe platform compile --spec floe.yaml --manifest manifest.yaml
     $ floe platform compile --enforcement-report report.sarif --enforcement-format sarif
+    $ floe platform compile --batch products/ --manifest manifest.yaml --workers 8
 """
 
 from __future__ import annotations
 
+import glob
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
 import structlog
 
-from floe_core.cli.utils import ExitCode, error_exit, info, success, warn
+from floe_core.cli.utils import ExitCode, error_exit, info, sanitize_error, success, warn
 from floe_core.schemas.compiled_artifacts import (
+    _MAX_K8S_NAME_LENGTH,
     _validate_configmap_name,
     _validate_configmap_namespace,
 )
@@ -56,6 +60,9 @@ Examples:
     $ floe platform compile --enforcement-report report.sarif --enforcement-format sarif
     $ floe platform compile --skip-contracts
     $ floe platform compile --drift-detection
+    $ floe platform compile --cache-dir .floe/compile-cache
+    $ floe platform compile --batch products/ --manifest manifest.yaml
+    $ floe platform compile --batch 'products/*/floe.yaml' --manifest manifest.yaml --workers 8
 """,
 )
 @click.option(
@@ -93,7 +100,10 @@ Examples:
     "--configmap-name",
     default=DEFAULT_CONFIGMAP_NAME,
     show_default=True,
-    help="ConfigMap metadata.name for configmap output.",
+    help=(
+        "ConfigMap metadata.name for configmap output. With --batch, each "
+        "product's ConfigMap is named <configmap-name>-<product>."
+    ),
 )
 @click.option(
     "--namespace",
@@ -133,6 +143,36 @@ Examples:
     help="Generate Dagster definitions.py file alongside CompiledArtifacts. "
     "Requires JSON output at a path named compiled_artifacts.json.",
 )
+@click.option(
+    "--parallel-enforcement",
+    is_flag=True,
+    default=False,
+    help="Run policy validators concurrently during enforcement. "
+    "Violations and their order are identical to a sequential run.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, resolve_path=True, path_type=Path),
+    default=None,
+    help="Directory for the incremental compilation cache. When set, unchanged "
+    "inputs (floe.yaml, manifest.yaml, floe-core and plugin versions) reuse "
+    "previously compiled artifacts.",
+    metavar="PATH",
+)
+@click.option(
+    "--batch",
+    default=None,
+    help="Compile every floe.yaml under a directory, or every file matching a glob, "
+    "against one shared manifest. Artifacts are written next to each floe.yaml "
+    "using the format-specific default output path.",
+    metavar="DIR|GLOB",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for --batch. Defaults to the number of CPUs.",
+)
 def compile_command(
     spec: Path | None,
     manifest: Path | None,
@@ -145,6 +185,10 @@ def compile_command(
     skip_contracts: bool,
     drift_detection: bool,
     generate_definitions: bool,
+    parallel_enforcement: bool,
+    cache_dir: Path | None,
+    batch: str | None,
+    workers: int | None,
 ) -> None:
     """Compile FloeSpec and Manifest into CompiledArtifacts.
 
@@ -164,10 +208,35 @@ def compile_command(
         skip_contracts: Skip data contract validation if True.
         drift_detection: Enable schema drift detection if True.
         generate_definitions: Generate Dagster definitions.py if True.
+        parallel_enforcement: Run policy validators concurrently if True.
+        cache_dir: Directory for the incremental compilation cache, if enabled.
+        batch: Directory or glob of floe.yaml files to compile in batch mode.
+        workers: Worker process count for batch mode.
     """
     output_format = output_format.lower()
     resolved_output = output or DEFAULT_OUTPUT_PATHS[output_format]
 
+    if batch is not None:
+        _run_batch_compile(
+            batch=batch,
+            spec=spec,
+            manifest=manifest,
+            output=output,
+            output_format=output_format,
+            configmap_name=configmap_name,
+            namespace=namespace,
+            cache_dir=cache_dir,
+            workers=workers,
+            single_product_options={
+                "--enforcement-report": enforcement_report is not None,
+                "--skip-contracts": skip_contracts,
+                "--drift-detection": drift_detection,
+                "--generate-definitions": generate_definitions,
+                "--parallel-enforcement": parallel_enforcement,
+            },
+        )
+        return
+
     # Validate required inputs
     if spec is None:
         error_exit(
@@ -219,10 +288,17 @@ def compile_command(
 
     try:
         # Step 1-3: Run compilation pipeline (FR-010, FR-011)
+        from floe_core.compilation.cache import CompilationCache
         from floe_core.compilation.stages import compile_pipeline
 
+        cache = CompilationCache(cache_dir) if cache_dir is not None else None
+        if cache is not None:
+            info(f"Compilation cache: {cache_dir}")
+
         info("Running compilation pipeline...")
-        artifacts: CompiledArtifacts = compile_pipeline(spec, manifest)
+        artifacts: CompiledArtifacts = compile_pipeline(
+            spec, manifest, cache=cache, parallel_enforcement=parallel_enforcement
+        )
 
         # Step 4: Save CompiledArtifacts to output path (FR-011)
         _write_artifacts_output(
@@ -279,6 +355,156 @@ def compile_command(
         )
 
 
+def _resolve_batch_specs(batch: str) -> list[Path]:
+    """Expand a --batch directory or glob into floe.yaml paths.
+
+    Args:
+        batch: Directory to search recursively for floe.yaml, or a glob pattern.
+
+    Returns:
+        Sorted, de-duplicated list of resolved spec paths.
+    """
+    batch_path = Path(batch)
+    if batch_path.is_dir():
+        matches = batch_path.rglob("floe.yaml")
+    else:
+        matches = (Path(match) for match in glob.glob(batch, recursive=True))
+    return sorted({match.resolve() for match in matches if match.is_file()})
+
+
+def _run_batch_compile(
+    batch: str,
+    spec: Path | None,
+    manifest: Path | None,
+    output: Path | None,
+    output_format: str,
+    configmap_name: str,
+    namespace: str | None,
+    cache_dir: Path | None,
+    workers: int | None,
+    single_product_options: dict[str, bool],
+) -> None:
+    """Compile many products against one manifest and report throughput.
+
+    Artifacts for each product are written relative to its floe.yaml
+    directory. Per-product failures are reported after the batch completes
+    and result in a COMPILATION_ERROR exit code.
+
+    Options that only apply to single-product compiles (passed in
+    single_product_options as option name to "was given") are rejected
+    rather than ignored.
+    """
+    if spec is not None or output is not None:
+        error_exit(
+            "--batch cannot be combined with --spec or --output.",
+            exit_code=ExitCode.USAGE_ERROR,
+        )
+
+    unsupported = [name for name, given in single_product_options.items() if given]
+    if unsupported:
+        error_exit(
+            f"--batch cannot be combined with {', '.join(unsupported)}.",
+            exit_code=ExitCode.USAGE_ERROR,
+        )
+
+    if manifest is None:
+        error_exit(
+            "Missing --manifest option. Provide path to PlatformManifest (manifest.yaml).",
+            exit_code=ExitCode.USAGE_ERROR,
+        )
+
+    if output_format == "configmap":
+        _validate_configmap_metadata(configmap_name, namespace)
+
+    spec_paths = _resolve_batch_specs(batch)
+    if not spec_paths:
+        error_exit(
+            f"No floe.yaml files found for --batch {batch}",
+            exit_code=ExitCode.FILE_NOT_FOUND,
+        )
+
+    info(f"Batch compiling {len(spec_paths)} products")
+    info(f"Using manifest: {manifest}")
+
+    try:
+        from floe_core.compilation.batch import compile_batch
+        from floe_core.compilation.cache import CompilationCache
+
+        cache = CompilationCache(cache_dir) if cache_dir is not None else None
+        result = compile_batch(spec_paths, manifest, max_workers=workers, cache=cache)
+
+        # Each product gets its own ConfigMap so one batch does not overwrite itself
+        configmap_names = dict.fromkeys(result.artifacts, configmap_name)
+        if output_format == "configmap":
+            configmap_names = {
+                spec_path: _batch_configmap_name(configmap_name, artifacts.metadata.product_name)
+                for spec_path, artifacts in result.artifacts.items()
+            }
+            _check_unique_configmap_names(configmap_names)
+
+        for spec_path, artifacts in result.artifacts.items():
+            _write_artifacts_output(
+                artifacts=artifacts,
+                output_path=spec_path.parent / DEFAULT_OUTPUT_PATHS[output_format],
+                output_format=output_format,
+                configmap_name=configmap_names[spec_path],
+                namespace=namespace,
+            )
+    except Exception as e:
+        # SECURITY: Don't expose internal exception details (see compile_command)
+        logger.error(
+            "batch_compilation_failed",
+            error_type=type(e).__name__,
+            error_summary=str(e)[:200] if str(e) else "Unknown error",
+        )
+        error_exit(
+            "Batch compilation failed. Check manifest and configuration.",
+            exit_code=ExitCode.COMPILATION_ERROR,
+        )
+
+    for failure in result.failures:
+        warn(
+            f"Failed to compile {failure.spec_path}",
+            stage=failure.stage,
+            error=sanitize_error(failure.message),
+        )
+
+    info(
+        f"Compiled {result.succeeded}/{result.total} products in "
+        f"{result.duration_seconds:.2f}s ({result.products_per_second:.2f} products/sec)"
+    )
+
+    if result.failed:
+        error_exit(
+            f"{result.failed} of {result.total} products failed to compile.",
+            exit_code=ExitCode.COMPILATION_ERROR,
+        )
+
+    success("Batch compilation complete.")
+
+
+def _batch_configmap_name(configmap_name: str, product_name: str) -> str:
+    """Derive a product's ConfigMap name in batch mode.
+
+    Returns ``<configmap_name>-<product>``, with the product name lowercased
+    and underscores replaced by hyphens to satisfy Kubernetes naming rules.
+    """
+    suffix = product_name.lower().replace("_", "-")
+    return f"{configmap_name}-{suffix}"[:_MAX_K8S_NAME_LENGTH].rstrip("-")
+
+
+def _check_unique_configmap_names(configmap_names: dict[Path, str]) -> None:
+    """Exit with a usage error if two products would share a ConfigMap name."""
+    seen: dict[str, Path] = {}
+    for spec_path, name in configmap_names.items():
+        if name in seen:
+            error_exit(
+                f"Products {seen[name]} and {spec_path} both map to ConfigMap {name!r}.",
+                exit_code=ExitCode.USAGE_ERROR,
+            )
+        seen[name] = spec_path
+
+
 def _write_artifacts_output(
     artifacts: CompiledArtifacts,
     output_path: Path,
@@ -299,6 +525,7 @@ def _write_artifacts_output(
         msg = f"Unsupported output format: {output_format}"
         raise ValueError(msg)
 
+    output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(
         artifacts.to_configmap_yaml(
             name=configmap_name,
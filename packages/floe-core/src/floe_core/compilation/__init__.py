@@ -27,6 +27,14 @@ See Also:
 
 from __future__ import annotations
 
+from floe_core.compilation.batch import (
+    BatchCompileFailure,
+    BatchCompileResult,
+    PlatformContext,
+    compile_batch,
+    prepare_platform_context,
+)
+from floe_core.compilation.cache import CompilationCache
 from floe_core.compilation.dbt_profiles import (
     format_env_var_placeholder,
     generate_dbt_profiles,
@@ -58,6 +66,14 @@ __all__ = [
     "CompilationStage",
     "compile_pipeline",
     "run_enforce_stage",
+    # Batch compilation
+    "BatchCompileFailure",
+    "BatchCompileResult",
+    "PlatformContext",
+    "compile_batch",
+    "prepare_platform_context",
+    # Incremental compilation cache
+    "CompilationCache",
     # dbt profiles
     "format_env_var_placeholder",
     "generate_dbt_profiles",
@@ -0,0 +1,288 @@
+"""Batch compilation of many data products against one platform manifest.
+
+Compiling each product with a separate ``floe platform compile`` invocation
+re-imports floe_core, re-parses and re-validates the same PlatformManifest,
+and re-resolves the same plugins for every product. Batch compilation does
+that manifest-level work once (``prepare_platform_context``) and fans the
+per-product LOAD/RESOLVE/ENFORCE/COMPILE/GENERATE work out to a process pool.
+
+Per-product failures are collected instead of aborting the batch.
+
+Example:
+    >>> from floe_core.compilation.batch import compile_batch
+    >>> result = compile_batch(
+    ...     spec_paths=sorted(Path("products").rglob("floe.yaml")),
+    ...     manifest_path=Path("manifest.yaml"),
+    ...     max_workers=8,
+    ... )
+    >>> print(f"{result.products_per_second:.1f} products/sec")
+    >>> for failure in result.failures:
+    ...     print(failure.spec_path, failure.message)
+
+See Also:
+    - floe_core.compilation.stages.compile_pipeline: Single-product pipeline
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import structlog
+
+from floe_core.telemetry.audit import PluginAuditRecord, audit_records
+
+if TYPE_CHECKING:
+    from floe_core.compilation.cache import CompilationCache
+    from floe_core.schemas.compiled_artifacts import CompiledArtifacts, ResolvedPlugins
+    from floe_core.schemas.manifest import PlatformManifest
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PlatformContext:
+    """Manifest-level compilation inputs shared by every product in a batch.
+
+    Attributes:
+        manifest_path: Path to manifest.yaml (used for source hashing).
+        manifest: Parsed PlatformManifest.
+        resolved_manifest: PlatformManifest with inheritance resolved.
+        plugins: Plugins resolved from the manifest.
+        audit_records: Plugin instrumentation audit outcomes.
+    """
+
+    manifest_path: Path
+    manifest: PlatformManifest
+    resolved_manifest: PlatformManifest
+    plugins: ResolvedPlugins
+    audit_records: tuple[PluginAuditRecord, ...]
+
+
+@dataclass(frozen=True)
+class BatchCompileFailure:
+    """Compilation failure for a single product in a batch.
+
+    Attributes:
+        spec_path: Path to the product's floe.yaml.
+        error_type: Exception class name.
+        message: Exception message.
+        stage: Pipeline stage that failed, if known.
+    """
+
+    spec_path: Path
+    error_type: str
+    message: str
+    stage: str | None = None
+
+
+@dataclass
+class BatchCompileResult:
+    """Outcome of a batch compilation.
+
+    Attributes:
+        artifacts: CompiledArtifacts per successfully compiled spec path.
+        failures: Failures for products that could not be compiled.
+        duration_seconds: Wall time of the whole batch.
+    """
+
+    artifacts: dict[Path, CompiledArtifacts] = field(default_factory=dict)
+    failures: list[BatchCompileFailure] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """Return number of products attempted."""
+        return len(self.artifacts) + len(self.failures)
+
+    @property
+    def succeeded(self) -> int:
+        """Return number of successfully compiled products."""
+        return len(self.artifacts)
+
+    @property
+    def failed(self) -> int:
+        """Return number of products that failed to compile."""
+        return len(self.failures)
+
+    @property
+    def products_per_second(self) -> float:
+        """Return batch throughput in products per second."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.total / self.duration_seconds
+
+
+def prepare_platform_context(
+    manifest_path: Path,
+    *,
+    cache: CompilationCache | None = None,
+) -> PlatformContext:
+    """Parse the manifest, resolve plugins, and audit plugins once.
+
+    Args:
+        manifest_path: Path to manifest.yaml file.
+        cache: Optional CompilationCache holding persisted plugin audit records.
+
+    Returns:
+        PlatformContext reusable across products.
+
+    Raises:
+        CompilationException: If the manifest cannot be loaded or resolved.
+    """
+    from floe_core.compilation.loader import load_manifest
+    from floe_core.compilation.resolver import resolve_manifest_inheritance, resolve_plugins
+    from floe_core.compilation.stages import _discover_plugins_for_audit
+
+    manifest = load_manifest(manifest_path)
+    resolved_manifest = resolve_manifest_inheritance(manifest)
+    plugins = resolve_plugins(resolved_manifest)
+
+    records = cache.get_plugin_audit() if cache is not None else None
+    if records is None:
+        records = audit_records(_discover_plugins_for_audit())
+        if cache is not None:
+            cache.put_plugin_audit(records)
+
+    return PlatformContext(
+        manifest_path=manifest_path,
+        manifest=manifest,
+        resolved_manifest=resolved_manifest,
+        plugins=plugins,
+        audit_records=tuple(records),
+    )
+
+
+def compile_batch(
+    spec_paths: list[Path],
+    manifest_path: Path,
+    *,
+    max_workers: int | None = None,
+    dry_run: bool = False,
+    cache: CompilationCache | None = None,
+) -> BatchCompileResult:
+    """Compile many floe.yaml files against one shared manifest.yaml.
+
+    The manifest is parsed and plugins are resolved once in the calling
+    process; the shared PlatformContext is handed to each worker process
+    once at start-up. A failure to prepare the manifest aborts the batch,
+    while per-product failures are collected in the result.
+
+    Args:
+        spec_paths: Paths to floe.yaml files to compile.
+        manifest_path: Path to the shared manifest.yaml file.
+        max_workers: Worker process count. Defaults to os.cpu_count().
+            A value of 1 compiles in the calling process.
+        dry_run: If True, violations are reported but don't block compilation.
+        cache: Optional CompilationCache shared by all products.
+
+    Returns:
+        BatchCompileResult with artifacts, failures, and throughput.
+
+    Raises:
+        CompilationException: If the shared manifest cannot be loaded or resolved.
+        ValueError: If max_workers is less than 1.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    start = time.perf_counter()
+    platform = prepare_platform_context(manifest_path, cache=cache)
+    workers = min(max_workers or os.cpu_count() or 1, max(len(spec_paths), 1))
+    cache_path = cache.path if cache is not None else None
+
+    log = logger.bind(product_count=len(spec_paths), max_workers=workers)
+    log.info("batch_compile_started")
+
+    result = BatchCompileResult()
+    if workers == 1:
+        _init_worker(platform, dry_run, cache_path)
+        outcomes = [_compile_one(spec_path) for spec_path in spec_paths]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(platform, dry_run, cache_path),
+        ) as executor:
+            outcomes = list(executor.map(_compile_one, spec_paths))
+
+    for spec_path, outcome in zip(spec_paths, outcomes, strict=True):
+        if isinstance(outcome, BatchCompileFailure):
+            result.failures.append(outcome)
+            log.warning(
+                "batch_compile_product_failed",
+                spec_path=str(spec_path),
+                error_type=outcome.error_type,
+                stage=outcome.stage,
+            )
+        else:
+            result.artifacts[spec_path] = outcome
+
+    result.duration_seconds = time.perf_counter() - start
+    log.info(
+        "batch_compile_completed",
+        succeeded=result.succeeded,
+        failed=result.failed,
+        duration_seconds=round(result.duration_seconds, 3),
+        products_per_second=round(result.products_per_second, 2),
+    )
+    return result
+
+
+# Per-process worker state, set once by _init_worker
+_worker_platform: PlatformContext | None = None
+_worker_dry_run: bool = False
+_worker_cache: CompilationCache | None = None
+
+
+def _init_worker(platform: PlatformContext, dry_run: bool, cache_path: Path | None) -> None:
+    """Install the shared PlatformContext in a worker process."""
+    from floe_core.compilation.cache import CompilationCache
+
+    global _worker_platform, _worker_dry_run, _worker_cache
+    _worker_platform = platform
+    _worker_dry_run = dry_run
+    _worker_cache = CompilationCache(cache_path) if cache_path is not None else None
+
+
+def _compile_one(spec_path: Path) -> CompiledArtifacts | BatchCompileFailure:
+    """Compile a single product inside a worker.
+
+    Exceptions are converted to BatchCompileFailure because not every
+    exception (e.g. CompilationException) survives pickling back to the
+    parent process.
+    """
+    from floe_core.compilation.errors import CompilationException
+    from floe_core.compilation.stages import compile_pipeline
+
+    assert _worker_platform is not None, "_init_worker must run before _compile_one"
+
+    try:
+        return compile_pipeline(
+            spec_path,
+            _worker_platform.manifest_path,
+            dry_run=_worker_dry_run,
+            cache=_worker_cache,
+            platform=_worker_platform,
+        )
+    except Exception as exc:
+        stage = exc.error.stage.value if isinstance(exc, CompilationException) else None
+        return BatchCompileFailure(
+            spec_path=spec_path,
+            error_type=type(exc).__name__,
+            message=str(exc),
+            stage=stage,
+        )
+
+
+__all__ = [
+    "BatchCompileFailure",
+    "BatchCompileResult",
+    "PlatformContext",
+    "compile_batch",
+    "prepare_platform_context",
+]
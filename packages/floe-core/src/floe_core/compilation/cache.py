@@ -0,0 +1,334 @@
+"""Content-addressed incremental compilation cache.
+
+Stores previously built CompiledArtifacts on disk, keyed by a fingerprint of
+everything that determines the compilation output:
+
+- Source hash of floe.yaml + manifest.yaml (``compute_source_hash``)
+- floe-core version and CompiledArtifacts contract version
+- Installed plugin distributions (entry point name, value, dist name + version)
+- Compile options that change the output (``dry_run``)
+
+A cache hit returns the stored CompiledArtifacts without re-running the
+LOAD/VALIDATE/RESOLVE/ENFORCE/COMPILE/GENERATE stages. The cache is
+best-effort: read or write failures are logged and compilation proceeds as
+if the cache were empty.
+
+The same directory also persists the ENFORCE-stage plugin instrumentation
+audit, keyed only by the installed plugin distributions, so a cache miss
+for one product does not re-import every installed plugin.
+
+Cache Structure:
+    <cache_dir>/
+    ├── plugin-audit.json     # Plugin instrumentation audit outcomes
+    └── ab/
+        └── ab12cd....json    # CompiledArtifacts JSON, named by cache key
+
+Example:
+    >>> from floe_core.compilation.cache import CompilationCache
+    >>> cache = CompilationCache(Path(".floe/compile-cache"))
+    >>> artifacts = compile_pipeline(spec_path, manifest_path, cache=cache)
+
+See Also:
+    - floe_core.compilation.builder.compute_source_hash: Input fingerprint
+    - floe_core.oci.cache: Content-addressed OCI artifact cache
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from importlib.metadata import PackageNotFoundError, entry_points, version
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import structlog
+
+from floe_core.plugin_types import PluginType
+from floe_core.schemas.versions import COMPILED_ARTIFACTS_VERSION, FLOE_VERSION
+from floe_core.telemetry.audit import PluginAuditRecord
+
+if TYPE_CHECKING:
+    from floe_core.schemas.compiled_artifacts import CompiledArtifacts
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the key derivation changes so stale entries are never matched
+CACHE_KEY_VERSION = "1"
+
+# File name of the persisted plugin instrumentation audit
+PLUGIN_AUDIT_FILE = "plugin-audit.json"
+
+
+def floe_core_version() -> str:
+    """Return the installed floe-core distribution version.
+
+    Falls back to ``FLOE_VERSION`` when running from a source checkout
+    without installed distribution metadata.
+
+    Returns:
+        Version string of the floe-core distribution.
+    """
+    try:
+        return version("floe-core")
+    except PackageNotFoundError:
+        return FLOE_VERSION
+
+
+def installed_plugin_fingerprint() -> list[str]:
+    """Describe every installed plugin entry point.
+
+    Each entry is ``<group>:<name>=<value>@<dist>==<version>`` so that
+    installing, removing, upgrading, or re-pointing a plugin changes the
+    fingerprint. Entry point groups that fail to enumerate are skipped.
+
+    Returns:
+        Sorted list of plugin descriptors.
+    """
+    descriptors: list[str] = []
+    for plugin_type in PluginType:
+        try:
+            eps = entry_points(group=plugin_type.value)
+        except Exception as exc:
+            logger.debug(
+                "plugin_fingerprint_group_failed",
+                plugin_type=plugin_type.name,
+                error=str(exc),
+            )
+            continue
+        for ep in eps:
+            dist = ep.dist
+            dist_ref = f"{dist.name}=={dist.version}" if dist is not None else "unknown"
+            descriptors.append(f"{plugin_type.value}:{ep.name}={ep.value}@{dist_ref}")
+    return sorted(descriptors)
+
+
+class CompilationCache:
+    """On-disk cache of CompiledArtifacts keyed by compilation inputs.
+
+    Example:
+        >>> cache = CompilationCache(Path(".floe/compile-cache"))
+        >>> key = cache.compute_key(Path("floe.yaml"), Path("manifest.yaml"))
+        >>> cache.get(key) is None
+        True
+        >>> cache.put(key, artifacts)
+        >>> cache.get(key).metadata.product_name
+        'my-pipeline'
+
+    Attributes:
+        path: Root directory of the cache.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize CompilationCache.
+
+        Args:
+            path: Root directory for cache entries. Created lazily on first put.
+        """
+        self._path = path
+        self._plugin_fingerprint: list[str] | None = None
+
+    @property
+    def path(self) -> Path:
+        """Return the cache root directory."""
+        return self._path
+
+    def compute_key(
+        self,
+        spec_path: Path,
+        manifest_path: Path,
+        *,
+        dry_run: bool = False,
+    ) -> str:
+        """Compute the cache key for a compilation.
+
+        The plugin fingerprint is computed once per CompilationCache instance,
+        so batch callers should reuse a single instance.
+
+        Args:
+            spec_path: Path to floe.yaml file.
+            manifest_path: Path to manifest.yaml file.
+            dry_run: Whether the compilation runs in dry-run mode.
+
+        Returns:
+            Hex SHA256 cache key.
+        """
+        from floe_core.compilation.builder import compute_source_hash
+
+        hasher = hashlib.sha256()
+        for part in (
+            f"key-version:{CACHE_KEY_VERSION}",
+            f"source:{compute_source_hash(spec_path, manifest_path)}",
+            f"floe-core:{floe_core_version()}",
+            f"floe-version:{FLOE_VERSION}",
+            f"contract:{COMPILED_ARTIFACTS_VERSION}",
+            f"dry-run:{dry_run}",
+            *self._get_plugin_fingerprint(),
+        ):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> CompiledArtifacts | None:
+        """Return cached CompiledArtifacts for a key.
+
+        Unreadable or invalid entries are removed and reported as a miss.
+
+        Args:
+            key: Cache key from compute_key().
+
+        Returns:
+            CompiledArtifacts if cached, None otherwise.
+        """
+        from floe_core.schemas.compiled_artifacts import CompiledArtifacts
+
+        entry_path = self._entry_path(key)
+        if not entry_path.exists():
+            logger.debug("compilation_cache_miss", cache_key=key)
+            return None
+
+        try:
+            artifacts = CompiledArtifacts.from_json_file(entry_path)
+        except Exception as exc:
+            logger.warning(
+                "compilation_cache_entry_invalid",
+                cache_key=key,
+                error=type(exc).__name__,
+            )
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        logger.debug("compilation_cache_hit", cache_key=key)
+        return artifacts
+
+    def put(self, key: str, artifacts: CompiledArtifacts) -> None:
+        """Store CompiledArtifacts under a key.
+
+        Writes to a temporary file and renames it into place so concurrent
+        readers never observe a partial entry. Write failures are logged and
+        otherwise ignored.
+
+        Args:
+            key: Cache key from compute_key().
+            artifacts: CompiledArtifacts to store.
+        """
+        entry_path = self._entry_path(key)
+        temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            artifacts.to_json_file(temp_path)
+            os.replace(temp_path, entry_path)
+        except OSError as exc:
+            logger.warning(
+                "compilation_cache_write_failed",
+                cache_key=key,
+                error=type(exc).__name__,
+            )
+            temp_path.unlink(missing_ok=True)
+            return
+
+        logger.debug("compilation_cache_put", cache_key=key)
+
+    def get_plugin_audit(self) -> list[PluginAuditRecord] | None:
+        """Return persisted plugin audit records for the installed plugins.
+
+        Returns:
+            PluginAuditRecord list if the audit was persisted for the exact set
+            of installed plugin distributions, None otherwise.
+        """
+        audit_path = self._path / PLUGIN_AUDIT_FILE
+        if not audit_path.exists():
+            return None
+
+        try:
+            data = json.loads(audit_path.read_text())
+            if data.get("key") != self._plugin_audit_key():
+                logger.debug("plugin_audit_cache_stale")
+                return None
+            records = [
+                PluginAuditRecord(
+                    plugin_type=PluginType[item["plugin_type"]],
+                    name=item["name"],
+                    tracer_name=item["tracer_name"],
+                )
+                for item in data["records"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("plugin_audit_cache_invalid", error=type(exc).__name__)
+            return None
+
+        logger.debug("plugin_audit_cache_hit", plugin_count=len(records))
+        return records
+
+    def put_plugin_audit(self, records: list[PluginAuditRecord]) -> None:
+        """Persist plugin audit records for the installed plugins.
+
+        Args:
+            records: Audit outcome for every discoverable plugin.
+        """
+        audit_path = self._path / PLUGIN_AUDIT_FILE
+        temp_path = audit_path.with_suffix(f".{os.getpid()}.tmp")
+        payload = {
+            "key": self._plugin_audit_key(),
+            "records": [
+                {
+                    "plugin_type": record.plugin_type.name,
+                    "name": record.name,
+                    "tracer_name": record.tracer_name,
+                }
+                for record in records
+            ],
+        }
+        try:
+            self._path.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(payload, indent=2))
+            os.replace(temp_path, audit_path)
+        except OSError as exc:
+            logger.warning("plugin_audit_cache_write_failed", error=type(exc).__name__)
+            temp_path.unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """Remove all cache entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        if not self._path.exists():
+            return 0
+
+        removed = 0
+        for entry_path in self._path.glob("*/*.json"):
+            entry_path.unlink(missing_ok=True)
+            removed += 1
+        (self._path / PLUGIN_AUDIT_FILE).unlink(missing_ok=True)
+
+        logger.info("compilation_cache_cleared", removed=removed)
+        return removed
+
+    def _get_plugin_fingerprint(self) -> list[str]:
+        """Return the installed plugin fingerprint, computed once per instance."""
+        if self._plugin_fingerprint is None:
+            self._plugin_fingerprint = installed_plugin_fingerprint()
+        return self._plugin_fingerprint
+
+    def _plugin_audit_key(self) -> str:
+        """Return the key identifying the installed plugin distributions."""
+        hasher = hashlib.sha256()
+        for part in (
+            f"key-version:{CACHE_KEY_VERSION}",
+            f"floe-core:{floe_core_version()}",
+            *self._get_plugin_fingerprint(),
+        ):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the on-disk path for a cache key."""
+        return self._path / key[:2] / f"{key}.json"
+
+
+__all__ = [
+    "CompilationCache",
+    "floe_core_version",
+    "installed_plugin_fingerprint",
+]
@@ -37,6 +37,8 @@ from floe_core.plugin_types import PluginType
 from floe_core.telemetry.tracing import create_span
 
 if TYPE_CHECKING:
+    from floe_core.compilation.batch import PlatformContext
+    from floe_core.compilation.cache import CompilationCache
     from floe_core.enforcement.result import EnforcementResult
     from floe_core.schemas.compiled_artifacts import (
         CompiledArtifacts,
@@ -179,6 +181,36 @@ def _discover_plugins_for_audit() -> list[tuple[PluginType, PluginMetadata]]:
     return results
 
 
+def _run_plugin_audit(cache: CompilationCache | None) -> list[str]:
+    """Run the plugin instrumentation audit, reusing persisted outcomes.
+
+    Discovering plugins for the audit imports every installed plugin package.
+    When a CompilationCache is available, audit outcomes are persisted keyed
+    by the installed plugin distributions, so plugins are only imported again
+    after one is installed, removed, or upgraded.
+
+    Args:
+        cache: Optional CompilationCache holding persisted audit records.
+
+    Returns:
+        List of warning messages for uninstrumented plugins.
+    """
+    from floe_core.telemetry.audit import (
+        audit_records,
+        verify_audit_records,
+        verify_plugin_instrumentation,
+    )
+
+    if cache is None:
+        return verify_plugin_instrumentation(_discover_plugins_for_audit())
+
+    records = cache.get_plugin_audit()
+    if records is None:
+        records = audit_records(_discover_plugins_for_audit())
+        cache.put_plugin_audit(records)
+    return verify_audit_records(records)
+
+
 def _resolve_governance(
     manifest_governance: GovernanceConfig | None,
     resolved_cls: type[ResolvedGovernance],
@@ -250,11 +282,32 @@ def _build_lineage_config(manifest: PlatformManifest) -> dict[str, Any] | None:
     return config
 
 
+def _reads_project_files(manifest: PlatformManifest) -> bool:
+    """Check whether compilation reads files beyond floe.yaml and manifest.yaml.
+
+    Governance secret scanning walks the project directory, so its outcome
+    is not captured by the compilation cache key.
+
+    Args:
+        manifest: Loaded PlatformManifest instance.
+
+    Returns:
+        True if the compilation output depends on other project files.
+    """
+    governance = manifest.governance
+    if governance is None or governance.policy_enforcement_level == "off":
+        return False
+    return governance.secret_scanning is not None and governance.secret_scanning.enabled
+
+
 def compile_pipeline(
     spec_path: Path,
     manifest_path: Path,
     *,
     dry_run: bool = False,
+    cache: CompilationCache | None = None,
+    platform: PlatformContext | None = None,
+    parallel_enforcement: bool = False,
 ) -> CompiledArtifacts:
     """Execute the 6-stage compilation pipeline.
 
@@ -268,6 +321,16 @@ def compile_pipeline(
 
     Each stage is wrapped in an OpenTelemetry span for observability (FR-013).
 
+    When a CompilationCache is provided, a cache hit returns the previously
+    built CompiledArtifacts without running any stage (and without emitting
+    per-model lineage events). Compilations whose output depends on files
+    outside floe.yaml/manifest.yaml (governance secret scanning of the
+    project directory) are never stored.
+
+    When a PlatformContext is provided (batch compilation), the already
+    parsed manifest, resolved plugins, and plugin audit outcomes are reused
+    instead of being loaded and resolved again for this product.
+
     Task: T080
     Requirements: FR-002 (Pipeline integration), US7 (Dry-run mode)
 
@@ -275,6 +338,10 @@ def compile_pipeline(
         spec_path: Path to floe.yaml file.
         manifest_path: Path to manifest.yaml file.
         dry_run: If True, violations are reported but don't block compilation.
+        cache: Optional CompilationCache for incremental compilation.
+        platform: Optional pre-resolved PlatformContext for manifest_path.
+        parallel_enforcement: If True, run policy validators concurrently
+            in the ENFORCE stage. Results are identical to a sequential run.
 
     Returns:
         CompiledArtifacts ready for serialization.
@@ -312,6 +379,30 @@ def compile_pipeline(
             "compile.manifest_path": str(manifest_path),
         },
     ) as pipeline_span:
+        # Incremental compilation: return cached artifacts for unchanged inputs
+        cache_key: str | None = None
+        if cache is not None:
+            cache_key = cache.compute_key(spec_path, manifest_path, dry_run=dry_run)
+            cached_artifacts = cache.get(cache_key)
+            pipeline_span.set_attribute("compile.cache_hit", cached_artifacts is not None)
+            if cached_artifacts is not None:
+                total_duration_ms = (time.perf_counter() - pipeline_start) * 1000
+                pipeline_span.set_attribute(
+                    "compile.product_name", cached_artifacts.metadata.product_name
+                )
+                pipeline_span.set_attribute("compile.artifacts_version", cached_artifacts.version)
+                pipeline_span.set_attribute(
+                    "compile.total_duration_ms", round(total_duration_ms, 2)
+                )
+                log.info(
+                    "compilation_complete",
+                    product_name=cached_artifacts.metadata.product_name,
+                    version=cached_artifacts.version,
+                    cache_hit=True,
+                    total_duration_ms=round(total_duration_ms, 2),
+                )
+                return cached_artifacts
+
         # Stage 1: LOAD - Parse YAML files
         stage_start = time.perf_counter()
         with create_span(
@@ -320,7 +411,7 @@ def compile_pipeline(
         ):
             log.info("compilation_stage_start", stage=CompilationStage.LOAD.value)
             spec = load_floe_spec(spec_path)
-            manifest = load_manifest(manifest_path)
+            manifest = platform.manifest if platform is not None else load_manifest(manifest_path)
             duration_ms = (time.perf_counter() - stage_start) * 1000
             log.info(
                 "compilation_stage_complete",
@@ -382,8 +473,12 @@ def compile_pipeline(
                 attributes={"compile.stage": CompilationStage.RESOLVE.value},
             ) as resolve_span:
                 log.info("compilation_stage_start", stage=CompilationStage.RESOLVE.value)
-                resolved_manifest = resolve_manifest_inheritance(manifest)
-                plugins = resolve_plugins(resolved_manifest)
+                if platform is not None:
+                    resolved_manifest = platform.resolved_manifest
+                    plugins = platform.plugins
+                else:
+                    resolved_manifest = resolve_manifest_inheritance(manifest)
+                    plugins = resolve_plugins(resolved_manifest)
                 transforms = resolve_transform_compute(spec, resolved_manifest)
                 # Add resolution details as span attributes
                 resolve_span.set_attribute("compile.compute_plugin", plugins.compute.type)
@@ -429,10 +524,12 @@ def compile_pipeline(
                     )
 
                 # Plugin instrumentation audit (FR-016, FR-017)
-                from floe_core.telemetry.audit import verify_plugin_instrumentation
+                if platform is not None:
+                    from floe_core.telemetry.audit import verify_audit_records
 
-                _audit_plugins = _discover_plugins_for_audit()
-                _audit_warnings = verify_plugin_instrumentation(_audit_plugins)
+                    _audit_warnings = verify_audit_records(platform.audit_records)
+                else:
+                    _audit_warnings = _run_plugin_audit(cache)
                 for _warn_msg in _audit_warnings:
                     log.warning("uninstrumented_plugin", message=_warn_msg)
 
@@ -549,6 +646,10 @@ def compile_pipeline(
                     governance_config=manifest.governance,
                     dbt_manifest=synthetic_dbt_manifest,
                     dry_run=dry_run,
+                    parallel=parallel_enforcement,
+                    secret_scan_cache_dir=(
+                        cache.path / "secret-scan" if cache is not None else None
+                    ),
                 )
 
                 from floe_core.enforcement.result import create_enforcement_summary
@@ -628,6 +729,11 @@ def compile_pipeline(
             pipeline_span.set_attribute("compile.product_name", spec.metadata.name)
             pipeline_span.set_attribute("compile.artifacts_version", artifacts.version)
 
+            # Store in the incremental cache unless the result depends on files
+            # outside the hashed sources (secret scanning reads the project dir)
+            if cache is not None and cache_key is not None and not _reads_project_files(manifest):
+                cache.put(cache_key, artifacts)
+
             # Log total compilation time
             total_duration_ms = (time.perf_counter() - pipeline_start) * 1000
             pipeline_span.set_attribute("compile.total_duration_ms", round(total_duration_ms, 2))
@@ -678,6 +784,8 @@ def run_enforce_stage(
     principal: str | None = None,
     identity_plugin: Any = None,
     project_dir: Path | None = None,
+    secret_scan_cache_dir: Path | None = None,
+    parallel: bool = False,
 ) -> EnforcementResult:
     """Run the ENFORCE stage of the compilation pipeline.
 
@@ -697,6 +805,10 @@ def run_enforce_stage(
         principal: Principal identifier for RBAC checks.
         identity_plugin: Identity plugin for RBAC checks.
         project_dir: Project directory for secret scanning.
+        secret_scan_cache_dir: Directory for cached secret scan findings, or
+            None to scan every file.
+        parallel: If True, run policy validators concurrently. Violations
+            and their order are identical to a sequential run.
 
     Returns:
         EnforcementResult containing pass/fail status and all violations.
@@ -759,6 +871,7 @@ def run_enforce_stage(
             "compile.stage": CompilationStage.ENFORCE.value,
             "enforcement.level": enforcement_level,
             "enforcement.dry_run": dry_run,
+            "enforcement.parallel": parallel,
         },
     ) as enforce_span:
         log.info(
@@ -772,6 +885,7 @@ def run_enforce_stage(
         integrator = GovernanceIntegrator(
             governance_config=governance_config,
             identity_plugin=identity_plugin,
+            secret_scan_cache_dir=secret_scan_cache_dir,
         )
         result = integrator.run_checks(
             project_dir=project_dir or Path.cwd(),
@@ -780,6 +894,7 @@ def run_enforce_stage(
             dry_run=dry_run,
             enforcement_level=enforcement_level,
             dbt_manifest=dbt_manifest,
+            parallel=parallel,
         )
 
         # Calculate duration
@@ -36,6 +36,9 @@ from floe_core.enforcement.exporters import (
     export_sarif,
 )
 
+# Manifest index shared by validators
+from floe_core.enforcement.manifest_index import ManifestIndex
+
 # Patterns module (T040-T042)
 from floe_core.enforcement.patterns import (
     DOCUMENTATION_URLS,
@@ -78,6 +81,7 @@ __all__: list[str] = [
     "PolicyEnforcementError",
     # Core enforcer (T029-T030)
     "PolicyEnforcer",
+    "ManifestIndex",
     # Patterns (T040-T042)
     "MEDALLION_PATTERN",
     "KIMBALL_PATTERN",
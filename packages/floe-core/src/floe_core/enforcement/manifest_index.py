@@ -0,0 +1,206 @@
+"""Precomputed, read-only index over a dbt manifest.
+
+PolicyEnforcer builds one ManifestIndex per enforcement run and hands it to
+every validator, so lookups that validators previously did by scanning all
+manifest nodes (tests for a model, model by name, unique_id for a name,
+parents/children of a node) are dictionary lookups.
+
+The index holds references to the manifest's node dictionaries; it never
+copies or mutates them. All mappings are exposed as read-only views.
+
+Requirements: FR-001 (PolicyEnforcer core module), FR-004 (Coverage Calculation)
+
+Example:
+    >>> from floe_core.enforcement.manifest_index import ManifestIndex
+    >>> index = ManifestIndex.from_manifest(dbt_manifest)
+    >>> index.model_by_name("bronze_orders")["unique_id"]
+    'model.analytics.bronze_orders'
+    >>> [t["name"] for t in index.tests_for_model("model.analytics.bronze_orders")]
+    ['not_null_bronze_orders_id']
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any
+
+from floe_core.enforcement.result import DownstreamClosure
+
+# Medallion layer detection pattern
+_LAYER_PATTERN: re.Pattern[str] = re.compile(r"^(bronze|silver|gold)_")
+
+_EMPTY: tuple[Any, ...] = ()
+
+
+def detect_layer(model_name: str) -> str | None:
+    """Detect the medallion layer from a model name prefix.
+
+    Args:
+        model_name: The model name (e.g., "bronze_orders", "dim_customer").
+
+    Returns:
+        The layer name ("bronze", "silver", "gold") or None if not medallion.
+    """
+    match = _LAYER_PATTERN.match(model_name)
+    if match:
+        return match.group(1)
+    return None
+
+
+@dataclass(frozen=True)
+class ManifestIndex:
+    """Read-only lookup tables over a dbt manifest.
+
+    Build with ``ManifestIndex.from_manifest()``; the constructor takes the
+    already-built tables.
+
+    Attributes:
+        manifest: The dbt manifest the index was built from.
+        models: Model nodes in manifest order.
+        tests: Test nodes in manifest order.
+        models_by_id: Model nodes keyed by unique_id.
+        models_by_name: Model nodes keyed by name (first occurrence wins).
+        tests_by_node: Test nodes keyed by their ``attached_node``.
+        tests_by_column: Per attached node, test nodes keyed by ``column_name``.
+            Model-level tests (no column_name) are not included.
+        parents: Per node unique_id, the unique_ids it depends on.
+        children: Per node unique_id, the unique_ids depending on it.
+            Taken from the manifest ``child_map`` when present.
+        unique_ids_by_name: Per simple node name (last unique_id segment),
+            the first matching unique_id in ``children`` order.
+        layers: Medallion layer per model unique_id (None if not medallion).
+    """
+
+    manifest: Mapping[str, Any]
+    models: tuple[dict[str, Any], ...]
+    tests: tuple[dict[str, Any], ...]
+    models_by_id: Mapping[str, dict[str, Any]]
+    models_by_name: Mapping[str, dict[str, Any]]
+    tests_by_node: Mapping[str, tuple[dict[str, Any], ...]]
+    tests_by_column: Mapping[str, Mapping[str, tuple[dict[str, Any], ...]]]
+    parents: Mapping[str, tuple[str, ...]]
+    children: Mapping[str, tuple[str, ...]]
+    unique_ids_by_name: Mapping[str, str]
+    layers: Mapping[str, str | None]
+
+    @classmethod
+    def from_manifest(cls, manifest: Mapping[str, Any]) -> ManifestIndex:
+        """Build the index in a single pass over the manifest nodes.
+
+        Args:
+            manifest: The compiled dbt manifest.json as a dictionary.
+
+        Returns:
+            ManifestIndex over the manifest.
+        """
+        nodes: Mapping[str, dict[str, Any]] = manifest.get("nodes", {})
+
+        models: list[dict[str, Any]] = []
+        tests: list[dict[str, Any]] = []
+        models_by_id: dict[str, dict[str, Any]] = {}
+        models_by_name: dict[str, dict[str, Any]] = {}
+        tests_by_node: dict[str, list[dict[str, Any]]] = {}
+        tests_by_column: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        parents: dict[str, tuple[str, ...]] = {}
+        layers: dict[str, str | None] = {}
+
+        for node_id, node in nodes.items():
+            resource_type = node.get("resource_type")
+            dependencies = node.get("depends_on", {}).get("nodes", [])
+            if dependencies:
+                parents[node_id] = tuple(dependencies)
+
+            if resource_type == "model":
+                models.append(node)
+                name = node.get("name", "")
+                models_by_id[node_id] = node
+                models_by_name.setdefault(name, node)
+                layers[node_id] = detect_layer(name)
+            elif resource_type == "test":
+                tests.append(node)
+                attached_node = node.get("attached_node")
+                if attached_node:
+                    tests_by_node.setdefault(attached_node, []).append(node)
+                    column_name = node.get("column_name")
+                    if column_name is not None:
+                        tests_by_column.setdefault(attached_node, {}).setdefault(
+                            column_name, []
+                        ).append(node)
+
+        child_map: Mapping[str, list[str]] | None = manifest.get("child_map")
+        if child_map is not None:
+            children = {uid: tuple(kids) for uid, kids in child_map.items()}
+        else:
+            inverted: dict[str, list[str]] = {}
+            for node_id, deps in parents.items():
+                for dep_id in deps:
+                    inverted.setdefault(dep_id, []).append(node_id)
+            children = {uid: tuple(kids) for uid, kids in inverted.items()}
+
+        unique_ids_by_name: dict[str, str] = {}
+        for uid in children:
+            unique_ids_by_name.setdefault(uid.rsplit(".", 1)[-1], uid)
+
+        return cls(
+            manifest=manifest,
+            models=tuple(models),
+            tests=tuple(tests),
+            models_by_id=MappingProxyType(models_by_id),
+            models_by_name=MappingProxyType(models_by_name),
+            tests_by_node=MappingProxyType(
+                {uid: tuple(group) for uid, group in tests_by_node.items()}
+            ),
+            tests_by_column=MappingProxyType(
+                {
+                    uid: MappingProxyType({col: tuple(group) for col, group in columns.items()})
+                    for uid, columns in tests_by_column.items()
+                }
+            ),
+            parents=MappingProxyType(parents),
+            children=MappingProxyType(children),
+            unique_ids_by_name=MappingProxyType(unique_ids_by_name),
+            layers=MappingProxyType(layers),
+        )
+
+    def model_by_name(self, name: str) -> dict[str, Any] | None:
+        """Return the model node with the given name, if any."""
+        return self.models_by_name.get(name)
+
+    def tests_for_model(self, unique_id: str) -> tuple[dict[str, Any], ...]:
+        """Return test nodes attached to a node (empty if none)."""
+        return self.tests_by_node.get(unique_id, _EMPTY)
+
+    def column_tests_for_model(self, unique_id: str) -> Mapping[str, tuple[dict[str, Any], ...]]:
+        """Return column-level test nodes for a node, keyed by column name."""
+        return self.tests_by_column.get(unique_id, MappingProxyType({}))
+
+    def parents_of(self, unique_id: str) -> tuple[str, ...]:
+        """Return unique_ids the node depends on (empty if none)."""
+        return self.parents.get(unique_id, _EMPTY)
+
+    def children_of(self, unique_id: str) -> tuple[str, ...]:
+        """Return unique_ids depending on the node (empty if none)."""
+        return self.children.get(unique_id, _EMPTY)
+
+    def unique_id_for_name(self, name: str) -> str | None:
+        """Resolve a simple node name to a unique_id in the dependency graph."""
+        return self.unique_ids_by_name.get(name)
+
+    @cached_property
+    def downstream(self) -> DownstreamClosure:
+        """Return the memoized downstream closure over ``children``.
+
+        Built on first access and shared by every lookup in the run.
+        """
+        return DownstreamClosure(self.children)
+
+    def layer_of(self, unique_id: str) -> str | None:
+        """Return the medallion layer of a model (None if not medallion)."""
+        return self.layers.get(unique_id)
+
+
+__all__ = ["ManifestIndex", "detect_layer"]
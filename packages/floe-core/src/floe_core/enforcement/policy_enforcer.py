@@ -13,17 +13,20 @@ from __future__ import annotations
 
 import fnmatch
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, ParamSpec
 
 import structlog
 
+from floe_core.enforcement.manifest_index import ManifestIndex
 from floe_core.enforcement.result import (
     EnforcementResult,
     EnforcementSummary,
     Violation,
-    compute_downstream_impact,
 )
 from floe_core.enforcement.validators.coverage import CoverageValidator
 from floe_core.enforcement.validators.custom_rules import CustomRuleValidator
@@ -38,6 +41,11 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Minimum model count before parallel mode moves manifest validators to processes
+PARALLEL_PROCESS_MIN_MODELS = 2000
+
+_P = ParamSpec("_P")
+
 
 class PolicyEnforcer:
     """Orchestrates policy enforcement for dbt manifests.
@@ -82,6 +90,8 @@ class PolicyEnforcer:
         dry_run: bool = False,
         include_context: bool = False,
         max_violations: int | None = None,
+        parallel: bool = False,
+        max_workers: int | None = None,
     ) -> EnforcementResult:
         """Run all policy validators against the dbt manifest.
 
@@ -101,16 +111,22 @@ class PolicyEnforcer:
             max_violations: Optional maximum violations to collect before
                 early exit. Useful for fail-fast scenarios where only the
                 first few violations are needed. If None, collects all.
+            parallel: If True, run independent validators concurrently.
+                Violation order and max_violations truncation are identical
+                to a sequential run. Default: False.
+            max_workers: Optional worker count for parallel mode. Defaults
+                to one worker per configured validator.
 
         Returns:
             EnforcementResult containing pass/fail status, all violations,
-            and summary statistics.
+            and summary statistics (including per-validator durations).
         """
         start_time = time.perf_counter()
 
-        # Extract manifest metadata
+        # Extract manifest metadata and index the manifest once for all validators
         manifest_version = self._get_manifest_version(manifest)
-        models = self._extract_models(manifest)
+        index = ManifestIndex.from_manifest(manifest)
+        models = list(index.models)
 
         self._log.info(
             "enforcement_started",
@@ -121,100 +137,199 @@ class PolicyEnforcer:
         )
 
         # Run all validators and collect violations
-        violations = self._run_all_validators(manifest, models, max_violations, contract_path)
+        violations, validator_durations = self._run_all_validators(
+            manifest,
+            index,
+            max_violations,
+            contract_path,
+            parallel=parallel,
+            max_workers=max_workers,
+        )
 
         # Post-process violations
-        violations = self._post_process_violations(violations, manifest, dry_run, include_context)
+        violations = self._post_process_violations(violations, index, dry_run, include_context)
 
         # Build result
         return self._build_enforcement_result(
-            violations, models, manifest_version, dry_run, start_time
+            violations, models, manifest_version, dry_run, start_time, validator_durations
         )
 
     def _run_all_validators(
         self,
         manifest: dict[str, Any],
-        models: list[dict[str, Any]],
+        index: ManifestIndex,
         max_violations: int | None,
         contract_path: Path | None = None,
-    ) -> list[Violation]:
+        *,
+        parallel: bool = False,
+        max_workers: int | None = None,
+    ) -> tuple[list[Violation], dict[str, float]]:
         """Run all configured validators and collect violations.
 
+        Violations are always ordered as if the validators ran one after
+        another in plan order (see _plan_validators), so parallel and
+        sequential runs produce identical results.
+
         Args:
             manifest: The dbt manifest dictionary.
-            models: Extracted model nodes.
+            index: ManifestIndex built from the manifest.
             max_violations: Optional limit for early exit.
             contract_path: Optional path to datacontract.yaml for ODCS v3
                 contract validation (Epic 3C).
+            parallel: If True, run validators concurrently.
+            max_workers: Worker count for parallel mode.
 
         Returns:
-            List of violations from all validators.
+            Tuple of (violations from all validators, duration in ms per
+            validator that ran).
         """
-        violations: list[Violation] = []
+        plan = self._plan_validators(contract_path)
+        if parallel and len(plan) > 1:
+            return self._run_validators_parallel(
+                plan, manifest, index, max_violations, contract_path, max_workers
+            )
 
-        # Run naming validation if configured
-        if self.governance_config.naming is not None:
-            violations.extend(self._validate_naming(models))
+        violations: list[Violation] = []
+        durations: dict[str, float] = {}
+        for name in plan:
+            found, durations[name] = _timed(
+                self._run_validator, name, manifest, index, contract_path
+            )
+            violations.extend(found)
             if self._limit_reached(violations, max_violations):
-                return violations[:max_violations]
+                return violations[:max_violations], durations
 
-        # Run quality gate validators
-        violations = self._run_quality_gate_validators(manifest, models, violations, max_violations)
-        if self._limit_reached(violations, max_violations):
-            return violations[:max_violations]
+        return violations, durations
 
-        # Run semantic validation (always enabled)
-        violations.extend(self._validate_semantic(manifest))
-        if self._limit_reached(violations, max_violations):
-            return violations[:max_violations]
+    def _plan_validators(self, contract_path: Path | None) -> list[str]:
+        """List the validators to run for this configuration, in result order.
 
-        # Run custom rule validation if configured
-        if self.governance_config.custom_rules:
-            violations.extend(self._validate_custom_rules(manifest))
-            if self._limit_reached(violations, max_violations):
-                return violations[:max_violations]
+        Args:
+            contract_path: Optional path to datacontract.yaml.
 
-        # Run data contract validation if configured (Epic 3C, T026)
+        Returns:
+            Validator names understood by _run_validator.
+        """
+        plan: list[str] = []
+        if self.governance_config.naming is not None:
+            plan.append("naming")
+        quality_gates = self.governance_config.quality_gates
+        if quality_gates is not None:
+            plan.append("coverage")
+            if quality_gates.require_descriptions:
+                plan.append("documentation")
+        # Semantic validation is always enabled
+        plan.append("semantic")
+        if self.governance_config.custom_rules:
+            plan.append("custom_rules")
+        # Data contract validation if configured (Epic 3C, T026)
         if contract_path is not None or self.governance_config.data_contracts is not None:
-            violations.extend(self._validate_data_contracts(contract_path))
-            if self._limit_reached(violations, max_violations):
-                return violations[:max_violations]
+            plan.append("data_contracts")
+        return plan
 
-        return violations
+    def _run_validator(
+        self,
+        name: str,
+        manifest: dict[str, Any],
+        index: ManifestIndex,
+        contract_path: Path | None,
+    ) -> list[Violation]:
+        """Run a single validator by name.
 
-    def _run_quality_gate_validators(
+        Args:
+            name: Validator name from _plan_validators.
+            manifest: The dbt manifest dictionary.
+            index: ManifestIndex built from the manifest.
+            contract_path: Optional path to datacontract.yaml.
+
+        Returns:
+            Violations found by the validator.
+        """
+        if name == "naming":
+            return self._validate_naming(list(index.models))
+        if name == "coverage":
+            return self._validate_coverage(list(index.models), list(index.tests), index)
+        if name == "documentation":
+            return self._validate_documentation(list(index.models))
+        if name == "semantic":
+            return self._validate_semantic(manifest, index)
+        if name == "custom_rules":
+            return self._validate_custom_rules(manifest, index)
+        return self._validate_data_contracts(contract_path)
+
+    def _run_validators_parallel(
         self,
+        plan: list[str],
         manifest: dict[str, Any],
-        models: list[dict[str, Any]],
-        violations: list[Violation],
+        index: ManifestIndex,
         max_violations: int | None,
-    ) -> list[Violation]:
-        """Run quality gate validators (coverage, documentation).
+        contract_path: Path | None,
+        max_workers: int | None,
+    ) -> tuple[list[Violation], dict[str, float]]:
+        """Run validators concurrently, merging results in plan order.
+
+        Data contract validation (file and CLI I/O) always runs on a thread.
+        Manifest validators run on threads too, or on a process pool when
+        the manifest has at least PARALLEL_PROCESS_MIN_MODELS models, where
+        the cost of shipping the manifest to worker processes is outweighed
+        by bypassing the GIL. Once the ordered prefix of results reaches
+        max_violations, validators that have not started are cancelled.
 
         Args:
+            plan: Validator names from _plan_validators.
             manifest: The dbt manifest dictionary.
-            models: Extracted model nodes.
-            violations: Current list of violations.
+            index: ManifestIndex built from the manifest.
             max_violations: Optional limit for early exit.
+            contract_path: Optional path to datacontract.yaml.
+            max_workers: Worker count per pool. Defaults to one per validator.
 
         Returns:
-            Updated list of violations.
+            Tuple of (violations in plan order, duration in ms per validator
+            that completed).
         """
-        quality_gates = self.governance_config.quality_gates
-        if quality_gates is None:
-            return violations
+        workers = max_workers or len(plan)
+        use_processes = len(index.models) >= PARALLEL_PROCESS_MIN_MODELS
+        cpu_bound = [name for name in plan if name != "data_contracts"]
+
+        self._log.debug(
+            "validators_parallel_started",
+            validators=plan,
+            max_workers=workers,
+            use_processes=use_processes,
+        )
 
-        # Run coverage validation
-        tests = self._extract_tests(manifest)
-        violations.extend(self._validate_coverage(models, tests))
-        if self._limit_reached(violations, max_violations):
-            return violations
+        futures: dict[str, Future[tuple[list[Violation], float]]] = {}
+        with ExitStack() as stack:
+            threads = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            processes = (
+                stack.enter_context(ProcessPoolExecutor(max_workers=min(workers, len(cpu_bound))))
+                if use_processes and cpu_bound
+                else None
+            )
+            for name in plan:
+                if processes is not None and name in cpu_bound:
+                    futures[name] = processes.submit(
+                        _run_validator_in_process,
+                        self.governance_config,
+                        manifest,
+                        name,
+                    )
+                else:
+                    futures[name] = threads.submit(
+                        _timed, self._run_validator, name, manifest, index, contract_path
+                    )
 
-        # Run documentation validation if configured
-        if quality_gates.require_descriptions:
-            violations.extend(self._validate_documentation(models))
+            violations: list[Violation] = []
+            durations: dict[str, float] = {}
+            for name in plan:
+                found, durations[name] = futures[name].result()
+                violations.extend(found)
+                if self._limit_reached(violations, max_violations):
+                    for future in futures.values():
+                        future.cancel()
+                    return violations[:max_violations], durations
 
-        return violations
+        return violations, durations
 
     def _limit_reached(
         self,
@@ -235,7 +350,7 @@ class PolicyEnforcer:
     def _post_process_violations(
         self,
         violations: list[Violation],
-        manifest: dict[str, Any],
+        index: ManifestIndex,
         dry_run: bool,
         include_context: bool,
     ) -> list[Violation]:
@@ -243,7 +358,7 @@ class PolicyEnforcer:
 
         Args:
             violations: Raw violations from validators.
-            manifest: The dbt manifest dictionary.
+            index: ManifestIndex built from the manifest.
             dry_run: Whether this is a dry-run.
             include_context: Whether to include downstream impact.
 
@@ -252,8 +367,7 @@ class PolicyEnforcer:
         """
         # Populate downstream_impact if requested (T048-T049)
         if include_context:
-            child_map = manifest.get("child_map", {})
-            violations = self._populate_downstream_impact(violations, child_map)
+            violations = self._populate_downstream_impact(violations, index)
 
         # Adjust severity for dry-run mode
         if dry_run:
@@ -268,6 +382,7 @@ class PolicyEnforcer:
         manifest_version: str,
         dry_run: bool,
         start_time: float,
+        validator_durations: dict[str, float] | None = None,
     ) -> EnforcementResult:
         """Build the final EnforcementResult.
 
@@ -277,13 +392,14 @@ class PolicyEnforcer:
             manifest_version: dbt version string.
             dry_run: Whether this is a dry-run.
             start_time: Start time from perf_counter().
+            validator_durations: Duration in milliseconds per validator run.
 
         Returns:
             Complete EnforcementResult.
         """
         passed = self._determine_passed(violations, dry_run)
         duration_ms = (time.perf_counter() - start_time) * 1000
-        summary = self._build_summary(models, violations, duration_ms)
+        summary = self._build_summary(models, violations, duration_ms, validator_durations)
         enforcement_level = self._get_effective_enforcement_level()
 
         result = EnforcementResult(
@@ -318,32 +434,6 @@ class PolicyEnforcer:
         metadata = manifest.get("metadata", {})
         return str(metadata.get("dbt_version", "unknown"))
 
-    def _extract_models(self, manifest: dict[str, Any]) -> list[dict[str, Any]]:
-        """Extract model nodes from the manifest.
-
-        Args:
-            manifest: The dbt manifest dictionary.
-
-        Returns:
-            List of model node dictionaries.
-        """
-        nodes = manifest.get("nodes", {})
-        models = [node for node in nodes.values() if node.get("resource_type") == "model"]
-        return models
-
-    def _extract_tests(self, manifest: dict[str, Any]) -> list[dict[str, Any]]:
-        """Extract test nodes from the manifest.
-
-        Args:
-            manifest: The dbt manifest dictionary.
-
-        Returns:
-            List of test node dictionaries.
-        """
-        nodes = manifest.get("nodes", {})
-        tests = [node for node in nodes.values() if node.get("resource_type") == "test"]
-        return tests
-
     def _validate_naming(
         self,
         models: list[dict[str, Any]],
@@ -371,12 +461,14 @@ class PolicyEnforcer:
         self,
         models: list[dict[str, Any]],
         tests: list[dict[str, Any]],
+        index: ManifestIndex | None = None,
     ) -> list[Violation]:
         """Validate test coverage against quality gates.
 
         Args:
             models: List of model nodes from the manifest.
             tests: List of test nodes from the manifest.
+            index: Optional ManifestIndex for per-model test lookups.
 
         Returns:
             List of coverage violations found.
@@ -387,7 +479,7 @@ class PolicyEnforcer:
 
         # Delegate to CoverageValidator (T060)
         validator = CoverageValidator(quality_gates)
-        return validator.validate(models, tests)
+        return validator.validate(models, tests, index=index)
 
     def _validate_documentation(
         self,
@@ -412,6 +504,7 @@ class PolicyEnforcer:
     def _validate_semantic(
         self,
         manifest: dict[str, Any],
+        index: ManifestIndex | None = None,
     ) -> list[Violation]:
         """Validate semantic relationships (refs, sources, dependencies).
 
@@ -420,17 +513,19 @@ class PolicyEnforcer:
 
         Args:
             manifest: The full dbt manifest dictionary.
+            index: Optional ManifestIndex built from the manifest.
 
         Returns:
             List of semantic violations found (FLOE-E301, E302, E303).
         """
         # Delegate to SemanticValidator (T017-T020)
         validator = SemanticValidator()
-        return validator.validate(manifest)
+        return validator.validate(manifest, index=index)
 
     def _validate_custom_rules(
         self,
         manifest: dict[str, Any],
+        index: ManifestIndex | None = None,
     ) -> list[Violation]:
         """Validate models against user-defined custom rules.
 
@@ -441,6 +536,7 @@ class PolicyEnforcer:
 
         Args:
             manifest: The full dbt manifest dictionary.
+            index: Optional ManifestIndex built from the manifest.
 
         Returns:
             List of custom rule violations found (FLOE-E4xx).
@@ -451,7 +547,7 @@ class PolicyEnforcer:
 
         # Delegate to CustomRuleValidator (T027-T033)
         validator = CustomRuleValidator(custom_rules)
-        return validator.validate(manifest)
+        return validator.validate(manifest, index=index)
 
     def _validate_data_contracts(
         self,
@@ -562,30 +658,27 @@ class PolicyEnforcer:
     def _populate_downstream_impact(
         self,
         violations: list[Violation],
-        child_map: dict[str, list[str]],
+        index: ManifestIndex,
     ) -> list[Violation]:
         """Populate downstream_impact field on violations.
 
-        Uses compute_downstream_impact to find affected downstream models
-        for each violation.
+        Uses the index's memoized DownstreamClosure, so the DAG is walked
+        at most once per model regardless of how many violations it has.
 
         Args:
             violations: List of violations to enrich.
-            child_map: dbt manifest child_map for dependency lookup.
+            index: ManifestIndex whose child_map is used for dependency lookup.
 
         Returns:
             New list of violations with downstream_impact populated.
         """
-        if not child_map:
+        if not index.manifest.get("child_map"):
             return violations
 
         result: list[Violation] = []
         for violation in violations:
-            impact = compute_downstream_impact(
-                model_name=violation.model_name,
-                child_map=child_map,
-                recursive=True,  # Include transitive dependencies
-            )
+            # Include transitive dependencies
+            impact = index.downstream.impact(violation.model_name)
             # Create new Violation with downstream_impact populated
             enriched = Violation(
                 error_code=violation.error_code,
@@ -666,6 +759,7 @@ class PolicyEnforcer:
         models: list[dict[str, Any]],
         violations: list[Violation],
         duration_ms: float,
+        validator_durations: dict[str, float] | None = None,
     ) -> EnforcementSummary:
         """Build enforcement summary statistics.
 
@@ -673,6 +767,7 @@ class PolicyEnforcer:
             models: List of model nodes validated.
             violations: List of violations found.
             duration_ms: Enforcement duration in milliseconds.
+            validator_durations: Duration in milliseconds per validator run.
 
         Returns:
             EnforcementSummary with statistics.
@@ -692,6 +787,7 @@ class PolicyEnforcer:
             semantic_violations=semantic_count,
             custom_rule_violations=custom_count,
             duration_ms=duration_ms,
+            validator_durations_ms=validator_durations or {},
         )
 
     def _get_effective_enforcement_level(self) -> Literal["off", "warn", "strict"]:
@@ -927,3 +1023,36 @@ class PolicyEnforcer:
                     action=override.action,
                     reason=override.reason,
                 )
+
+
+def _timed(
+    func: Callable[_P, list[Violation]],
+    *args: _P.args,
+    **kwargs: _P.kwargs,
+) -> tuple[list[Violation], float]:
+    """Call a validator and measure its duration.
+
+    Returns:
+        Tuple of (violations, duration in milliseconds).
+    """
+    start = time.perf_counter()
+    violations = func(*args, **kwargs)
+    return violations, (time.perf_counter() - start) * 1000
+
+
+def _run_validator_in_process(
+    governance_config: GovernanceConfig,
+    manifest: dict[str, Any],
+    name: str,
+) -> tuple[list[Violation], float]:
+    """Run a manifest validator in a worker process.
+
+    The ManifestIndex holds read-only mapping views that cannot be pickled,
+    so the worker rebuilds it from the manifest (outside the timed section).
+
+    Returns:
+        Tuple of (violations, duration in milliseconds).
+    """
+    enforcer = PolicyEnforcer(governance_config)
+    index = ManifestIndex.from_manifest(manifest)
+    return _timed(enforcer._run_validator, name, manifest, index, None)
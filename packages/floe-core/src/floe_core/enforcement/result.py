@@ -5,6 +5,7 @@ This module defines the result types returned by PolicyEnforcer.enforce():
 - EnforcementSummary: Statistics about the enforcement run
 - EnforcementResult: Top-level result with pass/fail status
 - compute_downstream_impact: Helper to compute downstream models from child_map
+- DownstreamClosure: Memoized transitive downstream models for many lookups
 - create_enforcement_summary: Create EnforcementResultSummary from EnforcementResult
 
 These models form the contract between PolicyEnforcer and the compilation pipeline.
@@ -16,6 +17,7 @@ Requirements: FR-002 (Pipeline Integration), US1 (Compile-time Enforcement),
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 
@@ -168,6 +170,8 @@ class EnforcementSummary(BaseModel):
         secret_violations: Count of secret scanning violations (Epic 3E).
         network_policy_violations: Count of network policy violations (Epic 3E).
         duration_ms: Enforcement duration in milliseconds.
+        validator_durations_ms: Duration in milliseconds per validator that ran
+            (naming, coverage, documentation, semantic, custom_rules, data_contracts).
 
     Example:
         >>> summary = EnforcementSummary(
@@ -260,6 +264,10 @@ class EnforcementSummary(BaseModel):
         ge=0.0,
         description="Enforcement duration in milliseconds",
     )
+    validator_durations_ms: dict[str, float] = Field(
+        default_factory=dict,
+        description="Duration in milliseconds per validator that ran",
+    )
 
 
 class EnforcementResult(BaseModel):
@@ -391,6 +399,7 @@ def compute_downstream_impact(
     child_map: dict[str, list[str]],
     *,
     recursive: bool = False,
+    unique_id: str | None = None,
 ) -> list[str]:
     """Compute list of downstream models affected by a model.
 
@@ -401,6 +410,8 @@ def compute_downstream_impact(
         model_name: Simple model name (e.g., "bronze_orders").
         child_map: dbt manifest child_map mapping unique_ids to child unique_ids.
         recursive: If True, include transitive dependencies. Default: False.
+        unique_id: Optional pre-resolved unique_id of the model (e.g. from
+            ManifestIndex.unique_id_for_name), skipping the child_map scan.
 
     Returns:
         List of simple model names that depend on this model. Empty if none.
@@ -416,7 +427,7 @@ def compute_downstream_impact(
         ['silver_orders', 'gold_orders']
     """
     # Find the unique_id for this model name
-    model_unique_id = _find_unique_id_for_model(model_name, child_map)
+    model_unique_id = unique_id or _find_unique_id_for_model(model_name, child_map)
 
     if model_unique_id is None:
         return []
@@ -460,6 +471,7 @@ def _compute_recursive_children(
         List of all descendant model names (deduplicated).
     """
     visited: set[str] = set()
+    seen_names: set[str] = set()
     result: list[str] = []
 
     def _visit(uid: str) -> None:
@@ -472,7 +484,8 @@ def _compute_recursive_children(
         for child_uid in children:
             # Add child's model name (not unique_id)
             model_name = _extract_model_name(child_uid)
-            if model_name and model_name not in result:
+            if model_name and model_name not in seen_names:
+                seen_names.add(model_name)
                 result.append(model_name)
             # Recurse
             _visit(child_uid)
@@ -516,6 +529,194 @@ def _extract_model_name(unique_id: str) -> str | None:
     return None
 
 
+class DownstreamClosure:
+    """Memoized transitive downstream models over a dbt child_map.
+
+    compute_downstream_impact(..., recursive=True) re-resolves the unique_id
+    and re-walks the DAG on every call. DownstreamClosure is built once per
+    enforcement run and answers any number of lookups:
+
+    - Node names are resolved through a dictionary instead of a child_map scan.
+    - The child_map is condensed into strongly connected components (so
+      circular references are handled) in topological order.
+    - Each component's descendant set is an integer bitset, computed on first
+      use from its children's bitsets and memoized; results are memoized per
+      model name.
+
+    Results list each descendant model name once, upstream models first.
+    Like compute_downstream_impact, a model caught in a cycle is its own
+    descendant.
+
+    Example:
+        >>> closure = DownstreamClosure({
+        ...     "model.project.bronze_orders": ["model.project.silver_orders"],
+        ...     "model.project.silver_orders": ["model.project.gold_orders"],
+        ... })
+        >>> closure.impact("bronze_orders")
+        ['silver_orders', 'gold_orders']
+    """
+
+    def __init__(self, child_map: Mapping[str, Sequence[str]]) -> None:
+        """Condense the child_map and assign bit positions.
+
+        Args:
+            child_map: dbt manifest child_map mapping unique_ids to child unique_ids.
+        """
+        self._child_map = child_map
+        self._unique_ids_by_name: dict[str, str] = {}
+        for uid in child_map:
+            self._unique_ids_by_name.setdefault(uid.rsplit(".", 1)[-1], uid)
+
+        components = _strongly_connected_components(child_map)
+        # Tarjan emits sinks first; bit positions follow topological order
+        components.reverse()
+
+        self._components = components
+        self._component_of: dict[str, int] = {}
+        self._member_bits: list[int] = []
+        self._bit_names: list[str | None] = []
+        for component_id, members in enumerate(components):
+            bits = 0
+            for uid in members:
+                self._component_of[uid] = component_id
+                bits |= 1 << len(self._bit_names)
+                self._bit_names.append(_extract_model_name(uid))
+            self._member_bits.append(bits)
+
+        self._reach: dict[int, int] = {}
+        self._impact: dict[str, list[str]] = {}
+
+    def impact(self, model_name: str) -> list[str]:
+        """Return all models transitively downstream of a model.
+
+        Args:
+            model_name: Simple model name (e.g., "bronze_orders").
+
+        Returns:
+            Deduplicated downstream model names. Empty if the model is unknown
+            or has no children.
+        """
+        cached = self._impact.get(model_name)
+        if cached is None:
+            unique_id = self._unique_ids_by_name.get(model_name)
+            cached = [] if unique_id is None else self._names(self._descendant_bits(unique_id))
+            self._impact[model_name] = cached
+        return list(cached)
+
+    def _descendant_bits(self, unique_id: str) -> int:
+        """Return the bitset of nodes reachable from unique_id."""
+        root = self._component_of[unique_id]
+        if root in self._reach:
+            return self._reach[root]
+
+        # Iterative post-order over the component DAG
+        stack: list[tuple[int, bool]] = [(root, False)]
+        while stack:
+            component_id, expanded = stack.pop()
+            if component_id in self._reach:
+                continue
+            child_components = self._child_components(component_id)
+            if not expanded:
+                stack.append((component_id, True))
+                stack.extend(
+                    (child, False)
+                    for child in child_components
+                    if child != component_id and child not in self._reach
+                )
+                continue
+
+            bits = 0
+            for child in child_components:
+                if child == component_id:
+                    bits |= self._member_bits[component_id]
+                else:
+                    bits |= self._member_bits[child] | self._reach[child]
+            if len(self._components[component_id]) > 1:
+                # A component with several members is a cycle
+                bits |= self._member_bits[component_id]
+            self._reach[component_id] = bits
+
+        return self._reach[root]
+
+    def _child_components(self, component_id: int) -> set[int]:
+        """Return components directly reachable from a component."""
+        return {
+            self._component_of[child]
+            for uid in self._components[component_id]
+            for child in self._child_map.get(uid, ())
+        }
+
+    def _names(self, bits: int) -> list[str]:
+        """Decode a bitset into deduplicated model names in bit order."""
+        names: list[str] = []
+        seen: set[str] = set()
+        # Scanning the binary string avoids one big-int operation per set bit
+        digits = format(bits, "b")[::-1]
+        position = digits.find("1")
+        while position != -1:
+            name = self._bit_names[position]
+            if name and name not in seen:
+                seen.add(name)
+                names.append(name)
+            position = digits.find("1", position + 1)
+        return names
+
+
+def _strongly_connected_components(child_map: Mapping[str, Sequence[str]]) -> list[list[str]]:
+    """Find strongly connected components of a child_map (iterative Tarjan).
+
+    Args:
+        child_map: dbt manifest child_map.
+
+    Returns:
+        Components as lists of unique_ids, each emitted after every
+        component reachable from it (sinks first).
+    """
+    index_of: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+
+    nodes = dict.fromkeys(child_map)
+    for children in child_map.values():
+        nodes.update(dict.fromkeys(children))
+
+    for start in nodes:
+        if start in index_of:
+            continue
+        work: list[tuple[str, int]] = [(start, 0)]
+        while work:
+            uid, child_pos = work.pop()
+            if child_pos == 0:
+                index_of[uid] = lowlink[uid] = len(index_of)
+                stack.append(uid)
+                on_stack.add(uid)
+            children = child_map.get(uid, ())
+            if child_pos < len(children):
+                work.append((uid, child_pos + 1))
+                child = children[child_pos]
+                if child not in index_of:
+                    work.append((child, 0))
+                elif child in on_stack:
+                    lowlink[uid] = min(lowlink[uid], index_of[child])
+                continue
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[uid])
+            if lowlink[uid] == index_of[uid]:
+                component: list[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == uid:
+                        break
+                components.append(component[::-1])
+
+    return components
+
+
 # ==============================================================================
 # T061: Create EnforcementResultSummary from EnforcementResult
 # ==============================================================================
@@ -11,22 +11,21 @@ Requirements: FR-004 (Coverage Calculation), FR-012 (Layer Thresholds), US4 (Cov
 
 from __future__ import annotations
 
-import re
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from floe_core.enforcement.manifest_index import detect_layer
 from floe_core.enforcement.patterns import DOCUMENTATION_URLS
 from floe_core.enforcement.result import Violation
 
 if TYPE_CHECKING:
+    from floe_core.enforcement.manifest_index import ManifestIndex
     from floe_core.schemas.governance import QualityGatesConfig
 
 logger = structlog.get_logger(__name__)
 
-# Medallion layer detection pattern
-_LAYER_PATTERN: re.Pattern[str] = re.compile(r"^(bronze|silver|gold)_")
-
 # Coverage documentation URL
 COVERAGE_DOC_URL = f"{DOCUMENTATION_URLS.get('base', 'https://floe.dev/docs')}/coverage"
 
@@ -67,17 +66,24 @@ class CoverageValidator:
         self,
         models: list[dict[str, Any]],
         tests: list[dict[str, Any]],
+        *,
+        index: ManifestIndex | None = None,
     ) -> list[Violation]:
         """Validate test coverage for all models against configured thresholds.
 
         Args:
             models: List of model node dictionaries from dbt manifest.
             tests: List of test node dictionaries from dbt manifest.
+            index: Optional ManifestIndex built from the same manifest. When
+                omitted, tests are grouped by attached node once up front.
 
         Returns:
             List of Violation objects for models that fail coverage thresholds.
         """
         violations: list[Violation] = []
+        tests_by_model = (
+            index.tests_by_node if index is not None else self._group_tests_by_model(tests)
+        )
 
         for model in models:
             model_name = model.get("name", "")
@@ -87,7 +93,7 @@ class CoverageValidator:
             columns = self._extract_columns(model)
 
             # Extract tests for this model
-            model_tests = self._extract_tests_for_model(model_unique_id, tests)
+            model_tests = tests_by_model.get(model_unique_id, ())
 
             # Map tests to columns
             column_tests = self._map_tests_to_columns(model_tests)
@@ -143,30 +149,28 @@ class CoverageValidator:
             return {}
         return dict(columns)
 
-    def _extract_tests_for_model(
+    def _group_tests_by_model(
         self,
-        model_unique_id: str,
         tests: list[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
-        """Extract tests that are attached to a specific model.
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Group tests by the model they are attached to.
 
         Args:
-            model_unique_id: The unique_id of the model (e.g., "model.test.bronze_orders").
             tests: List of all test nodes from dbt manifest.
 
         Returns:
-            List of test nodes attached to this model.
+            Dictionary of model unique_id to the test nodes attached to it.
         """
-        model_tests = []
+        grouped: dict[str, list[dict[str, Any]]] = {}
         for test in tests:
             attached_node = test.get("attached_node")
-            if attached_node == model_unique_id:
-                model_tests.append(test)
-        return model_tests
+            if attached_node:
+                grouped.setdefault(attached_node, []).append(test)
+        return grouped
 
     def _map_tests_to_columns(
         self,
-        tests: list[dict[str, Any]],
+        tests: Sequence[dict[str, Any]],
     ) -> dict[str, int]:
         """Map tests to their respective columns and count tests per column.
 
@@ -226,10 +230,7 @@ class CoverageValidator:
         Returns:
             The layer name ("bronze", "silver", "gold") or None if not medallion.
         """
-        match = _LAYER_PATTERN.match(model_name)
-        if match:
-            return match.group(1)
-        return None
+        return detect_layer(model_name)
 
     def _get_threshold_for_layer(self, layer: str | None) -> int:
         """Get the coverage threshold for a specific layer.
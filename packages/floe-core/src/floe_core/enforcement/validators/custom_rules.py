@@ -12,10 +12,12 @@ Requirements: FR-005 through FR-010 (US2 - Custom Policy Rules)
 from __future__ import annotations
 
 import fnmatch
+from collections.abc import Sequence
 from typing import Any
 
 import structlog
 
+from floe_core.enforcement.manifest_index import ManifestIndex
 from floe_core.enforcement.result import Violation
 from floe_core.schemas.governance import (
     CustomRule,
@@ -62,7 +64,12 @@ class CustomRuleValidator:
             rule_count=len(custom_rules),
         )
 
-    def validate(self, manifest: dict[str, Any]) -> list[Violation]:
+    def validate(
+        self,
+        manifest: dict[str, Any],
+        *,
+        index: ManifestIndex | None = None,
+    ) -> list[Violation]:
         """Validate all models against custom rules.
 
         Iterates through all custom rules and applies them to matching models
@@ -70,22 +77,23 @@ class CustomRuleValidator:
 
         Args:
             manifest: dbt manifest dictionary with nodes.
+            index: Optional ManifestIndex built from the same manifest.
+                Built here when omitted.
 
         Returns:
             List of Violation objects for all rule violations found.
         """
         violations: list[Violation] = []
-        nodes = manifest.get("nodes", {})
-
-        # Extract models only
-        models = [node for node in nodes.values() if node.get("resource_type") == "model"]
 
         if not self.custom_rules:
             self._log.debug("no_custom_rules_configured")
             return violations
 
+        if index is None:
+            index = ManifestIndex.from_manifest(manifest)
+
         for rule in self.custom_rules:
-            rule_violations = self._validate_rule(rule, models, manifest)
+            rule_violations = self._validate_rule(rule, index.models, index)
             violations.extend(rule_violations)
 
         if violations:
@@ -106,15 +114,15 @@ class CustomRuleValidator:
     def _validate_rule(
         self,
         rule: CustomRule,
-        models: list[dict[str, Any]],
-        manifest: dict[str, Any],
+        models: Sequence[dict[str, Any]],
+        index: ManifestIndex,
     ) -> list[Violation]:
         """Validate models against a single custom rule.
 
         Args:
             rule: The custom rule to apply.
             models: List of model nodes from manifest.
-            manifest: Full manifest (needed for test type validation).
+            index: Manifest index (needed for test type validation).
 
         Returns:
             List of violations from this rule.
@@ -127,11 +135,11 @@ class CustomRuleValidator:
         if isinstance(rule, RequireMetaField):
             return self._validate_meta_field(rule, matching_models)
         # Must be RequireTestsOfType (exhaustive via discriminated union)
-        return self._validate_tests_of_type(rule, matching_models, manifest)
+        return self._validate_tests_of_type(rule, matching_models, index)
 
     def _filter_models_by_pattern(
         self,
-        models: list[dict[str, Any]],
+        models: Sequence[dict[str, Any]],
         pattern: str,
     ) -> list[dict[str, Any]]:
         """Filter models by glob pattern.
@@ -235,7 +243,7 @@ class CustomRuleValidator:
         self,
         rule: RequireTestsOfType,
         models: list[dict[str, Any]],
-        manifest: dict[str, Any],
+        index: ManifestIndex,
     ) -> list[Violation]:
         """Validate require_tests_of_type rule.
 
@@ -245,20 +253,16 @@ class CustomRuleValidator:
         Args:
             rule: The RequireTestsOfType rule.
             models: Models filtered by applies_to pattern.
-            manifest: Full manifest to access test nodes.
+            index: Manifest index to access test nodes.
 
         Returns:
             List of FLOE-E402 violations.
         """
         violations: list[Violation] = []
-        nodes = manifest.get("nodes", {})
 
         # Build map of model -> test types
         model_tests: dict[str, set[str]] = {}
-        for node in nodes.values():
-            if node.get("resource_type") != "test":
-                continue
-
+        for node in index.tests:
             # Get attached model
             attached_node = node.get("attached_node")
             if not attached_node:
@@ -301,7 +305,7 @@ class CustomRuleValidator:
                 # Check min_columns threshold
                 # Count how many columns have any of the required test types
                 columns_with_tests = self._count_columns_with_tests(
-                    unique_id, nodes, required_tests
+                    index.tests_for_model(unique_id), required_tests
                 )
                 if columns_with_tests < rule.min_columns:
                     violation = self._create_min_columns_violation(
@@ -316,15 +320,13 @@ class CustomRuleValidator:
 
     def _count_columns_with_tests(
         self,
-        model_unique_id: str,
-        nodes: dict[str, Any],
+        model_tests: Sequence[dict[str, Any]],
         test_types: set[str],
     ) -> int:
         """Count columns with any of the specified test types.
 
         Args:
-            model_unique_id: The model's unique_id.
-            nodes: All nodes from manifest.
+            model_tests: Test nodes attached to the model.
             test_types: Set of test types to look for.
 
         Returns:
@@ -332,15 +334,7 @@ class CustomRuleValidator:
         """
         columns_with_tests: set[str] = set()
 
-        for node in nodes.values():
-            if node.get("resource_type") != "test":
-                continue
-
-            # Check if test is attached to this model
-            attached_node = node.get("attached_node")
-            if attached_node != model_unique_id:
-                continue
-
+        for node in model_tests:
             test_metadata = node.get("test_metadata", {})
             test_name = test_metadata.get("name", "")
 
@@ -16,6 +16,7 @@ from typing import Any
 
 import structlog
 
+from floe_core.enforcement.manifest_index import ManifestIndex
 from floe_core.enforcement.result import Violation
 
 logger = structlog.get_logger(__name__)
@@ -46,7 +47,12 @@ class SemanticValidator:
         """Initialize SemanticValidator."""
         self._log = logger.bind(component="SemanticValidator")
 
-    def validate(self, manifest: dict[str, Any]) -> list[Violation]:
+    def validate(
+        self,
+        manifest: dict[str, Any],
+        *,
+        index: ManifestIndex | None = None,
+    ) -> list[Violation]:
         """Run all semantic validation checks on manifest.
 
         Combines results from:
@@ -56,16 +62,20 @@ class SemanticValidator:
 
         Args:
             manifest: dbt manifest dictionary with nodes, sources, child_map.
+            index: Optional ManifestIndex built from the same manifest.
+                Built once here and shared by all checks when omitted.
 
         Returns:
             List of all Violation objects found across all checks.
         """
         violations: list[Violation] = []
+        if index is None:
+            index = ManifestIndex.from_manifest(manifest)
 
         # Run all semantic checks
-        violations.extend(self.validate_refs(manifest))
-        violations.extend(self.validate_sources(manifest))
-        violations.extend(self.detect_circular_deps(manifest))
+        violations.extend(self.validate_refs(manifest, index=index))
+        violations.extend(self.validate_sources(manifest, index=index))
+        violations.extend(self.detect_circular_deps(manifest, index=index))
 
         if violations:
             self._log.info(
@@ -82,7 +92,12 @@ class SemanticValidator:
 
         return violations
 
-    def validate_refs(self, manifest: dict[str, Any]) -> list[Violation]:
+    def validate_refs(
+        self,
+        manifest: dict[str, Any],
+        *,
+        index: ManifestIndex | None = None,
+    ) -> list[Violation]:
         """Validate model references (ref()) resolve to existing models.
 
         FR-001: System MUST validate model references (via ref())
@@ -90,31 +105,26 @@ class SemanticValidator:
 
         Args:
             manifest: dbt manifest dictionary.
+            index: Optional ManifestIndex built from the same manifest.
 
         Returns:
             List of FLOE-E301 violations for missing model references.
         """
         violations: list[Violation] = []
         nodes = manifest.get("nodes", {})
+        if index is None:
+            index = ManifestIndex.from_manifest(manifest)
 
-        # Build set of all valid model node IDs
-        valid_model_ids: set[str] = set(nodes.keys())
-
-        for _node_id, node in nodes.items():
-            if node.get("resource_type") != "model":
-                continue
-
+        for node_id, node in self._iter_models(index):
             model_name = node.get("name", "unknown")
-            depends_on = node.get("depends_on", {})
-            dependencies = depends_on.get("nodes", [])
 
-            for dep_id in dependencies:
+            for dep_id in index.parents_of(node_id):
                 # Skip source dependencies (handled by validate_sources)
                 if dep_id.startswith("source."):
                     continue
 
                 # Check if referenced model exists
-                if dep_id not in valid_model_ids:
+                if dep_id not in nodes:
                     # Extract missing model name from unique_id
                     missing_name = self._extract_model_name(dep_id)
                     violation = self._create_missing_ref_violation(
@@ -126,7 +136,12 @@ class SemanticValidator:
 
         return violations
 
-    def validate_sources(self, manifest: dict[str, Any]) -> list[Violation]:
+    def validate_sources(
+        self,
+        manifest: dict[str, Any],
+        *,
+        index: ManifestIndex | None = None,
+    ) -> list[Violation]:
         """Validate source references (source()) resolve to defined sources.
 
         FR-003: System MUST validate source references (via source())
@@ -134,32 +149,26 @@ class SemanticValidator:
 
         Args:
             manifest: dbt manifest dictionary.
+            index: Optional ManifestIndex built from the same manifest.
 
         Returns:
             List of FLOE-E303 violations for missing source references.
         """
         violations: list[Violation] = []
-        nodes = manifest.get("nodes", {})
         sources = manifest.get("sources", {})
+        if index is None:
+            index = ManifestIndex.from_manifest(manifest)
 
-        # Build set of valid source IDs
-        valid_source_ids: set[str] = set(sources.keys())
-
-        for _node_id, node in nodes.items():
-            if node.get("resource_type") != "model":
-                continue
-
+        for node_id, node in self._iter_models(index):
             model_name = node.get("name", "unknown")
-            depends_on = node.get("depends_on", {})
-            dependencies = depends_on.get("nodes", [])
 
-            for dep_id in dependencies:
+            for dep_id in index.parents_of(node_id):
                 # Only check source dependencies
                 if not dep_id.startswith("source."):
                     continue
 
                 # Check if source exists
-                if dep_id not in valid_source_ids:
+                if dep_id not in sources:
                     # Extract source info from unique_id
                     source_info = self._extract_source_info(dep_id)
                     violation = self._create_missing_source_violation(
@@ -172,7 +181,12 @@ class SemanticValidator:
 
         return violations
 
-    def detect_circular_deps(self, manifest: dict[str, Any]) -> list[Violation]:
+    def detect_circular_deps(
+        self,
+        manifest: dict[str, Any],
+        *,
+        index: ManifestIndex | None = None,
+    ) -> list[Violation]:
         """Detect circular dependencies between models.
 
         FR-002: System MUST detect circular dependencies between models
@@ -182,28 +196,25 @@ class SemanticValidator:
 
         Args:
             manifest: dbt manifest dictionary.
+            index: Optional ManifestIndex built from the same manifest.
 
         Returns:
             List of FLOE-E302 violations for detected cycles.
         """
         violations: list[Violation] = []
         nodes = manifest.get("nodes", {})
+        if index is None:
+            index = ManifestIndex.from_manifest(manifest)
 
         # Build adjacency list for models only
-        model_ids: set[str] = {
-            node_id for node_id, node in nodes.items() if node.get("resource_type") == "model"
-        }
+        model_ids: set[str] = {node_id for node_id, _node in self._iter_models(index)}
 
         # Build graph: node_id -> list of dependent node_ids
         graph: dict[str, list[str]] = {node_id: [] for node_id in model_ids}
         in_degree: dict[str, int] = dict.fromkeys(model_ids, 0)
 
         for node_id in model_ids:
-            node = nodes[node_id]
-            depends_on = node.get("depends_on", {})
-            dependencies = depends_on.get("nodes", [])
-
-            for dep_id in dependencies:
+            for dep_id in index.parents_of(node_id):
                 # Only consider model dependencies
                 if dep_id in model_ids:
                     graph[dep_id].append(node_id)
@@ -238,6 +249,17 @@ class SemanticValidator:
 
         return violations
 
+    def _iter_models(self, index: ManifestIndex) -> list[tuple[str, dict[str, Any]]]:
+        """Return (node_id, node) pairs for all models in manifest order.
+
+        Args:
+            index: Manifest index.
+
+        Returns:
+            List of model node IDs with their nodes.
+        """
+        return list(index.models_by_id.items())
+
     def _find_cycle_path(
         self,
         _graph: dict[str, list[str]],
@@ -46,6 +46,8 @@ class GovernanceIntegrator:
         self,
         governance_config: GovernanceConfig,
         identity_plugin: IdentityPlugin | None,
+        *,
+        secret_scan_cache_dir: Path | None = None,
     ) -> None:
         """Initialize integrator with governance configuration.
 
@@ -53,9 +55,12 @@ class GovernanceIntegrator:
             governance_config: Governance configuration with RBAC, secret scanning, policy settings
             identity_plugin: Identity plugin for RBAC token validation, or None
                 when OIDC is unavailable (principal fallback only).
+            secret_scan_cache_dir: Directory for cached secret scan findings of
+                unchanged files, or None to scan every file on every run.
         """
         self.governance_config = governance_config
         self.identity_plugin = identity_plugin
+        self.secret_scan_cache_dir = secret_scan_cache_dir
 
     def run_checks(
         self,
@@ -65,6 +70,7 @@ class GovernanceIntegrator:
         dry_run: bool,
         enforcement_level: Literal["off", "warn", "strict"],
         dbt_manifest: dict[str, Any] | None = None,
+        parallel: bool = False,
     ) -> EnforcementResult:
         """Run all governance checks and return unified result.
 
@@ -76,6 +82,8 @@ class GovernanceIntegrator:
             enforcement_level: "off" (skip all), "warn" (downgrade errors),
                 "strict" (fail on errors)
             dbt_manifest: dbt manifest.json for policy enforcement (optional)
+            parallel: If True, run policy validators concurrently
+                (see PolicyEnforcer.enforce)
 
         Returns:
             EnforcementResult with merged violations from all checks
@@ -107,7 +115,7 @@ class GovernanceIntegrator:
             all_violations.extend(secret_violations)
 
         # 3. Run policy enforcement
-        policy_result = self._run_policy_enforcement(dbt_manifest)
+        policy_result = self._run_policy_enforcement(dbt_manifest, parallel=parallel)
         all_violations.extend(policy_result.violations)
 
         # 3.5. Run policy-as-code evaluation (FR-015)
@@ -237,6 +245,7 @@ class GovernanceIntegrator:
                 scanner = SecretScanner(
                     custom_patterns=custom_patterns,
                     allow_secrets=allow_secrets,
+                    cache_dir=self.secret_scan_cache_dir,
                 )
 
                 # Get exclude patterns from config
@@ -347,12 +356,13 @@ class GovernanceIntegrator:
         )
 
     def _run_policy_enforcement(
-        self, dbt_manifest: dict[str, Any] | None = None
+        self, dbt_manifest: dict[str, Any] | None = None, parallel: bool = False
     ) -> EnforcementResult:
         """Run policy enforcement with OpenTelemetry tracing.
 
         Args:
             dbt_manifest: dbt manifest.json for policy enforcement
+            parallel: If True, run policy validators concurrently
 
         Returns:
             EnforcementResult from policy enforcer
@@ -363,7 +373,7 @@ class GovernanceIntegrator:
 
             try:
                 enforcer = PolicyEnforcer(governance_config=self.governance_config)
-                result = enforcer.enforce(dbt_manifest or {})
+                result = enforcer.enforce(dbt_manifest or {}, parallel=parallel)
             except Exception as e:
                 result = EnforcementResult(
                     passed=False,
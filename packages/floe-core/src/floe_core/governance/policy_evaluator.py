@@ -16,7 +16,10 @@ Requirements:
 from __future__ import annotations
 
 import ast
+import functools
+import operator
 import re
+from collections.abc import Callable
 from typing import Any, Literal, cast
 
 import structlog
@@ -374,10 +377,16 @@ class PolicyEvaluator:
 class SafeConditionEvaluator:
     """Safe evaluator for custom condition expressions.
 
-    SafeConditionEvaluator parses and evaluates Python expressions using AST
-    to avoid the security risks of eval/exec. Only safe node types are allowed
+    SafeConditionEvaluator parses Python expressions using AST to avoid the
+    security risks of eval/exec. Only safe node types are allowed
     (comparisons, attribute access, method calls, literals, boolean operators).
 
+    The parsed AST is compiled once into a tree of closures, so evaluating a
+    condition against many models does not re-dispatch on node types.
+    Compiled conditions are cached per condition string and shared across
+    evaluator instances. Unsafe nodes compile to closures that raise
+    ValueError when reached, matching AST interpretation exactly.
+
     Attributes:
         condition: Python expression string to evaluate.
 
@@ -396,7 +405,7 @@ class SafeConditionEvaluator:
             condition: Python expression string to evaluate.
         """
         self.condition = condition
-        self._ast_tree = ast.parse(condition, mode="eval")
+        self._compiled = _compile_condition(condition)
 
     def evaluate(self, context: dict[str, Any]) -> bool:
         """Evaluate the condition expression in the given context.
@@ -411,117 +420,189 @@ class SafeConditionEvaluator:
         Raises:
             ValueError: If the condition contains unsafe AST nodes.
         """
-        result = self._eval_node(self._ast_tree.body, context)
-        return bool(result)
+        return bool(self._compiled(context))
 
-    def _eval_node(self, node: ast.AST, context: dict[str, Any]) -> Any:
-        """Recursively evaluate an AST node.
 
-        Args:
-            node: AST node to evaluate.
-            context: Variable context.
+# A compiled AST node: evaluates against the variable context
+_Compiled = Callable[[dict[str, Any]], Any]
 
-        Returns:
-            Result of evaluating the node.
+# Maximum number of distinct compiled conditions kept in memory
+_CONDITION_CACHE_SIZE = 1024
 
-        Raises:
-            ValueError: If node type is not allowed.
-        """
-        if isinstance(node, ast.Constant):
-            return node.value
-
-        elif isinstance(node, ast.Name):
-            # Only allow specific variable names
-            if node.id in context:
-                return context[node.id]
-            elif node.id in ("None", "True", "False"):
-                return {"None": None, "True": True, "False": False}[node.id]
-            else:
-                raise ValueError(f"Undefined variable: {node.id}")
-
-        elif isinstance(node, ast.Attribute):
-            # Evaluate the value (e.g., model.meta)
-            obj: Any = self._eval_node(node.value, context)
-            attr_name = node.attr
-            if isinstance(obj, dict):
-                return cast(dict[str, Any], obj).get(attr_name)
-            return getattr(obj, attr_name, None)
-
-        elif isinstance(node, ast.Call):
-            # Evaluate function calls (e.g., .get('owner'))
-            args = [self._eval_node(arg, context) for arg in node.args]
-
-            # Handle method calls like obj.get('key')
-            if isinstance(node.func, ast.Attribute):
-                call_obj: Any = self._eval_node(node.func.value, context)
-                method_name = node.func.attr
-
-                if isinstance(call_obj, dict) and method_name == "get":
-                    # Special handling for dict.get(key, default=None)
-                    typed_dict: dict[str, Any] = cast(dict[str, Any], call_obj)
-                    key: Any = args[0] if args else None
-                    default: Any = args[1] if len(args) > 1 else None
-                    return typed_dict.get(key, default)
-
-                # Try to call as a regular method
-                target: Any = cast(Any, call_obj)
-                if hasattr(target, method_name):
-                    method: Any = getattr(target, method_name)
-                    if callable(method):
-                        return method(*args)
-
-            # General callable (not a method)
-            func = self._eval_node(node.func, context)
-            if callable(func):
-                return func(*args)
+_COMPARISONS: dict[type[ast.cmpop], Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+_NAME_CONSTANTS: dict[str, Any] = {"None": None, "True": True, "False": False}
+
+
+@functools.lru_cache(maxsize=_CONDITION_CACHE_SIZE)
+def _compile_condition(condition: str) -> _Compiled:
+    """Parse and compile a condition expression, cached by condition string.
+
+    Args:
+        condition: Python expression string.
+
+    Returns:
+        Closure evaluating the expression against a variable context.
+
+    Raises:
+        SyntaxError: If the condition is not a valid Python expression.
+    """
+    return _compile_node(ast.parse(condition, mode="eval").body)
+
+
+def _raise(message: str) -> _Compiled:
+    """Compile a node that raises ValueError when evaluated."""
+
+    def run(_context: dict[str, Any]) -> Any:
+        raise ValueError(message)
+
+    return run
+
+
+def _compile_node(node: ast.AST) -> _Compiled:
+    """Compile a whitelisted AST node into a closure.
+
+    Args:
+        node: AST node to compile.
+
+    Returns:
+        Closure evaluating the node. Nodes outside the whitelist compile to
+        a closure raising ValueError.
+    """
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda _context: value
+
+    if isinstance(node, ast.Name):
+        return _compile_name(node.id)
+
+    if isinstance(node, ast.Attribute):
+        return _compile_attribute(_compile_node(node.value), node.attr)
+
+    if isinstance(node, ast.Call):
+        return _compile_call(node)
+
+    if isinstance(node, ast.Compare):
+        return _compile_compare(node)
+
+    if isinstance(node, ast.BoolOp):
+        values = [_compile_node(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda context: all(value(context) for value in values)
+        if isinstance(node.op, ast.Or):
+            return lambda context: any(value(context) for value in values)
+        return _raise(f"Unsupported boolean operator: {type(node.op).__name__}")
+
+    if isinstance(node, ast.UnaryOp):
+        if isinstance(node.op, ast.Not):
+            operand = _compile_node(node.operand)
+            return lambda context: not operand(context)
+        return _raise(f"Unsupported unary operator: {type(node.op).__name__}")
+
+    return _raise(f"Unsafe AST node type: {type(node).__name__}")
+
+
+def _compile_name(name: str) -> _Compiled:
+    """Compile a variable reference (context variables, then None/True/False)."""
+    constant = _NAME_CONSTANTS.get(name)
+    is_constant = name in _NAME_CONSTANTS
+
+    def run(context: dict[str, Any]) -> Any:
+        if name in context:
+            return context[name]
+        if is_constant:
+            return constant
+        raise ValueError(f"Undefined variable: {name}")
+
+    return run
+
+
+def _compile_attribute(value: _Compiled, attr_name: str) -> _Compiled:
+    """Compile attribute access; dictionaries are read by key."""
+
+    def run(context: dict[str, Any]) -> Any:
+        obj: Any = value(context)
+        if isinstance(obj, dict):
+            return cast(dict[str, Any], obj).get(attr_name)
+        return getattr(obj, attr_name, None)
+
+    return run
+
+
+def _compile_call(node: ast.Call) -> _Compiled:
+    """Compile a function or method call (e.g. ``model.meta.get('owner')``)."""
+    args = [_compile_node(arg) for arg in node.args]
+    func = _compile_node(node.func)
+
+    if not isinstance(node.func, ast.Attribute):
 
+        def call_function(context: dict[str, Any]) -> Any:
+            arg_values = [arg(context) for arg in args]
+            target = func(context)
+            if callable(target):
+                return target(*arg_values)
             raise ValueError("Calling non-callable")
 
-        elif isinstance(node, ast.Compare):
-            # Evaluate comparisons (e.g., x is not None, x > 5)
-            left = self._eval_node(node.left, context)
-            for op, comparator in zip(node.ops, node.comparators, strict=True):
-                right = self._eval_node(comparator, context)
-                if isinstance(op, ast.Eq):
-                    result = left == right
-                elif isinstance(op, ast.NotEq):
-                    result = left != right
-                elif isinstance(op, ast.Lt):
-                    result = left < right
-                elif isinstance(op, ast.LtE):
-                    result = left <= right
-                elif isinstance(op, ast.Gt):
-                    result = left > right
-                elif isinstance(op, ast.GtE):
-                    result = left >= right
-                elif isinstance(op, ast.Is):
-                    result = left is right
-                elif isinstance(op, ast.IsNot):
-                    result = left is not right
-                elif isinstance(op, ast.In):
-                    result = left in right
-                elif isinstance(op, ast.NotIn):
-                    result = left not in right
-                else:
-                    raise ValueError(f"Unsupported comparison operator: {type(op).__name__}")
-                if not result:
-                    return False
-                left = right
-            return True
-
-        elif isinstance(node, ast.BoolOp):
-            # Evaluate boolean operators (and, or)
-            if isinstance(node.op, ast.And):
-                return all(self._eval_node(value, context) for value in node.values)
-            elif isinstance(node.op, ast.Or):
-                return any(self._eval_node(value, context) for value in node.values)
-            raise ValueError(f"Unsupported boolean operator: {type(node.op).__name__}")
-
-        elif isinstance(node, ast.UnaryOp):
-            # Evaluate unary operators (not)
-            if isinstance(node.op, ast.Not):
-                return not self._eval_node(node.operand, context)
-            raise ValueError(f"Unsupported unary operator: {type(node.op).__name__}")
-
-        else:
-            raise ValueError(f"Unsafe AST node type: {type(node).__name__}")
+        return call_function
+
+    method_owner = _compile_node(node.func.value)
+    method_name = node.func.attr
+
+    def call_method(context: dict[str, Any]) -> Any:
+        arg_values = [arg(context) for arg in args]
+        call_obj: Any = method_owner(context)
+
+        if isinstance(call_obj, dict) and method_name == "get":
+            # Special handling for dict.get(key, default=None)
+            typed_dict: dict[str, Any] = cast(dict[str, Any], call_obj)
+            key: Any = arg_values[0] if arg_values else None
+            default: Any = arg_values[1] if len(arg_values) > 1 else None
+            return typed_dict.get(key, default)
+
+        # Try to call as a regular method
+        target: Any = cast(Any, call_obj)
+        if hasattr(target, method_name):
+            method: Any = getattr(target, method_name)
+            if callable(method):
+                return method(*arg_values)
+
+        # General callable (not a method)
+        resolved = func(context)
+        if callable(resolved):
+            return resolved(*arg_values)
+        raise ValueError("Calling non-callable")
+
+    return call_method
+
+
+def _compile_compare(node: ast.Compare) -> _Compiled:
+    """Compile a (possibly chained) comparison such as ``x is not None``."""
+    left = _compile_node(node.left)
+    steps: list[tuple[Callable[[Any, Any], Any] | None, str, _Compiled]] = [
+        (_COMPARISONS.get(type(op)), type(op).__name__, _compile_node(comparator))
+        for op, comparator in zip(node.ops, node.comparators, strict=True)
+    ]
+
+    def run(context: dict[str, Any]) -> Any:
+        left_value = left(context)
+        for compare, op_name, comparator in steps:
+            right_value = comparator(context)
+            if compare is None:
+                raise ValueError(f"Unsupported comparison operator: {op_name}")
+            if not compare(left_value, right_value):
+                return False
+            left_value = right_value
+        return True
+
+    return run
@@ -9,8 +9,15 @@ plugin that detects hardcoded secrets using regex patterns. It supports:
 - High-entropy strings — E605
 - Custom user-defined patterns — E6XX
 
+All patterns are compiled once per scanner. A combined alternation of every
+pattern (one named group per pattern) pre-screens each line, so the common
+case of a line matching nothing costs a single regex search. Directory scans
+prune excluded and vendored directories before descending, skip binary
+files, scan files on a thread pool, and can reuse findings for unchanged
+files from an on-disk cache keyed by file content hash.
+
 Requirements:
-    - FR-008: Built-in regex patterns
+    - FR-008: Built-in patterns
     - FR-010: Exclude patterns support
     - FR-011: Custom pattern support
     - FR-012: SecretFinding with file location
@@ -19,14 +26,22 @@ Requirements:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import math
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
+
+import structlog
 
 from floe_core.governance.types import SecretFinding, SecretPattern
 from floe_core.plugins.secret_scanner import SecretScannerPlugin
 
+logger = structlog.get_logger(__name__)
+
 # Built-in pattern definitions
 _BUILTIN_PATTERNS: list[tuple[str, str, str]] = [
     # (pattern_name, regex, error_code)
@@ -52,10 +67,32 @@ _BUILTIN_PATTERNS: list[tuple[str, str, str]] = [
     ),
 ]
 
+# Candidate strings for high-entropy detection
+_ENTROPY_REGEX = r"""=\s*['"]([\w/+=]{20,})['\"]"""
+_ENTROPY_PATTERN = re.compile(_ENTROPY_REGEX)
+
 # Shannon entropy threshold for high-entropy detection
 _ENTROPY_THRESHOLD = 4.0
 _ENTROPY_MIN_LENGTH = 20
 
+# Directories holding generated or vendored files, never descended into
+DEFAULT_EXCLUDED_DIRS: frozenset[str] = frozenset(
+    {".git", "target", "dbt_packages", "node_modules", "__pycache__", ".venv"}
+)
+
+# Bytes inspected for a NUL byte when deciding whether a file is binary
+_BINARY_SNIFF_BYTES = 8192
+
+# Bump when findings for identical content could change
+_CACHE_FORMAT_VERSION = "1"
+
+# Leading global inline flags, e.g. "(?i)", which must become scoped flags
+# once a pattern is embedded in the combined alternation
+_GLOBAL_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+# Group references that change meaning once groups are renumbered
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
 
 def _shannon_entropy(data: str) -> float:
     """Calculate Shannon entropy of a string.
@@ -75,6 +112,42 @@ def _shannon_entropy(data: str) -> float:
     return -sum((count / length) * math.log2(count / length) for count in freq.values())
 
 
+def _scoped(regex: str) -> str:
+    """Wrap a pattern so it can be embedded in an alternation.
+
+    Args:
+        regex: Standalone regular expression.
+
+    Returns:
+        The pattern as a group, with leading global flags made local.
+    """
+    match = _GLOBAL_FLAGS.match(regex)
+    if match:
+        return f"(?{match.group(1)}:{regex[match.end() :]})"
+    return f"(?:{regex})"
+
+
+def _directory_pattern(pattern: str) -> str | None:
+    """Return the directory glob of an explicit directory exclude pattern.
+
+    "build/" and "vendor/**" name whole directories and become "build" and
+    "vendor". Any other pattern (e.g. "tests/*") returns None: it only
+    excludes the files it matches, so no directory can be pruned for it.
+    """
+    if pattern.endswith("/**"):
+        stripped = pattern[: -len("/**")]
+    elif pattern.endswith("/"):
+        stripped = pattern.rstrip("/")
+    else:
+        return None
+    return stripped or None
+
+
+def _is_binary(data: bytes) -> bool:
+    """Return True if file content looks binary (NUL byte near the start)."""
+    return b"\0" in data[:_BINARY_SNIFF_BYTES]
+
+
 class BuiltinSecretScanner(SecretScannerPlugin):
     """Built-in regex-based secret scanner.
 
@@ -85,6 +158,10 @@ class BuiltinSecretScanner(SecretScannerPlugin):
     Args:
         custom_patterns: Additional custom patterns to detect.
         allow_secrets: When True, downgrade severity to 'warning'.
+        cache_dir: Directory for the findings cache. When None, every file
+            is scanned on every scan_directory call.
+        max_workers: Threads used by scan_directory. Defaults to the
+            ThreadPoolExecutor default.
 
     Example:
         >>> scanner = BuiltinSecretScanner()
@@ -95,15 +172,58 @@ class BuiltinSecretScanner(SecretScannerPlugin):
         self,
         custom_patterns: list[SecretPattern] | None = None,
         allow_secrets: bool = False,
+        *,
+        cache_dir: Path | None = None,
+        max_workers: int | None = None,
     ) -> None:
         """Initialize scanner with optional custom patterns.
 
         Args:
             custom_patterns: Additional regex patterns to detect.
             allow_secrets: Downgrade all findings to warnings.
+            cache_dir: Directory for the findings cache, or None to disable.
+            max_workers: Threads used by scan_directory.
         """
         self._custom_patterns = custom_patterns or []
         self._allow_secrets = allow_secrets
+        self._cache_dir = cache_dir
+        self._max_workers = max_workers
+
+        # (pattern_name, error_code, compiled) in reporting order
+        self._patterns: list[tuple[str, str, re.Pattern[str]]] = [
+            (name, code, re.compile(regex)) for name, regex, code in _BUILTIN_PATTERNS
+        ]
+        self._patterns.extend(
+            (custom.name, custom.error_code, re.compile(custom.regex))
+            for custom in self._custom_patterns
+        )
+        self._combined, self._unscreened = self._build_screen()
+
+    def _build_screen(self) -> tuple[re.Pattern[str] | None, list[int]]:
+        """Build the combined pre-screening alternation.
+
+        Patterns using group references cannot be renumbered into the
+        alternation; they are returned separately and run on every line.
+
+        Returns:
+            Tuple of (combined pattern or None, indices of unscreened patterns).
+        """
+        alternatives: list[str] = []
+        unscreened: list[int] = []
+        regexes = [regex for _, regex, _ in _BUILTIN_PATTERNS]
+        regexes.extend(custom.regex for custom in self._custom_patterns)
+        for index, regex in enumerate(regexes):
+            if _GROUP_REFERENCE.search(regex):
+                unscreened.append(index)
+            else:
+                alternatives.append(f"(?P<p{index}>{_scoped(regex)})")
+        alternatives.append(f"(?P<entropy>{_ENTROPY_REGEX})")
+
+        try:
+            return re.compile("|".join(alternatives)), unscreened
+        except re.error as exc:
+            logger.debug("secret_scan_screen_disabled", error=str(exc))
+            return None, list(range(len(self._patterns)))
 
     @property
     def name(self) -> str:
@@ -124,7 +244,8 @@ class BuiltinSecretScanner(SecretScannerPlugin):
         """Scan a single file for secrets.
 
         Applies built-in patterns and custom patterns to each line.
-        Optionally checks for high-entropy strings.
+        Optionally checks for high-entropy strings. Findings are ordered by
+        pattern (built-in, custom, high entropy), then by line.
 
         Args:
             file_path: Path to the file being scanned.
@@ -133,68 +254,50 @@ class BuiltinSecretScanner(SecretScannerPlugin):
         Returns:
             List of SecretFinding instances for detected secrets.
         """
-        findings: list[SecretFinding] = []
-        lines = content.split("\n")
         severity: Literal["error", "warning"] = "warning" if self._allow_secrets else "error"
+        # One bucket per pattern plus a trailing bucket for high entropy
+        buckets: list[list[SecretFinding]] = [[] for _ in range(len(self._patterns) + 1)]
+        all_patterns: range | list[int] = range(len(self._patterns))
+
+        def record(
+            bucket: int, pattern_name: str, error_code: str, line_idx: int, line: str
+        ) -> None:
+            buckets[bucket].append(
+                SecretFinding(
+                    file_path=str(file_path),
+                    line_number=line_idx,
+                    pattern_name=pattern_name,
+                    error_code=error_code,
+                    matched_content=line.strip(),
+                    severity=severity,
+                    allow_secrets=self._allow_secrets,
+                )
+            )
+
+        for line_idx, line in enumerate(content.split("\n"), start=1):
+            if self._combined is None or self._combined.search(line):
+                indices, check_entropy = all_patterns, True
+            elif self._unscreened:
+                indices, check_entropy = self._unscreened, False
+            else:
+                continue
 
-        # Check built-in patterns
-        for pattern_name, regex, error_code in _BUILTIN_PATTERNS:
-            compiled = re.compile(regex)
-            for line_idx, line in enumerate(lines, start=1):
-                match = compiled.search(line)
-                if match:
-                    findings.append(
-                        SecretFinding(
-                            file_path=str(file_path),
-                            line_number=line_idx,
-                            pattern_name=pattern_name,
-                            error_code=error_code,
-                            matched_content=line.strip(),
-                            severity=severity,
-                            allow_secrets=self._allow_secrets,
-                        )
-                    )
-
-        # Check custom patterns
-        for custom in self._custom_patterns:
-            compiled = re.compile(custom.regex)
-            for line_idx, line in enumerate(lines, start=1):
-                match = compiled.search(line)
-                if match:
-                    findings.append(
-                        SecretFinding(
-                            file_path=str(file_path),
-                            line_number=line_idx,
-                            pattern_name=custom.name,
-                            error_code=custom.error_code,
-                            matched_content=line.strip(),
-                            severity=severity,
-                            allow_secrets=self._allow_secrets,
-                        )
-                    )
-
-        # Check high-entropy strings
-        for line_idx, line in enumerate(lines, start=1):
-            entropy_match = re.search(r"""=\s*['"]([\w/+=]{20,})['\"]""", line)
-            if entropy_match:
-                candidate = entropy_match.group(1)
-                if (
-                    len(candidate) >= _ENTROPY_MIN_LENGTH
-                    and _shannon_entropy(candidate) >= _ENTROPY_THRESHOLD
-                ):
-                    findings.append(
-                        SecretFinding(
-                            file_path=str(file_path),
-                            line_number=line_idx,
-                            pattern_name="high_entropy",
-                            error_code="E605",
-                            matched_content=line.strip(),
-                            severity=severity,
-                            allow_secrets=self._allow_secrets,
-                        )
-                    )
+            for index in indices:
+                pattern_name, error_code, compiled = self._patterns[index]
+                if compiled.search(line):
+                    record(index, pattern_name, error_code, line_idx, line)
 
-        return findings
+            if check_entropy:
+                entropy_match = _ENTROPY_PATTERN.search(line)
+                if entropy_match:
+                    candidate = entropy_match.group(1)
+                    if (
+                        len(candidate) >= _ENTROPY_MIN_LENGTH
+                        and _shannon_entropy(candidate) >= _ENTROPY_THRESHOLD
+                    ):
+                        record(len(self._patterns), "high_entropy", "E605", line_idx, line)
+
+        return [finding for bucket in buckets for finding in bucket]
 
     def scan_directory(
         self,
@@ -204,36 +307,151 @@ class BuiltinSecretScanner(SecretScannerPlugin):
         """Scan a directory tree for secrets.
 
         Walks the directory tree, applies exclude patterns, and scans
-        each file for secrets.
+        each file for secrets. Directories in DEFAULT_EXCLUDED_DIRS, and
+        directories matching an explicit directory pattern (one ending in
+        "/" or "/**", e.g. "build/" or "vendor/**"), are not descended
+        into. Other patterns are matched against each file path. Binary
+        files and files that are not UTF-8 are skipped.
 
         Args:
             directory: Root directory to scan.
             exclude_patterns: Glob patterns to exclude from scanning.
 
         Returns:
-            List of secret findings across all scanned files.
+            List of secret findings across all scanned files, ordered by path.
         """
+        files = self._collect_files(directory, exclude_patterns or [])
+        cached = self._load_cache()
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = list(
+                executor.map(lambda path: self._scan_path(directory, path, cached), files)
+            )
+
         findings: list[SecretFinding] = []
-        exclude = exclude_patterns or []
+        entries: dict[str, list[dict[str, Any]]] = {}
+        for file_findings, content_hash in results:
+            findings.extend(file_findings)
+            if content_hash is not None:
+                entries[content_hash] = [
+                    finding.model_dump(exclude={"file_path"}) for finding in file_findings
+                ]
+
+        self._save_cache(entries)
+        logger.debug(
+            "secret_scan_completed",
+            files_scanned=len(files),
+            cache_hits=sum(1 for key in entries if key in cached),
+            findings=len(findings),
+        )
+        return findings
 
-        for file_path in directory.rglob("*"):
-            if not file_path.is_file():
-                continue
+    def _collect_files(self, directory: Path, exclude: list[str]) -> list[Path]:
+        """List files to scan, pruning excluded directories before descending.
 
-            # Check exclude patterns
-            relative = str(file_path.relative_to(directory))
-            if any(file_path.match(pattern) for pattern in exclude):
-                continue
+        Args:
+            directory: Root directory to scan.
+            exclude: Glob patterns to exclude.
 
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, PermissionError):
-                continue
+        Returns:
+            Sorted file paths not matching any exclude pattern.
+        """
+        dir_patterns = [
+            dir_pattern
+            for dir_pattern in (_directory_pattern(pattern) for pattern in exclude)
+            if dir_pattern is not None
+        ]
+        files: list[Path] = []
+        for root, dir_names, file_names in os.walk(directory):
+            root_path = Path(root)
+            dir_names[:] = sorted(
+                name
+                for name in dir_names
+                if name not in DEFAULT_EXCLUDED_DIRS
+                and not any((root_path / name).match(pattern) for pattern in dir_patterns)
+            )
+            for file_name in sorted(file_names):
+                file_path = root_path / file_name
+                if not any(file_path.match(pattern) for pattern in exclude):
+                    files.append(file_path)
+        return files
+
+    def _scan_path(
+        self,
+        directory: Path,
+        file_path: Path,
+        cached: dict[str, list[dict[str, Any]]],
+    ) -> tuple[list[SecretFinding], str | None]:
+        """Read and scan one file, reusing cached findings for unchanged content.
 
-            file_findings = self.scan_file(Path(relative), content)
-            findings.extend(file_findings)
+        Args:
+            directory: Root directory of the scan.
+            file_path: File to scan.
+            cached: Cached findings keyed by content hash.
 
-        return findings
+        Returns:
+            Tuple of (findings, content hash). The hash is None for files
+            that were skipped.
+        """
+        try:
+            data = file_path.read_bytes()
+        except OSError:
+            return [], None
+        if _is_binary(data):
+            return [], None
+        try:
+            content = data.decode("utf-8")
+        except UnicodeDecodeError:
+            return [], None
+
+        relative = str(file_path.relative_to(directory))
+        content_hash = hashlib.sha256(data).hexdigest()
+        entry = cached.get(content_hash)
+        if entry is not None:
+            return [SecretFinding(file_path=relative, **item) for item in entry], content_hash
+        return self.scan_file(Path(relative), content), content_hash
+
+    def _cache_path(self) -> Path | None:
+        """Return the cache file for this scanner configuration."""
+        if self._cache_dir is None:
+            return None
+        hasher = hashlib.sha256()
+        for part in (
+            f"format:{_CACHE_FORMAT_VERSION}",
+            f"scanner:{self.name}=={self.version}",
+            f"allow-secrets:{self._allow_secrets}",
+            f"entropy:{_ENTROPY_REGEX}:{_ENTROPY_THRESHOLD}:{_ENTROPY_MIN_LENGTH}",
+            *(f"{name}:{code}:{compiled.pattern}" for name, code, compiled in self._patterns),
+        ):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        return self._cache_dir / f"findings-{hasher.hexdigest()[:16]}.json"
+
+    def _load_cache(self) -> dict[str, list[dict[str, Any]]]:
+        """Load cached findings; a missing or unreadable cache is empty."""
+        cache_path = self._cache_path()
+        if cache_path is None or not cache_path.exists():
+            return {}
+        try:
+            data = json.loads(cache_path.read_text())
+        except (OSError, ValueError) as exc:
+            logger.warning("secret_scan_cache_invalid", error=type(exc).__name__)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_cache(self, entries: dict[str, list[dict[str, Any]]]) -> None:
+        """Persist findings for the files seen in this scan (best-effort)."""
+        cache_path = self._cache_path()
+        if cache_path is None:
+            return
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(entries))
+            os.replace(temp_path, cache_path)
+        except OSError as exc:
+            logger.warning("secret_scan_cache_write_failed", error=type(exc).__name__)
+            temp_path.unlink(missing_ok=True)
 
     def get_supported_patterns(self) -> list[str]:
         """Return names of patterns this scanner detects.
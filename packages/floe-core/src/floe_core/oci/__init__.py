@@ -81,7 +81,7 @@ from floe_core.oci.auth import (
 )
 
 # Cache manager (T010)
-from floe_core.oci.cache import CacheManager
+from floe_core.oci.cache import CacheManager, CacheRefresher, WarmResult
 
 # Client (T012)
 from floe_core.oci.client import OCIClient
@@ -132,8 +132,15 @@ from floe_core.oci.metrics import (
     set_oci_metrics,
 )
 
+# Layer packing (compression and section splitting)
+from floe_core.oci.packing import (
+    pack_artifacts,
+    unpack_layers,
+)
+
 # Promotion (Epic 8C)
 from floe_core.oci.promotion import PromotionController
+from floe_core.oci.registry_sync import RegistrySyncEngine
 
 # Resilience patterns (T008, T009)
 from floe_core.oci.resilience import (
@@ -158,6 +165,7 @@ from floe_core.oci.signing import (
     SigningClient,
     SigningError,
     sign_artifact,
+    sign_artifacts,
 )
 
 # Verification (Epic 8B)
@@ -206,6 +214,8 @@ __all__: list[str] = [
     "with_resilience",
     # Cache (T010)
     "CacheManager",
+    "CacheRefresher",
+    "WarmResult",
     # Metrics (T011)
     "OCIMetrics",
     "CircuitBreakerStateValue",
@@ -233,6 +243,9 @@ __all__: list[str] = [
     "parse_created_timestamp",
     "parse_layers",
     "parse_manifest_response",
+    # Layer packing
+    "pack_artifacts",
+    "unpack_layers",
     # Configuration schemas
     "RegistryConfig",
     "CacheConfig",
@@ -243,6 +256,7 @@ __all__: list[str] = [
     "SigningError",
     "OIDCTokenError",
     "sign_artifact",
+    "sign_artifacts",
     "ANNOTATION_BUNDLE",
     "ANNOTATION_MODE",
     "ANNOTATION_ISSUER",
@@ -274,4 +288,5 @@ __all__: list[str] = [
     "retrieve_sbom",
     # Promotion (Epic 8C)
     "PromotionController",
+    "RegistrySyncEngine",
 ]
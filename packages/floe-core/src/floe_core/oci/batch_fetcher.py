@@ -1,6 +1,6 @@
 """Batch fetcher for parallel OCI manifest retrieval.
 
-This module provides the _BatchFetcher class for parallel HTTP requests to OCI
+This module provides the BatchFetcher class for parallel HTTP requests to OCI
 registries, fixing the N+1 query pattern in OCIClient.list().
 
 Requirements: FR-005
@@ -10,6 +10,13 @@ Task: T012
 The batch fetcher uses concurrent.futures.ThreadPoolExecutor to fetch multiple
 manifests in parallel, reducing list() latency from O(n) to O(n/workers).
 
+Concurrency is governed by an AdaptiveConcurrencyLimiter (AIMD): the number
+of in-flight requests grows by roughly one per round trip while latency stays
+near the observed baseline, shrinks when latency climbs, and halves on 429
+or 5xx responses. Retry-After is honored by pausing dispatch, and throttled
+tags are retried. Results can be consumed as they complete via
+iter_manifests(), so callers can stream output and stop early.
+
 Example:
     >>> from floe_core.oci.batch_fetcher import BatchFetcher
     >>> from oras.client import OrasClient
@@ -19,13 +26,19 @@ Example:
     ...     oras_client=oras_client,
     ...     tag_refs=[("v1.0.0", "registry/repo:v1.0.0"), ...],
     ... )
-    >>> for tag, manifest in results.items():
+    >>> for tag, manifest in results.manifests.items():
     ...     print(f"{tag}: {manifest['digest']}")
 """
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -43,6 +56,251 @@ DEFAULT_MAX_WORKERS = 10
 MAX_WORKERS_LIMIT = 20
 """Maximum allowed workers to prevent overwhelming registries."""
 
+DEFAULT_LATENCY_TOLERANCE = 2.0
+"""Latency above this multiple of the baseline is treated as congestion."""
+
+LATENCY_DECREASE_FACTOR = 0.9
+"""Multiplicative decrease applied to the limit on congested latency."""
+
+THROTTLE_DECREASE_FACTOR = 0.5
+"""Multiplicative decrease applied to the limit on 429/5xx responses."""
+
+MAX_RETRY_AFTER_SECONDS = 60.0
+"""Upper bound on how long a Retry-After header can pause dispatch."""
+
+DEFAULT_THROTTLE_RETRIES = 3
+"""Times a tag is re-queued after a 429/503 response before failing."""
+
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+"""Statuses after which a tag is re-queued rather than reported as failed."""
+
+_BASELINE_DRIFT = 0.01
+"""Fraction the latency baseline moves toward slower samples, so it can recover."""
+
+_MIN_BASELINE_SECONDS = 0.01
+"""Floor for the latency baseline, so sub-millisecond mocks do not look congested."""
+
+_DISPATCH_POLL_SECONDS = 0.05
+"""How often the dispatcher rechecks the limiter while waiting."""
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP-date.
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit driven by latency and registry throttling.
+
+    Each completed request adjusts the limit:
+
+    - Latency within DEFAULT_LATENCY_TOLERANCE x baseline: additive increase
+      of 1/limit, i.e. about +1 per round trip of the whole window.
+    - Latency above that: multiplicative decrease (LATENCY_DECREASE_FACTOR).
+    - 429 or 5xx: multiplicative decrease (THROTTLE_DECREASE_FACTOR), and a
+      pause of Retry-After seconds before any new request is dispatched.
+
+    The baseline is the lowest latency seen, drifting slowly toward slower
+    samples so a registry that becomes permanently slower is not throttled
+    to the minimum forever.
+
+    Thread Safety:
+        All methods are thread-safe. One limiter may be shared by several
+        BatchFetcher calls against the same registry.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=20)
+        >>> if limiter.try_acquire():
+        ...     limiter.release(0.12)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_MAX_WORKERS,
+        *,
+        min_limit: int = 1,
+        max_limit: int = MAX_WORKERS_LIMIT,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+    ) -> None:
+        """Initialize AdaptiveConcurrencyLimiter.
+
+        Args:
+            initial_limit: Starting concurrency, clamped to [min_limit, max_limit].
+            min_limit: Lowest concurrency the limiter will shrink to.
+            max_limit: Highest concurrency the limiter will grow to.
+            latency_tolerance: Multiple of the baseline latency above which a
+                request counts as congested.
+
+        Raises:
+            ValueError: If the limits or tolerance are invalid.
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError(
+                f"Invalid limits: min_limit={min_limit}, max_limit={max_limit} "
+                "(need 1 <= min_limit <= max_limit)"
+            )
+        if latency_tolerance <= 1.0:
+            raise ValueError(f"latency_tolerance must be > 1.0, got {latency_tolerance}")
+
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_tolerance = latency_tolerance
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._baseline: float | None = None
+        self._backoff_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """Return the current concurrency limit."""
+        with self._lock:
+            return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        """Return the highest concurrency the limiter will grow to."""
+        return self._max_limit
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently admitted."""
+        with self._lock:
+            return self._in_flight
+
+    def backoff_remaining(self) -> float:
+        """Return seconds left in a Retry-After pause (0 if none)."""
+        with self._lock:
+            return max(0.0, self._backoff_until - time.monotonic())
+
+    def try_acquire(self) -> bool:
+        """Admit one request if the limit and any Retry-After pause allow it.
+
+        Returns:
+            True if admitted; the caller must then call release().
+        """
+        with self._lock:
+            if time.monotonic() < self._backoff_until:
+                return False
+            if self._in_flight >= int(self._limit):
+                return False
+            self._in_flight += 1
+            return True
+
+    def cancel(self) -> None:
+        """Return a slot admitted for a request that never ran.
+
+        Unlike release(), the limit is left unchanged since no latency
+        was observed.
+        """
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def release(
+        self,
+        latency: float,
+        *,
+        throttled: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
+        """Record a finished request and adjust the limit.
+
+        Args:
+            latency: Request duration in seconds.
+            throttled: True if the registry answered 429 or 5xx.
+            retry_after: Seconds from a Retry-After header, if any.
+        """
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            previous = int(self._limit)
+
+            if throttled:
+                self._limit = max(float(self._min_limit), self._limit * THROTTLE_DECREASE_FACTOR)
+                if retry_after:
+                    pause = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+                    self._backoff_until = max(self._backoff_until, time.monotonic() + pause)
+            else:
+                if self._baseline is None or latency < self._baseline:
+                    self._baseline = latency
+                else:
+                    self._baseline += (latency - self._baseline) * _BASELINE_DRIFT
+                threshold = self._latency_tolerance * max(self._baseline, _MIN_BASELINE_SECONDS)
+                if latency > threshold:
+                    self._limit = max(float(self._min_limit), self._limit * LATENCY_DECREASE_FACTOR)
+                else:
+                    self._limit = min(float(self._max_limit), self._limit + 1.0 / self._limit)
+
+            current = int(self._limit)
+
+        if current != previous:
+            logger.debug(
+                "batch_fetch_limit_changed",
+                previous=previous,
+                limit=current,
+                throttled=throttled,
+                retry_after=retry_after,
+            )
+
+
+# Last HTTP response seen by the current worker thread's ORAS session.
+# oras-py raises plain ValueErrors that drop the status code, so a session
+# response hook records it here for throttle detection.
+_response_state = threading.local()
+
+
+def _record_response(response: Any, *args: Any, **kwargs: Any) -> None:
+    """requests response hook storing status and Retry-After per thread."""
+    _response_state.status_code = getattr(response, "status_code", None)
+    headers = getattr(response, "headers", None) or {}
+    _response_state.retry_after = headers.get("Retry-After")
+
+
+def _observe_responses(client: Any) -> None:
+    """Install the response hook on a client's requests session (idempotent)."""
+    hooks = getattr(getattr(client, "session", None), "hooks", None)
+    if not isinstance(hooks, dict):
+        return
+    response_hooks = hooks.setdefault("response", [])
+    if isinstance(response_hooks, list) and _record_response not in response_hooks:
+        response_hooks.append(_record_response)
+
+
+def _throttle_info(error: Exception) -> tuple[int | None, float | None]:
+    """Return (status_code, retry_after) for a failed request.
+
+    Prefers a response attached to the exception (requests.HTTPError),
+    falling back to the last response recorded on this thread.
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        headers = getattr(response, "headers", None) or {}
+        return status, parse_retry_after(headers.get("Retry-After"))
+    status = getattr(_response_state, "status_code", None)
+    if isinstance(status, int) and status >= 400:
+        return status, parse_retry_after(getattr(_response_state, "retry_after", None))
+    return None, None
+
 
 class BatchFetchError(Exception):
     """Error during batch manifest fetching.
@@ -50,17 +308,30 @@ class BatchFetchError(Exception):
     Attributes:
         tag: The tag that failed to fetch.
         cause: The underlying exception.
+        status_code: HTTP status of the failed request, if known.
+        retry_after: Seconds from the response's Retry-After header, if any.
     """
 
-    def __init__(self, tag: str, cause: Exception) -> None:
+    def __init__(
+        self,
+        tag: str,
+        cause: Exception,
+        *,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
         """Initialize BatchFetchError.
 
         Args:
             tag: The tag that failed to fetch.
             cause: The underlying exception.
+            status_code: HTTP status of the failed request, if known.
+            retry_after: Seconds from the response's Retry-After header, if any.
         """
         self.tag = tag
         self.cause = cause
+        self.status_code = status_code
+        self.retry_after = retry_after
         super().__init__(f"Failed to fetch manifest for tag '{tag}': {cause}")
 
 
@@ -118,7 +389,8 @@ class BatchFetcher:
     """Parallel manifest fetcher using ThreadPoolExecutor.
 
     Fetches multiple OCI manifests concurrently to avoid N+1 query patterns.
-    Uses ThreadPoolExecutor for I/O-bound parallel HTTP requests.
+    Uses ThreadPoolExecutor for I/O-bound parallel HTTP requests, with an
+    AdaptiveConcurrencyLimiter deciding how many requests are in flight.
 
     Thread Safety:
         This class is thread-safe. Multiple threads can call fetch_manifests()
@@ -134,19 +406,37 @@ class BatchFetcher:
         ...     print(f"{tag}: fetched successfully")
     """
 
-    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        *,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        max_throttle_retries: int = DEFAULT_THROTTLE_RETRIES,
+    ) -> None:
         """Initialize BatchFetcher.
 
         Args:
             max_workers: Maximum number of parallel workers.
                 Capped at MAX_WORKERS_LIMIT to prevent overwhelming registries.
-                Defaults to DEFAULT_MAX_WORKERS (10).
+                Defaults to DEFAULT_MAX_WORKERS (10). Ignored when limiter
+                is given.
+            limiter: Optional shared limiter, e.g. one per registry client so
+                the learned limit carries across calls. Defaults to a limiter
+                starting at, and never exceeding, max_workers.
+            max_throttle_retries: Times a tag answered with 429/503 is
+                re-queued before it is reported as failed.
         """
-        # Cap workers to prevent overwhelming registries
-        self._max_workers = min(max_workers, MAX_WORKERS_LIMIT)
+        if limiter is None:
+            # Cap workers to prevent overwhelming registries
+            capped = min(max_workers, MAX_WORKERS_LIMIT)
+            limiter = AdaptiveConcurrencyLimiter(initial_limit=capped, max_limit=capped)
+        self._limiter = limiter
+        self._max_workers = limiter.max_limit
+        self._max_throttle_retries = max_throttle_retries
         logger.debug(
             "batch_fetcher_initialized",
             max_workers=self._max_workers,
+            initial_limit=limiter.limit,
         )
 
     @property
@@ -154,10 +444,17 @@ class BatchFetcher:
         """Return the maximum number of worker threads."""
         return self._max_workers
 
+    @property
+    def limiter(self) -> AdaptiveConcurrencyLimiter:
+        """Return the concurrency limiter governing this fetcher."""
+        return self._limiter
+
     def fetch_manifests(
         self,
         oras_client: OrasClient,
         tag_refs: list[tuple[str, str]],
+        *,
+        client_factory: Callable[[], OrasClient] | None = None,
     ) -> BatchFetchResult:
         """Fetch manifests for multiple tags in parallel.
 
@@ -169,6 +466,10 @@ class BatchFetcher:
             tag_refs: List of (tag_name, target_ref) tuples.
                 - tag_name: Human-readable tag (e.g., "v1.0.0")
                 - target_ref: Full OCI reference (e.g., "registry/repo:v1.0.0")
+            client_factory: Optional callable returning the calling thread's
+                ORAS client (e.g., OCIClient._create_oras_client backed by the
+                registry connection pool). When given, each worker uses its own
+                pooled client instead of sharing oras_client across threads.
 
         Returns:
             BatchFetchResult containing successfully fetched manifests and errors.
@@ -185,14 +486,54 @@ class BatchFetcher:
         """
         result = BatchFetchResult()
 
+        for tag_name, outcome in self.iter_manifests(
+            oras_client, tag_refs, client_factory=client_factory
+        ):
+            if isinstance(outcome, Exception):
+                result.add_error(tag_name, outcome)
+            else:
+                result.add_manifest(tag_name, outcome)
+
+        return result
+
+    def iter_manifests(
+        self,
+        oras_client: OrasClient,
+        tag_refs: list[tuple[str, str]],
+        *,
+        client_factory: Callable[[], OrasClient] | None = None,
+    ) -> Generator[tuple[str, dict[str, Any] | Exception], None, None]:
+        """Fetch manifests in parallel, yielding each as it completes.
+
+        Requests are dispatched as the limiter admits them. Tags answered with
+        429/503 are re-queued (up to max_throttle_retries) after any
+        Retry-After pause. Closing the iterator early cancels requests that
+        have not started.
+
+        Args:
+            oras_client: Authenticated ORAS client for registry operations.
+            tag_refs: List of (tag_name, target_ref) tuples.
+            client_factory: Optional callable returning the calling thread's
+                ORAS client (see fetch_manifests()).
+
+        Yields:
+            (tag_name, manifest_data) on success, or (tag_name, exception)
+            with the underlying error on failure, in completion order.
+
+        Example:
+            >>> for tag, outcome in fetcher.iter_manifests(client, tag_refs):
+            ...     if not isinstance(outcome, Exception):
+            ...         print(tag)
+        """
         if not tag_refs:
-            return result
+            return
 
         log = logger.bind(
             total_tags=len(tag_refs),
             max_workers=self._max_workers,
         )
-        log.debug("batch_fetch_started")
+        log.debug("batch_fetch_started", initial_limit=self._limiter.limit)
+        limiter = self._limiter
 
         def _fetch_single(tag_name: str, target_ref: str) -> tuple[str, dict[str, Any]]:
             """Fetch a single manifest (executed in thread pool).
@@ -207,54 +548,104 @@ class BatchFetcher:
             Raises:
                 BatchFetchError: If fetch fails.
             """
+            start = time.monotonic()
+            _response_state.status_code = None
+            _response_state.retry_after = None
             try:
-                manifest_data = oras_client.get_manifest(container=target_ref)
-                return tag_name, manifest_data
+                worker_client = client_factory() if client_factory is not None else oras_client
+                _observe_responses(worker_client)
+                manifest_data = worker_client.get_manifest(container=target_ref)
             except Exception as e:
-                raise BatchFetchError(tag_name, e) from e
-
-        # Use ThreadPoolExecutor for parallel I/O
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            # Submit all fetch tasks
-            future_to_tag = {
-                executor.submit(_fetch_single, tag_name, target_ref): tag_name
-                for tag_name, target_ref in tag_refs
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_tag):
-                tag_name = future_to_tag[future]
-                try:
-                    _, manifest_data = future.result()
-                    result.add_manifest(tag_name, manifest_data)
-                except BatchFetchError as e:
-                    result.add_error(tag_name, e.cause)
-                    log.warning(
-                        "batch_fetch_tag_failed",
-                        tag=tag_name,
-                        error=str(e.cause),
-                    )
-                except Exception as e:
-                    result.add_error(tag_name, e)
-                    log.warning(
-                        "batch_fetch_tag_failed",
-                        tag=tag_name,
-                        error=str(e),
-                    )
-
-        log.debug(
-            "batch_fetch_completed",
-            successful=result.successful_tags,
-            failed=result.failed_tags,
-        )
-
-        return result
+                status, retry_after = _throttle_info(e)
+                throttled = status is not None and (status == 429 or status >= 500)
+                limiter.release(
+                    time.monotonic() - start, throttled=throttled, retry_after=retry_after
+                )
+                raise BatchFetchError(
+                    tag_name, e, status_code=status, retry_after=retry_after
+                ) from e
+            limiter.release(time.monotonic() - start)
+            return tag_name, manifest_data
+
+        queue: deque[tuple[str, str]] = deque(tag_refs)
+        attempts: dict[str, int] = {}
+        pending: dict[Future[tuple[str, dict[str, Any]]], tuple[str, str]] = {}
+        successful = failed = 0
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            while queue or pending:
+                while queue and limiter.try_acquire():
+                    tag_ref = queue.popleft()
+                    pending[executor.submit(_fetch_single, *tag_ref)] = tag_ref
+
+                if not pending:
+                    # Paused by Retry-After, or the shared limit is used elsewhere
+                    time.sleep(max(limiter.backoff_remaining(), _DISPATCH_POLL_SECONDS))
+                    continue
+
+                done, _ = wait(pending, timeout=_DISPATCH_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    tag_ref = pending.pop(future)
+                    tag_name = tag_ref[0]
+                    try:
+                        _, manifest_data = future.result()
+                    except BatchFetchError as e:
+                        attempts[tag_name] = attempts.get(tag_name, 0) + 1
+                        if (
+                            e.status_code in RETRYABLE_STATUS_CODES
+                            and attempts[tag_name] <= self._max_throttle_retries
+                        ):
+                            log.debug(
+                                "batch_fetch_tag_throttled",
+                                tag=tag_name,
+                                status_code=e.status_code,
+                                retry_after=e.retry_after,
+                            )
+                            queue.append(tag_ref)
+                            continue
+                        failed += 1
+                        log.warning(
+                            "batch_fetch_tag_failed",
+                            tag=tag_name,
+                            error=str(e.cause),
+                        )
+                        yield tag_name, e.cause
+                    except Exception as e:
+                        failed += 1
+                        log.warning(
+                            "batch_fetch_tag_failed",
+                            tag=tag_name,
+                            error=str(e),
+                        )
+                        yield tag_name, e
+                    else:
+                        successful += 1
+                        yield tag_name, manifest_data
+        finally:
+            # Early close: drop queued work; running requests finish and release
+            cancelled = len(queue)
+            for future in pending:
+                if future.cancel():
+                    limiter.cancel()
+                    cancelled += 1
+            executor.shutdown(wait=False)
+            log.debug(
+                "batch_fetch_completed",
+                successful=successful,
+                failed=failed,
+                cancelled=cancelled,
+                final_limit=limiter.limit,
+            )
 
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "BatchFetcher",
     "BatchFetchError",
     "BatchFetchResult",
     "DEFAULT_MAX_WORKERS",
     "MAX_WORKERS_LIMIT",
+    "RETRYABLE_STATUS_CODES",
+    "parse_retry_after",
 ]
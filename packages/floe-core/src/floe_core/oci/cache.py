@@ -1,11 +1,14 @@
 """Local cache manager for OCI artifacts.
 
 This module implements file-based caching for pulled OCI artifacts with
-TTL-based expiry for mutable tags and LRU eviction when size limits are exceeded.
+TTL-based expiry for mutable tags and size-weighted eviction when size limits
+are exceeded.
 
 Cache Structure:
     /var/cache/floe/oci/
-    ├── index.json                    # Cache index with metadata
+    ├── index.db                      # Cache index (SQLite, WAL mode)
+    ├── .tmp/                         # Blobs being written by put()
+    ├── .trash/                       # Evicted blobs awaiting deletion
     ├── sha256/
     │   └── abc123.../                # Content-addressed by digest
     │       ├── manifest.json         # OCI manifest
@@ -25,9 +28,39 @@ Cache Policies:
     | latest-*    | 24h (configurable) | On expiry |
     | Other       | 24h (configurable) | On expiry |
 
-Eviction Policy: LRU (Least Recently Used) when cache exceeds max_size
-
-Thread Safety: File locking via fcntl.flock() to prevent corruption
+Eviction Policy: When the cache exceeds max_size, gc() removes expired
+entries and entries superseded by a newer pull of the same mutable tag, then
+evicts by a size-weighted LRU/LFU score (size x idle time / (1 + hits)) until
+the cache is below 90% of max_size. A large, idle, rarely used artifact goes
+before many small, popular ones. The current entry of a mutable tag that was
+accessed within the last hour is pinned and never evicted for size.
+
+Maintenance: gc() deletes index rows in short SQLite transactions, holds the
+file lock only to move blob directories into a trash directory, and deletes
+them after releasing it. put() writes blobs to a temporary file before taking
+the lock. Readers never take the lock, and a reader racing an eviction sees
+a cache miss.
+
+Index: Entries live in an SQLite database in WAL mode, indexed by digest and
+by (tag, registry), so a lookup reads one row and readers never block each
+other or a writer. Access times and hit counts are recorded in memory and
+written in batches rather than on every hit. An index.json left by older
+releases is imported on first use.
+
+Verification: Cached blobs are memory-mapped and hashed in fixed-size chunks.
+Blobs whose file (inode, mtime, size) is unchanged since a recent successful
+verification are not re-hashed. Successful signature verification results
+are also kept in the index (see VerificationClient), keyed by artifact,
+signature, policy, and trust root, so a policy or key change never hits.
+
+Thread Safety: SQLite transactions guard the index; file locking via
+fcntl.flock() serializes writers that create or delete blob directories
+
+Warm-up: warm() fills the cache ahead of time from a fetch callable with
+bounded parallelism. Tags that are already cached are skipped, so an
+interrupted warm-up resumes where it stopped, and a mutable tag whose
+content is already stored only has its expiry extended. CacheRefresher
+re-runs a warm-up on an interval to keep mutable tags fresh.
 
 Example:
     >>> from floe_core.oci.cache import CacheManager
@@ -59,11 +92,18 @@ from __future__ import annotations
 import fcntl
 import hashlib
 import json
+import mmap
 import os
 import re
 import shutil
-from contextlib import contextmanager
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -72,13 +112,90 @@ from floe_core.oci.errors import CacheError
 from floe_core.schemas.oci import CacheConfig, CacheEntry, CacheIndex
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator, Iterable
+
+    from floe_core.oci.metrics import OCIMetrics
 
 logger = structlog.get_logger(__name__)
 
 # Bytes per gigabyte for size calculations
 BYTES_PER_GB = 1024 * 1024 * 1024
 
+# Seconds a connection waits for another process's write transaction
+_BUSY_TIMEOUT_SECONDS = 30.0
+
+# Pending access times and hit counts are written once this many accumulate...
+_TOUCH_FLUSH_SIZE = 64
+# ...or once this many seconds have passed since the last write
+_TOUCH_FLUSH_INTERVAL_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    digest TEXT PRIMARY KEY,
+    tag TEXT NOT NULL,
+    registry TEXT NOT NULL,
+    pulled_at TEXT NOT NULL,
+    expires_at TEXT,
+    size INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    last_accessed TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_tag_registry ON entries (tag, registry);
+CREATE INDEX IF NOT EXISTS entries_last_accessed ON entries (last_accessed);
+CREATE TABLE IF NOT EXISTS verified (
+    digest TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    verified_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS verification_results (
+    cache_key TEXT PRIMARY KEY,
+    artifact_digest TEXT NOT NULL,
+    policy_hash TEXT NOT NULL,
+    trust_root TEXT NOT NULL,
+    result TEXT NOT NULL,
+    expires_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verification_results_digest
+    ON verification_results (artifact_digest);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Bytes hashed per step when verifying a cached blob
+_VERIFY_CHUNK_SIZE = 1024 * 1024
+
+# An unchanged blob is re-hashed once its last verification is this old
+_REVERIFY_INTERVAL = timedelta(hours=24)
+
+_COLUMNS = "digest, tag, registry, pulled_at, expires_at, size, path, last_accessed"
+
+# gc() evicts until the cache is at most this fraction of max_size
+_GC_LOW_WATER = 0.9
+
+# Entries gc() evicts per index transaction
+_GC_BATCH_SIZE = 256
+
+# A mutable tag's current entry accessed this recently is never evicted for size
+_PIN_WINDOW = timedelta(hours=1)
+
+# Idle time (days) added to every entry's eviction score so size still counts
+# for entries accessed moments ago
+_MIN_IDLE_DAYS = 1.0 / 1440
+
+# Leftover temporary blobs older than this are deleted by gc()
+_STALE_TEMP_SECONDS = 3600.0
+
+# Default number of tags warm() fetches at once
+DEFAULT_WARM_WORKERS = 4
+
+# Default seconds between CacheRefresher passes
+DEFAULT_REFRESH_INTERVAL_SECONDS = 300.0
+
 
 def _is_semver(tag: str) -> bool:
     """Check if tag follows semver pattern (immutable)."""
@@ -95,6 +212,73 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _entry_from_row(row: sqlite3.Row | tuple[Any, ...]) -> CacheEntry:
+    """Build a CacheEntry from an ``entries`` row (in _COLUMNS order)."""
+    digest, tag, registry, pulled_at, expires_at, size, path, last_accessed = row
+    return CacheEntry(
+        digest=digest,
+        tag=tag,
+        registry=registry,
+        pulled_at=datetime.fromisoformat(pulled_at),
+        expires_at=datetime.fromisoformat(expires_at) if expires_at else None,
+        size=size,
+        path=Path(path),
+        last_accessed=datetime.fromisoformat(last_accessed),
+    )
+
+
+def _entry_to_row(entry: CacheEntry) -> tuple[Any, ...]:
+    """Serialize a CacheEntry to an ``entries`` row (in _COLUMNS order)."""
+    return (
+        entry.digest,
+        entry.tag,
+        entry.registry,
+        entry.pulled_at.isoformat(),
+        entry.expires_at.isoformat() if entry.expires_at else None,
+        entry.size,
+        str(entry.path),
+        entry.last_accessed.isoformat(),
+    )
+
+
+def _view_digest(view: memoryview) -> str:
+    """Compute the OCI digest of a buffer in fixed-size chunks."""
+    hasher = hashlib.sha256()
+    for offset in range(0, len(view), _VERIFY_CHUNK_SIZE):
+        with view[offset : offset + _VERIFY_CHUNK_SIZE] as chunk:
+            hasher.update(chunk)
+    return f"sha256:{hasher.hexdigest()}"
+
+
+class WarmResult:
+    """Result of a cache warm-up.
+
+    Attributes:
+        fetched: Tags downloaded from the registry and stored.
+        renewed: Mutable tags whose content was already stored; only their
+            expiry was extended.
+        cached: Tags that were already cached and fresh.
+        errors: Dictionary mapping tags to the error that occurred.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty WarmResult."""
+        self.fetched: list[str] = []
+        self.renewed: list[str] = []
+        self.cached: list[str] = []
+        self.errors: dict[str, Exception] = {}
+
+    @property
+    def total_tags(self) -> int:
+        """Return total number of tags attempted."""
+        return len(self.fetched) + len(self.renewed) + len(self.cached) + len(self.errors)
+
+    @property
+    def failed_tags(self) -> int:
+        """Return number of tags that failed to warm."""
+        return len(self.errors)
+
+
 class CacheManager:
     """Local cache manager for OCI artifacts.
 
@@ -106,7 +290,8 @@ class CacheManager:
     - TTL-based expiry for mutable tags
     - Indefinite caching for immutable tags (semver, digests)
     - LRU eviction when cache exceeds max_size
-    - Thread-safe index updates via file locking
+    - Indexed lookups by digest and by (registry, tag) in a WAL-mode SQLite index
+    - Batched LRU access-time updates
 
     Example:
         >>> config = CacheConfig(path=Path("/var/cache/floe/oci"), max_size_gb=10)
@@ -129,26 +314,57 @@ class CacheManager:
         config: CacheConfig with path, max_size_gb, ttl_hours settings.
     """
 
-    def __init__(self, config: CacheConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: CacheConfig | None = None,
+        *,
+        metrics: OCIMetrics | None = None,
+    ) -> None:
         """Initialize CacheManager.
 
         Args:
             config: Cache configuration. Uses defaults if None.
+            metrics: Optional OCIMetrics that evictions, lock waits, and
+                cache size and hit ratio are reported to.
 
         Raises:
-            CacheError: If cache directory cannot be created.
+            CacheError: If cache directory or index cannot be created.
         """
         self._config = config or CacheConfig()
-        self._index_path = self._config.path / "index.json"
+        self._metrics = metrics
+        self._db_path = self._config.path / "index.db"
+        self._legacy_index_path = self._config.path / "index.json"
         self._blobs_path = self._config.path / "sha256"
         self._tags_path = self._config.path / "tags"
+        self._tmp_path = self._config.path / ".tmp"
+        self._trash_path = self._config.path / ".trash"
         self._lock_path = self._config.path / ".lock"
 
+        # Per-thread SQLite connections (connections are not shareable)
+        self._local = threading.local()
+        # Deferred touches: digest -> (last_accessed, hits since last flush)
+        self._pending_touches: dict[str, tuple[datetime, int]] = {}
+        self._touch_lock = threading.Lock()
+        self._last_touch_flush = time.monotonic()
+
+        # In-process counters reported by stats()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "entries_evicted": 0,
+            "bytes_evicted": 0,
+            "lock_acquisitions": 0,
+        }
+        self._lock_wait_seconds = 0.0
+        self._counters_lock = threading.Lock()
+
         # Ensure cache directories exist
         try:
             self._config.path.mkdir(parents=True, exist_ok=True)
             self._blobs_path.mkdir(parents=True, exist_ok=True)
             self._tags_path.mkdir(parents=True, exist_ok=True)
+            self._tmp_path.mkdir(parents=True, exist_ok=True)
+            self._trash_path.mkdir(parents=True, exist_ok=True)
         except OSError as e:
             raise CacheError(
                 "init",
@@ -156,6 +372,9 @@ class CacheManager:
                 str(self._config.path),
             ) from e
 
+        if self.enabled:
+            self._init_index()
+
     @property
     def config(self) -> CacheConfig:
         """Return cache configuration."""
@@ -170,7 +389,11 @@ class CacheManager:
         """Retrieve a cached artifact entry.
 
         Checks if an artifact is in the cache and returns its metadata.
-        Updates last_accessed time for LRU tracking.
+        Records the access and counts a hit or miss for stats(); access
+        times and hit counts are written to the index in batches.
+
+        When several digests were cached under the same mutable tag, the
+        most recently pulled one is returned.
 
         Args:
             registry: OCI registry URI.
@@ -187,35 +410,36 @@ class CacheManager:
         if not self.enabled:
             return None
 
-        with self._lock():
-            index = self._load_index()
-
-            # Find entry by registry and tag
-            for entry in index.entries.values():
-                if entry.registry == registry and entry.tag == tag:
-                    if entry.is_expired:
-                        logger.debug(
-                            "cache_expired",
-                            registry=registry,
-                            tag=tag,
-                            expires_at=(entry.expires_at.isoformat() if entry.expires_at else None),
-                        )
-                        return None
-
-                    # Update last_accessed for LRU
-                    entry.touch()
-                    self._save_index(index)
-
-                    logger.debug(
-                        "cache_hit",
-                        registry=registry,
-                        tag=tag,
-                        digest=entry.digest,
-                    )
-                    return entry
+        row = self._query_one(
+            f"SELECT {_COLUMNS} FROM entries WHERE tag = ? AND registry = ? "
+            "ORDER BY pulled_at DESC LIMIT 1",
+            (tag, registry),
+        )
+        if row is None:
+            self._count("misses")
+            logger.debug("cache_miss", registry=registry, tag=tag)
+            return None
 
-        logger.debug("cache_miss", registry=registry, tag=tag)
-        return None
+        entry = _entry_from_row(row)
+        if entry.is_expired:
+            self._count("misses")
+            logger.debug(
+                "cache_expired",
+                registry=registry,
+                tag=tag,
+                expires_at=(entry.expires_at.isoformat() if entry.expires_at else None),
+            )
+            return None
+
+        self._count("hits")
+        self._touch(entry)
+        logger.debug(
+            "cache_hit",
+            registry=registry,
+            tag=tag,
+            digest=entry.digest,
+        )
+        return entry
 
     def get_by_digest(self, digest: str) -> CacheEntry | None:
         """Retrieve a cached artifact by digest.
@@ -229,13 +453,12 @@ class CacheManager:
         if not self.enabled:
             return None
 
-        with self._lock():
-            index = self._load_index()
-            entry = index.entries.get(digest)
-            if entry:
-                entry.touch()
-                self._save_index(index)
-            return entry
+        row = self._query_one(f"SELECT {_COLUMNS} FROM entries WHERE digest = ?", (digest,))
+        if row is None:
+            return None
+        entry = _entry_from_row(row)
+        self._touch(entry)
+        return entry
 
     def get_with_content(self, registry: str, tag: str) -> tuple[CacheEntry, bytes] | None:
         """Retrieve a cached artifact with verified content.
@@ -261,58 +484,108 @@ class CacheManager:
             ...     entry, content = result
             ...     process(content)
         """
+        with self.open_content(registry, tag) as cached:
+            if cached is None:
+                return None
+            entry, view = cached
+            return (entry, view.tobytes())
+
+    @contextmanager
+    def open_content(
+        self, registry: str, tag: str
+    ) -> Generator[tuple[CacheEntry, memoryview] | None, None, None]:
+        """Open a cached artifact as a verified, read-only memory map.
+
+        The content is exposed as a memoryview over the mapped blob, so it
+        is never copied into process memory; the view is valid only inside
+        the ``with`` block. The digest is verified by hashing the mapped
+        file in chunks, unless the blob is unchanged since a recent
+        verification. If content is corrupted or unreadable, the entry is
+        removed from the cache. An entry evicted by gc() between the lookup
+        and the read is treated as a cache miss.
+
+        Args:
+            registry: OCI registry URI.
+            tag: Artifact tag or digest.
+
+        Yields:
+            Tuple of (CacheEntry, content view) if found and valid,
+            None if not in cache.
+
+        Raises:
+            DigestMismatchError: If content does not match stored digest.
+
+        Example:
+            >>> with manager.open_content(registry, "v1.0.0") as cached:
+            ...     if cached:
+            ...         entry, view = cached
+            ...         destination.write(view)
+        """
         from floe_core.oci.errors import DigestMismatchError
 
         entry = self.get(registry, tag)
         if entry is None:
-            return None
+            yield None
+            return
 
-        # Read and verify content
-        try:
-            content = entry.path.read_bytes()
-        except OSError as e:
-            logger.warning(
-                "cache_read_failed",
-                registry=registry,
-                tag=tag,
-                digest=entry.digest,
-                error=str(e),
-            )
-            # Remove corrupted entry
-            self.remove(entry.digest)
-            raise DigestMismatchError(
-                expected=entry.digest,
-                actual="<read_error>",
-                artifact_ref=tag,
-            ) from e
+        with ExitStack() as stack:
+            try:
+                view, stat = self._map_blob(entry, stack)
+            except OSError as e:
+                if isinstance(e, FileNotFoundError) and not self._has_entry(entry.digest):
+                    evicted = True
+                else:
+                    logger.warning(
+                        "cache_read_failed",
+                        registry=registry,
+                        tag=tag,
+                        digest=entry.digest,
+                        error=str(e),
+                    )
+                    # Remove corrupted entry
+                    self.remove(entry.digest)
+                    raise DigestMismatchError(
+                        expected=entry.digest,
+                        actual="<read_error>",
+                        artifact_ref=tag,
+                    ) from e
+            else:
+                evicted = False
+
+            if evicted:
+                # Removed by gc() after the lookup
+                logger.debug("cache_evicted_during_read", registry=registry, tag=tag)
+                yield None
+                return
+
+            if not self._recently_verified(entry.digest, stat):
+                computed_digest = _view_digest(view)
+                if computed_digest != entry.digest:
+                    logger.error(
+                        "cache_corruption_detected",
+                        registry=registry,
+                        tag=tag,
+                        expected_digest=entry.digest,
+                        actual_digest=computed_digest,
+                    )
+                    # Release the mapping before deleting the blob
+                    stack.close()
+                    self.remove(entry.digest)
+                    raise DigestMismatchError(
+                        expected=entry.digest,
+                        actual=computed_digest,
+                        artifact_ref=tag,
+                    )
+                self._record_verified(entry.digest, stat)
 
-        # Verify digest
-        computed_digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
-        if computed_digest != entry.digest:
-            logger.error(
-                "cache_corruption_detected",
+            logger.debug(
+                "cache_hit_verified",
                 registry=registry,
                 tag=tag,
-                expected_digest=entry.digest,
-                actual_digest=computed_digest,
-            )
-            # Remove corrupted entry
-            self.remove(entry.digest)
-            raise DigestMismatchError(
-                expected=entry.digest,
-                actual=computed_digest,
-                artifact_ref=tag,
+                digest=entry.digest,
+                size=len(view),
             )
-
-        logger.debug(
-            "cache_hit_verified",
-            registry=registry,
-            tag=tag,
-            digest=entry.digest,
-            size=len(content),
-        )
-
-        return (entry, content)
+            yield entry, view
 
     def put(
         self,
@@ -360,23 +633,19 @@ class CacheManager:
                 str(self._config.path),
             )
 
-        # Determine expiry
-        expires_at: datetime | None = None
-        if not (_is_semver(tag) or _is_digest(tag)):
-            # Mutable tag - set TTL
-            expires_at = _utc_now() + timedelta(hours=self._config.ttl_hours)
+        expires_at = self._expiry_for(tag)
 
-        # Create blob directory
         digest_short = digest.replace("sha256:", "")
         blob_dir = self._blobs_path / digest_short
         blob_path = blob_dir / "blob"
 
-        with self._lock():
-            try:
+        # Write content outside the lock; only the rename is serialized
+        tmp_path = self._tmp_path / f"{digest_short}.{uuid.uuid4().hex}"
+        try:
+            tmp_path.write_bytes(content)
+            with self._lock():
                 blob_dir.mkdir(parents=True, exist_ok=True)
-
-                # Write content
-                blob_path.write_bytes(content)
+                os.replace(tmp_path, blob_path)
 
                 # Write manifest if provided
                 if manifest:
@@ -397,30 +666,119 @@ class CacheManager:
                 )
 
                 # Update index
-                index = self._load_index()
-                index.add_entry(entry)
-                self._save_index(index)
+                with self._transaction() as conn:
+                    conn.execute(
+                        f"INSERT OR REPLACE INTO entries ({_COLUMNS}) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        _entry_to_row(entry),
+                    )
+                    self._mark_updated(conn)
+        except OSError as e:
+            raise CacheError(
+                "put",
+                f"Failed to write cache entry: {e}",
+                str(blob_path),
+            ) from e
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
-                logger.info(
-                    "cache_put",
-                    registry=registry,
-                    tag=tag,
-                    digest=digest,
-                    size=len(content),
-                    expires_at=expires_at.isoformat() if expires_at else None,
-                )
+        logger.info(
+            "cache_put",
+            registry=registry,
+            tag=tag,
+            digest=digest,
+            size=len(content),
+            expires_at=expires_at.isoformat() if expires_at else None,
+        )
 
-                # Check if eviction needed
-                self._maybe_evict(index)
+        # Check if eviction needed (runs without holding the lock)
+        self._maybe_evict()
 
-                return entry
+        return entry
 
-            except OSError as e:
-                raise CacheError(
-                    "put",
-                    f"Failed to write cache entry: {e}",
-                    str(blob_path),
-                ) from e
+    def warm(
+        self,
+        registry: str,
+        tags: Iterable[str],
+        fetch: Callable[[str], tuple[bytes, str]],
+        *,
+        resolve: Callable[[str], str | None] | None = None,
+        max_workers: int = DEFAULT_WARM_WORKERS,
+        refresh_within: timedelta | None = None,
+    ) -> WarmResult:
+        """Fill the cache for several tags ahead of time.
+
+        Tags are warmed concurrently, at most max_workers at a time. A tag
+        that is already cached and fresh is skipped, so re-running an
+        interrupted warm-up only fetches what is still missing. For other
+        tags, resolve (if given) looks up the content digest cheaply; when
+        that content is already stored, the tag is re-pointed at it and its
+        expiry extended instead of downloading it again. Otherwise fetch
+        downloads the content, which is stored with put().
+
+        Failures are recorded per tag and do not stop the other tags.
+
+        Args:
+            registry: OCI registry URI the tags belong to.
+            tags: Tags to warm.
+            fetch: Called with a tag; returns (content bytes, digest).
+            resolve: Optional callable returning a tag's content digest
+                without downloading the content (None if unknown).
+            max_workers: Maximum number of tags warmed at once.
+            refresh_within: Also revalidate mutable entries that expire
+                within this window. None only warms missing or expired tags.
+
+        Returns:
+            WarmResult describing what happened to each tag.
+
+        Raises:
+            CacheError: If caching is disabled.
+            ValueError: If max_workers is less than 1.
+
+        Example:
+            >>> result = manager.warm(
+            ...     "oci://harbor.example.com/floe",
+            ...     ["v1.0.0-prod", "latest-prod"],
+            ...     fetch=client_fetch,
+            ... )
+            >>> print(f"{len(result.fetched)} fetched, {result.failed_tags} failed")
+        """
+        if not self.enabled:
+            raise CacheError("warm", "Caching is disabled", str(self._config.path))
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        result = WarmResult()
+        pending = list(dict.fromkeys(tags))
+        if not pending:
+            return result
+
+        outcomes = {"fetched": result.fetched, "renewed": result.renewed, "cached": result.cached}
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pending)),
+            thread_name_prefix="floe-cache-warm",
+        ) as executor:
+            futures = {
+                executor.submit(self._warm_tag, registry, tag, fetch, resolve, refresh_within): tag
+                for tag in pending
+            }
+            for future in as_completed(futures):
+                tag = futures[future]
+                try:
+                    outcomes[future.result()].append(tag)
+                except Exception as e:
+                    logger.warning("cache_warm_failed", registry=registry, tag=tag, error=str(e))
+                    result.errors[tag] = e
+
+        logger.info(
+            "cache_warm_completed",
+            registry=registry,
+            fetched=len(result.fetched),
+            renewed=len(result.renewed),
+            cached=len(result.cached),
+            failed=result.failed_tags,
+        )
+        return result
 
     def remove(self, digest: str) -> bool:
         """Remove an artifact from the cache.
@@ -434,22 +792,11 @@ class CacheManager:
         if not self.enabled:
             return False
 
-        with self._lock():
-            index = self._load_index()
-            entry = index.remove_entry(digest)
-
-            if entry:
-                # Remove blob directory
-                digest_short = digest.replace("sha256:", "")
-                blob_dir = self._blobs_path / digest_short
-                if blob_dir.exists():
-                    shutil.rmtree(blob_dir, ignore_errors=True)
-
-                self._save_index(index)
-                logger.info("cache_remove", digest=digest)
-                return True
-
-        return False
+        if not self._delete_entries([digest]):
+            return False
+        self._discard_blobs([digest])
+        logger.info("cache_remove", digest=digest)
+        return True
 
     def clear(self) -> None:
         """Clear all cached artifacts.
@@ -471,8 +818,13 @@ class CacheManager:
                 self._tags_path.mkdir(parents=True, exist_ok=True)
 
             # Reset index
-            index = CacheIndex()
-            self._save_index(index)
+            with self._touch_lock:
+                self._pending_touches.clear()
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM entries")
+                conn.execute("DELETE FROM verified")
+                conn.execute("DELETE FROM verification_results")
+                self._mark_updated(conn)
 
             logger.info("cache_cleared")
 
@@ -485,52 +837,143 @@ class CacheManager:
         if not self.enabled:
             return 0
 
-        removed = 0
-        with self._lock():
-            index = self._load_index()
-            expired = index.get_expired_entries()
-
-            for entry in expired:
-                if index.remove_entry(entry.digest):
-                    # Remove blob
-                    digest_short = entry.digest.replace("sha256:", "")
-                    blob_dir = self._blobs_path / digest_short
-                    if blob_dir.exists():
-                        shutil.rmtree(blob_dir, ignore_errors=True)
-                    removed += 1
-
-            if removed > 0:
-                self._save_index(index)
-                logger.info("cache_cleanup_expired", removed=removed)
+        removed, _ = self._evict_rows(self._expired_rows(), reason="expired")
+        if removed > 0:
+            logger.info("cache_cleanup_expired", removed=removed)
 
         return removed
 
+    def gc(self) -> dict[str, int]:
+        """Run a maintenance pass over the cache.
+
+        Removes expired entries and entries superseded by a newer pull of
+        the same mutable tag. If the cache is still larger than max_size,
+        evicts entries with the highest size x idle time / (1 + hits)
+        score until it is below 90% of max_size, skipping the current
+        entry of any mutable tag accessed within the last hour.
+
+        Index rows are deleted in short transactions and blob directories
+        are deleted outside the cache lock, so readers and put() are not
+        blocked while gc() runs. Safe to run concurrently from several
+        processes.
+
+        Returns:
+            Dictionary with the number of expired, superseded, and evicted
+            entries removed, the bytes freed, and the remaining size and
+            entry count.
+
+        Example:
+            >>> result = manager.gc()
+            >>> result["freed_bytes"]
+            1073741824
+        """
+        result = {
+            "expired": 0,
+            "superseded": 0,
+            "evicted": 0,
+            "freed_bytes": 0,
+            "remaining_bytes": 0,
+            "remaining_entries": 0,
+        }
+        if not self.enabled:
+            return result
+
+        # Pending touches decide which entries are pinned and which go first
+        self.flush_access_times()
+        now = _utc_now()
+
+        result["expired"], freed = self._evict_rows(self._expired_rows(), reason="expired")
+        result["freed_bytes"] += freed
+
+        superseded = self._query_all(
+            "SELECT digest, pulled_at, size FROM entries AS old "
+            "WHERE expires_at IS NOT NULL AND EXISTS ("
+            "SELECT 1 FROM entries AS new WHERE new.tag = old.tag "
+            "AND new.registry = old.registry AND new.pulled_at > old.pulled_at)"
+        )
+        result["superseded"], freed = self._evict_rows(superseded, reason="superseded")
+        result["freed_bytes"] += freed
+
+        max_bytes = self._config.max_size_gb * BYTES_PER_GB
+        total_size, _ = self._index_size()
+        if total_size > max_bytes:
+            target = int(max_bytes * _GC_LOW_WATER)
+            pin_cutoff = (now - _PIN_WINDOW).isoformat()
+            while total_size > target:
+                rows = self._query_all(
+                    "SELECT digest, pulled_at, size FROM entries "
+                    "WHERE expires_at IS NULL OR last_accessed < ? "
+                    "ORDER BY size * (julianday(?) - julianday(last_accessed) + ?) "
+                    "/ (1 + hits) DESC LIMIT ?",
+                    (pin_cutoff, now.isoformat(), _MIN_IDLE_DAYS, _GC_BATCH_SIZE),
+                )
+                victims: list[tuple[Any, ...]] = []
+                planned = total_size
+                for row in rows:
+                    if planned <= target:
+                        break
+                    victims.append(row)
+                    planned -= row[2]
+                evicted, freed = self._evict_rows(victims, reason="size")
+                if evicted == 0:
+                    # Everything left is pinned, or other processes got there first
+                    break
+                result["evicted"] += evicted
+                result["freed_bytes"] += freed
+                total_size, _ = self._index_size()
+
+        self._purge_scratch()
+
+        result["remaining_bytes"], result["remaining_entries"] = self._index_size()
+        if self._metrics is not None:
+            self._metrics.set_cache_stats(
+                result["remaining_bytes"],
+                result["remaining_entries"],
+                hit_ratio=self._hit_ratio(),
+            )
+        logger.info("cache_gc", **result)
+        return result
+
     def stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
+        Hits, misses, hit ratio, evictions, and lock wait time are counted
+        by this CacheManager since it was created; the other stats cover
+        the whole cache.
+
         Returns:
             Dictionary with entry count, total size, and other stats.
         """
-        with self._lock():
-            index = self._load_index()
-
-            immutable_count = sum(1 for e in index.entries.values() if e.is_immutable)
-            mutable_count = len(index.entries) - immutable_count
-            expired_count = len(index.get_expired_entries())
-
-            return {
-                "enabled": self.enabled,
-                "path": str(self._config.path),
-                "max_size_gb": self._config.max_size_gb,
-                "ttl_hours": self._config.ttl_hours,
-                "entry_count": len(index.entries),
-                "immutable_count": immutable_count,
-                "mutable_count": mutable_count,
-                "expired_count": expired_count,
-                "total_size_bytes": index.total_size,
-                "total_size_gb": index.total_size / BYTES_PER_GB,
-                "last_updated": index.last_updated.isoformat(),
-            }
+        entry_count = 0
+        immutable_count = 0
+        total_size = 0
+        last_updated = _utc_now()
+        expired_count = 0
+        if self.enabled:
+            row = self._query_one(
+                "SELECT COUNT(*), COUNT(*) - COUNT(expires_at), COALESCE(SUM(size), 0) FROM entries"
+            )
+            if row is not None:
+                entry_count, immutable_count, total_size = row
+            updated = self._query_one("SELECT value FROM meta WHERE key = 'last_updated'")
+            if updated is not None:
+                last_updated = datetime.fromisoformat(updated[0])
+            expired_count = len(self._expired_entries())
+
+        return {
+            "enabled": self.enabled,
+            "path": str(self._config.path),
+            "max_size_gb": self._config.max_size_gb,
+            "ttl_hours": self._config.ttl_hours,
+            "entry_count": entry_count,
+            "immutable_count": immutable_count,
+            "mutable_count": entry_count - immutable_count,
+            "expired_count": expired_count,
+            "total_size_bytes": total_size,
+            "total_size_gb": total_size / BYTES_PER_GB,
+            "last_updated": last_updated.isoformat(),
+            **self._process_stats(),
+        }
 
     def get_entries_by_tag(self, tag: str) -> list[CacheEntry]:
         """Get all cache entries matching a specific tag.
@@ -544,116 +987,552 @@ class CacheManager:
         if not self.enabled:
             return []
 
-        with self._lock():
-            index = self._load_index()
-            return [e for e in index.entries.values() if e.tag == tag]
+        rows = self._query_all(f"SELECT {_COLUMNS} FROM entries WHERE tag = ?", (tag,))
+        return [_entry_from_row(row) for row in rows]
 
-    def _maybe_evict(self, index: CacheIndex) -> None:
-        """Evict entries if cache exceeds max size.
+    def get_verification(self, cache_key: str) -> str | None:
+        """Return a cached signature verification result.
 
-        Uses LRU (Least Recently Used) policy for immutable entries.
-        Mutable entries are subject to TTL expiry.
+        Args:
+            cache_key: Key from VerificationClient (artifact, signature,
+                policy, and trust root digests).
+
+        Returns:
+            Serialized VerificationResult JSON, or None if absent or expired.
+        """
+        if not self.enabled:
+            return None
+
+        row = self._query_one(
+            "SELECT result FROM verification_results WHERE cache_key = ? AND expires_at > ?",
+            (cache_key, _utc_now().isoformat()),
+        )
+        return None if row is None else str(row[0])
+
+    def put_verification(
+        self,
+        cache_key: str,
+        *,
+        artifact_digest: str,
+        policy_hash: str,
+        trust_root: str,
+        result: str,
+        ttl_seconds: int,
+    ) -> None:
+        """Store a signature verification result.
+
+        Results for the same artifact under a different policy or trust
+        root are dropped, as are expired results.
 
         Args:
-            index: Current cache index (already locked).
+            cache_key: Key from VerificationClient.
+            artifact_digest: SHA256 digest of the verified content.
+            policy_hash: Digest of the verification policy in effect.
+            trust_root: Fingerprint of the key or trust root used.
+            result: Serialized VerificationResult JSON.
+            ttl_seconds: Seconds the result may be reused.
         """
-        max_bytes = self._config.max_size_gb * BYTES_PER_GB
+        if not self.enabled:
+            return
+
+        now = _utc_now()
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM verification_results WHERE expires_at <= ? OR "
+                "(artifact_digest = ? AND (policy_hash != ? OR trust_root != ?))",
+                (now.isoformat(), artifact_digest, policy_hash, trust_root),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO verification_results "
+                "(cache_key, artifact_digest, policy_hash, trust_root, result, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    artifact_digest,
+                    policy_hash,
+                    trust_root,
+                    result,
+                    (now + timedelta(seconds=ttl_seconds)).isoformat(),
+                ),
+            )
+
+    def flush_access_times(self) -> None:
+        """Write pending access times and hit counts to the index.
 
-        if index.total_size <= max_bytes:
+        Called automatically when enough accesses accumulate, by gc(), and
+        by close(). Pending accesses only affect eviction order, so losing
+        them (e.g. on a crash) is harmless.
+        """
+        with self._touch_lock:
+            pending = self._pending_touches
+            self._pending_touches = {}
+            self._last_touch_flush = time.monotonic()
+        if not pending or not self.enabled:
             return
 
-        # Calculate how much to free (add 10% buffer)
-        to_free = int((index.total_size - max_bytes) * 1.1)
-        freed = 0
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE entries SET last_accessed = MAX(last_accessed, ?), hits = hits + ? "
+                "WHERE digest = ?",
+                [(ts.isoformat(), hits, digest) for digest, (ts, hits) in pending.items()],
+            )
+        logger.debug("cache_access_times_flushed", count=len(pending))
+
+    def close(self) -> None:
+        """Flush pending access times and close this thread's index connection."""
+        if self.enabled:
+            self.flush_access_times()
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _expiry_for(self, tag: str) -> datetime | None:
+        """Return when an entry stored now for tag expires (None if never)."""
+        if _is_semver(tag) or _is_digest(tag):
+            return None
+        # Mutable tag - set TTL
+        return _utc_now() + timedelta(hours=self._config.ttl_hours)
+
+    def _warm_tag(
+        self,
+        registry: str,
+        tag: str,
+        fetch: Callable[[str], tuple[bytes, str]],
+        resolve: Callable[[str], str | None] | None,
+        refresh_within: timedelta | None,
+    ) -> str:
+        """Warm one tag for warm().
+
+        Returns:
+            "cached", "renewed", or "fetched".
+        """
+        row = self._query_one(
+            f"SELECT {_COLUMNS} FROM entries WHERE tag = ? AND registry = ? "
+            "ORDER BY pulled_at DESC LIMIT 1",
+            (tag, registry),
+        )
+        if row is not None:
+            entry = _entry_from_row(row)
+            fresh = entry.expires_at is None or (
+                not entry.is_expired
+                and (refresh_within is None or entry.expires_at - _utc_now() > refresh_within)
+            )
+            if fresh and entry.path.is_file():
+                return "cached"
+
+        if resolve is not None:
+            digest = resolve(tag)
+            if digest is not None and self._renew(digest, tag, registry):
+                return "renewed"
+
+        content, digest = fetch(tag)
+        self.put(digest=digest, tag=tag, registry=registry, content=content)
+        return "fetched"
+
+    def _renew(self, digest: str, tag: str, registry: str) -> bool:
+        """Point tag at already-stored content and restart its expiry.
+
+        Args:
+            digest: Content digest the tag currently resolves to.
+            tag: Artifact tag.
+            registry: OCI registry URI.
+
+        Returns:
+            True if the content was stored and the entry updated, False if
+            the content must be fetched.
+        """
+        with self._lock():
+            row = self._query_one(f"SELECT {_COLUMNS} FROM entries WHERE digest = ?", (digest,))
+            if row is None or not _entry_from_row(row).path.is_file():
+                return False
+            expires_at = self._expiry_for(tag)
+            with self._transaction() as conn:
+                conn.execute(
+                    "UPDATE entries SET tag = ?, registry = ?, pulled_at = ?, expires_at = ? "
+                    "WHERE digest = ?",
+                    (
+                        tag,
+                        registry,
+                        _utc_now().isoformat(),
+                        expires_at.isoformat() if expires_at else None,
+                        digest,
+                    ),
+                )
+                self._mark_updated(conn)
+
+        logger.info(
+            "cache_renewed",
+            registry=registry,
+            tag=tag,
+            digest=digest,
+            expires_at=expires_at.isoformat() if expires_at else None,
+        )
+        return True
+
+    def _touch(self, entry: CacheEntry) -> None:
+        """Record an access for eviction scoring, writing it later in a batch.
+
+        Args:
+            entry: Entry that was accessed; its last_accessed is updated.
+        """
+        entry.touch()
+        with self._touch_lock:
+            _, hits = self._pending_touches.get(entry.digest, (entry.last_accessed, 0))
+            self._pending_touches[entry.digest] = (entry.last_accessed, hits + 1)
+            due = (
+                len(self._pending_touches) >= _TOUCH_FLUSH_SIZE
+                or time.monotonic() - self._last_touch_flush >= _TOUCH_FLUSH_INTERVAL_SECONDS
+            )
+        if due:
+            self.flush_access_times()
+
+    def _maybe_evict(self) -> None:
+        """Run gc() if the cache exceeds its maximum size.
+
+        Called by put() after releasing the cache lock.
+        """
+        total_size, _ = self._index_size()
+        if total_size > self._config.max_size_gb * BYTES_PER_GB:
+            self.gc()
+
+    def _index_size(self) -> tuple[int, int]:
+        """Return (total size in bytes, entry count) from the index."""
+        row = self._query_one("SELECT COALESCE(SUM(size), 0), COUNT(*) FROM entries")
+        return (int(row[0]), int(row[1])) if row is not None else (0, 0)
+
+    def _expired_entries(self) -> list[CacheEntry]:
+        """Return expired entries (only mutable entries carry an expiry)."""
+        rows = self._query_all(f"SELECT {_COLUMNS} FROM entries WHERE expires_at IS NOT NULL")
+        return [entry for entry in map(_entry_from_row, rows) if entry.is_expired]
+
+    def _expired_rows(self) -> list[tuple[Any, ...]]:
+        """Return (digest, pulled_at, size) of expired entries for _evict_rows()."""
+        rows = self._query_all(f"SELECT {_COLUMNS} FROM entries WHERE expires_at IS NOT NULL")
+        return [(row[0], row[3], row[5]) for row in rows if _entry_from_row(row).is_expired]
+
+    def _evict_rows(self, rows: list[tuple[Any, ...]], *, reason: str) -> tuple[int, int]:
+        """Remove entries selected by gc() and delete their blobs.
+
+        A row is only deleted if its pulled_at is unchanged, so an entry
+        that was re-stored or renewed since it was selected survives.
+
+        Args:
+            rows: (digest, pulled_at, size) tuples.
+            reason: Eviction reason reported to metrics and logs.
+
+        Returns:
+            Tuple of (entries removed, bytes freed).
+        """
         removed = 0
+        freed = 0
+        for start in range(0, len(rows), _GC_BATCH_SIZE):
+            deleted: list[tuple[str, int]] = []
+            with self._transaction() as conn:
+                for digest, pulled_at, size in rows[start : start + _GC_BATCH_SIZE]:
+                    cursor = conn.execute(
+                        "DELETE FROM entries WHERE digest = ? AND pulled_at = ?",
+                        (digest, pulled_at),
+                    )
+                    if cursor.rowcount:
+                        deleted.append((digest, size))
+                conn.executemany(
+                    "DELETE FROM verified WHERE digest = ?", [(digest,) for digest, _ in deleted]
+                )
+                if deleted:
+                    self._mark_updated(conn)
+            digests = [digest for digest, _ in deleted]
+            with self._touch_lock:
+                for digest in digests:
+                    self._pending_touches.pop(digest, None)
+            self._discard_blobs(digests)
+            removed += len(deleted)
+            freed += sum(size for _, size in deleted)
+
+        if removed:
+            with self._counters_lock:
+                self._counters["entries_evicted"] += removed
+                self._counters["bytes_evicted"] += freed
+            if self._metrics is not None:
+                self._metrics.record_cache_eviction(removed, freed, reason=reason)
+            logger.info("cache_eviction", reason=reason, removed=removed, freed_bytes=freed)
+        return removed, freed
+
+    def _delete_entries(self, digests: list[str]) -> int:
+        """Delete index entries by digest.
 
-        # First, remove expired entries
-        for entry in index.get_expired_entries():
-            if freed >= to_free:
-                break
-            if index.remove_entry(entry.digest):
-                digest_short = entry.digest.replace("sha256:", "")
-                blob_dir = self._blobs_path / digest_short
-                if blob_dir.exists():
-                    shutil.rmtree(blob_dir, ignore_errors=True)
-                freed += entry.size
-                removed += 1
-
-        # Then use LRU for remaining
-        if freed < to_free:
-            # Calculate how many more to remove
-            remaining_to_free = to_free - freed
-            avg_size = index.total_size / len(index.entries) if index.entries else 0
-            estimate_count = int(remaining_to_free / avg_size) + 1 if avg_size > 0 else 10
-
-            lru_entries = index.get_lru_entries(estimate_count * 2)
-            for entry in lru_entries:
-                if freed >= to_free:
-                    break
-                if index.remove_entry(entry.digest):
-                    digest_short = entry.digest.replace("sha256:", "")
-                    blob_dir = self._blobs_path / digest_short
-                    if blob_dir.exists():
-                        shutil.rmtree(blob_dir, ignore_errors=True)
-                    freed += entry.size
-                    removed += 1
+        Args:
+            digests: Digests to delete.
 
-        if removed > 0:
-            self._save_index(index)
-            logger.info(
-                "cache_eviction",
-                removed=removed,
-                freed_bytes=freed,
-                new_size_bytes=index.total_size,
+        Returns:
+            Number of entries deleted.
+        """
+        if not digests:
+            return 0
+        with self._transaction() as conn:
+            deleted = sum(
+                conn.execute("DELETE FROM entries WHERE digest = ?", (digest,)).rowcount
+                for digest in digests
+            )
+            conn.executemany(
+                "DELETE FROM verified WHERE digest = ?", [(digest,) for digest in digests]
             )
+            if deleted:
+                self._mark_updated(conn)
+        with self._touch_lock:
+            for digest in digests:
+                self._pending_touches.pop(digest, None)
+        return deleted
 
-    def _load_index(self) -> CacheIndex:
-        """Load cache index from disk.
+    def _map_blob(self, entry: CacheEntry, stack: ExitStack) -> tuple[memoryview, os.stat_result]:
+        """Memory-map a blob read-only; cleanup is registered on ``stack``.
+
+        Args:
+            entry: Entry whose blob to map.
+            stack: ExitStack that closes the file, map, and view.
 
         Returns:
-            CacheIndex from file, or new empty index if not exists.
+            Tuple of (view over the blob, stat of the opened file).
+
+        Raises:
+            OSError: If the blob cannot be opened or mapped.
+        """
+        handle = stack.enter_context(entry.path.open("rb"))
+        stat = os.fstat(handle.fileno())
+        if stat.st_size == 0:
+            # Empty files cannot be mapped
+            return memoryview(b""), stat
+        mapped = stack.enter_context(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+        view = stack.enter_context(memoryview(mapped))
+        return view, stat
+
+    def _recently_verified(self, digest: str, stat: os.stat_result) -> bool:
+        """Check whether an unchanged blob passed verification recently."""
+        row = self._query_one(
+            "SELECT inode, mtime_ns, size, verified_at FROM verified WHERE digest = ?",
+            (digest,),
+        )
+        if row is None:
+            return False
+        inode, mtime_ns, size, verified_at = row
+        return (inode, mtime_ns, size) == (
+            stat.st_ino,
+            stat.st_mtime_ns,
+            stat.st_size,
+        ) and datetime.fromisoformat(verified_at) > _utc_now() - _REVERIFY_INTERVAL
+
+    def _record_verified(self, digest: str, stat: os.stat_result) -> None:
+        """Record a successful verification of a blob's current file."""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO verified (digest, inode, mtime_ns, size, verified_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (digest, stat.st_ino, stat.st_mtime_ns, stat.st_size, _utc_now().isoformat()),
+            )
+
+    def _has_entry(self, digest: str) -> bool:
+        """Check whether the index has an entry for digest."""
+        return self._query_one("SELECT 1 FROM entries WHERE digest = ?", (digest,)) is not None
+
+    def _discard_blobs(self, digests: list[str]) -> None:
+        """Delete the blob directories of digests removed from the index.
+
+        Directories are moved into the trash directory under the cache
+        lock, skipping any digest a concurrent put() stored again, and
+        deleted after the lock is released.
+        """
+        if not digests:
+            return
+        moved: list[Path] = []
+        with self._lock():
+            for digest in digests:
+                if self._has_entry(digest):
+                    continue
+                blob_dir = self._blobs_path / digest.replace("sha256:", "")
+                trash_dir = self._trash_path / f"{blob_dir.name}.{uuid.uuid4().hex}"
+                try:
+                    os.replace(blob_dir, trash_dir)
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    logger.warning("cache_blob_remove_failed", digest=digest, error=str(e))
+                    continue
+                moved.append(trash_dir)
+        for trash_dir in moved:
+            shutil.rmtree(trash_dir, ignore_errors=True)
+
+    def _purge_scratch(self) -> None:
+        """Delete leftover trash and temporary blobs from crashed writers."""
+        stale_before = time.time() - _STALE_TEMP_SECONDS
+        for path in self._tmp_path.iterdir():
+            try:
+                if path.stat().st_mtime < stale_before:
+                    path.unlink()
+            except OSError:
+                continue
+        for path in self._trash_path.iterdir():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        """Increment an in-process counter reported by stats()."""
+        with self._counters_lock:
+            self._counters[counter] += amount
+
+    def _hit_ratio(self) -> float:
+        """Return the fraction of get() lookups that were hits."""
+        with self._counters_lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return self._counters["hits"] / lookups if lookups else 0.0
+
+    def _process_stats(self) -> dict[str, Any]:
+        """Return the in-process counters for stats()."""
+        hit_ratio = self._hit_ratio()
+        with self._counters_lock:
+            return {
+                "hits": self._counters["hits"],
+                "misses": self._counters["misses"],
+                "hit_ratio": hit_ratio,
+                "entries_evicted": self._counters["entries_evicted"],
+                "bytes_evicted": self._counters["bytes_evicted"],
+                "lock_acquisitions": self._counters["lock_acquisitions"],
+                "lock_wait_seconds": self._lock_wait_seconds,
+            }
+
+    def _init_index(self) -> None:
+        """Create the index schema and import a legacy index.json.
+
+        Raises:
+            CacheError: If the index database cannot be opened.
         """
-        if not self._index_path.exists():
-            return CacheIndex()
+        with self._lock():
+            try:
+                conn = self._connection()
+                conn.executescript(_SCHEMA)
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+                if "hits" not in columns:
+                    # Index created by a release without hit counts
+                    conn.execute("ALTER TABLE entries ADD COLUMN hits INTEGER NOT NULL DEFAULT 0")
+            except sqlite3.Error as e:
+                raise CacheError(
+                    "init",
+                    f"Failed to open cache index: {e}",
+                    str(self._db_path),
+                ) from e
+            if self._legacy_index_path.exists():
+                self._import_legacy_index()
+
+    def _import_legacy_index(self) -> None:
+        """Move entries from an index.json written by older releases.
 
+        A corrupt legacy index is discarded; the cache starts empty.
+        """
         try:
-            data = json.loads(self._index_path.read_text())
-            return CacheIndex.model_validate(data)
+            data = json.loads(self._legacy_index_path.read_text())
+            legacy = CacheIndex.model_validate(data)
         except Exception as e:
             logger.warning(
                 "cache_index_load_failed",
                 error=str(e),
-                path=str(self._index_path),
+                path=str(self._legacy_index_path),
             )
-            return CacheIndex()
+            legacy = CacheIndex()
 
-    def _save_index(self, index: CacheIndex) -> None:
-        """Save cache index to disk.
+        with self._transaction() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO entries ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [_entry_to_row(entry) for entry in legacy.entries.values()],
+            )
+            self._mark_updated(conn)
+        self._legacy_index_path.unlink(missing_ok=True)
+        logger.info("cache_index_migrated", entries=len(legacy.entries))
 
-        Args:
-            index: CacheIndex to save.
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's index connection, opening it on first use.
 
         Raises:
-            CacheError: If write fails.
+            CacheError: If the index database cannot be opened.
         """
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                conn = sqlite3.connect(
+                    self._db_path,
+                    timeout=_BUSY_TIMEOUT_SECONDS,
+                    isolation_level=None,  # Explicit transactions only
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            except sqlite3.Error as e:
+                raise CacheError(
+                    "open_index",
+                    f"Failed to open cache index: {e}",
+                    str(self._db_path),
+                ) from e
+            self._local.conn = conn
+        return conn
+
+    def _query_one(self, sql: str, params: tuple[Any, ...] = ()) -> tuple[Any, ...] | None:
+        """Run a read query and return its first row (None if no rows)."""
         try:
-            # Write to temp file first, then rename for atomicity
-            temp_path = self._index_path.with_suffix(".tmp")
-            temp_path.write_text(index.model_dump_json(indent=2))
-            temp_path.rename(self._index_path)
-        except OSError as e:
+            row: tuple[Any, ...] | None = self._connection().execute(sql, params).fetchone()
+        except sqlite3.Error as e:
+            raise CacheError(
+                "read_index", f"Failed to read cache index: {e}", str(self._db_path)
+            ) from e
+        return row
+
+    def _query_all(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Run a read query and return all rows."""
+        try:
+            rows: list[tuple[Any, ...]] = self._connection().execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise CacheError(
+                "read_index", f"Failed to read cache index: {e}", str(self._db_path)
+            ) from e
+        return rows
+
+    @contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """Run statements in one write transaction, rolled back on error.
+
+        Yields:
+            This thread's index connection.
+
+        Raises:
+            CacheError: If the transaction fails.
+        """
+        conn = self._connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
             raise CacheError(
                 "save_index",
-                f"Failed to save cache index: {e}",
-                str(self._index_path),
+                f"Failed to update cache index: {e}",
+                str(self._db_path),
             ) from e
 
+    @staticmethod
+    def _mark_updated(conn: sqlite3.Connection) -> None:
+        """Record the index modification time."""
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_updated', ?)",
+            (_utc_now().isoformat(),),
+        )
+
     @contextmanager
     def _lock(self) -> Generator[None, None, None]:
         """Context manager for cache file locking.
 
-        Uses fcntl.flock for file-based locking to ensure
-        safe concurrent access.
+        Uses fcntl.flock for file-based locking so that only one writer
+        creates or deletes blob directories at a time. Index reads do not
+        take this lock. Time spent waiting for the lock is reported by
+        stats() and to metrics.
 
         Yields:
             None
@@ -663,8 +1542,120 @@ class CacheManager:
 
         lock_fd = os.open(str(self._lock_path), os.O_RDWR)
         try:
+            started = time.monotonic()
             fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            waited = time.monotonic() - started
+            with self._counters_lock:
+                self._counters["lock_acquisitions"] += 1
+                self._lock_wait_seconds += waited
+            if self._metrics is not None:
+                self._metrics.record_cache_lock_wait(waited)
             yield
         finally:
             fcntl.flock(lock_fd, fcntl.LOCK_UN)
             os.close(lock_fd)
+
+
+class CacheRefresher:
+    """Re-run a cache warm-up on an interval in a background thread.
+
+    Keeps mutable tags such as ``latest-prod`` fresh so consumers hit the
+    cache instead of the registry. Each pass calls refresh (typically
+    OCIClient.prefetch with refresh_mutable=True); a failing pass is logged
+    and the next pass runs as scheduled.
+
+    Example:
+        >>> refresher = CacheRefresher(
+        ...     lambda: client.prefetch(environments=["prod"], refresh_mutable=True),
+        ...     interval_seconds=300,
+        ... )
+        >>> with refresher:
+        ...     run_pipeline()
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], WarmResult],
+        *,
+        interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize CacheRefresher.
+
+        Args:
+            refresh: Called once per pass to warm the cache.
+            interval_seconds: Seconds between the start of one pass and the
+                next. Should be well below the cache TTL.
+
+        Raises:
+            ValueError: If interval_seconds is not positive.
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be positive, got {interval_seconds}")
+        self._refresh = refresh
+        self._interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_result: WarmResult | None = None
+
+    @property
+    def last_result(self) -> WarmResult | None:
+        """Return the result of the last successful pass, if any."""
+        return self._last_result
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def run_once(self) -> WarmResult | None:
+        """Run one refresh pass in the calling thread.
+
+        Returns:
+            The pass result, or None if the pass raised.
+        """
+        try:
+            result = self._refresh()
+        except Exception as e:
+            logger.warning("cache_refresh_failed", error=str(e))
+            return None
+        self._last_result = result
+        return result
+
+    def run_forever(self) -> None:
+        """Run passes in the calling thread until stop() is called."""
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            self.run_once()
+            self._stop_event.wait(max(0.0, self._interval_seconds - (time.monotonic() - started)))
+
+    def start(self) -> None:
+        """Start passes in a daemon thread (no-op if already running)."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.run_forever, name="floe-cache-refresher", daemon=True
+        )
+        self._thread.start()
+        logger.info("cache_refresher_started", interval_seconds=self._interval_seconds)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop after the current pass and wait for the thread to exit.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread (None waits).
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            logger.info("cache_refresher_stopped")
+
+    def __enter__(self) -> CacheRefresher:
+        """Start the refresher."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop the refresher."""
+        self.stop()
@@ -50,7 +50,7 @@ from __future__ import annotations
 
 import builtins
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -60,10 +60,18 @@ import yaml
 from oras.client import OrasClient
 
 from floe_core.oci.auth import AuthProvider, create_auth_provider
-from floe_core.oci.cache import CacheManager
+from floe_core.oci.cache import (
+    DEFAULT_REFRESH_INTERVAL_SECONDS,
+    DEFAULT_WARM_WORKERS,
+    CacheManager,
+    CacheRefresher,
+    WarmResult,
+)
+from floe_core.oci.connection_pool import get_connection_pool
 from floe_core.oci.errors import (
     ArtifactNotFoundError,
     AuthenticationError,
+    CacheError,
     CircuitBreakerOpenError,
     ImmutabilityViolationError,
     OCIError,
@@ -79,16 +87,26 @@ from floe_core.oci.layers import (
 )
 from floe_core.oci.manifest import (
     build_manifest,
+    calculate_digest,
     calculate_layers_total_size,
     calculate_manifest_digest,
     create_empty_config,
+    manifest_content,
     parse_created_timestamp,
     parse_manifest_response,
     serialize_layer,
 )
 from floe_core.oci.metrics import OCIMetrics, get_oci_metrics
+from floe_core.oci.packing import (
+    PACKED_CORE_TITLE,
+    layers_content_digest,
+    pack_artifacts,
+    unpack_layers,
+)
 from floe_core.oci.resilience import CircuitBreaker, RetryPolicy
 from floe_core.schemas.oci import (
+    OCI_EMPTY_CONFIG_TYPE,
+    ArtifactLayer,
     ArtifactManifest,
     ArtifactTag,
     AuthType,
@@ -96,6 +114,8 @@ from floe_core.schemas.oci import (
 )
 
 if TYPE_CHECKING:
+    from floe_core.oci.batch_fetcher import AdaptiveConcurrencyLimiter, BatchFetcher
+    from floe_core.oci.registry_sync import BlobStage
     from floe_core.plugins.secrets import SecretsPlugin
     from floe_core.schemas.compiled_artifacts import CompiledArtifacts
     from floe_core.schemas.promotion import PromotionConfig, PromotionRecord
@@ -103,6 +123,10 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Suggested max_age_seconds for list_tag_names() callers that tolerate
+# slightly stale tag listings (e.g., building error messages)
+TAG_NAMES_CACHE_TTL_SECONDS = 30.0
+
 
 class OCIClient:
     """OCI client for floe CompiledArtifacts distribution.
@@ -177,6 +201,12 @@ class OCIClient:
         # Lazy-initialized PullOperations helper
         self._pull_ops: PullOperations | None = None
 
+        # Last tag name listing: (monotonic fetch time, tag names)
+        self._tag_names_cache: tuple[float, builtins.list[str]] | None = None
+
+        # Manifest fetch concurrency learned across list() calls
+        self._fetch_limiter: AdaptiveConcurrencyLimiter | None = None
+
         logger.info(
             "oci_client_initialized",
             registry=self._registry_host,
@@ -209,7 +239,7 @@ class OCIClient:
     def cache_manager(self) -> CacheManager | None:
         """Get or create the cache manager."""
         if self._cache_manager is None and self._config.cache.enabled:
-            self._cache_manager = CacheManager(config=self._config.cache)
+            self._cache_manager = CacheManager(config=self._config.cache, metrics=self.metrics)
         return self._cache_manager
 
     @property
@@ -484,17 +514,106 @@ class OCIClient:
         """
         self._check_immutability_before_push(tag)
 
-        layer_content, layer_descriptor = serialize_layer(artifacts, annotations=annotations)
-        manifest = build_manifest(artifacts, layers=[layer_descriptor], annotations=annotations)
+        packing = self._config.packing
+        if packing.is_packed:
+            blobs, _content_digest = pack_artifacts(artifacts, packing, annotations=annotations)
+            layers = [layer for _, layer in blobs]
+        else:
+            layer_content, layer_descriptor = serialize_layer(artifacts, annotations=annotations)
+            layers = [layer_descriptor]
+        manifest = build_manifest(artifacts, layers=layers, annotations=annotations)
 
         span.set_attribute("oci.artifact.size_bytes", manifest.size)
         span.set_attribute("oci.artifact.layer_count", len(manifest.layers))
 
         target_ref = self._build_target_ref(tag)
-        self._upload_to_registry(layer_content, manifest, target_ref)
+        if packing.is_packed:
+            self._upload_packed_to_registry(blobs, manifest, target_ref, span)
+        else:
+            self._upload_to_registry(layer_content, manifest, target_ref)
 
         return manifest
 
+    def _upload_packed_to_registry(
+        self,
+        blobs: builtins.list[tuple[bytes, ArtifactLayer]],
+        manifest: ArtifactManifest,
+        target_ref: str,
+        span: Any,
+    ) -> None:
+        """Upload a packed artifact blob by blob, skipping blobs already present.
+
+        Unchanged sections keep their digest across pushes, so only the
+        layers that changed are transferred.
+
+        Args:
+            blobs: Layer blobs and descriptors from pack_artifacts().
+            manifest: Built manifest with metadata.
+            target_ref: Target reference (registry/namespace/repo:tag).
+            span: OTel tracing span.
+
+        Raises:
+            RegistryUnavailableError: If a blob or manifest upload fails.
+        """
+        config_content, config_digest = create_empty_config()
+        uploads: builtins.list[tuple[bytes, dict[str, Any]]] = [
+            (
+                config_content,
+                {
+                    "mediaType": OCI_EMPTY_CONFIG_TYPE,
+                    "digest": config_digest,
+                    "size": len(config_content),
+                },
+            )
+        ]
+        uploads.extend(
+            (
+                blob,
+                {
+                    "mediaType": layer.media_type,
+                    "digest": layer.digest,
+                    "size": layer.size,
+                    "annotations": layer.annotations,
+                },
+            )
+            for blob, layer in blobs
+        )
+
+        with self._with_circuit_breaker("push"):
+            oras_client = self._create_oras_client()
+            container = oras_client.get_container(target_ref)
+            uploaded = 0
+            with tempfile.TemporaryDirectory() as tmpdir:
+                for index, (blob, descriptor) in enumerate(uploads):
+                    digest = descriptor["digest"]
+                    if oras_client.get_blob(container, digest, head=True).ok:
+                        continue
+                    blob_file = Path(tmpdir) / f"blob-{index}"
+                    blob_file.write_bytes(blob)
+                    response = oras_client.upload_blob(str(blob_file), container, descriptor)
+                    if not response.ok:
+                        raise RegistryUnavailableError(
+                            self._registry_host,
+                            f"Blob upload failed for {digest}: {response.status_code}",
+                        )
+                    uploaded += 1
+
+            response = oras_client.upload_manifest(manifest_content(manifest), container)
+            if not response.ok:
+                raise RegistryUnavailableError(
+                    self._registry_host,
+                    f"Push failed: {response.status_code}: {response.text}",
+                )
+
+        span.set_attribute("oci.artifact.blobs_uploaded", uploaded)
+        span.set_attribute("oci.artifact.blobs_reused", len(uploads) - uploaded)
+        logger.debug(
+            "packed_push_uploaded",
+            target_ref=target_ref,
+            blobs_total=len(uploads),
+            blobs_uploaded=uploaded,
+        )
+
     def _upload_to_registry(
         self, layer_content: bytes, manifest: ArtifactManifest, target_ref: str
     ) -> None:
@@ -559,6 +678,8 @@ class OCIClient:
             log: Bound logger.
             start_time: Monotonic time for metrics.
         """
+        # A pushed tag may be new; drop the cached tag listing
+        self._tag_names_cache = None
         duration = self._record_operation_metrics(
             "push", start_time, success=True, size=manifest.size
         )
@@ -573,7 +694,12 @@ class OCIClient:
         )
 
     def _create_oras_client(self) -> OrasClient:
-        """Create and authenticate ORAS client.
+        """Return an authenticated ORAS client from the registry connection pool.
+
+        Clients are pooled per registry host and credentials: the calling
+        thread's client is reused across operations, keep-alive connections
+        and bearer tokens are shared with other threads, and the registry
+        login happens once per pool rather than per operation.
 
         Returns:
             Authenticated OrasClient instance.
@@ -585,31 +711,26 @@ class OCIClient:
         # Basic auth needs 'basic' backend, otherwise use default 'token'
         auth_backend = "basic" if self.auth_provider.auth_type == AuthType.BASIC else "token"
 
-        # Create ORAS client with TLS settings and auth backend
-        oras_client = OrasClient(
-            insecure=not self._config.tls_verify,
-            auth_backend=auth_backend,
-        )
-
         # Get credentials from auth provider
+        # Anonymous auth yields empty credentials and skips login (ORAS would
+        # prompt interactively if username/password are empty)
         credentials = self.auth_provider.get_credentials()
 
-        # Skip login for anonymous auth (empty credentials)
-        # ORAS prompts interactively if username/password are empty
-        if credentials.username and credentials.password:
-            try:
-                oras_client.login(
-                    hostname=self._registry_host,
-                    username=credentials.username,
-                    password=credentials.password,
-                )
-            except Exception as e:
-                raise AuthenticationError(
-                    self._registry_host,
-                    f"Failed to authenticate with registry: {e}",
-                ) from e
-
-        return oras_client
+        pool = get_connection_pool(
+            self._registry_host,
+            tls_verify=self._config.tls_verify,
+            auth_backend=auth_backend,
+            username=credentials.username,
+            password=credentials.password,
+            metrics=self.metrics,
+        )
+        try:
+            return pool.client()
+        except Exception as e:
+            raise AuthenticationError(
+                self._registry_host,
+                f"Failed to authenticate with registry: {e}",
+            ) from e
 
     def _build_target_ref(self, tag: str) -> str:
         """Build OCI target reference from registry URI and tag.
@@ -872,8 +993,11 @@ class OCIClient:
         with tempfile.TemporaryDirectory() as tmpdir:
             try:
                 pulled_files = oras_client.pull(target=target_ref, outdir=tmpdir)
-                artifacts_path = self.pull_operations.find_artifacts_file(pulled_files, tmpdir)
-                content = artifacts_path.read_bytes()
+                if any(Path(f).name.startswith(PACKED_CORE_TITLE) for f in pulled_files):
+                    content = self._unpack_pulled_files(pulled_files, tag)
+                else:
+                    artifacts_path = self.pull_operations.find_artifacts_file(pulled_files, tmpdir)
+                    content = artifacts_path.read_bytes()
                 digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
                 return content, digest
             except OCIError:
@@ -884,6 +1008,34 @@ class OCIClient:
         # This return is unreachable but satisfies type checker
         raise OCIError("Unexpected error in pull")  # pragma: no cover
 
+    def _unpack_pulled_files(self, pulled_files: builtins.list[str], tag: str) -> bytes:
+        """Reassemble a packed artifact from the layer files ORAS pulled.
+
+        Args:
+            pulled_files: File paths returned by ORAS pull.
+            tag: Tag being pulled.
+
+        Returns:
+            The unpacked compiled_artifacts.json bytes.
+
+        Raises:
+            OCIError: If a pulled layer does not match the manifest.
+            DigestMismatchError: If the reassembled content is corrupt.
+        """
+        files_by_name = {Path(f).name: Path(f) for f in pulled_files}
+        layers: builtins.list[dict[str, Any]] = self._fetch_manifest_data(tag).get("layers", [])
+
+        def read_blob(layer: dict[str, Any]) -> bytes:
+            title = (layer.get("annotations") or {}).get("org.opencontainers.image.title", "")
+            path = files_by_name.get(title)
+            blob = path.read_bytes() if path is not None else b""
+            if path is None or calculate_digest(blob) != layer.get("digest"):
+                # The tag moved between the pull and the manifest fetch
+                raise OCIError(f"Artifact {tag} changed during pull; layer {title} is stale")
+            return blob
+
+        return unpack_layers(layers, read_blob, tag)
+
     def _handle_oras_pull_error(self, error: Exception, tag: str) -> None:
         """Handle ORAS pull errors and raise appropriate exceptions.
 
@@ -937,7 +1089,7 @@ class OCIClient:
         from floe_core.schemas.signing import SignatureMetadata
 
         artifact_ref = f"{self._config.uri}:{tag}"
-        verification_client = VerificationClient(policy)
+        verification_client = VerificationClient(policy, cache=self.cache_manager)
 
         try:
             manifest_data = self._fetch_manifest_data(tag)
@@ -1205,6 +1357,146 @@ class OCIClient:
             log.error("list_failed", error=str(e))
             raise OCIError(f"List failed: {e}") from e
 
+    def iter_list(
+        self,
+        *,
+        filter_pattern: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[ArtifactTag]:
+        """Stream artifacts and tags from the registry as they are fetched.
+
+        Like list(), but yields each ArtifactTag as soon as its manifest
+        arrives (in completion order, not registry order). Stopping early,
+        or passing limit, cancels manifest fetches that have not started.
+
+        Args:
+            filter_pattern: Optional glob pattern to filter tags (e.g., "v1.*").
+            limit: Optional maximum number of artifacts to yield.
+
+        Yields:
+            ArtifactTag objects as their manifests are fetched.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            CircuitBreakerOpenError: If the circuit breaker is open.
+            OCIError: If the registry cannot be listed.
+
+        Example:
+            >>> for tag in client.iter_list(filter_pattern="v1.*", limit=20):
+            ...     print(f"{tag.name}: {tag.digest}")
+        """
+        import time
+
+        if limit is not None and limit < 1:
+            return
+
+        log = logger.bind(registry=self._registry_host, filter_pattern=filter_pattern)
+        log.info("list_started", limit=limit)
+        start_time = time.monotonic()
+
+        try:
+            with self._with_circuit_breaker("list"):
+                oras_client = self._create_oras_client()
+                tag_names = self._fetch_tag_names(oras_client)
+            tag_names = self._filter_tags(tag_names, filter_pattern)
+        except (CircuitBreakerOpenError, AuthenticationError, OCIError):
+            self._record_operation_metrics("list", start_time, success=False)
+            raise
+        except Exception as e:
+            self._record_operation_metrics("list", start_time, success=False)
+            log.error("list_failed", error=str(e))
+            raise OCIError(f"List failed: {e}") from e
+
+        tag_refs = [(tag_name, self._build_target_ref(tag_name)) for tag_name in tag_names]
+        yielded = 0
+        success = True
+        manifests = self._batch_fetcher().iter_manifests(
+            oras_client, tag_refs, client_factory=self._create_oras_client
+        )
+        try:
+            for tag_name, outcome in manifests:
+                if isinstance(outcome, Exception):
+                    log.warning("list_tag_failed", tag=tag_name, error=str(outcome))
+                    continue
+                yield self._build_artifact_tag(tag_name, outcome)
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    break
+        except Exception:
+            success = False
+            raise
+        finally:
+            manifests.close()
+            duration = self._record_operation_metrics("list", start_time, success=success)
+            log.info(
+                "list_completed",
+                tag_count=yielded,
+                duration_ms=int(duration * 1000),
+            )
+
+    def list_tag_names(
+        self,
+        *,
+        prefix: str | None = None,
+        pattern: str | None = None,
+        max_age_seconds: float = 0.0,
+    ) -> builtins.list[str]:
+        """List tag names in the repository without fetching manifests.
+
+        Uses only the registry tags endpoint (following its Link-header
+        pagination), so the cost is independent of how large each artifact
+        is. Use list() when digests, sizes, or creation times are needed.
+
+        Args:
+            prefix: Optional prefix tag names must start with.
+            pattern: Optional glob pattern tag names must match (e.g., "v1.*").
+            max_age_seconds: Reuse this client's previous listing if it is
+                at most this many seconds old. The default (0) always asks
+                the registry. Pushes through this client drop the cached
+                listing.
+
+        Returns:
+            Matching tag names in registry order.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            CircuitBreakerOpenError: If the circuit breaker is open.
+            OCIError: If the registry cannot be listed.
+
+        Example:
+            >>> client.list_tag_names(prefix="v1.0.0-prod-rollback-")
+            ['v1.0.0-prod-rollback-1', 'v1.0.0-prod-rollback-2']
+        """
+        import time
+
+        cached = self._tag_names_cache
+        if cached is not None and time.monotonic() - cached[0] <= max_age_seconds:
+            tag_names = cached[1]
+        else:
+            log = logger.bind(registry=self._registry_host)
+            start_time = time.monotonic()
+            try:
+                with self._with_circuit_breaker("list_tags"):
+                    tag_names = self._fetch_tag_names(self._create_oras_client())
+            except (CircuitBreakerOpenError, AuthenticationError, OCIError):
+                self._record_operation_metrics("list_tags", start_time, success=False)
+                raise
+            except Exception as e:
+                self._record_operation_metrics("list_tags", start_time, success=False)
+                log.error("list_tags_failed", error=str(e))
+                raise OCIError(f"List tags failed: {e}") from e
+            duration = self._record_operation_metrics("list_tags", start_time, success=True)
+            log.debug(
+                "list_tags_completed",
+                tag_count=len(tag_names),
+                duration_ms=int(duration * 1000),
+            )
+            self._tag_names_cache = (time.monotonic(), tag_names)
+
+        if prefix:
+            tag_names = [name for name in tag_names if name.startswith(prefix)]
+        return self._filter_tags(tag_names, pattern)
+
     def _list_internal(self, filter_pattern: str | None, log: Any) -> builtins.list[ArtifactTag]:
         """Internal list logic with circuit breaker protection.
 
@@ -1277,11 +1569,10 @@ class OCIClient:
         Returns:
             List of ArtifactTag objects.
         """
-        from floe_core.oci.batch_fetcher import BatchFetcher
-
         tag_refs = [(tag_name, self._build_target_ref(tag_name)) for tag_name in tag_names]
-        batch_fetcher = BatchFetcher(max_workers=10)
-        fetch_result = batch_fetcher.fetch_manifests(oras_client, tag_refs)
+        fetch_result = self._batch_fetcher().fetch_manifests(
+            oras_client, tag_refs, client_factory=self._create_oras_client
+        )
 
         # Log failures
         for tag_name, error in fetch_result.errors.items():
@@ -1289,6 +1580,47 @@ class OCIClient:
 
         return self._build_artifact_tag_list(fetch_result.manifests)
 
+    def _batch_fetcher(self) -> BatchFetcher:
+        """Create a BatchFetcher sharing this client's adaptive limiter.
+
+        The limiter starts at DEFAULT_MAX_WORKERS and may grow to
+        MAX_WORKERS_LIMIT; it persists across calls so later listings start
+        from the concurrency the registry has tolerated so far.
+
+        Returns:
+            BatchFetcher bound to the client's limiter.
+        """
+        from floe_core.oci.batch_fetcher import (
+            DEFAULT_MAX_WORKERS,
+            MAX_WORKERS_LIMIT,
+            AdaptiveConcurrencyLimiter,
+            BatchFetcher,
+        )
+
+        if self._fetch_limiter is None:
+            self._fetch_limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=DEFAULT_MAX_WORKERS, max_limit=MAX_WORKERS_LIMIT
+            )
+        return BatchFetcher(limiter=self._fetch_limiter)
+
+    def _build_artifact_tag(self, tag_name: str, manifest_data: dict[str, Any]) -> ArtifactTag:
+        """Build an ArtifactTag from manifest data.
+
+        Args:
+            tag_name: Tag name.
+            manifest_data: Manifest dictionary for the tag.
+
+        Returns:
+            ArtifactTag with digest, creation time, and total layer size.
+        """
+        digest = calculate_manifest_digest(manifest_data)
+        annotations = manifest_data.get("annotations", {})
+        created_at = parse_created_timestamp(annotations)
+        layers_data = manifest_data.get("layers", [])
+        total_size = calculate_layers_total_size(layers_data)
+
+        return ArtifactTag(name=tag_name, digest=digest, created_at=created_at, size=total_size)
+
     def _build_artifact_tag_list(
         self, manifests: dict[str, dict[str, Any]]
     ) -> builtins.list[ArtifactTag]:
@@ -1300,22 +1632,168 @@ class OCIClient:
         Returns:
             List of ArtifactTag objects.
         """
-        result: builtins.list[ArtifactTag] = []
+        return [
+            self._build_artifact_tag(tag_name, manifest_data)
+            for tag_name, manifest_data in manifests.items()
+        ]
 
-        for tag_name, manifest_data in manifests.items():
-            digest = calculate_manifest_digest(manifest_data)
-            annotations = manifest_data.get("annotations", {})
-            created_at = parse_created_timestamp(annotations)
-            layers_data = manifest_data.get("layers", [])
-            total_size = calculate_layers_total_size(layers_data)
+    def prefetch(
+        self,
+        *,
+        filter_pattern: str | None = None,
+        environments: Sequence[str] | None = None,
+        max_workers: int = DEFAULT_WARM_WORKERS,
+        refresh_mutable: bool = False,
+    ) -> WarmResult:
+        """Pull artifacts into the local cache ahead of time.
+
+        Lists the repository's tags, keeps those matching filter_pattern
+        and (if given) ending in ``-<environment>`` for one of environments,
+        and warms the cache for them with CacheManager.warm(). A later
+        pull() of a warmed tag is then served from the cache.
+
+        Content is signature-verified before it is cached, using the policy
+        of the environment the tag belongs to (or this client's environment).
+        Tags already cached are skipped; a mutable tag whose content is
+        already cached only has its expiry extended.
 
-            artifact_tag = ArtifactTag(
-                name=tag_name, digest=digest, created_at=created_at, size=total_size
-            )
-            result.append(artifact_tag)
+        Args:
+            filter_pattern: Optional glob pattern tags must match (e.g., "v1.*").
+            environments: Optional environments whose tags to prefetch
+                (e.g., ["prod"] selects "v1.0.0-prod" and "latest-prod").
+            max_workers: Maximum number of tags fetched at once.
+            refresh_mutable: Revalidate cached mutable tags against the
+                registry even if they have not expired yet.
+
+        Returns:
+            WarmResult describing what happened to each tag.
+
+        Raises:
+            CacheError: If caching is disabled.
+            AuthenticationError: If authentication fails.
+            CircuitBreakerOpenError: If the circuit breaker is open.
+            OCIError: If the registry cannot be listed.
+
+        Example:
+            >>> result = client.prefetch(filter_pattern="v1.*", environments=["prod"])
+            >>> print(f"{len(result.fetched)} fetched, {result.failed_tags} failed")
+        """
+        import time
+        from datetime import timedelta
+
+        cache = self.cache_manager
+        if cache is None:
+            raise CacheError("prefetch", "Caching is disabled", str(self._config.cache.path))
+
+        log = logger.bind(registry=self._registry_host, filter_pattern=filter_pattern)
+        start_time = time.monotonic()
+
+        try:
+            targets = self._prefetch_targets(filter_pattern, environments)
+        except (CircuitBreakerOpenError, AuthenticationError, OCIError):
+            self._record_operation_metrics("prefetch", start_time, success=False)
+            raise
+        log.info("prefetch_started", tag_count=len(targets), environments=environments)
+
+        def fetch(tag: str) -> tuple[bytes, str]:
+            content, digest = self._fetch_from_registry(tag)
+            # Verify signature BEFORE caching; cache hits are not re-verified
+            self._verify_signature_if_enabled(content, digest, tag, log, targets[tag])
+            return content, digest
+
+        result = cache.warm(
+            self._config.uri,
+            targets,
+            fetch,
+            resolve=self._resolve_content_digest,
+            max_workers=max_workers,
+            refresh_within=timedelta(hours=cache.config.ttl_hours) if refresh_mutable else None,
+        )
 
+        duration = self._record_operation_metrics("prefetch", start_time, success=not result.errors)
+        log.info(
+            "prefetch_completed",
+            fetched=len(result.fetched),
+            renewed=len(result.renewed),
+            cached=len(result.cached),
+            failed=result.failed_tags,
+            duration_ms=int(duration * 1000),
+        )
         return result
 
+    def cache_refresher(
+        self,
+        *,
+        filter_pattern: str | None = None,
+        environments: Sequence[str] | None = None,
+        max_workers: int = DEFAULT_WARM_WORKERS,
+        interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+    ) -> CacheRefresher:
+        """Build a background refresher that keeps prefetched tags fresh.
+
+        Each pass re-lists the repository (so newly promoted tags are
+        picked up) and runs prefetch() with refresh_mutable=True, so mutable
+        tags such as ``latest-prod`` follow the registry between passes.
+
+        Args:
+            filter_pattern: Optional glob pattern tags must match.
+            environments: Optional environments whose tags to keep fresh.
+            max_workers: Maximum number of tags fetched at once.
+            interval_seconds: Seconds between passes.
+
+        Returns:
+            An unstarted CacheRefresher; call start() or use it as a
+            context manager.
+
+        Example:
+            >>> with client.cache_refresher(environments=["prod"]):
+            ...     run_pipeline()
+        """
+        return CacheRefresher(
+            lambda: self.prefetch(
+                filter_pattern=filter_pattern,
+                environments=environments,
+                max_workers=max_workers,
+                refresh_mutable=True,
+            ),
+            interval_seconds=interval_seconds,
+        )
+
+    def _prefetch_targets(
+        self,
+        filter_pattern: str | None,
+        environments: Sequence[str] | None,
+    ) -> dict[str, str | None]:
+        """Select tags to prefetch, mapped to the environment for verification."""
+        tag_names = self.list_tag_names(pattern=filter_pattern)
+        if not environments:
+            return dict.fromkeys(tag_names, self._environment)
+
+        targets: dict[str, str | None] = {}
+        for tag_name in tag_names:
+            for env in environments:
+                if tag_name.endswith(f"-{env}"):
+                    targets[tag_name] = env
+                    break
+        return targets
+
+    def _resolve_content_digest(self, tag: str) -> str | None:
+        """Return the digest of a tag's artifact content from its manifest.
+
+        This equals the digest pull() computes over the content (the layer
+        digest, or the recorded content digest of a packed artifact), so it
+        identifies cached content without downloading it.
+
+        Args:
+            tag: Tag to resolve.
+
+        Returns:
+            Content digest, or None if the manifest has no artifact layer.
+        """
+        with self._with_circuit_breaker("pull"):
+            manifest_data = self._fetch_manifest_data(tag)
+        return layers_content_digest(manifest_data.get("layers", []))
+
     def promote_to_environment(
         self,
         source_tag: str,
@@ -1562,35 +2040,103 @@ class OCIClient:
                     registry=self._registry_host,
                 )
 
-    def copy_tag(self, source_ref: str, dest_ref: str) -> None:
+    def copy_tag(
+        self,
+        source_ref: str,
+        dest_ref: str,
+        *,
+        source_client: OCIClient | None = None,
+        blob_stage: BlobStage | None = None,
+    ) -> None:
         """Copy an artifact tag from source to destination.
 
-        Used for cross-registry sync operations (FR-028).
+        Used for cross-registry sync operations (FR-028). The source manifest
+        is read from source_client, every referenced blob this registry does
+        not already have is uploaded, and the manifest is pushed under the
+        destination tag. Blobs already present (checked by digest) are never
+        re-uploaded.
+
+        Circuit breaking is left to the caller, so a sync engine guarding this
+        registry does not record each failure twice.
 
         Args:
             source_ref: Full source reference (e.g., oci://registry/repo:tag).
-            dest_ref: Full destination reference.
+            dest_ref: Full destination reference in this registry.
+            source_client: Client for the source registry. Defaults to self.
+            blob_stage: Shared stage of downloaded source blobs. When None, a
+                private stage is used and removed after the copy.
 
         Raises:
             ArtifactNotFoundError: If source artifact doesn't exist.
             AuthenticationError: If authentication fails.
-            RegistryUnavailableError: If registry is unavailable.
-
-        Note:
-            This is a stub implementation. Production use requires
-            oci-copy or crane copy integration.
+            ImmutabilityViolationError: If the destination tag is immutable and exists.
+            RegistryUnavailableError: If a blob or manifest upload fails.
         """
-        logger.info(
-            "copy_tag_stub",
-            source_ref=source_ref,
-            dest_ref=dest_ref,
-            message="Cross-registry copy not yet implemented",
-        )
-        raise NotImplementedError(
-            "Cross-registry copy requires oci-copy or crane integration. "
-            f"Would copy {source_ref} to {dest_ref}"
+        from floe_core.oci.registry_sync import BlobStage
+
+        source = source_client or self
+        source_tag = self._tag_from_ref(source_ref)
+        dest_tag = self._tag_from_ref(dest_ref)
+        log = logger.bind(source_ref=source_ref, dest_ref=dest_ref)
+
+        self._check_immutability_before_push(dest_tag)
+        manifest_data = source._fetch_manifest_data(source_tag)
+        descriptors: builtins.list[dict[str, Any]] = list(manifest_data.get("layers", []))
+        if "config" in manifest_data:
+            descriptors.insert(0, manifest_data["config"])
+
+        stage = blob_stage or BlobStage(source)
+        try:
+            oras_client = self._create_oras_client()
+            container = oras_client.get_container(self._build_target_ref(dest_tag))
+            uploaded = 0
+            for descriptor in descriptors:
+                digest = descriptor["digest"]
+                if oras_client.get_blob(container, digest, head=True).ok:
+                    continue
+                blob_path = stage.fetch(descriptor, source_tag)
+                response = oras_client.upload_blob(str(blob_path), container, descriptor)
+                if not response.ok:
+                    raise RegistryUnavailableError(
+                        self._registry_host,
+                        f"Blob upload failed for {digest}: {response.status_code}",
+                    )
+                uploaded += 1
+
+            response = oras_client.upload_manifest(manifest_data, container)
+            if not response.ok:
+                raise RegistryUnavailableError(
+                    self._registry_host,
+                    f"Manifest upload failed: {response.status_code}: {response.text}",
+                )
+        finally:
+            if blob_stage is None:
+                stage.close()
+
+        log.info(
+            "copy_tag_completed",
+            blobs_total=len(descriptors),
+            blobs_uploaded=uploaded,
         )
 
+    @staticmethod
+    def _tag_from_ref(ref: str) -> str:
+        """Extract the tag from a full reference (e.g., oci://host/repo:tag).
+
+        Args:
+            ref: Full artifact reference.
+
+        Returns:
+            The tag component.
+
+        Raises:
+            ValueError: If the reference has no tag.
+        """
+        _, sep, tag = ref.rpartition(":")
+        if not sep or not tag or "/" in tag:
+            raise ValueError(f"Reference has no tag: {ref}")
+        return tag
+
     def get_artifact_digest(self, tag: str) -> str:
         """Get the digest of an artifact by tag.
 
@@ -1628,4 +2174,5 @@ __all__ = [
     "MUTABLE_TAG_PATTERNS",
     "OCIClient",
     "SEMVER_PATTERN",
+    "TAG_NAMES_CACHE_TTL_SECONDS",
 ]
@@ -0,0 +1,407 @@
+"""Pooled, authenticated registry connections for OCI operations.
+
+Every OCIClient operation used to build a fresh ORAS client: a new
+requests.Session (new TCP + TLS handshake), a new docker login, and a new
+bearer token negotiation on the first 401. RegistryConnectionPool keeps
+that state per registry host and credentials instead:
+
+- One urllib3 connection pool (HTTPAdapter) per registry, mounted on every
+  pooled session, so keep-alive connections are reused across calls and
+  across BatchFetcher worker threads.
+- One ORAS client per thread. ORAS auth backends mutate their token state
+  on every request, so clients are not shared between threads; only the
+  underlying connections and tokens are.
+- A BearerTokenCache shared by all of the pool's clients. Tokens are kept
+  until ``expires_in`` (minus a small leeway) and dropped early when the
+  registry rejects them.
+- A single docker login per pool rather than per operation.
+
+HTTP/2 is not used: ORAS talks to registries through requests, which only
+speaks HTTP/1.1. Keep-alive pooling removes the repeated handshakes that
+HTTP/2 multiplexing would otherwise have saved.
+
+Example:
+    >>> from floe_core.oci.connection_pool import get_connection_pool
+    >>> pool = get_connection_pool("harbor.example.com", username="u", password="p")
+    >>> oras_client = pool.client()
+    >>> oras_client.get_manifest(container="harbor.example.com/floe/demo:v1.0.0")
+
+See Also:
+    - floe_core.oci.client.OCIClient._create_oras_client: Main caller
+    - floe_core.oci.batch_fetcher.BatchFetcher: Per-worker pooled clients
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import oras.auth.utils as auth_utils
+import structlog
+from oras.auth.token import TokenAuth
+from oras.client import OrasClient
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    import requests
+
+    from floe_core.oci.metrics import OCIMetrics
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_POOL_MAXSIZE = 20
+"""Connections kept alive per registry host (matches BatchFetcher's worker limit)."""
+
+DEFAULT_TOKEN_EXPIRES_IN = 60
+"""Token lifetime in seconds when the token endpoint omits expires_in (Docker spec)."""
+
+TOKEN_EXPIRY_LEEWAY_SECONDS = 10
+"""Tokens are treated as expired this many seconds before their real expiry."""
+
+TokenKey = tuple[str, str, str]
+"""Bearer token cache key: (realm, service, scope)."""
+
+
+class BearerTokenCache:
+    """Thread-safe cache of registry bearer tokens honoring expires_in.
+
+    Example:
+        >>> cache = BearerTokenCache()
+        >>> cache.put(("https://auth", "registry", "repo:floe:pull"), "tok", 300)
+        >>> cache.get(("https://auth", "registry", "repo:floe:pull"))
+        'tok'
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty BearerTokenCache."""
+        self._tokens: dict[TokenKey, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: TokenKey) -> str | None:
+        """Return the cached token for key, or None if missing or expired.
+
+        Args:
+            key: (realm, service, scope) the token was issued for.
+
+        Returns:
+            Bearer token, or None.
+        """
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is None:
+                return None
+            token, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._tokens[key]
+                return None
+            return token
+
+    def put(self, key: TokenKey, token: str, expires_in: int | None) -> None:
+        """Cache a token.
+
+        Args:
+            key: (realm, service, scope) the token was issued for.
+            token: Bearer token.
+            expires_in: Token lifetime in seconds from the token endpoint.
+                Defaults to DEFAULT_TOKEN_EXPIRES_IN when None.
+        """
+        lifetime = expires_in if expires_in is not None else DEFAULT_TOKEN_EXPIRES_IN
+        expires_at = time.monotonic() + max(lifetime - TOKEN_EXPIRY_LEEWAY_SECONDS, 0)
+        with self._lock:
+            self._tokens[key] = (token, expires_at)
+
+    def invalidate(self, key: TokenKey) -> None:
+        """Drop the cached token for key, if any.
+
+        Args:
+            key: (realm, service, scope) to invalidate.
+        """
+        with self._lock:
+            self._tokens.pop(key, None)
+
+    def __len__(self) -> int:
+        """Return the number of cached tokens (including expired ones)."""
+        with self._lock:
+            return len(self._tokens)
+
+
+class _PooledTokenAuth(TokenAuth):  # type: ignore[misc]
+    """ORAS token auth backend backed by the pool's BearerTokenCache.
+
+    ORAS keeps one token per client and never expires it. This backend
+    looks tokens up in the shared cache per (realm, service, scope),
+    records expires_in when fetching, and stops sending a token once it has
+    expired so the registry challenges for a fresh one.
+    """
+
+    def __init__(self, pool: RegistryConnectionPool) -> None:
+        super().__init__()
+        self._pool = pool
+        self._token_key: TokenKey | None = None
+
+    def get_auth_header(self) -> dict[str, str]:
+        """Return the Authorization header, dropping expired tokens."""
+        if self._token_key is not None:
+            self.token = self._pool.tokens.get(self._token_key)
+        header: dict[str, str] = super().get_auth_header()
+        return header
+
+    def authenticate_request(
+        self,
+        original: requests.Response,
+        headers: dict[str, str],
+        refresh: bool = False,
+    ) -> tuple[dict[str, str], bool]:
+        """Answer a registry auth challenge from the cache when possible."""
+        raw = original.headers.get("Www-Authenticate")
+        if raw:
+            challenge = auth_utils.parse_auth_header(raw)
+            key: TokenKey = (challenge.realm or "", challenge.service or "", challenge.scope or "")
+            cached = self._pool.tokens.get(key)
+            # A token the registry just rejected must not be offered again
+            if cached is not None and (
+                refresh or headers.get("Authorization") == f"Bearer {cached}"
+            ):
+                self._pool.tokens.invalidate(key)
+                cached = None
+            self._token_key = key
+            self.token = cached
+            self._pool.record("token_hit" if cached is not None else "token_miss")
+        result: tuple[dict[str, str], bool] = super().authenticate_request(original, headers)
+        return result
+
+    def request_token(self, h: auth_utils.authHeader) -> str | None:
+        """Request a token with basic auth and cache it."""
+        return self._fetch_token(h, anonymous=False)
+
+    def request_anonymous_token(self, h: auth_utils.authHeader) -> str | None:
+        """Request an anonymous token and cache it."""
+        return self._fetch_token(h, anonymous=True)
+
+    def _fetch_token(self, h: auth_utils.authHeader, *, anonymous: bool) -> str | None:
+        """Fetch a token from the realm, caching it for expires_in seconds."""
+        if not h.realm:
+            return None
+        realm = h.realm if h.realm.startswith("http") else f"{self.prefix}://{h.realm}"
+        params = {
+            name: value for name, value in (("service", h.service), ("scope", h.scope)) if value
+        }
+        headers = {"Accept": "application/json"}
+        basic_auth = getattr(self, "_basic_auth", None)
+        if not anonymous and basic_auth:
+            headers["Authorization"] = f"Basic {basic_auth}"
+
+        response = self.session.get(realm, headers=headers, params=params, verify=self._tls_verify)
+        if response.status_code != 200:
+            logger.debug(
+                "registry_token_request_failed",
+                realm=realm,
+                status_code=response.status_code,
+            )
+            return None
+
+        data: dict[str, Any] = response.json()
+        token: str | None = data.get("token") or data.get("access_token")
+        if token:
+            key: TokenKey = (h.realm, h.service or "", h.scope or "")
+            self._pool.tokens.put(key, token, data.get("expires_in"))
+            self._pool.record("token_fetched")
+        return token
+
+
+class RegistryConnectionPool:
+    """Keep-alive connections, ORAS clients, and tokens for one registry.
+
+    Thread Safety:
+        client() returns a client owned by the calling thread. All of the
+        pool's clients share one HTTPAdapter and one BearerTokenCache, both
+        of which are thread-safe.
+
+    Attributes:
+        registry_host: Registry hostname.
+        tokens: Bearer tokens shared by the pool's clients.
+    """
+
+    def __init__(
+        self,
+        registry_host: str,
+        *,
+        tls_verify: bool = True,
+        auth_backend: str = "token",
+        username: str = "",
+        password: str = "",
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        metrics: OCIMetrics | None = None,
+    ) -> None:
+        """Initialize RegistryConnectionPool.
+
+        Args:
+            registry_host: Registry hostname.
+            tls_verify: Whether to verify TLS certificates.
+            auth_backend: ORAS auth backend name ("token" or "basic").
+            username: Registry username. Empty for anonymous access.
+            password: Registry password or token. Empty for anonymous access.
+            pool_maxsize: Connections kept alive for the registry.
+            metrics: Optional metrics collector for pool events.
+        """
+        self.registry_host = registry_host
+        self.tokens = BearerTokenCache()
+        self._tls_verify = tls_verify
+        self._auth_backend = auth_backend
+        self._username = username
+        self._password = password
+        self._metrics = metrics
+        # pool_connections counts distinct hosts: registry plus token realm(s)
+        self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._logged_in = False
+        self._clients_created = 0
+
+    def client(self) -> OrasClient:
+        """Return the calling thread's authenticated ORAS client.
+
+        Returns:
+            OrasClient using the pool's connections and token cache.
+
+        Raises:
+            Exception: If the first login to the registry fails.
+        """
+        oras_client: OrasClient | None = getattr(self._local, "client", None)
+        if oras_client is not None:
+            self.record("client_reused")
+            return oras_client
+
+        oras_client = self._new_client()
+        self._local.client = oras_client
+        return oras_client
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool statistics.
+
+        Returns:
+            Dictionary with registry_host, clients_created, and cached_tokens.
+        """
+        return {
+            "registry_host": self.registry_host,
+            "clients_created": self._clients_created,
+            "cached_tokens": len(self.tokens),
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._adapter.close()
+
+    def record(self, operation: str) -> None:
+        """Record a pool event in metrics, if configured.
+
+        Args:
+            operation: Pool event name.
+        """
+        if self._metrics is not None:
+            self._metrics.record_connection_pool_operation(operation, self.registry_host)
+
+    def _new_client(self) -> OrasClient:
+        """Create an ORAS client wired to the shared adapter and token cache."""
+        oras_client = OrasClient(
+            insecure=not self._tls_verify,
+            auth_backend=self._auth_backend,
+        )
+        oras_client.session.mount("https://", self._adapter)
+        oras_client.session.mount("http://", self._adapter)
+
+        if self._auth_backend == "token":
+            auth = _PooledTokenAuth(self)
+            auth.session = oras_client.session
+            auth.prefix = oras_client.prefix
+            auth._tls_verify = oras_client._tls_verify
+            oras_client.auth = auth
+
+        if self._username and self._password:
+            with self._lock:
+                if self._logged_in:
+                    oras_client.auth.set_basic_auth(self._username, self._password)
+                else:
+                    oras_client.login(
+                        hostname=self.registry_host,
+                        username=self._username,
+                        password=self._password,
+                    )
+                    self._logged_in = True
+                    self.record("login")
+
+        with self._lock:
+            self._clients_created += 1
+        self.record("client_created")
+        logger.debug(
+            "registry_pool_client_created",
+            registry=self.registry_host,
+            thread=threading.current_thread().name,
+        )
+        return oras_client
+
+
+_pools: dict[tuple[str, bool, str, str, str], RegistryConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(
+    registry_host: str,
+    *,
+    tls_verify: bool = True,
+    auth_backend: str = "token",
+    username: str = "",
+    password: str = "",
+    metrics: OCIMetrics | None = None,
+) -> RegistryConnectionPool:
+    """Return the process-wide pool for a registry and set of credentials.
+
+    Pools are keyed by host, TLS setting, auth backend, and credentials, so
+    rotated credentials get a fresh pool instead of stale logins.
+
+    Args:
+        registry_host: Registry hostname.
+        tls_verify: Whether to verify TLS certificates.
+        auth_backend: ORAS auth backend name ("token" or "basic").
+        username: Registry username. Empty for anonymous access.
+        password: Registry password or token. Empty for anonymous access.
+        metrics: Optional metrics collector, used when the pool is created.
+
+    Returns:
+        RegistryConnectionPool shared by every caller with the same key.
+    """
+    password_hash = hashlib.sha256(password.encode()).hexdigest()
+    key = (registry_host, tls_verify, auth_backend, username, password_hash)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = RegistryConnectionPool(
+                registry_host,
+                tls_verify=tls_verify,
+                auth_backend=auth_backend,
+                username=username,
+                password=password,
+                metrics=metrics,
+            )
+            _pools[key] = pool
+        return pool
+
+
+def clear_connection_pools() -> None:
+    """Close and forget every pool (e.g., after credential revocation or in tests)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+__all__ = [
+    "DEFAULT_POOL_MAXSIZE",
+    "DEFAULT_TOKEN_EXPIRES_IN",
+    "BearerTokenCache",
+    "RegistryConnectionPool",
+    "clear_connection_pools",
+    "get_connection_pool",
+]
@@ -0,0 +1,347 @@
+"""Native key-based blob signing compatible with cosign.
+
+Implements:
+    - FR-001: Cosign integration (in-process key-based signing)
+    - FR-010: Key-based signature verification
+
+Signs and verifies blobs with local ECDSA (P-256, P-384, P-521) and Ed25519
+keys in-process using ``cryptography``, so the common air-gapped flows do not
+spawn a cosign subprocess per artifact.
+
+Signatures match what ``cosign sign-blob --key <file> --tlog-upload=false``
+produces: ECDSA signatures are ASN.1 DER over the curve's default digest
+(SHA-256, SHA-384, SHA-512) and Ed25519 signatures are over the raw message.
+Bundles are written in cosign's local payload format
+(``{"base64Signature": ...}``), and both that format and the Sigstore bundle
+format (``messageSignature``, ``dsseEnvelope``) are accepted on verification.
+
+Keys that cannot be used natively return ``None`` from the loaders so callers
+fall back to the cosign CLI: KMS URIs, cosign's own encrypted key format
+(scrypt + secretbox), and anything ``cryptography`` cannot parse.
+
+Example:
+    >>> from floe_core.oci.key_signing import load_private_key, sign_blob
+    >>> key = load_private_key("/keys/signing.pem")
+    >>> if key is not None:
+    ...     bundle = sign_blob(key, b"artifact content")
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.ec import (
+        EllipticCurvePrivateKey,
+        EllipticCurvePublicKey,
+    )
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey,
+        Ed25519PublicKey,
+    )
+
+    NativePrivateKey = EllipticCurvePrivateKey | Ed25519PrivateKey
+    NativePublicKey = EllipticCurvePublicKey | Ed25519PublicKey
+
+logger = logging.getLogger(__name__)
+
+# Key references handled by cosign's KMS providers, never loaded natively
+KMS_KEY_PREFIXES = ("awskms://", "gcpkms://", "azurekms://", "hashivault://")
+
+# Environment variable cosign reads the private key password from
+COSIGN_PASSWORD_ENV = "COSIGN_PASSWORD"
+
+# PEM labels of cosign's scrypt + secretbox encrypted key format
+_COSIGN_ENCRYPTED_KEY_MARKERS = (
+    b"ENCRYPTED SIGSTORE PRIVATE KEY",
+    b"ENCRYPTED COSIGN PRIVATE KEY",
+)
+
+# Digest cosign pairs with each ECDSA curve
+_CURVE_HASHES = {
+    "secp256r1": "SHA256",
+    "secp384r1": "SHA384",
+    "secp521r1": "SHA512",
+}
+
+# Sigstore messageDigest algorithm names mapped to hashlib constructors
+_DIGEST_ALGORITHMS = {
+    "SHA2_256": "sha256",
+    "SHA2_384": "sha384",
+    "SHA2_512": "sha512",
+}
+
+
+def is_kms_key_ref(key_ref: str) -> bool:
+    """Return True if key_ref is a KMS URI that only cosign can use."""
+    return key_ref.startswith(KMS_KEY_PREFIXES)
+
+
+def _read_key_file(key_ref: str) -> bytes | None:
+    """Read key material from a file path, or None if unreadable."""
+    if is_kms_key_ref(key_ref):
+        return None
+    try:
+        return Path(key_ref).read_bytes()
+    except OSError as e:
+        logger.debug("Cannot read key file %s natively: %s", key_ref, e)
+        return None
+
+
+def load_private_key(key_ref: str) -> NativePrivateKey | None:
+    """Load an ECDSA or Ed25519 private key for native signing.
+
+    PEM keys in PKCS#8, SEC1 or traditional OpenSSL form are supported.
+    Encrypted PEM keys are decrypted with ``COSIGN_PASSWORD``.
+
+    Args:
+        key_ref: Path to the private key file
+
+    Returns:
+        The private key, or None if the key must be handled by cosign
+    """
+    data = _read_key_file(key_ref)
+    if data is None:
+        return None
+    if any(marker in data for marker in _COSIGN_ENCRYPTED_KEY_MARKERS):
+        logger.debug("Key %s uses cosign's encrypted format; deferring to cosign", key_ref)
+        return None
+
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+    except ImportError:
+        logger.debug("cryptography not installed; deferring key-based signing to cosign")
+        return None
+
+    password = os.environ.get(COSIGN_PASSWORD_ENV)
+    try:
+        key = serialization.load_pem_private_key(
+            data, password=password.encode() if password else None
+        )
+    except TypeError:
+        # Password supplied for an unencrypted key, or missing for an encrypted one
+        try:
+            key = serialization.load_pem_private_key(data, password=None)
+        except (TypeError, ValueError) as e:
+            logger.debug("Cannot load private key %s natively: %s", key_ref, e)
+            return None
+    except ValueError as e:
+        logger.debug("Cannot load private key %s natively: %s", key_ref, e)
+        return None
+
+    if isinstance(key, (ec.EllipticCurvePrivateKey, ed25519.Ed25519PrivateKey)):
+        if isinstance(key, ec.EllipticCurvePrivateKey) and key.curve.name not in _CURVE_HASHES:
+            logger.debug("Unsupported curve %s; deferring to cosign", key.curve.name)
+            return None
+        return key
+
+    logger.debug("Unsupported key type %s; deferring to cosign", type(key).__name__)
+    return None
+
+
+def load_public_key(key_ref: str) -> NativePublicKey | None:
+    """Load an ECDSA or Ed25519 public key for native verification.
+
+    Accepts a PEM public key (as written by ``cosign generate-key-pair``)
+    or a PEM certificate, whose subject public key is used.
+
+    Args:
+        key_ref: Path to the public key or certificate file
+
+    Returns:
+        The public key, or None if the key must be handled by cosign
+    """
+    data = _read_key_file(key_ref)
+    if data is None:
+        return None
+
+    try:
+        from cryptography import x509
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+    except ImportError:
+        logger.debug("cryptography not installed; deferring key-based verification to cosign")
+        return None
+
+    try:
+        if b"BEGIN CERTIFICATE" in data:
+            key: Any = x509.load_pem_x509_certificate(data).public_key()
+        else:
+            key = serialization.load_pem_public_key(data)
+    except ValueError as e:
+        logger.debug("Cannot load public key %s natively: %s", key_ref, e)
+        return None
+
+    if isinstance(key, ec.EllipticCurvePublicKey) and key.curve.name in _CURVE_HASHES:
+        return key
+    if isinstance(key, ed25519.Ed25519PublicKey):
+        return key
+
+    logger.debug("Unsupported public key type %s; deferring to cosign", type(key).__name__)
+    return None
+
+
+def _ecdsa_algorithm(curve_name: str) -> Any:
+    """Build the ECDSA signature algorithm cosign uses for a curve."""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    return ec.ECDSA(getattr(hashes, _CURVE_HASHES[curve_name])())
+
+
+def sign_blob(private_key: NativePrivateKey, content: bytes) -> dict[str, Any]:
+    """Sign content and return a cosign local payload bundle.
+
+    Args:
+        private_key: Key returned by load_private_key()
+        content: Bytes to sign
+
+    Returns:
+        Bundle dict with ``base64Signature``, as written by cosign sign-blob
+    """
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    if isinstance(private_key, ec.EllipticCurvePrivateKey):
+        signature = private_key.sign(content, _ecdsa_algorithm(private_key.curve.name))
+    else:
+        signature = private_key.sign(content)
+
+    return {"base64Signature": base64.b64encode(signature).decode("ascii")}
+
+
+def sign_blobs(private_key: NativePrivateKey, contents: list[bytes]) -> list[dict[str, Any]]:
+    """Sign several blobs with one loaded key.
+
+    Args:
+        private_key: Key returned by load_private_key()
+        contents: Blobs to sign
+
+    Returns:
+        One bundle per blob, in input order
+    """
+    return [sign_blob(private_key, content) for content in contents]
+
+
+def _digest_algorithm(public_key: NativePublicKey, recorded: str | None) -> str | None:
+    """Return the Sigstore digest algorithm expected for public_key.
+
+    ECDSA keys hash with their curve's digest (SHA-256, SHA-384, SHA-512).
+    Ed25519 signs the raw message, so any supported recorded digest is accepted.
+    """
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        return "SHA2_" + _CURVE_HASHES[public_key.curve.name].removeprefix("SHA")
+    return recorded if recorded in _DIGEST_ALGORITHMS else None
+
+
+def _signature_from_bundle(
+    bundle_data: dict[str, Any],
+    content: bytes,
+    public_key: NativePublicKey,
+) -> bytes | None:
+    """Extract the raw signature from a cosign or Sigstore bundle.
+
+    For Sigstore bundles, the recorded message digest must match content and
+    use the digest algorithm of public_key.
+    """
+    signature_b64 = bundle_data.get("base64Signature")
+    message_signature = bundle_data.get("messageSignature")
+    dsse_envelope = bundle_data.get("dsseEnvelope")
+
+    if signature_b64 is None and isinstance(message_signature, dict):
+        digest = message_signature.get("messageDigest") or {}
+        expected = digest.get("digest")
+        if expected is not None:
+            algorithm = _digest_algorithm(public_key, digest.get("algorithm"))
+            recorded = digest.get("algorithm", algorithm)
+            if algorithm is None or recorded != algorithm:
+                logger.error("Unsupported bundle message digest algorithm: %s", recorded)
+                return None
+            hasher = hashlib.new(_DIGEST_ALGORITHMS[algorithm], content)
+            if expected != base64.b64encode(hasher.digest()).decode("ascii"):
+                logger.error("Bundle message digest does not match content")
+                return None
+        signature_b64 = message_signature.get("signature")
+
+    if signature_b64 is None and isinstance(dsse_envelope, dict):
+        signature_b64 = dsse_envelope.get("signature")
+
+    if not isinstance(signature_b64, str):
+        return None
+
+    try:
+        return base64.b64decode(signature_b64, validate=True)
+    except (binascii.Error, ValueError):
+        logger.error("Signature in bundle is not valid base64")
+        return None
+
+
+def verify_blob(
+    public_key: NativePublicKey,
+    content: bytes,
+    bundle_data: dict[str, Any],
+) -> bool:
+    """Verify a cosign or Sigstore bundle signature over content.
+
+    Args:
+        public_key: Key returned by load_public_key()
+        content: Original content bytes
+        bundle_data: Parsed signature bundle
+
+    Returns:
+        True if the signature is valid for content, False otherwise
+    """
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    signature = _signature_from_bundle(bundle_data, content, public_key)
+    if signature is None:
+        logger.error("No signature found in bundle")
+        return False
+
+    try:
+        if isinstance(public_key, ec.EllipticCurvePublicKey):
+            public_key.verify(signature, content, _ecdsa_algorithm(public_key.curve.name))
+        else:
+            public_key.verify(signature, content)
+    except InvalidSignature:
+        logger.error("Key-based signature verification failed")
+        return False
+
+    logger.debug("Key-based signature verification succeeded")
+    return True
+
+
+def requires_cosign(key_ref: str, *, public: bool = False) -> bool:
+    """Return True if key_ref cannot be used without the cosign CLI.
+
+    Args:
+        key_ref: Key path or KMS URI
+        public: Check a public key (verification) instead of a private key
+
+    Returns:
+        True for KMS URIs and keys that cannot be loaded natively
+    """
+    loader = load_public_key if public else load_private_key
+    return loader(key_ref) is None
+
+
+__all__ = [
+    "COSIGN_PASSWORD_ENV",
+    "KMS_KEY_PREFIXES",
+    "is_kms_key_ref",
+    "load_private_key",
+    "load_public_key",
+    "requires_cosign",
+    "sign_blob",
+    "sign_blobs",
+    "verify_blob",
+]
@@ -38,7 +38,7 @@ from typing import TYPE_CHECKING, Any
 
 import structlog
 
-from floe_core.oci.errors import OCIError
+from floe_core.oci.errors import DigestMismatchError, OCIError
 
 if TYPE_CHECKING:
     from floe_core.oci.cache import CacheManager
@@ -404,21 +404,29 @@ class PullOperations:
             span.set_attribute("oci.cache_hit", False)
             return None
 
-        cache_entry = self._cache_manager.get(registry_uri, tag)
-        if cache_entry is None:
+        try:
+            with self._cache_manager.open_content(registry_uri, tag) as cached:
+                if cached is None:
+                    span.set_attribute("oci.cache_hit", False)
+                    if self._metrics:
+                        self._metrics.record_cache_operation("miss")
+                    return None
+
+                # Cache hit (digest verified; pydantic needs one bytes copy)
+                cache_entry, view = cached
+                log.info("pull_cache_hit", digest=cache_entry.digest)
+                span.set_attribute("oci.cache_hit", True)
+                if self._metrics:
+                    self._metrics.record_cache_operation("hit")
+                artifacts = CompiledArtifacts.model_validate_json(view.tobytes())
+        except DigestMismatchError as e:
+            # Corrupt entry was evicted; fall back to a registry pull
+            log.warning("pull_cache_corrupt", error=str(e))
             span.set_attribute("oci.cache_hit", False)
             if self._metrics:
                 self._metrics.record_cache_operation("miss")
             return None
 
-        # Cache hit
-        log.info("pull_cache_hit", digest=cache_entry.digest)
-        span.set_attribute("oci.cache_hit", True)
-        if self._metrics:
-            self._metrics.record_cache_operation("hit")
-        content = cache_entry.path.read_bytes()
-        artifacts = CompiledArtifacts.model_validate_json(content)
-
         # Record metrics
         duration = time.monotonic() - start_time
         if self._metrics:
@@ -7,6 +7,7 @@ distribution-spec v1.1.1 and ORAS artifact specification.
 Key Functions:
     build_manifest: Create ArtifactManifest from CompiledArtifacts
     calculate_digest: Calculate SHA256 digest for content
+    manifest_content: OCI manifest JSON for a built ArtifactManifest
     serialize_layer: Serialize CompiledArtifacts as OCI layer
 
 Media Type: application/vnd.floe.compiled-artifacts.v1+json
@@ -214,6 +215,20 @@ def build_manifest(
     return manifest
 
 
+def manifest_content(manifest: ArtifactManifest) -> dict[str, Any]:
+    """Return the OCI manifest JSON document for a built ArtifactManifest.
+
+    Used when uploading layers individually rather than through ORAS push.
+
+    Args:
+        manifest: Manifest from build_manifest().
+
+    Returns:
+        Dictionary representing OCI manifest JSON.
+    """
+    return _build_manifest_content(layers=manifest.layers, annotations=manifest.annotations)
+
+
 def _build_manifest_content(
     layers: list[ArtifactLayer],
     annotations: dict[str, str],
@@ -468,6 +483,7 @@ __all__ = [
     "build_manifest",
     "calculate_digest",
     "create_empty_config",
+    "manifest_content",
     "serialize_layer",
     # Parse operations (pull/inspect)
     "calculate_layers_total_size",
@@ -8,15 +8,20 @@ Metrics Emitted:
     Counters:
         - floe_oci_operations_total: Total operations by type, status, and registry
         - floe_oci_cache_operations_total: Cache operations by type (hit/miss/evict)
+        - floe_oci_cache_evicted_bytes_total: Bytes removed from the cache by reason
+        - floe_oci_connection_pool_operations_total: Pooled client and token cache
+          events by type and registry
 
     Histograms:
         - floe_oci_operation_duration_seconds: Operation duration distribution
         - floe_oci_artifact_size_bytes: Artifact size distribution
+        - floe_oci_cache_lock_wait_seconds: Time spent waiting for the cache lock
 
     Gauges:
         - floe_oci_circuit_breaker_state: Circuit breaker state (0=closed, 1=open, 2=half_open)
         - floe_oci_cache_size_bytes: Current cache size in bytes
         - floe_oci_cache_entries_count: Current number of cache entries
+        - floe_oci_cache_hit_ratio: Cache hit ratio of the reporting process
 
 Trace Spans:
     - floe.oci.push: Full push operation
@@ -123,6 +128,10 @@ class OCIMetrics:
     CIRCUIT_BREAKER_FAILURES = "floe_oci_circuit_breaker_failures"
     CACHE_SIZE_BYTES = "floe_oci_cache_size_bytes"
     CACHE_ENTRIES_COUNT = "floe_oci_cache_entries_count"
+    CONNECTION_POOL_OPERATIONS_TOTAL = "floe_oci_connection_pool_operations_total"
+    CACHE_HIT_RATIO = "floe_oci_cache_hit_ratio"
+    CACHE_EVICTED_BYTES_TOTAL = "floe_oci_cache_evicted_bytes_total"
+    CACHE_LOCK_WAIT_SECONDS = "floe_oci_cache_lock_wait_seconds"
 
     # Span names
     SPAN_PUSH = "floe.oci.push"
@@ -158,6 +167,10 @@ class OCIMetrics:
         self._circuit_breaker_failures_gauge: Gauge | None = None
         self._cache_size_gauge: Gauge | None = None
         self._cache_entries_gauge: Gauge | None = None
+        self._connection_pool_counter: Counter | None = None
+        self._cache_hit_ratio_gauge: Gauge | None = None
+        self._cache_evicted_bytes_counter: Counter | None = None
+        self._cache_lock_wait_histogram: Histogram | None = None
 
     @property
     def operations_counter(self) -> Counter:
@@ -247,6 +260,50 @@ class OCIMetrics:
             )
         return self._cache_entries_gauge
 
+    @property
+    def connection_pool_counter(self) -> Counter:
+        """Get or create the connection pool operations counter."""
+        if self._connection_pool_counter is None:
+            self._connection_pool_counter = self._meter.create_counter(
+                self.CONNECTION_POOL_OPERATIONS_TOTAL,
+                unit="1",
+                description="Pooled registry client and bearer token cache events",
+            )
+        return self._connection_pool_counter
+
+    @property
+    def cache_hit_ratio_gauge(self) -> Gauge:
+        """Get or create the cache hit ratio gauge."""
+        if self._cache_hit_ratio_gauge is None:
+            self._cache_hit_ratio_gauge = self._meter.create_gauge(
+                self.CACHE_HIT_RATIO,
+                unit="1",
+                description="Fraction of cache lookups served from the cache",
+            )
+        return self._cache_hit_ratio_gauge
+
+    @property
+    def cache_evicted_bytes_counter(self) -> Counter:
+        """Get or create the cache evicted bytes counter."""
+        if self._cache_evicted_bytes_counter is None:
+            self._cache_evicted_bytes_counter = self._meter.create_counter(
+                self.CACHE_EVICTED_BYTES_TOTAL,
+                unit="By",
+                description="Total bytes removed from the cache by reason",
+            )
+        return self._cache_evicted_bytes_counter
+
+    @property
+    def cache_lock_wait_histogram(self) -> Histogram:
+        """Get or create the cache lock wait histogram."""
+        if self._cache_lock_wait_histogram is None:
+            self._cache_lock_wait_histogram = self._meter.create_histogram(
+                self.CACHE_LOCK_WAIT_SECONDS,
+                unit="s",
+                description="Time spent waiting to acquire the cache file lock",
+            )
+        return self._cache_lock_wait_histogram
+
     def record_operation(
         self,
         operation: str,
@@ -343,6 +400,22 @@ class OCIMetrics:
 
         self.cache_operations_counter.add(1, attributes=attributes)
 
+    def record_connection_pool_operation(self, operation: str, registry: str) -> None:
+        """Record a connection pool event.
+
+        Args:
+            operation: Pool event (client_created, client_reused, login,
+                token_hit, token_miss, token_fetched).
+            registry: Registry hostname or URI.
+        """
+        self.connection_pool_counter.add(
+            1,
+            attributes={
+                "operation": operation,
+                "registry": self._normalize_registry(registry),
+            },
+        )
+
     def set_circuit_breaker_state(
         self,
         registry: str,
@@ -376,15 +449,46 @@ class OCIMetrics:
         self,
         size_bytes: int,
         entry_count: int,
+        *,
+        hit_ratio: float | None = None,
     ) -> None:
         """Set cache statistics gauges.
 
         Args:
             size_bytes: Current cache size in bytes.
             entry_count: Current number of cache entries.
+            hit_ratio: Optional fraction of lookups served from the cache.
         """
         self.cache_size_gauge.set(size_bytes)
         self.cache_entries_gauge.set(entry_count)
+        if hit_ratio is not None:
+            self.cache_hit_ratio_gauge.set(hit_ratio)
+
+    def record_cache_eviction(
+        self,
+        entries: int,
+        bytes_evicted: int,
+        *,
+        reason: str,
+    ) -> None:
+        """Record entries removed from the cache.
+
+        Args:
+            entries: Number of entries removed.
+            bytes_evicted: Total size of the removed entries in bytes.
+            reason: Why they were removed (expired, superseded, size).
+        """
+        attributes: dict[str, Any] = {"operation": "evict", "reason": reason}
+        self.cache_operations_counter.add(entries, attributes=attributes)
+        self.cache_evicted_bytes_counter.add(bytes_evicted, attributes={"reason": reason})
+
+    def record_cache_lock_wait(self, wait_seconds: float) -> None:
+        """Record time spent waiting for the cache file lock.
+
+        Args:
+            wait_seconds: Seconds between requesting and acquiring the lock.
+        """
+        self.cache_lock_wait_histogram.record(wait_seconds)
 
     @contextmanager
     def operation_timer(
@@ -0,0 +1,313 @@
+"""Compressed, section-split layer packing for CompiledArtifacts.
+
+By default an artifact is pushed as a single uncompressed
+compiled_artifacts.json layer. With a LayerPackingConfig that enables
+compression or section splitting, push produces a packed layout instead:
+
+    - A core layer: the artifact JSON with each large top-level section
+      (e.g. transforms, data_contracts) replaced by ``null``
+    - One layer per large section, holding that section's JSON value
+
+Layers are optionally gzip or zstd compressed, with the compression appended
+to the media type (``+gzip``, ``+zstd``). Compression is deterministic, so
+a section that did not change compresses to the same blob and a repush finds
+it already in the registry.
+
+Pull splices each section back into the core layer at the byte offset
+recorded in the section's annotations, reproducing the exact bytes of the
+unpacked compiled_artifacts.json. The artifact digest, cache entries, and
+signatures therefore cover the same content however it was packed.
+
+The core layer of a packed artifact is titled compiled_artifacts.core.json,
+so older releases that only know the single-layer layout fail with
+"compiled_artifacts.json not found" rather than reading an artifact with
+missing sections.
+
+Example:
+    >>> from floe_core.oci.packing import pack_artifacts, unpack_layers
+    >>> from floe_core.schemas.oci import LayerPackingConfig
+    >>>
+    >>> config = LayerPackingConfig(compression="gzip", split_threshold_bytes=1048576)
+    >>> layers, content_digest = pack_artifacts(artifacts, config)
+    >>> blobs = {layer.digest: blob for blob, layer in layers}
+    >>> content = unpack_layers(manifest_layers, lambda d: blobs[d["digest"]], "v1.0.0")
+
+See Also:
+    - floe_core.oci.manifest: Single-layer serialization and manifest building
+    - floe_core.schemas.oci: LayerPackingConfig
+"""
+
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from floe_core.oci.errors import DigestMismatchError, OCIError
+from floe_core.oci.manifest import calculate_digest, serialize_layer
+from floe_core.schemas.oci import (
+    FLOE_ARTIFACT_SECTION_TYPE,
+    FLOE_ARTIFACT_TYPE,
+    ArtifactLayer,
+    LayerCompression,
+    LayerPackingConfig,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from floe_core.schemas.compiled_artifacts import CompiledArtifacts
+
+logger = structlog.get_logger(__name__)
+
+# Layer title of the core layer in the packed layout
+PACKED_CORE_TITLE = "compiled_artifacts.core.json"
+
+ANNOTATION_TITLE = "org.opencontainers.image.title"
+# Digest of the reassembled compiled_artifacts.json (core layer only)
+ANNOTATION_CONTENT_DIGEST = "io.floe.artifacts.content-digest"
+# Top-level field a section layer holds
+ANNOTATION_SECTION = "io.floe.artifacts.section"
+# Byte offset of the section's ``null`` placeholder in the core layer
+ANNOTATION_SECTION_OFFSET = "io.floe.artifacts.section-offset"
+
+_PLACEHOLDER = b"null"
+
+# File extension added to layer titles per compression
+_EXTENSIONS: dict[str, str] = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def pack_artifacts(
+    artifacts: CompiledArtifacts,
+    config: LayerPackingConfig,
+    *,
+    annotations: dict[str, str] | None = None,
+) -> tuple[list[tuple[bytes, ArtifactLayer]], str]:
+    """Serialize CompiledArtifacts into layers according to config.
+
+    Args:
+        artifacts: CompiledArtifacts to serialize.
+        config: Packing configuration. The default configuration yields the
+            single-layer layout produced by serialize_layer().
+        annotations: Optional layer annotations, applied to the core layer.
+
+    Returns:
+        Tuple of ([(blob bytes, layer descriptor), ...], content digest),
+        where the content digest is that of the unpacked JSON.
+
+    Raises:
+        OCIError: If zstd compression is requested without zstandard installed.
+    """
+    if not config.is_packed:
+        content, layer = serialize_layer(artifacts, annotations=annotations)
+        return [(content, layer)], layer.digest
+
+    content = artifacts.model_dump_json().encode("utf-8")
+    digest = calculate_digest(content)
+    threshold = config.split_threshold_bytes
+    compression = config.compression
+    extension = _EXTENSIONS[compression]
+
+    core = bytearray()
+    sections: list[tuple[str, int, bytes]] = []
+    cursor = 0
+    if threshold is not None:
+        for name in type(artifacts).model_fields:
+            value = _field_json(artifacts, name)
+            if len(value) < threshold:
+                continue
+            key = f'"{name}":'.encode()
+            start = content.index(key + value, cursor) + len(key)
+            core += content[cursor:start]
+            sections.append((name, len(core), value))
+            core += _PLACEHOLDER
+            cursor = start + len(value)
+    core += content[cursor:]
+
+    core_annotations = {
+        ANNOTATION_TITLE: f"{PACKED_CORE_TITLE}{extension}",
+        ANNOTATION_CONTENT_DIGEST: digest,
+    }
+    if annotations:
+        core_annotations.update(annotations)
+    layers = [_layer(bytes(core), FLOE_ARTIFACT_TYPE, compression, core_annotations)]
+    for name, offset, value in sections:
+        layers.append(
+            _layer(
+                value,
+                FLOE_ARTIFACT_SECTION_TYPE,
+                compression,
+                {
+                    ANNOTATION_TITLE: f"compiled_artifacts.{name}.json{extension}",
+                    ANNOTATION_SECTION: name,
+                    ANNOTATION_SECTION_OFFSET: str(offset),
+                },
+            )
+        )
+
+    logger.debug(
+        "artifacts_packed",
+        content_digest=digest,
+        content_size=len(content),
+        packed_size=sum(layer.size for _, layer in layers),
+        compression=compression,
+        sections=[name for name, _, _ in sections],
+    )
+    return layers, digest
+
+
+def is_packed(layers: list[dict[str, Any]]) -> bool:
+    """Check whether manifest layers use the packed layout.
+
+    Args:
+        layers: Layer descriptors from a manifest.
+
+    Returns:
+        True if a layer carries the packed content digest annotation.
+    """
+    return any(ANNOTATION_CONTENT_DIGEST in (layer.get("annotations") or {}) for layer in layers)
+
+
+def layers_content_digest(layers: list[dict[str, Any]]) -> str | None:
+    """Return the digest of an artifact's unpacked JSON from its manifest layers.
+
+    For the single-layer layout the layer digest is the content digest.
+
+    Args:
+        layers: Layer descriptors from a manifest.
+
+    Returns:
+        Content digest, or None if no artifact layer is present.
+    """
+    for layer in layers:
+        annotations = layer.get("annotations") or {}
+        digest = annotations.get(ANNOTATION_CONTENT_DIGEST)
+        if digest is None and annotations.get(ANNOTATION_TITLE) == "compiled_artifacts.json":
+            digest = layer.get("digest")
+        if isinstance(digest, str):
+            return digest
+    return None
+
+
+def unpack_layers(
+    layers: list[dict[str, Any]],
+    read_blob: Callable[[dict[str, Any]], bytes],
+    artifact_ref: str,
+) -> bytes:
+    """Reassemble compiled_artifacts.json from packed manifest layers.
+
+    Args:
+        layers: Layer descriptors from the manifest.
+        read_blob: Returns the (possibly compressed) blob of a descriptor.
+        artifact_ref: Artifact reference for error messages.
+
+    Returns:
+        The unpacked JSON bytes.
+
+    Raises:
+        OCIError: If the layout is malformed or a compression is unsupported.
+        DigestMismatchError: If the reassembled content does not match the
+            digest recorded at push time.
+    """
+    core_layer: dict[str, Any] | None = None
+    sections: list[tuple[int, dict[str, Any]]] = []
+    for layer in layers:
+        annotations = layer.get("annotations") or {}
+        if ANNOTATION_CONTENT_DIGEST in annotations:
+            core_layer = layer
+        elif ANNOTATION_SECTION in annotations:
+            try:
+                offset = int(annotations[ANNOTATION_SECTION_OFFSET])
+            except (KeyError, ValueError) as e:
+                raise OCIError(
+                    f"Section layer {annotations[ANNOTATION_SECTION]} of {artifact_ref} "
+                    "has no valid offset"
+                ) from e
+            sections.append((offset, layer))
+    if core_layer is None:
+        raise OCIError(f"Packed artifact {artifact_ref} has no core layer")
+
+    core = _decompress(read_blob(core_layer), core_layer.get("mediaType", ""))
+    content = bytearray()
+    cursor = 0
+    for offset, layer in sorted(sections, key=lambda item: item[0]):
+        end = offset + len(_PLACEHOLDER)
+        if offset < cursor or core[offset:end] != _PLACEHOLDER:
+            raise OCIError(f"Packed artifact {artifact_ref} has a misplaced section layer")
+        content += core[cursor:offset]
+        content += _decompress(read_blob(layer), layer.get("mediaType", ""))
+        cursor = end
+    content += core[cursor:]
+
+    expected = core_layer["annotations"][ANNOTATION_CONTENT_DIGEST]
+    actual = calculate_digest(bytes(content))
+    if actual != expected:
+        raise DigestMismatchError(expected=expected, actual=actual, artifact_ref=artifact_ref)
+    return bytes(content)
+
+
+def _field_json(artifacts: CompiledArtifacts, name: str) -> bytes:
+    """Return a top-level field's JSON exactly as model_dump_json() writes it."""
+    wrapped = artifacts.model_dump_json(include={name}).encode("utf-8")
+    prefix = f'{{"{name}":'.encode()
+    return wrapped[len(prefix) : -1]
+
+
+def _layer(
+    data: bytes,
+    media_type: str,
+    compression: LayerCompression,
+    annotations: dict[str, str],
+) -> tuple[bytes, ArtifactLayer]:
+    """Compress data and build its layer descriptor."""
+    blob = _compress(data, compression)
+    if compression != "none":
+        media_type = f"{media_type}+{compression}"
+    return blob, ArtifactLayer(
+        digest=calculate_digest(blob),
+        media_type=media_type,
+        size=len(blob),
+        annotations=annotations,
+    )
+
+
+def _compress(data: bytes, compression: LayerCompression) -> bytes:
+    """Compress data deterministically (same input, same blob)."""
+    if compression == "gzip":
+        return gzip.compress(data, mtime=0)
+    if compression == "zstd":
+        return bytes(_zstandard().ZstdCompressor().compress(data))
+    return data
+
+
+def _decompress(blob: bytes, media_type: str) -> bytes:
+    """Decompress a blob according to its media type suffix."""
+    if media_type.endswith("+gzip"):
+        return gzip.decompress(blob)
+    if media_type.endswith("+zstd"):
+        return bytes(_zstandard().ZstdDecompressor().decompress(blob))
+    return blob
+
+
+def _zstandard() -> Any:
+    """Import zstandard, which zstd layers require."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise OCIError(
+            "zstandard required for zstd layer compression. Install with: pip install zstandard"
+        ) from e
+    return zstandard
+
+
+__all__ = [
+    "ANNOTATION_CONTENT_DIGEST",
+    "ANNOTATION_SECTION",
+    "ANNOTATION_SECTION_OFFSET",
+    "PACKED_CORE_TITLE",
+    "layers_content_digest",
+    "is_packed",
+    "pack_artifacts",
+    "unpack_layers",
+]
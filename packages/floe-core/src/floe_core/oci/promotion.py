@@ -46,10 +46,16 @@ See Also:
 
 from __future__ import annotations
 
+import os
 import re
 import shlex
+import signal
 import subprocess
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -89,6 +95,7 @@ if TYPE_CHECKING:
     from floe_core.enforcement import PolicyEnforcer
     from floe_core.oci.authorization import AuthorizationChecker
     from floe_core.oci.client import OCIClient
+    from floe_core.oci.registry_sync import RegistrySyncEngine
     from floe_core.oci.webhooks import WebhookNotifier
     from floe_core.schemas.oci import RegistryConfig
     from floe_core.schemas.signing import VerificationResult
@@ -104,6 +111,9 @@ SAFE_TAG_PATTERN = re.compile(
 )
 MAX_TAG_LENGTH = 128  # OCI spec limit
 
+# Seconds between cancellation checks while a gate command runs
+_GATE_CANCEL_POLL_SECONDS = 0.2
+
 
 def validate_tag_security(tag: str) -> None:
     """Validate tag for command injection safety.
@@ -134,6 +144,123 @@ def validate_tag_security(tag: str) -> None:
         )
 
 
+class _GateCancelledError(Exception):
+    """Raised when a running gate command is stopped by fail-fast."""
+
+
+@dataclass(frozen=True)
+class _PlannedGate:
+    """A gate scheduled by _run_all_gates.
+
+    Attributes:
+        gate: Gate type.
+        depends_on: Gates that must finish before this gate starts.
+        run: Runs the gate given the shared cancel event; None for gates
+            that are skipped without running.
+    """
+
+    gate: PromotionGate
+    depends_on: tuple[PromotionGate, ...]
+    run: Callable[[threading.Event], GateResult] | None
+
+
+def _signal_process_group(proc: subprocess.Popen[str], sig: signal.Signals) -> None:
+    """Send a signal to a process and its process group.
+
+    On non-POSIX platforms only the process itself is terminated.
+    """
+    if os.name != "posix":
+        proc.terminate()
+        return
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass  # Already exited
+
+
+def _run_cancellable(
+    command: str,
+    timeout_seconds: float,
+    cancel_event: threading.Event,
+    grace_period: float = 5,
+) -> subprocess.CompletedProcess[str]:
+    """Run a shell command that stops on timeout or when cancel_event is set.
+
+    The command runs in its own process group so that SIGTERM (then SIGKILL
+    after grace_period seconds) reaches every process the shell started.
+
+    Args:
+        command: Shell command (already sanitized by the caller).
+        timeout_seconds: Maximum execution time in seconds.
+        cancel_event: Event that requests early termination.
+        grace_period: Seconds between SIGTERM and SIGKILL.
+
+    Returns:
+        CompletedProcess with captured stdout and stderr.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeded timeout_seconds.
+        _GateCancelledError: If cancel_event was set first.
+    """
+    # Security: shell=True required, callers sanitize input via shlex.quote()
+    proc = subprocess.Popen(
+        command,
+        shell=True,  # nosec B602 - command input sanitized via shlex.quote()
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=os.name == "posix",
+    )
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        try:
+            stdout, stderr = proc.communicate(timeout=_GATE_CANCEL_POLL_SECONDS)
+            return subprocess.CompletedProcess(command, proc.returncode, stdout, stderr)
+        except subprocess.TimeoutExpired:
+            pass
+        if cancel_event.is_set() or time.monotonic() >= deadline:
+            break
+
+    _signal_process_group(proc, signal.SIGTERM)
+    try:
+        proc.communicate(timeout=grace_period)
+    except subprocess.TimeoutExpired:
+        _signal_process_group(proc, signal.SIGKILL)  # SIGKILL after grace period
+        proc.communicate()
+    if cancel_event.is_set():
+        raise _GateCancelledError(command)
+    raise subprocess.TimeoutExpired(command, timeout_seconds)
+
+
+def _with_sync_results(
+    record: PromotionRecord,
+    sync_results: list[RegistrySyncStatus],
+) -> PromotionRecord:
+    """Return record with secondary sync statuses and failure warnings (FR-030).
+
+    Args:
+        record: Promotion record (frozen, so a copy is returned).
+        sync_results: RegistrySyncStatus per secondary registry.
+
+    Returns:
+        Copy of record with registry_sync_status set and one warning per
+        registry that failed to sync.
+    """
+    warnings = list(record.warnings)
+    for sync_status in sync_results:
+        if not sync_status.synced:
+            warnings.append(
+                f"Secondary registry sync failed for "
+                f"{sync_status.registry_uri}: {sync_status.error}"
+            )
+    return record.model_copy(
+        update={
+            "registry_sync_status": sync_results,
+            "warnings": warnings,
+        }
+    )
+
+
 class PromotionController:
     """Controller for artifact promotion lifecycle.
 
@@ -199,6 +326,16 @@ class PromotionController:
             has_policy_enforcer=policy_enforcer is not None,
         )
 
+        # Secondary registry sync (FR-028): engine created on first use so its
+        # per-registry circuit breakers persist across promotions. Eventual-mode
+        # syncs run on a single background worker, keyed by environment tag;
+        # the latest record of each, with final sync statuses, is kept here.
+        self._sync_engine: RegistrySyncEngine | None = None
+        self._background_sync_executor: ThreadPoolExecutor | None = None
+        self._background_syncs: dict[str, Future[PromotionRecord]] = {}
+        self._eventual_records: dict[str, PromotionRecord] = {}
+        self._background_sync_lock = threading.Lock()
+
         # Verification result cache keyed by artifact digest (T072 - FR-022)
         # Since artifacts are immutable (same digest = same content), we can
         # cache verification results to avoid redundant cryptographic operations
@@ -534,6 +671,7 @@ class PromotionController:
         gate: PromotionGate,
         command: str,
         timeout_seconds: int,
+        cancel_event: threading.Event | None = None,
     ) -> GateResult:
         """Execute a single validation gate with timeout handling.
 
@@ -545,6 +683,8 @@ class PromotionController:
             gate: The gate type being executed.
             command: Shell command to run for the gate.
             timeout_seconds: Maximum execution time in seconds.
+            cancel_event: Optional event; when set while the command runs,
+                the command is terminated and _GateCancelledError is raised.
 
         Returns:
             GateResult with status, duration, and any error message.
@@ -572,16 +712,19 @@ class PromotionController:
             )
 
             try:
-                # Try simple subprocess.run first (covers most cases)
-                # Security: shell=True is required for gate command execution but
-                # artifact_ref is sanitized via shlex.quote() and validate_tag_security()
-                result = subprocess.run(
-                    command,
-                    shell=True,  # nosec B602 - command input sanitized via shlex.quote()
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout_seconds,
-                )
+                if cancel_event is not None:
+                    result = _run_cancellable(command, timeout_seconds, cancel_event, grace_period)
+                else:
+                    # Try simple subprocess.run first (covers most cases)
+                    # Security: shell=True is required for gate command execution but
+                    # artifact_ref is sanitized via shlex.quote() and validate_tag_security()
+                    result = subprocess.run(
+                        command,
+                        shell=True,  # nosec B602 - command input sanitized via shlex.quote()
+                        capture_output=True,
+                        text=True,
+                        timeout=timeout_seconds,
+                    )
 
                 duration_ms = int((time.monotonic() - start_time) * 1000)
                 span.set_attribute("duration_ms", duration_ms)
@@ -624,26 +767,28 @@ class PromotionController:
                 span.set_attribute("duration_ms", duration_ms)
 
                 # For proper SIGTERM/SIGKILL handling, use Popen
+                # (_run_cancellable has already terminated its process)
                 # Security: shell=True required, command is sanitized via shlex.quote()
-                try:
-                    proc = subprocess.Popen(
-                        command,
-                        shell=True,  # nosec B602 - command input sanitized via shlex.quote()
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                    )
-                    proc.terminate()  # Send SIGTERM
-
+                if cancel_event is None:
                     try:
-                        proc.wait(timeout=grace_period)
-                    except subprocess.TimeoutExpired:
-                        proc.kill()  # Send SIGKILL after grace period
-                        proc.wait()
+                        proc = subprocess.Popen(
+                            command,
+                            shell=True,  # nosec B602 - command input sanitized via shlex.quote()
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            text=True,
+                        )
+                        proc.terminate()  # Send SIGTERM
 
-                except Exception:
-                    # If Popen fails, we've already recorded the timeout
-                    pass
+                        try:
+                            proc.wait(timeout=grace_period)
+                        except subprocess.TimeoutExpired:
+                            proc.kill()  # Send SIGKILL after grace period
+                            proc.wait()
+
+                    except Exception:
+                        # If Popen fails, we've already recorded the timeout
+                        pass
 
                 error_msg = f"Gate execution timed out after {timeout_seconds} seconds"
                 self._log.warning(
@@ -659,6 +804,10 @@ class PromotionController:
                     error=error_msg,
                 )
 
+            except _GateCancelledError:
+                self._log.info("gate_execution_cancelled", gate=gate.value)
+                raise
+
             except Exception as e:
                 duration_ms = int((time.monotonic() - start_time) * 1000)
                 span.set_attribute("duration_ms", duration_ms)
@@ -810,6 +959,7 @@ class PromotionController:
         config: SecurityGateConfig,
         artifact_ref: str,
         timeout_seconds: int = 600,
+        cancel_event: threading.Event | None = None,
     ) -> GateResult:
         """Execute the security scan gate using configured scanner.
 
@@ -821,6 +971,8 @@ class PromotionController:
             config: SecurityGateConfig with scanner command and thresholds.
             artifact_ref: Full artifact reference (registry/repo:tag@digest).
             timeout_seconds: Command timeout in seconds.
+            cancel_event: Optional event; when set while the scanner runs,
+                the scanner is terminated and _GateCancelledError is raised.
 
         Returns:
             GateResult with status based on security scan evaluation.
@@ -861,14 +1013,18 @@ class PromotionController:
                 )
 
                 # Run the scanner command
-                # Security: shell=True required, artifact_ref is sanitized via shlex.quote()
-                result = subprocess.run(
-                    command,
-                    shell=True,  # nosec B602 - artifact_ref sanitized via shlex.quote()
-                    capture_output=True,
-                    text=True,
-                    timeout=min(timeout_seconds, config.timeout_seconds),
-                )
+                scan_timeout = min(timeout_seconds, config.timeout_seconds)
+                if cancel_event is not None:
+                    result = _run_cancellable(command, scan_timeout, cancel_event)
+                else:
+                    # Security: shell=True required, artifact_ref is sanitized via shlex.quote()
+                    result = subprocess.run(
+                        command,
+                        shell=True,  # nosec B602 - artifact_ref sanitized via shlex.quote()
+                        capture_output=True,
+                        text=True,
+                        timeout=scan_timeout,
+                    )
 
                 duration_ms = int((time.monotonic() - start_time) * 1000)
 
@@ -954,6 +1110,10 @@ class PromotionController:
                     error=error_msg,
                 )
 
+            except _GateCancelledError:
+                self._log.info("security_gate_cancelled")
+                raise
+
             except SecurityGateParseError as e:
                 duration_ms = int((time.monotonic() - start_time) * 1000)
                 error_msg = f"Failed to parse security scanner output: {e}"
@@ -999,8 +1159,10 @@ class PromotionController:
         """Run all enabled gates for an environment.
 
         Orchestrates execution of all gates configured for the target environment.
-        Policy compliance gate always runs first. If a gate fails and dry_run is False,
-        execution stops immediately (fail-fast).
+        Gates run concurrently (up to ``max_parallel_gates``) once the gates
+        they depend on (``gate_dependencies``) have finished. Policy compliance
+        always runs first. If a gate fails and dry_run is False, no further
+        gates are started and running gate commands are terminated (fail-fast).
 
         Args:
             to_env: Target environment name.
@@ -1009,7 +1171,9 @@ class PromotionController:
             dry_run: If True, continue all gates even if one fails.
 
         Returns:
-            List of GateResult for all executed gates.
+            List of GateResult for all completed gates, in configuration
+            order (policy compliance first). Gates that were cancelled or
+            never started are omitted.
 
         Raises:
             ValueError: If target environment is not found.
@@ -1034,67 +1198,99 @@ class PromotionController:
                 environment=to_env,
                 gates=[g.value for g in env_config.gates.keys()],
                 dry_run=dry_run,
+                max_parallel_gates=env_config.max_parallel_gates,
             )
 
-            results: list[GateResult] = []
-            timeout_seconds = env_config.gate_timeout_seconds
-
-            # Always run policy_compliance gate first (mandatory)
-            policy_result = self._run_policy_compliance_gate(
-                manifest=manifest,
-                dry_run=dry_run,
+            plan = self._plan_gates(env_config, manifest, artifact_ref, dry_run=dry_run)
+            completed, failed_gate = self._execute_gate_plan(
+                plan, env_config.max_parallel_gates, dry_run=dry_run
             )
-            results.append(policy_result)
+            results = [completed[p.gate] for p in plan if p.gate in completed]
 
-            # Check for failure (stop unless dry_run)
-            if policy_result.status == GateStatus.FAILED and not dry_run:
-                duration_ms = int((time.monotonic() - start_time) * 1000)
+            duration_ms = int((time.monotonic() - start_time) * 1000)
+            span.set_attribute("duration_ms", duration_ms)
+            span.set_attribute("gate_count", len(results))
+
+            if failed_gate is not None:
                 self._log.warning(
                     "run_all_gates_stopped",
-                    reason="policy_compliance_failed",
+                    reason=f"{failed_gate.value}_failed",
                     results_count=len(results),
                 )
-                span.set_attribute("duration_ms", duration_ms)
-                span.set_attribute("gate_count", len(results))
                 span.set_attribute("status", "failed")
                 return results
 
-            # Run other enabled gates
-            for gate, gate_config in env_config.gates.items():
-                # Skip policy_compliance (already run)
-                if gate == PromotionGate.POLICY_COMPLIANCE:
-                    continue
-
-                # Skip disabled gates
-                if gate_config is False:
-                    continue
-
-                # Special handling for SECURITY_SCAN gate with SecurityGateConfig
-                if gate == PromotionGate.SECURITY_SCAN and isinstance(
-                    gate_config, SecurityGateConfig
-                ):
-                    gate_result = self._run_security_gate(
-                        config=gate_config,
+            all_passed = all(r.status in (GateStatus.PASSED, GateStatus.SKIPPED) for r in results)
+            self._log.info(
+                "run_all_gates_completed",
+                environment=to_env,
+                results_count=len(results),
+                all_passed=all_passed,
+            )
+            span.set_attribute("status", "passed" if all_passed else "failed")
+
+            return results
+
+    def _plan_gates(
+        self,
+        env_config: EnvironmentConfig,
+        manifest: dict[str, Any],
+        artifact_ref: str,
+        *,
+        dry_run: bool,
+    ) -> list[_PlannedGate]:
+        """Build the gate execution plan for an environment.
+
+        Args:
+            env_config: Target environment configuration.
+            manifest: The dbt manifest for policy compliance gate.
+            artifact_ref: Full artifact reference for security scan.
+            dry_run: Passed through to the policy compliance gate.
+
+        Returns:
+            Planned gates in configuration order, policy compliance first.
+        """
+        timeout_seconds = env_config.gate_timeout_seconds
+        policy = PromotionGate.POLICY_COMPLIANCE
+        plan = [
+            _PlannedGate(
+                gate=policy,
+                depends_on=(),
+                run=lambda _cancel: self._run_policy_compliance_gate(
+                    manifest=manifest,
+                    dry_run=dry_run,
+                ),
+            )
+        ]
+
+        for gate, gate_config in env_config.gates.items():
+            # Skip policy_compliance (already planned) and disabled gates
+            if gate == policy or gate_config is False:
+                continue
+
+            # Dependencies on disabled gates are trivially satisfied
+            declared = env_config.gate_dependencies.get(gate, [])
+            depends_on = (
+                policy,
+                *(d for d in declared if d != policy and env_config.gates[d] is not False),
+            )
+
+            run: Callable[[threading.Event], GateResult] | None
+            # Special handling for SECURITY_SCAN gate with SecurityGateConfig
+            if gate == PromotionGate.SECURITY_SCAN and isinstance(gate_config, SecurityGateConfig):
+                security_config = gate_config
+
+                def run(
+                    cancel: threading.Event, config: SecurityGateConfig = security_config
+                ) -> GateResult:
+                    return self._run_security_gate(
+                        config=config,
                         artifact_ref=artifact_ref,
                         timeout_seconds=timeout_seconds,
+                        cancel_event=cancel,
                     )
-                    results.append(gate_result)
-
-                    # Check for failure (stop unless dry_run)
-                    if gate_result.status == GateStatus.FAILED and not dry_run:
-                        duration_ms = int((time.monotonic() - start_time) * 1000)
-                        self._log.warning(
-                            "run_all_gates_stopped",
-                            reason="security_scan_failed",
-                            results_count=len(results),
-                        )
-                        span.set_attribute("duration_ms", duration_ms)
-                        span.set_attribute("gate_count", len(results))
-                        span.set_attribute("status", "failed")
-                        return results
-                    continue
 
-                # Get command for the gate
+            else:
                 command = self._get_gate_command(gate, artifact_ref)
                 if command is None:
                     # No command configured, skip
@@ -1103,49 +1299,92 @@ class PromotionController:
                         gate=gate.value,
                         reason="no_command_configured",
                     )
-                    results.append(
-                        GateResult(
+                    run = None
+                else:
+
+                    def run(
+                        cancel: threading.Event,
+                        gate: PromotionGate = gate,
+                        command: str = command,
+                    ) -> GateResult:
+                        return self._run_gate(
                             gate=gate,
-                            status=GateStatus.SKIPPED,
-                            duration_ms=0,
+                            command=command,
+                            timeout_seconds=timeout_seconds,
+                            cancel_event=cancel,
                         )
-                    )
-                    continue
 
-                # Run the gate
-                gate_result = self._run_gate(
-                    gate=gate,
-                    command=command,
-                    timeout_seconds=timeout_seconds,
-                )
-                results.append(gate_result)
+            plan.append(_PlannedGate(gate=gate, depends_on=depends_on, run=run))
 
-                # Check for failure (stop unless dry_run)
-                if gate_result.status == GateStatus.FAILED and not dry_run:
-                    duration_ms = int((time.monotonic() - start_time) * 1000)
-                    self._log.warning(
-                        "run_all_gates_stopped",
-                        reason=f"{gate.value}_failed",
-                        results_count=len(results),
-                    )
-                    span.set_attribute("duration_ms", duration_ms)
-                    span.set_attribute("gate_count", len(results))
-                    span.set_attribute("status", "failed")
-                    return results
+        return plan
 
-            duration_ms = int((time.monotonic() - start_time) * 1000)
-            all_passed = all(r.status in (GateStatus.PASSED, GateStatus.SKIPPED) for r in results)
-            self._log.info(
-                "run_all_gates_completed",
-                environment=to_env,
-                results_count=len(results),
-                all_passed=all_passed,
-            )
-            span.set_attribute("duration_ms", duration_ms)
-            span.set_attribute("gate_count", len(results))
-            span.set_attribute("status", "passed" if all_passed else "failed")
+    def _execute_gate_plan(
+        self,
+        plan: list[_PlannedGate],
+        max_workers: int,
+        *,
+        dry_run: bool,
+    ) -> tuple[dict[PromotionGate, GateResult], PromotionGate | None]:
+        """Run planned gates concurrently, respecting dependencies.
 
-            return results
+        A gate starts once every gate it depends on has finished (passed,
+        failed, or skipped). Unless dry_run, the first FAILED result stops
+        scheduling and cancels gates that are still queued or running.
+
+        Args:
+            plan: Planned gates from _plan_gates().
+            max_workers: Maximum number of concurrently running gates.
+            dry_run: If True, failures do not stop execution.
+
+        Returns:
+            Tuple of (results by gate, first failed gate if execution stopped).
+        """
+        completed: dict[PromotionGate, GateResult] = {}
+        pending = list(plan)
+        running: dict[Future[GateResult], PromotionGate] = {}
+        cancel_event = threading.Event()
+        failed_gate: PromotionGate | None = None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                # Start every gate whose dependencies have finished
+                progressed = failed_gate is None
+                while progressed:
+                    progressed = False
+                    for planned in list(pending):
+                        if not all(d in completed for d in planned.depends_on):
+                            continue
+                        pending.remove(planned)
+                        if planned.run is None:
+                            completed[planned.gate] = GateResult(
+                                gate=planned.gate,
+                                status=GateStatus.SKIPPED,
+                                duration_ms=0,
+                            )
+                            progressed = True
+                        else:
+                            running[executor.submit(planned.run, cancel_event)] = planned.gate
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    gate = running.pop(future)
+                    try:
+                        result = future.result()
+                    except (CancelledError, _GateCancelledError):
+                        self._log.info("gate_cancelled", gate=gate.value)
+                        continue
+                    completed[gate] = result
+
+                    if result.status == GateStatus.FAILED and not dry_run and failed_gate is None:
+                        failed_gate = gate
+                        cancel_event.set()
+                        for other in running:
+                            other.cancel()
+
+        return completed, failed_gate
 
     def _get_artifact_digest(self, tag: str) -> str:
         """Get artifact digest from registry.
@@ -1351,32 +1590,53 @@ class PromotionController:
                 # Re-raise in enforce mode
                 raise
 
+    def _get_sync_engine(self) -> RegistrySyncEngine:
+        """Return the registry sync engine, creating it on first use.
+
+        The engine is kept for the life of the controller so its per-registry
+        circuit breakers carry over between promotions.
+
+        Returns:
+            RegistrySyncEngine reading from the primary registry.
+        """
+        if self._sync_engine is None:
+            from floe_core.oci.registry_sync import RegistrySyncEngine
+
+            self._sync_engine = RegistrySyncEngine(
+                self.client,
+                max_workers=self.promotion.max_parallel_syncs,
+            )
+        return self._sync_engine
+
     def _sync_to_registries(
         self,
         tag: str,
         to_env: str,
         artifact_digest: str,
         secondary_clients: list[OCIClient],
+        *,
+        verify_digests: bool | None = None,
+        reconcile: bool = False,
     ) -> list[RegistrySyncStatus]:
         """Sync artifact to secondary registries (T080 - FR-028).
 
-        Syncs the promoted artifact to secondary registries in parallel.
-        Failures are captured but don't block the primary promotion (FR-030).
+        Syncs the promoted artifact to secondary registries on a bounded
+        worker pool, uploading each missing blob from a single shared
+        download. Failures are captured but don't block the primary
+        promotion (FR-030).
 
         Args:
             tag: Source artifact tag.
             to_env: Target environment name.
             artifact_digest: Expected artifact digest for verification.
             secondary_clients: List of OCIClient instances for secondary registries.
+            verify_digests: Override config.verify_secondary_digests. If None, uses config.
+            reconcile: If True, only sync registries whose tag is missing or stale.
 
         Returns:
-            List of RegistrySyncStatus for each secondary registry.
+            List of RegistrySyncStatus for each secondary registry, in the
+            order of secondary_clients.
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        from datetime import datetime, timezone
-
-        from floe_core.schemas.promotion import RegistrySyncStatus
-
         # Create OpenTelemetry span for sync_to_registries operation
         with create_span(
             "floe.oci.sync_to_registries",
@@ -1384,6 +1644,7 @@ class PromotionController:
                 "tag": tag,
                 "to_env": to_env,
                 "secondary_count": len(secondary_clients),
+                "reconcile": reconcile,
             },
         ) as span:
             start_time = time.monotonic()
@@ -1394,71 +1655,27 @@ class PromotionController:
                 span.set_attribute("status", "skipped")
                 return []
 
-            sync_results: list[RegistrySyncStatus] = []
             env_tag = f"{tag}-{to_env}"
+            if verify_digests is None:
+                verify_digests = self.promotion.verify_secondary_digests
 
             self._log.info(
                 "sync_to_registries_started",
                 tag=tag,
                 env_tag=env_tag,
                 secondary_count=len(secondary_clients),
+                reconcile=reconcile,
             )
 
-            def sync_to_registry(client: OCIClient) -> RegistrySyncStatus:
-                """Sync to a single secondary registry."""
-                registry_uri = client.registry_uri
-                try:
-                    # Copy the artifact tag to secondary registry
-                    # This would use oci-copy or equivalent operation
-                    client.copy_tag(
-                        source_ref=f"{self.client.registry_uri}/{tag}",
-                        dest_ref=f"{registry_uri}/{env_tag}",
-                    )
-
-                    # Verify digest if configured
-                    actual_digest = None
-                    if self.promotion.verify_secondary_digests:
-                        actual_digest = client.get_artifact_digest(env_tag)
-                        if actual_digest != artifact_digest:
-                            return RegistrySyncStatus(
-                                registry_uri=registry_uri,
-                                synced=False,
-                                digest=actual_digest,
-                                error=(
-                                    f"Digest mismatch: expected "
-                                    f"{artifact_digest[:19]}..., "
-                                    f"got {actual_digest[:19]}..."
-                                ),
-                            )
-
-                    return RegistrySyncStatus(
-                        registry_uri=registry_uri,
-                        synced=True,
-                        digest=actual_digest or artifact_digest,
-                        synced_at=datetime.now(timezone.utc),
-                    )
-
-                except Exception as e:
-                    self._log.warning(
-                        "sync_to_registry_failed",
-                        registry_uri=registry_uri,
-                        error=str(e),
-                    )
-                    return RegistrySyncStatus(
-                        registry_uri=registry_uri,
-                        synced=False,
-                        error=str(e),
-                    )
-
-            # Execute syncs in parallel (FR-028)
-            with ThreadPoolExecutor(max_workers=len(secondary_clients)) as executor:
-                futures = {
-                    executor.submit(sync_to_registry, client): client
-                    for client in secondary_clients
-                }
-                for future in as_completed(futures):
-                    result = future.result()
-                    sync_results.append(result)
+            engine = self._get_sync_engine()
+            sync = engine.reconcile if reconcile else engine.sync
+            sync_results = sync(
+                tag,
+                env_tag,
+                artifact_digest,
+                secondary_clients,
+                verify_digests=verify_digests,
+            )
 
             # Log summary
             duration_ms = int((time.monotonic() - start_time) * 1000)
@@ -1475,6 +1692,228 @@ class PromotionController:
 
             return sync_results
 
+    def _secondary_clients_from_config(self) -> list[OCIClient]:
+        """Create clients for config.secondary_registries.
+
+        Registries whose client cannot be created are logged and skipped.
+
+        Returns:
+            List of OCIClient instances, possibly empty.
+        """
+        from floe_core.oci.client import OCIClient
+        from floe_core.schemas.oci import AuthType, RegistryAuth, RegistryConfig
+
+        clients: list[OCIClient] = []
+        for registry_uri in self.promotion.secondary_registries or []:
+            try:
+                config = RegistryConfig(
+                    uri=registry_uri,
+                    auth=RegistryAuth(type=AuthType.ANONYMOUS),
+                )
+                clients.append(OCIClient.from_registry_config(config))
+            except Exception as e:
+                self._log.warning(
+                    "secondary_registry_client_creation_failed",
+                    registry_uri=registry_uri,
+                    error=str(e),
+                )
+        return clients
+
+    def _schedule_eventual_sync(
+        self,
+        record: PromotionRecord,
+        tag: str,
+        to_env: str,
+        secondary_clients: list[OCIClient],
+        verify_digests: bool | None,
+    ) -> PromotionRecord:
+        """Start a background sync and return the record with pending statuses.
+
+        Args:
+            record: Record of the completed primary promotion.
+            tag: Source artifact tag.
+            to_env: Target environment name.
+            secondary_clients: Clients for the secondary registries.
+            verify_digests: Override config.verify_secondary_digests.
+
+        Returns:
+            The record with one pending RegistrySyncStatus per secondary registry.
+        """
+        pending = record.model_copy(
+            update={
+                "registry_sync_status": [
+                    RegistrySyncStatus(registry_uri=client.registry_uri, synced=False, pending=True)
+                    for client in secondary_clients
+                ]
+            }
+        )
+        with self._background_sync_lock:
+            if self._background_sync_executor is None:
+                self._background_sync_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="floe-eventual-sync"
+                )
+            self._eventual_records[f"{tag}-{to_env}"] = pending
+            self._background_syncs[f"{tag}-{to_env}"] = self._background_sync_executor.submit(
+                self._complete_eventual_sync,
+                record=record,
+                tag=tag,
+                to_env=to_env,
+                secondary_clients=secondary_clients,
+                verify_digests=verify_digests,
+            )
+
+        self._log.info(
+            "eventual_sync_scheduled",
+            tag=tag,
+            to_env=to_env,
+            secondary_count=len(secondary_clients),
+        )
+        return pending
+
+    def _complete_eventual_sync(
+        self,
+        record: PromotionRecord,
+        tag: str,
+        to_env: str,
+        secondary_clients: list[OCIClient],
+        verify_digests: bool | None,
+    ) -> PromotionRecord:
+        """Run a scheduled sync and keep the record with its final statuses.
+
+        Args:
+            record: Record of the completed primary promotion.
+            tag: Source artifact tag.
+            to_env: Target environment name.
+            secondary_clients: Clients for the secondary registries.
+            verify_digests: Override config.verify_secondary_digests.
+
+        Returns:
+            The record with final sync statuses and partial-failure warnings.
+        """
+        sync_results = self._sync_to_registries(
+            tag=tag,
+            to_env=to_env,
+            artifact_digest=record.artifact_digest,
+            secondary_clients=secondary_clients,
+            verify_digests=verify_digests,
+        )
+        final = _with_sync_results(record, sync_results)
+        with self._background_sync_lock:
+            self._eventual_records[f"{tag}-{to_env}"] = final
+        return final
+
+    def wait_for_promotion(
+        self,
+        tag: str,
+        to_env: str,
+        timeout: float | None = None,
+    ) -> PromotionRecord | None:
+        """Wait for an eventual-mode promotion and return its final record.
+
+        The record carries the final registry_sync_status and a warning per
+        failed secondary, as promote_multi() returns in sync mode. Later
+        reconcile_registries() calls for the promotion update it again.
+
+        Args:
+            tag: Artifact tag passed to promote_multi().
+            to_env: Target environment passed to promote_multi().
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            The latest PromotionRecord, or None if no background sync was
+            scheduled for this promotion.
+
+        Raises:
+            TimeoutError: If the sync does not finish within timeout.
+        """
+        key = f"{tag}-{to_env}"
+        with self._background_sync_lock:
+            future = self._background_syncs.get(key)
+        if future is None:
+            return None
+        future.result(timeout=timeout)
+        with self._background_sync_lock:
+            return self._eventual_records[key]
+
+    def wait_for_registry_sync(
+        self,
+        tag: str,
+        to_env: str,
+        timeout: float | None = None,
+    ) -> list[RegistrySyncStatus]:
+        """Wait for a background (eventual) secondary sync to finish.
+
+        Args:
+            tag: Artifact tag passed to promote_multi().
+            to_env: Target environment passed to promote_multi().
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            Final RegistrySyncStatus per secondary registry, or an empty
+            list if no background sync was scheduled for this promotion.
+
+        Raises:
+            TimeoutError: If the sync does not finish within timeout.
+        """
+        record = self.wait_for_promotion(tag, to_env, timeout=timeout)
+        return list(record.registry_sync_status) if record is not None else []
+
+    def reconcile_registries(
+        self,
+        tag: str,
+        to_env: str,
+        *,
+        secondary_clients: list[OCIClient] | None = None,
+        verify_digests: bool | None = None,
+    ) -> list[RegistrySyncStatus]:
+        """Bring lagging secondary registries up to date with the primary.
+
+        Registries whose environment tag already has the digest of the
+        primary's source tag are left untouched; the rest are synced again. Used after eventual-mode
+        promotions or to repair registries that were unavailable. The record
+        returned by wait_for_promotion() is updated with the new statuses.
+
+        Args:
+            tag: Artifact tag that was promoted.
+            to_env: Environment the tag was promoted to.
+            secondary_clients: Clients for the secondary registries.
+                If None, uses config.secondary_registries to create clients.
+            verify_digests: Override config.verify_secondary_digests. If None, uses config.
+
+        Returns:
+            RegistrySyncStatus per secondary registry.
+
+        Raises:
+            ArtifactNotFoundError: If the tag was not promoted in the primary registry.
+        """
+        validate_tag_security(tag)
+        clients = secondary_clients or self._secondary_clients_from_config()
+        if not clients:
+            return []
+
+        # Fails with ArtifactNotFoundError if the tag was never promoted
+        self.client.get_artifact_digest(f"{tag}-{to_env}")
+        # The primary's environment tag is re-pushed with promotion
+        # annotations, so its digest differs from the artifact's. Secondaries
+        # receive a copy of the source tag, the digest promote_multi() records.
+        artifact_digest = self.client.get_artifact_digest(tag)
+        sync_results = self._sync_to_registries(
+            tag=tag,
+            to_env=to_env,
+            artifact_digest=artifact_digest,
+            secondary_clients=clients,
+            verify_digests=verify_digests,
+            reconcile=True,
+        )
+
+        # Keep the eventual-mode record of this promotion current
+        key = f"{tag}-{to_env}"
+        with self._background_sync_lock:
+            record = self._eventual_records.get(key)
+            if record is not None:
+                self._eventual_records[key] = _with_sync_results(record, sync_results)
+        return sync_results
+
     def _get_promotion_history(
         self,
         annotations: dict[str, str],
@@ -1861,7 +2300,9 @@ class PromotionController:
     def _get_promoted_versions(self, environment: str) -> list[str]:
         """Get list of versions promoted to an environment.
 
-        Scans tags with pattern `*-{environment}` to find promoted versions.
+        Scans tag names with pattern `*-{environment}` to find promoted
+        versions. Only the registry tags endpoint is queried; a listing up
+        to TAG_NAMES_CACHE_TTL_SECONDS old may be reused.
 
         Args:
             environment: Environment to scan (e.g., "prod").
@@ -1875,20 +2316,24 @@ class PromotionController:
         """
         import re
 
+        from floe_core.oci.client import TAG_NAMES_CACHE_TTL_SECONDS
+
         self._log.debug("get_promoted_versions_started", environment=environment)
 
+        # Pattern: v{X.Y.Z}-{environment} (not rollback tags)
+        env_suffix = f"-{environment}"
         try:
-            all_tags = self.client.list()
+            tag_names = self.client.list_tag_names(
+                pattern=f"*{env_suffix}",
+                max_age_seconds=TAG_NAMES_CACHE_TTL_SECONDS,
+            )
         except Exception:
             return []
 
-        # Pattern: v{X.Y.Z}-{environment} (not rollback tags)
-        env_suffix = f"-{environment}"
         rollback_pattern = re.compile(r"-rollback-\d+$")
         versions: list[str] = []
 
-        for tag_info in all_tags:
-            tag_name = tag_info.name
+        for tag_name in tag_names:
             if tag_name.endswith(env_suffix) and not rollback_pattern.search(tag_name):
                 # Extract version by removing environment suffix
                 version = tag_name[: -len(env_suffix)]
@@ -1927,18 +2372,19 @@ class PromotionController:
             environment=environment,
         )
 
+        # Pattern: {tag}-{environment}-rollback-{N}
+        rollback_prefix = f"{tag}-{environment}-rollback-"
         try:
-            all_tags = self.client.list()
+            # Always fresh: a stale listing could reuse a rollback number
+            tag_names = self.client.list_tag_names(prefix=rollback_prefix)
         except Exception:
             return 1
 
-        # Pattern: {tag}-{environment}-rollback-{N}
-        rollback_prefix = f"{tag}-{environment}-rollback-"
         pattern = re.compile(rf"^{re.escape(rollback_prefix)}(\d+)$")
 
         max_number = 0
-        for tag_info in all_tags:
-            match = pattern.match(tag_info.name)
+        for tag_name in tag_names:
+            match = pattern.match(tag_name)
             if match:
                 number = int(match.group(1))
                 max_number = max(max_number, number)
@@ -2332,6 +2778,7 @@ class PromotionController:
         secondary_clients: list[OCIClient] | None = None,
         dry_run: bool = False,
         verify_digests: bool | None = None,
+        sync_mode: Literal["sync", "eventual"] | None = None,
     ) -> PromotionRecord:
         """Promote artifact with multi-registry sync support (T080 - FR-028).
 
@@ -2339,6 +2786,12 @@ class PromotionController:
         Secondary registries are synced in parallel after primary promotion.
         Failures in secondary registries are captured as warnings (FR-030).
 
+        In eventual mode the record is returned as soon as the primary
+        promotion completes, with every secondary marked pending. The
+        returned record is never updated; use wait_for_promotion() for the
+        record with final statuses and warnings, and reconcile_registries()
+        to repair registries that lag behind.
+
         Args:
             tag: Source artifact tag to promote.
             from_env: Source environment name.
@@ -2348,6 +2801,7 @@ class PromotionController:
                 If None, uses config.secondary_registries to create clients.
             dry_run: If True, validate without making changes.
             verify_digests: Override config.verify_secondary_digests. If None, uses config.
+            sync_mode: Override config.secondary_sync_mode. If None, uses config.
 
         Returns:
             PromotionRecord with registry_sync_status populated.
@@ -2368,56 +2822,30 @@ class PromotionController:
         if dry_run:
             return record
 
-        # Determine secondary clients
-        clients_to_sync = secondary_clients or []
-
-        # If no explicit clients, try to create from config
-        if not clients_to_sync and self.promotion.secondary_registries:
-            from floe_core.oci.client import OCIClient
-            from floe_core.schemas.oci import AuthType, RegistryAuth, RegistryConfig
-
-            for registry_uri in self.promotion.secondary_registries:
-                try:
-                    config = RegistryConfig(
-                        uri=registry_uri,
-                        auth=RegistryAuth(type=AuthType.ANONYMOUS),
-                    )
-                    clients_to_sync.append(OCIClient.from_registry_config(config))
-                except Exception as e:
-                    self._log.warning(
-                        "secondary_registry_client_creation_failed",
-                        registry_uri=registry_uri,
-                        error=str(e),
-                    )
-
+        clients_to_sync = secondary_clients or self._secondary_clients_from_config()
         if not clients_to_sync:
             return record
 
+        # Eventual mode: return after primary, reconcile secondaries in background
+        if (sync_mode or self.promotion.secondary_sync_mode) == "eventual":
+            return self._schedule_eventual_sync(
+                record=record,
+                tag=tag,
+                to_env=to_env,
+                secondary_clients=clients_to_sync,
+                verify_digests=verify_digests,
+            )
+
         # Sync to secondary registries
         sync_results = self._sync_to_registries(
             tag=tag,
             to_env=to_env,
             artifact_digest=record.artifact_digest,
             secondary_clients=clients_to_sync,
+            verify_digests=verify_digests,
         )
 
-        # Add warnings for failed syncs (FR-030)
-        warnings = list(record.warnings)
-        for sync_status in sync_results:
-            if not sync_status.synced:
-                warnings.append(
-                    f"Secondary registry sync failed for "
-                    f"{sync_status.registry_uri}: {sync_status.error}"
-                )
-
-        # Return updated record with sync status
-        # Since PromotionRecord is frozen, we need to create a new instance
-        return record.model_copy(
-            update={
-                "registry_sync_status": sync_results,
-                "warnings": warnings,
-            }
-        )
+        return _with_sync_results(record, sync_results)
 
     def rollback(
         self,
@@ -0,0 +1,369 @@
+"""Fan-out sync of promoted artifacts to secondary registries (FR-028 to FR-030).
+
+RegistrySyncEngine copies a tag from the primary registry to every secondary
+registry on a bounded worker pool. Source blobs are downloaded once into a
+shared BlobStage and uploaded only to registries that do not already have
+them, so N regional registries cost one download plus the missing uploads
+instead of N full copies.
+
+Each secondary registry is guarded by a CircuitBreaker: a registry that keeps
+failing is skipped (reported as not synced) until its recovery timeout
+elapses, instead of stalling every promotion on connection timeouts.
+
+Example:
+    >>> from floe_core.oci.registry_sync import RegistrySyncEngine
+    >>> engine = RegistrySyncEngine(primary_client, max_workers=4)
+    >>> statuses = engine.sync(
+    ...     source_tag="v1.2.3",
+    ...     dest_tag="v1.2.3-prod",
+    ...     expected_digest="sha256:abc...",
+    ...     clients=[eu_client, us_client, ap_client],
+    ... )
+    >>> [s.registry_uri for s in statuses if not s.synced]
+    []
+
+See Also:
+    - floe_core.oci.promotion.PromotionController.promote_multi: Caller
+    - floe_core.oci.client.OCIClient.copy_tag: Per-registry copy
+"""
+
+from __future__ import annotations
+
+import hashlib
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from floe_core.oci.errors import CircuitBreakerOpenError, DigestMismatchError
+from floe_core.oci.resilience import CircuitBreaker
+from floe_core.schemas.promotion import RegistrySyncStatus
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from floe_core.oci.client import OCIClient
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SYNC_WORKERS = 4
+"""Default number of secondary registries synced concurrently."""
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class BlobStage:
+    """Source blobs downloaded once and shared by every destination registry.
+
+    Blobs are fetched lazily by digest into a private temporary directory
+    and verified against their digest. Concurrent requests for the same
+    digest wait for a single download. The directory is removed on close().
+
+    Example:
+        >>> with BlobStage(primary_client) as stage:
+        ...     path = stage.fetch({"digest": "sha256:...", "size": 1024}, "v1.2.3")
+    """
+
+    def __init__(self, source: OCIClient) -> None:
+        """Initialize BlobStage.
+
+        Args:
+            source: Client for the registry the blobs are read from.
+        """
+        self._source = source
+        self._dir = Path(tempfile.mkdtemp(prefix="floe-blob-stage-"))
+        self._lock = threading.Lock()
+        self._digest_locks: dict[str, threading.Lock] = {}
+        self._paths: dict[str, Path] = {}
+        self.downloads = 0
+
+    def __enter__(self) -> BlobStage:
+        """Return self for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Remove staged blobs."""
+        self.close()
+
+    def fetch(self, descriptor: dict[str, Any], source_tag: str) -> Path:
+        """Return a local path holding the blob described by descriptor.
+
+        Args:
+            descriptor: OCI descriptor with at least ``digest``.
+            source_tag: Tag in the source repository the blob belongs to.
+
+        Returns:
+            Path to the staged, digest-verified blob.
+
+        Raises:
+            DigestMismatchError: If the downloaded content does not match.
+        """
+        digest: str = descriptor["digest"]
+        with self._lock:
+            digest_lock = self._digest_locks.setdefault(digest, threading.Lock())
+
+        with digest_lock:
+            staged = self._paths.get(digest)
+            if staged is not None:
+                return staged
+
+            path = self._dir / digest.replace(":", "-")
+            # Pooled per-thread client: shared connections and tokens
+            self._source._create_oras_client().download_blob(
+                self._source._build_target_ref(source_tag), digest, str(path)
+            )
+            actual = _file_digest(path)
+            if actual != digest:
+                path.unlink(missing_ok=True)
+                raise DigestMismatchError(expected=digest, actual=actual, artifact_ref=source_tag)
+
+            self._paths[digest] = path
+            self.downloads += 1
+            return path
+
+    def close(self) -> None:
+        """Remove the staging directory."""
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+def _file_digest(path: Path) -> str:
+    """Compute the sha256 digest of a file."""
+    sha = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            sha.update(chunk)
+    return f"sha256:{sha.hexdigest()}"
+
+
+class RegistrySyncEngine:
+    """Concurrent, circuit-broken sync of one tag to many registries.
+
+    Circuit breakers are kept per registry URI for the life of the engine,
+    so a registry that failed during one promotion is skipped fast during
+    the next one until it recovers.
+
+    Attributes:
+        source: Client for the primary registry.
+        max_workers: Maximum number of registries synced concurrently.
+    """
+
+    def __init__(
+        self,
+        source: OCIClient,
+        *,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> None:
+        """Initialize RegistrySyncEngine.
+
+        Args:
+            source: Client for the primary registry.
+            max_workers: Maximum number of registries synced concurrently.
+
+        Raises:
+            ValueError: If max_workers is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.source = source
+        self.max_workers = max_workers
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def circuit_breaker(self, client: OCIClient) -> CircuitBreaker:
+        """Return the circuit breaker guarding a secondary registry.
+
+        Uses the client's own breaker when it has one, so sync failures and
+        the client's other operations share state. Otherwise the engine keeps
+        a default breaker per registry URI.
+
+        Args:
+            client: Client for the secondary registry.
+
+        Returns:
+            CircuitBreaker for the registry.
+        """
+        from floe_core.oci.client import OCIClient
+
+        if isinstance(client, OCIClient) and client.circuit_breaker is not None:
+            return client.circuit_breaker
+        with self._lock:
+            breaker = self._breakers.get(client.registry_uri)
+            if breaker is None:
+                breaker = CircuitBreaker(client.registry_uri)
+                self._breakers[client.registry_uri] = breaker
+            return breaker
+
+    def sync(
+        self,
+        source_tag: str,
+        dest_tag: str,
+        expected_digest: str,
+        clients: list[OCIClient],
+        *,
+        verify_digests: bool = True,
+    ) -> list[RegistrySyncStatus]:
+        """Copy source_tag to dest_tag in every secondary registry.
+
+        Failures are reported per registry and never raised (FR-030).
+
+        Args:
+            source_tag: Tag in the primary registry.
+            dest_tag: Tag to create in each secondary registry.
+            expected_digest: Digest the synced artifact must have.
+            clients: Clients for the secondary registries.
+            verify_digests: Whether to compare the synced digest (FR-029).
+
+        Returns:
+            RegistrySyncStatus per client, in the order of clients.
+        """
+        if not clients:
+            return []
+
+        workers = min(self.max_workers, len(clients))
+        with (
+            BlobStage(self.source) as stage,
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="floe-sync") as executor,
+        ):
+            futures = [
+                executor.submit(
+                    self._sync_one,
+                    client,
+                    source_tag,
+                    dest_tag,
+                    expected_digest,
+                    stage,
+                    verify_digests,
+                )
+                for client in clients
+            ]
+            results = [future.result() for future in futures]
+
+        logger.info(
+            "registry_sync_completed",
+            dest_tag=dest_tag,
+            synced=sum(1 for r in results if r.synced),
+            total=len(results),
+            blobs_downloaded=stage.downloads,
+        )
+        return results
+
+    def reconcile(
+        self,
+        source_tag: str,
+        dest_tag: str,
+        expected_digest: str,
+        clients: list[OCIClient],
+        *,
+        verify_digests: bool = True,
+    ) -> list[RegistrySyncStatus]:
+        """Sync only registries whose dest_tag is missing or stale.
+
+        Args:
+            source_tag: Tag in the primary registry.
+            dest_tag: Tag expected in each secondary registry.
+            expected_digest: Digest the synced artifact must have.
+            clients: Clients for the secondary registries.
+            verify_digests: Whether to compare the synced digest (FR-029).
+
+        Returns:
+            RegistrySyncStatus per client, in the order of clients.
+        """
+        statuses: dict[int, RegistrySyncStatus] = {}
+        lagging: list[OCIClient] = []
+        for client in clients:
+            try:
+                current = client.get_artifact_digest(dest_tag)
+            except Exception:
+                current = None
+            if current == expected_digest:
+                statuses[id(client)] = RegistrySyncStatus(
+                    registry_uri=client.registry_uri,
+                    synced=True,
+                    digest=current,
+                    synced_at=datetime.now(timezone.utc),
+                )
+            else:
+                lagging.append(client)
+
+        logger.info(
+            "registry_reconcile_started",
+            dest_tag=dest_tag,
+            lagging=[c.registry_uri for c in lagging],
+        )
+        for client, status in zip(
+            lagging,
+            self.sync(
+                source_tag, dest_tag, expected_digest, lagging, verify_digests=verify_digests
+            ),
+            strict=True,
+        ):
+            statuses[id(client)] = status
+        return [statuses[id(client)] for client in clients]
+
+    def _sync_one(
+        self,
+        client: OCIClient,
+        source_tag: str,
+        dest_tag: str,
+        expected_digest: str,
+        stage: BlobStage,
+        verify_digests: bool,
+    ) -> RegistrySyncStatus:
+        """Copy the artifact to one registry and verify its digest."""
+        registry_uri = client.registry_uri
+        try:
+            with self.circuit_breaker(client).protect():
+                client.copy_tag(
+                    source_ref=f"{self.source.registry_uri}:{source_tag}",
+                    dest_ref=f"{registry_uri}:{dest_tag}",
+                    source_client=self.source,
+                    blob_stage=stage,
+                )
+        except CircuitBreakerOpenError as e:
+            logger.warning("sync_to_registry_skipped", registry_uri=registry_uri, error=str(e))
+            return RegistrySyncStatus(registry_uri=registry_uri, synced=False, error=str(e))
+        except Exception as e:
+            logger.warning("sync_to_registry_failed", registry_uri=registry_uri, error=str(e))
+            return RegistrySyncStatus(registry_uri=registry_uri, synced=False, error=str(e))
+
+        actual_digest = None
+        if verify_digests:
+            try:
+                actual_digest = client.get_artifact_digest(dest_tag)
+            except Exception as e:
+                return RegistrySyncStatus(
+                    registry_uri=registry_uri,
+                    synced=False,
+                    error=f"Digest verification failed: {e}",
+                )
+            if actual_digest != expected_digest:
+                return RegistrySyncStatus(
+                    registry_uri=registry_uri,
+                    synced=False,
+                    digest=actual_digest,
+                    error=(
+                        f"Digest mismatch: expected "
+                        f"{expected_digest[:19]}..., "
+                        f"got {actual_digest[:19]}..."
+                    ),
+                )
+
+        return RegistrySyncStatus(
+            registry_uri=registry_uri,
+            synced=True,
+            digest=actual_digest or expected_digest,
+            synced_at=datetime.now(timezone.utc),
+        )
+
+
+__all__ = ["DEFAULT_SYNC_WORKERS", "BlobStage", "RegistrySyncEngine"]
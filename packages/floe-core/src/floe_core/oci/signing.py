@@ -37,8 +37,8 @@ import shutil
 import subprocess
 import tempfile
 import time
-from collections.abc import Callable, Iterator
-from contextlib import contextmanager
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -46,6 +46,7 @@ from typing import TYPE_CHECKING, Any
 from opentelemetry import trace
 
 from floe_core.oci.errors import ConcurrentSigningError
+from floe_core.oci.key_signing import is_kms_key_ref, load_private_key, sign_blobs
 from floe_core.schemas.signing import SignatureMetadata, SigningConfig
 
 # Security: Allowed key file extensions to prevent arbitrary file access
@@ -58,6 +59,8 @@ if TYPE_CHECKING:
     from sigstore.models import Bundle
     from sigstore.oidc import IdentityToken
 
+    from floe_core.oci.key_signing import NativePrivateKey
+
 logger = logging.getLogger(__name__)
 
 
@@ -294,7 +297,8 @@ class SigningClient:
 
     Supports both keyless (OIDC) and key-based signing modes.
     Keyless signing uses sigstore-python directly.
-    Key-based signing may fall back to cosign CLI for KMS support.
+    Key-based signing with local ECDSA/Ed25519 keys runs in-process and
+    falls back to cosign CLI for KMS and cosign-encrypted keys.
 
     Attributes:
         config: SigningConfig with mode and credentials
@@ -354,6 +358,45 @@ class SigningClient:
             else:
                 return self._sign_key_based(content, artifact_ref)
 
+    @_with_span("floe.oci.sign_batch")
+    def sign_batch(
+        self,
+        artifacts: Sequence[tuple[bytes, str]],
+        lock_timeout: float | None = None,
+    ) -> list[SignatureMetadata]:
+        """Sign several artifacts in one call.
+
+        Key-based mode loads the key once for the whole batch. Keyless mode
+        acquires one OIDC token and signs every artifact with a single
+        Fulcio certificate. The signing locks of all artifacts are held for
+        the duration of the batch, acquired in sorted order.
+
+        Args:
+            artifacts: (content, artifact_ref) pairs to sign
+            lock_timeout: Optional override for each lock timeout (default: 30s)
+
+        Returns:
+            SignatureMetadata for each artifact, in input order
+
+        Raises:
+            SigningError: If signing fails
+            OIDCTokenError: If OIDC token cannot be acquired (keyless mode)
+            ConcurrentSigningError: If a lock cannot be acquired within timeout
+        """
+        span = trace.get_current_span()
+        span.set_attribute("floe.signing.mode", self.config.mode)
+        span.set_attribute("floe.signing.batch_size", len(artifacts))
+
+        if not artifacts:
+            return []
+
+        with ExitStack() as stack:
+            for artifact_ref in sorted({ref for _, ref in artifacts}):
+                stack.enter_context(signing_lock(artifact_ref, lock_timeout))
+            if self.config.mode == "keyless":
+                return self._sign_keyless_batch(artifacts)
+            return self._sign_key_based_batch(artifacts)
+
     def _sign_keyless(self, content: bytes, artifact_ref: str) -> SignatureMetadata:
         """Sign using keyless (OIDC) mode with sigstore-python.
 
@@ -364,6 +407,19 @@ class SigningClient:
         Returns:
             SignatureMetadata with bundle and identity information
         """
+        return self._sign_keyless_batch([(content, artifact_ref)])[0]
+
+    def _sign_keyless_batch(
+        self, artifacts: Sequence[tuple[bytes, str]]
+    ) -> list[SignatureMetadata]:
+        """Sign artifacts in keyless mode with one identity token and signer.
+
+        Args:
+            artifacts: (content, artifact_ref) pairs to sign
+
+        Returns:
+            SignatureMetadata for each artifact, in input order
+        """
         from sigstore.models import ClientTrustConfig
         from sigstore.sign import SigningContext
 
@@ -375,17 +431,21 @@ class SigningClient:
         trust_config = ClientTrustConfig.production()
         context = SigningContext.from_trust_config(trust_config)
 
+        results: list[SignatureMetadata] = []
         with _trace_span("floe.oci.sign.fulcio"):
             with context.signer(identity, cache=True) as signer:
-                with _trace_span("floe.oci.sign.rekor"):
-                    bundle: Bundle = signer.sign_artifact(content)
+                for content, _artifact_ref in artifacts:
+                    with _trace_span("floe.oci.sign.rekor"):
+                        bundle: Bundle = signer.sign_artifact(content)
+                    results.append(self._bundle_to_metadata(bundle, identity))
 
-        return self._bundle_to_metadata(bundle, identity)
+        return results
 
     def _sign_key_based(self, content: bytes, artifact_ref: str) -> SignatureMetadata:
         """Sign using key-based mode (private key or KMS).
 
-        Uses cosign CLI for signing with local key files or KMS references.
+        Local ECDSA and Ed25519 keys are signed in-process. KMS references
+        and keys in cosign's encrypted format use the cosign CLI.
         No transparency log entry is created (air-gapped mode).
 
         Args:
@@ -396,18 +456,66 @@ class SigningClient:
             SignatureMetadata with signature bundle
 
         Raises:
-            CosignNotAvailableError: If cosign CLI is not installed
+            CosignNotAvailableError: If cosign is needed but not installed
+            KeyLoadError: If private key cannot be loaded
+            SigningError: If signing operation fails
+        """
+        return self._sign_key_based_batch([(content, artifact_ref)])[0]
+
+    def _sign_key_based_batch(
+        self, artifacts: Sequence[tuple[bytes, str]]
+    ) -> list[SignatureMetadata]:
+        """Sign artifacts in key-based mode, natively when the key allows it.
+
+        Args:
+            artifacts: (content, artifact_ref) pairs to sign
+
+        Returns:
+            SignatureMetadata for each artifact, in input order
+
+        Raises:
+            CosignNotAvailableError: If cosign is needed but not installed
             KeyLoadError: If private key cannot be loaded
             SigningError: If signing operation fails
         """
+        native = self._load_native_key()
+        if native is not None:
+            key_ref, private_key = native
+            with _trace_span("floe.oci.sign.key_based"):
+                trace.get_current_span().set_attribute("floe.signing.backend", "native")
+                try:
+                    bundles = sign_blobs(private_key, [content for content, _ in artifacts])
+                except Exception as e:
+                    raise SigningError(f"Native key-based signing failed: {e}") from e
+                return [self._key_signature_to_metadata(b, key_ref) for b in bundles]
+
         if not check_cosign_available():
             raise CosignNotAvailableError()
 
         key_ref = self._resolve_key_reference()
 
         with _trace_span("floe.oci.sign.key_based"):
-            signature_bundle = self._cosign_sign_blob(content, key_ref)
-            return self._key_signature_to_metadata(signature_bundle, key_ref)
+            trace.get_current_span().set_attribute("floe.signing.backend", "cosign")
+            return [
+                self._key_signature_to_metadata(self._cosign_sign_blob(content, key_ref), key_ref)
+                for content, _ in artifacts
+            ]
+
+    def _load_native_key(self) -> tuple[str, NativePrivateKey] | None:
+        """Load the configured private key for in-process signing.
+
+        Returns:
+            (key_ref, private_key), or None if the key is unresolvable here
+            or needs cosign (KMS URIs, cosign-encrypted keys)
+        """
+        try:
+            key_ref = self._resolve_key_reference()
+        except KeyLoadError:
+            return None
+        private_key = load_private_key(key_ref)
+        if private_key is None:
+            return None
+        return key_ref, private_key
 
     def _resolve_key_reference(self) -> str:
         """Resolve the key reference from config.
@@ -478,7 +586,7 @@ class SigningClient:
 
             content_file.write_bytes(content)
 
-            is_kms = key_ref.startswith(("awskms://", "gcpkms://", "azurekms://", "hashivault://"))
+            is_kms = is_kms_key_ref(key_ref)
 
             cmd = [
                 "cosign",
@@ -565,7 +673,7 @@ class SigningClient:
         Returns:
             Fingerprint string (may be empty if not computable)
         """
-        if key_ref.startswith(("awskms://", "gcpkms://", "azurekms://", "hashivault://")):
+        if is_kms_key_ref(key_ref):
             return hashlib.sha256(key_ref.encode()).hexdigest()[:16]
 
         try:
@@ -756,6 +864,24 @@ def sign_artifact(
     return result
 
 
+def sign_artifacts(
+    artifacts: Sequence[tuple[bytes, str]],
+    config: SigningConfig,
+) -> list[SignatureMetadata]:
+    """Convenience function to sign several artifacts in one call.
+
+    Args:
+        artifacts: (content, artifact_ref) pairs to sign
+        config: Signing configuration
+
+    Returns:
+        SignatureMetadata for each artifact, in input order
+    """
+    client = SigningClient(config)
+    results: list[SignatureMetadata] = client.sign_batch(artifacts)
+    return results
+
+
 __all__ = [
     "SigningClient",
     "SigningError",
@@ -764,6 +890,7 @@ __all__ = [
     "KeyLoadError",
     "check_cosign_available",
     "sign_artifact",
+    "sign_artifacts",
     # Annotation keys
     "ANNOTATION_BUNDLE",
     "ANNOTATION_MODE",
@@ -10,7 +10,8 @@ Implements:
 
 This module provides signature verification for OCI artifacts using sigstore-python.
 It supports keyless verification (OIDC-based) with identity policy matching, and
-key-based verification for air-gapped environments using cosign CLI.
+key-based verification for air-gapped environments, in-process for local
+ECDSA/Ed25519 keys and via cosign CLI for KMS keys.
 
 Example:
     >>> from floe_core.oci.verification import VerificationClient
@@ -38,6 +39,7 @@ See Also:
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import logging
 import re
@@ -52,6 +54,7 @@ from urllib.parse import urlparse, urlunparse
 from opentelemetry import trace
 
 from floe_core.oci.errors import SignatureVerificationError
+from floe_core.oci.key_signing import load_public_key, verify_blob
 from floe_core.schemas.signing import (
     SignatureMetadata,
     TrustedIssuer,
@@ -66,6 +69,8 @@ if TYPE_CHECKING:
     from sigstore.models import Bundle
     from sigstore.verify import Verifier
 
+    from floe_core.oci.cache import CacheManager
+
 logger = logging.getLogger(__name__)
 
 
@@ -199,9 +204,16 @@ class VerificationClient:
     Supports keyless (OIDC) verification with identity policy matching.
     Verifies signatures against configured trusted issuers and subjects.
 
+    When a CacheManager is given, successful results are reused for
+    policy.cache_ttl_seconds. Cache keys cover the artifact digest, the
+    signature, the policy (including environment), and the trust root
+    (public key or Sigstore trust root), so changing any of them forces a
+    fresh verification. Cache hits are still audit-logged.
+
     Attributes:
         policy: VerificationPolicy with trusted issuers and enforcement settings
         environment: Optional environment name for per-env policy overrides
+        cache: Optional CacheManager holding verification results
 
     Example:
         >>> policy = VerificationPolicy(
@@ -222,15 +234,18 @@ class VerificationClient:
         self,
         policy: VerificationPolicy,
         environment: str | None = None,
+        cache: CacheManager | None = None,
     ) -> None:
         """Initialize VerificationClient.
 
         Args:
             policy: Verification policy from manifest.yaml
             environment: Environment name for per-env policy overrides
+            cache: Optional OCI cache used to reuse successful verifications
         """
         self.policy = policy
         self.environment = environment
+        self.cache = cache
         self._verifier: Verifier | None = None
 
     @property
@@ -283,6 +298,22 @@ class VerificationClient:
             if metadata is None:
                 return self._handle_unsigned(artifact_ref, artifact_digest)
 
+            cache_key = self._cache_key(content, metadata)
+            span.set_attribute("floe.verification.cache_hit", False)
+            if cache_key is not None:
+                cached = self._cached_result(cache_key[0])
+                if cached is not None:
+                    span.set_attribute("floe.verification.cache_hit", True)
+                    span.set_attribute("floe.verification.status", cached.status)
+                    self._log_audit_event(
+                        artifact_ref=artifact_ref,
+                        artifact_digest=artifact_digest or "",
+                        result=cached,
+                        success=True,
+                        cache_hit=True,
+                    )
+                    return cached
+
             # Verify the signature
             try:
                 result = self._verify_signature(content, metadata, artifact_ref)
@@ -301,6 +332,10 @@ class VerificationClient:
                     success=result.is_valid,
                 )
 
+                # Only successes are cached: failures may be transient (Rekor, network)
+                if result.is_valid and cache_key is not None:
+                    self._store_result(cache_key, result)
+
                 # Handle enforcement
                 if not result.is_valid:
                     self._handle_verification_failure(result, artifact_ref)
@@ -331,6 +366,106 @@ class VerificationClient:
                 self._handle_verification_failure(result, artifact_ref)
                 return result
 
+    def _cache_key(
+        self,
+        content: bytes,
+        metadata: SignatureMetadata,
+    ) -> tuple[str, str, str, str] | None:
+        """Build the verification cache key for a signed artifact.
+
+        Args:
+            content: Artifact bytes
+            metadata: Signature metadata
+
+        Returns:
+            (cache_key, artifact_digest, policy_hash, trust_root), or None
+            if caching is disabled or the trust root cannot be resolved.
+        """
+        if self.cache is None or not self.cache.enabled or self.policy.cache_ttl_seconds == 0:
+            return None
+
+        trust_root = self._trust_root_fingerprint(metadata)
+        if trust_root is None:
+            return None
+
+        artifact_digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        signature_digest = hashlib.sha256(metadata.model_dump_json().encode()).hexdigest()
+        policy_hash = hashlib.sha256(
+            f"{self.policy.model_dump_json()}|{self.environment or ''}".encode()
+        ).hexdigest()
+        cache_key = hashlib.sha256(
+            f"{artifact_digest}|{signature_digest}|{policy_hash}|{trust_root}".encode()
+        ).hexdigest()
+        return cache_key, artifact_digest, policy_hash, trust_root
+
+    def _trust_root_fingerprint(self, metadata: SignatureMetadata) -> str | None:
+        """Fingerprint the key or trust root a signature is verified against.
+
+        Key-based signatures use the configured public key content (or its
+        KMS URI). Keyless signatures use the Sigstore production trust root,
+        identified by the installed sigstore release and Rekor mode.
+
+        Args:
+            metadata: Signature metadata
+
+        Returns:
+            Fingerprint string, or None if the public key cannot be resolved.
+        """
+        if metadata.mode == "key-based":
+            public_key_ref = self._resolve_public_key_ref()
+            if public_key_ref is None:
+                return None
+            key_path = Path(public_key_ref)
+            try:
+                key_material = key_path.read_bytes() if key_path.is_file() else None
+            except (OSError, ValueError):
+                key_material = None
+            if key_material is None:
+                key_material = public_key_ref.encode()
+            return f"key:{hashlib.sha256(key_material).hexdigest()}"
+
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            sigstore_version = version("sigstore")
+        except PackageNotFoundError:
+            sigstore_version = "unknown"
+        return f"sigstore:production:{sigstore_version}:offline={not self.policy.require_rekor}"
+
+    def _cached_result(self, cache_key: str) -> VerificationResult | None:
+        """Return a cached successful result, ignoring unreadable entries."""
+        if self.cache is None:
+            return None
+        try:
+            cached = self.cache.get_verification(cache_key)
+            if cached is None:
+                return None
+            return VerificationResult.model_validate_json(cached)
+        except Exception as e:
+            logger.warning("Ignoring unreadable verification cache entry: %s", e)
+            return None
+
+    def _store_result(
+        self,
+        cache_key: tuple[str, str, str, str],
+        result: VerificationResult,
+    ) -> None:
+        """Store a successful result; cache failures never fail verification."""
+        if self.cache is None:
+            return
+        key, artifact_digest, policy_hash, trust_root = cache_key
+        try:
+            self.cache.put_verification(
+                key,
+                artifact_digest=artifact_digest,
+                policy_hash=policy_hash,
+                trust_root=trust_root,
+                result=result.model_dump_json(),
+                ttl_seconds=self.policy.cache_ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning("Failed to store verification result in cache: %s", e)
+
     def _verify_signature(
         self,
         content: bytes,
@@ -339,7 +474,7 @@ class VerificationClient:
     ) -> VerificationResult:
         """Verify signature using appropriate method based on signing mode.
 
-        Routes to keyless (sigstore-python) or key-based (cosign CLI) verification
+        Routes to keyless (sigstore-python) or key-based (native or cosign CLI) verification
         based on the signature metadata mode.
 
         Args:
@@ -486,10 +621,11 @@ class VerificationClient:
         metadata: SignatureMetadata,
         artifact_ref: str,
     ) -> VerificationResult:
-        """Verify key-based signature using cosign CLI.
+        """Verify key-based signature natively, or with cosign CLI.
 
         Used for air-gapped environments where signatures are created with
-        private keys instead of OIDC identity.
+        private keys instead of OIDC identity. Local ECDSA and Ed25519 public
+        keys are verified in-process; KMS references use cosign verify-blob.
 
         Args:
             content: Artifact bytes
@@ -500,14 +636,6 @@ class VerificationClient:
             VerificationResult with verification status
         """
         with _get_tracer().start_as_current_span("floe.oci.verify.key_based") as span:
-            if not check_cosign_available():
-                return VerificationResult(
-                    status="invalid",
-                    signer_identity=metadata.subject,
-                    verified_at=datetime.now(timezone.utc),
-                    failure_reason="cosign CLI not available for key-based verification",
-                )
-
             public_key_ref = self._resolve_public_key_ref()
             if public_key_ref is None:
                 return VerificationResult(
@@ -539,7 +667,22 @@ class VerificationClient:
                     failure_reason=f"Invalid signature bundle: {e}",
                 )
 
-            verification_success = self._cosign_verify_blob(content, bundle_data, public_key_ref)
+            public_key = load_public_key(public_key_ref)
+            if public_key is not None:
+                span.set_attribute("floe.verification.backend", "native")
+                verification_success = verify_blob(public_key, content, bundle_data)
+            elif not check_cosign_available():
+                return VerificationResult(
+                    status="invalid",
+                    signer_identity=metadata.subject,
+                    verified_at=datetime.now(timezone.utc),
+                    failure_reason="cosign CLI not available for key-based verification",
+                )
+            else:
+                span.set_attribute("floe.verification.backend", "cosign")
+                verification_success = self._cosign_verify_blob(
+                    content, bundle_data, public_key_ref
+                )
 
             if verification_success:
                 return VerificationResult(
@@ -888,6 +1031,7 @@ class VerificationClient:
         artifact_digest: str,
         result: VerificationResult,
         success: bool,
+        cache_hit: bool = False,
     ) -> None:
         """Log structured audit event for verification attempt.
 
@@ -896,6 +1040,7 @@ class VerificationClient:
             artifact_digest: Artifact SHA256 digest
             result: Verification result
             success: Whether verification passed
+            cache_hit: Whether the result came from the verification cache
         """
         span = trace.get_current_span()
         span_context = span.get_span_context()
@@ -915,6 +1060,7 @@ class VerificationClient:
             span_id=(format(span_context.span_id, "016x") if span_context.is_valid else ""),
             success=success,
             failure_reason=result.failure_reason,
+            cache_hit=cache_hit,
         )
 
         # Log as structured JSON
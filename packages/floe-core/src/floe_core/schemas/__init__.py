@@ -151,6 +151,7 @@ from floe_core.schemas.metadata import (
 
 # OCI schemas (Epic 8A)
 from floe_core.schemas.oci import (
+    FLOE_ARTIFACT_SECTION_TYPE,
     FLOE_ARTIFACT_TYPE,
     OCI_EMPTY_CONFIG_TYPE,
     ArtifactLayer,
@@ -161,6 +162,7 @@ from floe_core.schemas.oci import (
     CacheEntry,
     CacheIndex,
     CircuitBreakerConfig,
+    LayerPackingConfig,
     RegistryAuth,
     RegistryConfig,
     ResilienceConfig,
@@ -445,6 +447,7 @@ __all__: list[str] = [
     "SecurityConfig",
     # OCI schemas (Epic 8A)
     "FLOE_ARTIFACT_TYPE",
+    "FLOE_ARTIFACT_SECTION_TYPE",
     "OCI_EMPTY_CONFIG_TYPE",
     "AuthType",
     "RegistryAuth",
@@ -452,6 +455,7 @@ __all__: list[str] = [
     "CircuitBreakerConfig",
     "ResilienceConfig",
     "CacheConfig",
+    "LayerPackingConfig",
     "RegistryConfig",
     "SignatureStatus",
     "ArtifactLayer",
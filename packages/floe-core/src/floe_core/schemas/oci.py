@@ -7,6 +7,7 @@ These schemas are contracts - changes require versioning per Constitution Princi
 
 Key Components:
     RegistryConfig: Top-level registry configuration from manifest.yaml
+    LayerPackingConfig: Layer compression and section splitting for push
     ArtifactManifest: Metadata returned by inspect operations
     CacheEntry: Local cache entry metadata
     CacheIndex: Index of all cached artifacts
@@ -25,7 +26,7 @@ import re
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
@@ -52,6 +53,12 @@ FLOE_ARTIFACT_TYPE = "application/vnd.floe.compiled-artifacts.v1+json"
 OCI_EMPTY_CONFIG_TYPE = "application/vnd.oci.empty.v1+json"
 """Media type for OCI empty config blob (used when no config needed)."""
 
+FLOE_ARTIFACT_SECTION_TYPE = "application/vnd.floe.compiled-artifacts.section.v1+json"
+"""Media type for a CompiledArtifacts section pushed as its own layer."""
+
+LayerCompression = Literal["none", "gzip", "zstd"]
+"""Compression applied to pushed layers (zstd requires the zstandard package)."""
+
 
 # =============================================================================
 # Registry Configuration Schemas
@@ -260,6 +267,42 @@ class CacheConfig(BaseModel):
     )
 
 
+class LayerPackingConfig(BaseModel):
+    """How CompiledArtifacts are packed into layers on push.
+
+    The defaults push one uncompressed compiled_artifacts.json layer,
+    readable by every floe release. Enabling compression or section
+    splitting produces a packed layout that pull reassembles into the
+    same bytes; older releases cannot pull packed artifacts.
+
+    Examples:
+        >>> config = LayerPackingConfig(compression="zstd", split_threshold_bytes=1048576)
+        >>> config.is_packed
+        True
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    compression: LayerCompression = Field(
+        default="none",
+        description="Layer compression (none, gzip, zstd); reflected in layer media types",
+    )
+    split_threshold_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Top-level sections whose JSON is at least this many bytes are pushed as "
+            "separate content-addressed layers, so unchanged sections are not re-uploaded "
+            "(None keeps a single layer)"
+        ),
+    )
+
+    @property
+    def is_packed(self) -> bool:
+        """Whether push uses the packed layout instead of a single plain layer."""
+        return self.compression != "none" or self.split_threshold_bytes is not None
+
+
 class RegistryConfig(BaseModel):
     """Complete OCI registry configuration.
 
@@ -315,6 +358,10 @@ class RegistryConfig(BaseModel):
         default=None,
         description="Artifact verification policy (Epic 8B)",
     )
+    packing: LayerPackingConfig = Field(
+        default_factory=LayerPackingConfig,
+        description="Layer compression and section splitting for push",
+    )
 
     @field_validator("uri")
     @classmethod
@@ -656,8 +703,9 @@ class CacheEntry(BaseModel):
 class CacheIndex(BaseModel):
     """Index of all cached artifacts.
 
-    Stored as index.json in the cache directory. Maps digests to cache entries
-    for fast lookup and provides aggregate statistics.
+    Maps digests to cache entries and provides aggregate statistics. This was
+    the index.json format of earlier releases; CacheManager now keeps its
+    index in SQLite and reads this model only to import an existing index.json.
 
     Examples:
         >>> index = CacheIndex(
@@ -26,7 +26,7 @@ from enum import Enum
 from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from floe_core.schemas.signing import VerificationResult
 
@@ -451,6 +451,9 @@ class EnvironmentConfig(BaseModel):
         name: Environment name (e.g., "dev", "staging", "prod").
         gates: Map of gate types to enabled status. policy_compliance is always true.
         gate_timeout_seconds: Maximum gate execution time (30-3600 seconds).
+        gate_dependencies: Gates that must finish before a gate may start.
+            policy_compliance always runs before every other gate.
+        max_parallel_gates: Maximum number of gates executed concurrently.
         authorization: Access control rules for this environment.
         lock: Current lock state (if locked, promotions are blocked).
 
@@ -483,6 +486,16 @@ class EnvironmentConfig(BaseModel):
         le=3600,
         description="Maximum gate execution time in seconds",
     )
+    gate_dependencies: dict[PromotionGate, list[PromotionGate]] = Field(
+        default_factory=dict,
+        description="Gates that must finish before a gate may start",
+    )
+    max_parallel_gates: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Maximum number of gates executed concurrently",
+    )
     authorization: AuthorizationConfig | None = Field(
         default=None,
         description="Access control rules for this environment",
@@ -505,6 +518,36 @@ class EnvironmentConfig(BaseModel):
             )
         return v
 
+    @model_validator(mode="after")
+    def validate_gate_dependencies(self) -> EnvironmentConfig:
+        """Validate that gate dependencies reference configured gates and are acyclic."""
+        for gate, dependencies in self.gate_dependencies.items():
+            unknown = [g.value for g in (gate, *dependencies) if g not in self.gates]
+            if unknown:
+                raise ValueError(
+                    f"gate_dependencies references gates not configured for "
+                    f"environment '{self.name}': {sorted(set(unknown))}"
+                )
+
+        # Depth-first search for cycles
+        visiting: set[PromotionGate] = set()
+        done: set[PromotionGate] = set()
+
+        def visit(gate: PromotionGate) -> None:
+            if gate in done:
+                return
+            if gate in visiting:
+                raise ValueError(f"gate_dependencies contains a cycle through '{gate.value}'")
+            visiting.add(gate)
+            for dependency in self.gate_dependencies.get(gate, []):
+                visit(dependency)
+            visiting.discard(gate)
+            done.add(gate)
+
+        for gate in self.gate_dependencies:
+            visit(gate)
+        return self
+
 
 def _default_environments() -> list[EnvironmentConfig]:
     """Create default environment configurations [dev, staging, prod]."""
@@ -543,6 +586,11 @@ class PromotionConfig(BaseModel):
         default_timeout_seconds: Default gate timeout.
         webhooks: Webhook configurations for notifications.
         gate_commands: Custom gate command configurations.
+        secondary_registries: Secondary registry URIs for cross-registry sync.
+        verify_secondary_digests: Verify digests after secondary sync.
+        secondary_sync_mode: 'sync' waits for secondary registries, 'eventual'
+            returns after the primary promotion and syncs in the background.
+        max_parallel_syncs: Maximum number of secondary registries synced concurrently.
 
     Examples:
         >>> config = PromotionConfig()
@@ -597,6 +645,19 @@ class PromotionConfig(BaseModel):
             "If False, sync continues without verification."
         ),
     )
+    secondary_sync_mode: Literal["sync", "eventual"] = Field(
+        default="sync",
+        description=(
+            "Secondary registry sync mode: 'sync' (promotion waits for all registries), "
+            "'eventual' (promotion returns after primary, registries reconciled in background)"
+        ),
+    )
+    max_parallel_syncs: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum number of secondary registries synced concurrently",
+    )
 
     @field_validator("environments")
     @classmethod
@@ -672,6 +733,7 @@ class RegistrySyncStatus(BaseModel):
         digest: Artifact digest in this registry (for verification).
         error: Error message if sync failed.
         synced_at: Sync completion timestamp.
+        pending: Whether sync was deferred to background reconciliation.
 
     Examples:
         >>> status = RegistrySyncStatus(
@@ -704,6 +766,10 @@ class RegistrySyncStatus(BaseModel):
         default=None,
         description="Sync completion timestamp",
     )
+    pending: bool = Field(
+        default=False,
+        description="Whether sync was deferred to background reconciliation (eventual mode)",
+    )
 
 
 class PromotionRecord(BaseModel):
@@ -192,6 +192,7 @@ class VerificationPolicy(BaseModel):
         public_key_ref: Public key for key-based verification
         environments: Per-environment policy overrides
         grace_period_days: Days to accept expired certs during rotation
+        cache_ttl_seconds: Seconds a successful verification may be reused (0 disables)
 
     Example:
         >>> policy = VerificationPolicy(
@@ -258,6 +259,13 @@ class VerificationPolicy(BaseModel):
         default=False,
         description="Allow relaxed attestation verification for private infrastructure",
     )
+    cache_ttl_seconds: Annotated[int, Field(ge=0, le=86400)] = Field(
+        default=3600,
+        description=(
+            "Seconds a successful verification result is reused from the OCI cache "
+            "(0 disables the verification cache)"
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_verification_config(self) -> VerificationPolicy:
@@ -410,6 +418,10 @@ class VerificationResult(BaseModel):
         default_factory=list, description="Certificate chain (PEM)"
     )
     failure_reason: str | None = Field(default=None, description="Reason if verification failed")
+    cache_hit: bool = Field(
+        default=False,
+        description="Result reused from the verification cache instead of re-verified",
+    )
     certificate_expired_at: datetime | None = Field(
         default=None, description="Certificate expiration time (FR-012 grace period)"
     )
@@ -496,6 +508,7 @@ class VerificationAuditEvent(BaseModel):
     span_id: str = Field(description="W3C span ID")
     success: bool = Field(description="Verification passed")
     failure_reason: str | None = Field(default=None, description="Reason if verification failed")
+    cache_hit: bool = Field(default=False, description="Result served from verification cache")
 
 
 class VerificationBundle(BaseModel):
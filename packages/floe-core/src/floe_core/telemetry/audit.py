@@ -23,6 +23,7 @@ Example:
 from __future__ import annotations
 
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import structlog
@@ -43,6 +44,73 @@ _EXCLUDED_PLUGIN_TYPES: frozenset[PluginType] = frozenset(
 )
 
 
+@dataclass(frozen=True)
+class PluginAuditRecord:
+    """Instrumentation audit outcome for a single plugin.
+
+    Captures only what the audit needs, so results can be persisted and
+    re-evaluated without importing the plugin again.
+
+    Attributes:
+        plugin_type: Plugin category.
+        name: Plugin name from PluginMetadata.
+        tracer_name: OTel tracer name, or None if uninstrumented.
+    """
+
+    plugin_type: PluginType
+    name: str
+    tracer_name: str | None
+
+
+def audit_records(
+    plugins: Sequence[tuple[PluginType, PluginMetadata]],
+) -> list[PluginAuditRecord]:
+    """Capture the audit-relevant metadata of loaded plugins.
+
+    Args:
+        plugins: Sequence of (PluginType, PluginMetadata) tuples.
+
+    Returns:
+        One PluginAuditRecord per plugin, in input order.
+    """
+    return [
+        PluginAuditRecord(
+            plugin_type=plugin_type,
+            name=plugin.name,
+            tracer_name=plugin.tracer_name,
+        )
+        for plugin_type, plugin in plugins
+    ]
+
+
+def verify_audit_records(records: Sequence[PluginAuditRecord]) -> list[str]:
+    """Check previously captured audit records for missing instrumentation.
+
+    Applies the same rules as ``verify_plugin_instrumentation()`` to
+    PluginAuditRecord values, e.g. records restored from a compile cache.
+
+    Args:
+        records: Sequence of PluginAuditRecord to audit.
+
+    Returns:
+        List of warning messages for uninstrumented plugins.
+    """
+    warnings: list[str] = []
+
+    for record in records:
+        if record.plugin_type in _EXCLUDED_PLUGIN_TYPES:
+            continue
+        if record.tracer_name is None:
+            warnings.append(_uninstrumented_message(record.name, record.plugin_type))
+
+    return warnings
+
+
+def _uninstrumented_message(name: str, plugin_type: PluginType) -> str:
+    """Format the warning emitted for an uninstrumented plugin."""
+    return f"Plugin '{name}' (type={plugin_type.name}) is not instrumented (tracer_name is None)"
+
+
 def verify_plugin_instrumentation(
     plugins: Sequence[tuple[PluginType, PluginMetadata]],
 ) -> list[str]:
@@ -80,10 +148,6 @@ def verify_plugin_instrumentation(
             continue
 
         if plugin.tracer_name is None:
-            msg = (
-                f"Plugin '{plugin.name}' (type={plugin_type.name}) "
-                "is not instrumented (tracer_name is None)"
-            )
-            warnings.append(msg)
+            warnings.append(_uninstrumented_message(plugin.name, plugin_type))
 
     return warnings
@@ -426,8 +426,8 @@ class TestPullFromRegistry(IntegrationTestBase):
         cache_files = list(cache_dir.rglob("*"))
         assert len(cache_files) > 0, "Expected cache files after first pull"
         # Verify cache index exists - this is the structural contract
-        cache_index = cache_dir / "index.json"
-        assert cache_index.exists(), "Expected cache index.json file"
+        cache_index = cache_dir / "index.db"
+        assert cache_index.exists(), "Expected cache index.db file"
 
         # Second pull - should use cache
         pulled_second = client.pull(tag=test_artifact_tag)
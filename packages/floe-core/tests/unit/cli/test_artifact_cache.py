@@ -0,0 +1,90 @@
+"""Unit tests for artifact cache CLI commands.
+
+Requirements: FR-015, FR-016
+
+These tests verify the artifact cache commands:
+- gc removes expired and superseded entries and reports what it freed
+- gc validates --max-size-gb
+- stats prints entry counts and size
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from floe_core.cli.main import cli
+from floe_core.oci.cache import CacheManager
+from floe_core.schemas.oci import CacheConfig
+
+REGISTRY = "oci://harbor.example.com/floe"
+
+
+def _put(manager: CacheManager, tag: str, content: bytes) -> str:
+    """Store content under tag and return its digest."""
+    digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+    manager.put(digest=digest, tag=tag, registry=REGISTRY, content=content)
+    return digest
+
+
+class TestArtifactCache:
+    """Tests for the artifact cache command group."""
+
+    @pytest.mark.requirement("8A-FR-016")
+    def test_cache_appears_in_artifact_help(self) -> None:
+        """Test that cache group is listed in artifact group."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["artifact", "--help"])
+
+        assert result.exit_code == 0
+        assert "cache" in result.output
+
+    @pytest.mark.requirement("8A-FR-016")
+    def test_gc_removes_superseded_entries(self, tmp_path: Path) -> None:
+        """Test that gc removes an older pull of a mutable tag."""
+        cache_path = tmp_path / "cache"
+        manager = CacheManager(CacheConfig(path=cache_path))
+        old = _put(manager, "latest-dev", b"first")
+        _put(manager, "latest-dev", b"second")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["artifact", "cache", "gc", "--path", str(cache_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "1 superseded" in result.output
+        assert "1 entries" in result.output
+        assert manager.get_by_digest(old) is None
+
+    @pytest.mark.requirement("8A-FR-015")
+    def test_gc_rejects_max_size_below_one(self, tmp_path: Path) -> None:
+        """Test that --max-size-gb must be at least 1, like CacheConfig."""
+        cache_path = tmp_path / "cache"
+        CacheManager(CacheConfig(path=cache_path))
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["artifact", "cache", "gc", "--path", str(cache_path), "--max-size-gb", "0"],
+        )
+
+        assert result.exit_code != 0
+        assert "--max-size-gb" in result.output
+
+    @pytest.mark.requirement("8A-FR-016")
+    def test_stats_prints_entry_counts(self, tmp_path: Path) -> None:
+        """Test that stats reports immutable and mutable entry counts."""
+        cache_path = tmp_path / "cache"
+        manager = CacheManager(CacheConfig(path=cache_path))
+        _put(manager, "v1.0.0", b"immutable")
+        _put(manager, "latest-dev", b"mutable")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["artifact", "cache", "stats", "--path", str(cache_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "Entries:        2" in result.output
+        assert "Immutable:    1" in result.output
+        assert "Mutable:      1" in result.output
@@ -0,0 +1,122 @@
+"""Unit tests for artifact prefetch CLI command.
+
+Requirements: FR-013, FR-014
+
+These tests verify the artifact prefetch command:
+- Passes --tag-pattern, --environment, and --workers to OCIClient.prefetch()
+- Reports per-tag failures with a non-zero exit code
+- Runs a refresher with --watch
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from floe_core.cli.main import cli
+from floe_core.oci.cache import WarmResult
+
+
+def _result(fetched: list[str], errors: dict[str, Exception] | None = None) -> WarmResult:
+    """Build a WarmResult with the given outcomes."""
+    result = WarmResult()
+    result.fetched.extend(fetched)
+    result.errors.update(errors or {})
+    return result
+
+
+class TestArtifactPrefetch:
+    """Tests for the artifact prefetch command."""
+
+    @pytest.mark.requirement("8A-FR-013")
+    def test_prefetch_appears_in_artifact_help(self) -> None:
+        """Test that prefetch command is listed in artifact group."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["artifact", "--help"])
+
+        assert result.exit_code == 0
+        assert "prefetch" in result.output
+
+    @pytest.mark.requirement("8A-FR-013")
+    @patch("floe_core.oci.OCIClient")
+    def test_prefetch_passes_options_to_client(self, mock_client_class: MagicMock) -> None:
+        """Test that pattern, environments, and workers reach OCIClient.prefetch()."""
+        mock_client = MagicMock()
+        mock_client.prefetch.return_value = _result(["v1.0.0-prod", "latest-prod"])
+        mock_client_class.from_registry_config.return_value = mock_client
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "artifact",
+                "prefetch",
+                "--registry",
+                "oci://example.com/repo",
+                "--tag-pattern",
+                "v1.*",
+                "-e",
+                "staging",
+                "-e",
+                "prod",
+                "--workers",
+                "8",
+            ],
+        )
+
+        assert result.exit_code == 0
+        mock_client.prefetch.assert_called_once_with(
+            filter_pattern="v1.*", environments=["staging", "prod"], max_workers=8
+        )
+        assert "2 fetched" in result.output
+
+    @pytest.mark.requirement("8A-FR-013")
+    @patch("floe_core.oci.OCIClient")
+    def test_prefetch_failures_exit_nonzero(self, mock_client_class: MagicMock) -> None:
+        """Test that any failed tag makes the command fail."""
+        mock_client = MagicMock()
+        mock_client.prefetch.return_value = _result(
+            ["v1.0.0-prod"], {"latest-prod": ConnectionError("Registry unavailable")}
+        )
+        mock_client_class.from_registry_config.return_value = mock_client
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["artifact", "prefetch", "--registry", "oci://example.com/repo", "-e", "prod"]
+        )
+
+        assert result.exit_code != 0
+        assert "latest-prod" in result.output
+
+    @pytest.mark.requirement("8A-FR-014")
+    @patch("floe_core.oci.OCIClient")
+    def test_prefetch_watch_runs_refresher(self, mock_client_class: MagicMock) -> None:
+        """Test that --watch runs the client's refresher until interrupted."""
+        mock_client = MagicMock()
+        refresher = mock_client.cache_refresher.return_value
+        refresher.run_forever.side_effect = KeyboardInterrupt
+        refresher.last_result = None
+        mock_client_class.from_registry_config.return_value = mock_client
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "artifact",
+                "prefetch",
+                "--registry",
+                "oci://example.com/repo",
+                "-e",
+                "prod",
+                "--watch",
+                "--interval",
+                "60",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert mock_client.cache_refresher.call_args.kwargs["interval_seconds"] == 60.0
+        refresher.stop.assert_called_once()
+        mock_client.prefetch.assert_not_called()
@@ -14,6 +14,7 @@ Tests cover:
 - Exit code handling (FR-015)
 - Command accepts --skip-contracts flag (T077)
 - Command accepts --drift-detection flag (T077)
+- Command compiles many products with --batch
 """
 
 from __future__ import annotations
@@ -30,7 +31,10 @@ if TYPE_CHECKING:
 class _FakeCompiledArtifacts:
     """Minimal serializer surface for compile CLI unit tests."""
 
-    def __init__(self) -> None:
+    def __init__(self, product_name: str = "test-product") -> None:
+        from types import SimpleNamespace
+
+        self.metadata = SimpleNamespace(product_name=product_name)
         self.configmap_calls: list[tuple[str, str | None]] = []
 
     def to_json_file(self, path: Path) -> None:
@@ -66,7 +70,7 @@ def fake_compiled_artifacts(monkeypatch: pytest.MonkeyPatch) -> _FakeCompiledArt
     import floe_core.compilation.stages as stages
 
     artifacts = _FakeCompiledArtifacts()
-    monkeypatch.setattr(stages, "compile_pipeline", lambda _spec, _manifest: artifacts)
+    monkeypatch.setattr(stages, "compile_pipeline", lambda _spec, _manifest, **_kwargs: artifacts)
     return artifacts
 
 
@@ -337,6 +341,44 @@ class TestPlatformCompileCommand:
         assert result.exit_code == 0, result.output
         assert (temp_dir / expected_output).exists()
 
+    @pytest.mark.requirement("FR-010")
+    def test_compile_passes_parallel_enforcement_to_pipeline(
+        self,
+        cli_runner: CliRunner,
+        sample_floe_yaml: Path,
+        sample_manifest_yaml: Path,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that --parallel-enforcement reaches compile_pipeline()."""
+        import floe_core.compilation.stages as stages
+        from floe_core.cli.main import cli
+
+        calls: list[dict[str, object]] = []
+
+        def _fake_compile_pipeline(_spec: Path, _manifest: Path, **kwargs: object) -> object:
+            calls.append(kwargs)
+            return _FakeCompiledArtifacts()
+
+        monkeypatch.setattr(stages, "compile_pipeline", _fake_compile_pipeline)
+        monkeypatch.chdir(temp_dir)
+
+        result = cli_runner.invoke(
+            cli,
+            [
+                "platform",
+                "compile",
+                "--spec",
+                str(sample_floe_yaml),
+                "--manifest",
+                str(sample_manifest_yaml),
+                "--parallel-enforcement",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert calls[0]["parallel_enforcement"] is True
+
     @pytest.mark.requirement("FR-011")
     @pytest.mark.parametrize("output_format", ["json", "yaml", "configmap"])
     def test_compile_respects_explicit_output_path_for_all_formats(
@@ -865,6 +907,257 @@ class TestPlatformCompileCommand:
         assert "drift" in result.output.lower()
 
 
+class TestPlatformCompileBatch:
+    """Tests for platform compile --batch mode."""
+
+    @pytest.mark.requirement("FR-010")
+    def test_batch_writes_artifacts_next_to_each_spec(
+        self,
+        cli_runner: CliRunner,
+        sample_manifest_yaml: Path,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that --batch compiles every floe.yaml and reports throughput."""
+        import floe_core.compilation.batch as batch
+        from floe_core.cli.main import cli
+
+        spec_paths = []
+        for name in ("orders", "customers"):
+            spec_path = temp_dir / "products" / name / "floe.yaml"
+            spec_path.parent.mkdir(parents=True)
+            spec_path.write_text("name: test\n")
+            spec_paths.append(spec_path.resolve())
+
+        def _fake_compile_batch(paths: list[Path], _manifest: Path, **_kwargs: object) -> object:
+            return batch.BatchCompileResult(
+                artifacts={path: _FakeCompiledArtifacts() for path in paths},
+                duration_seconds=0.5,
+            )
+
+        monkeypatch.setattr(batch, "compile_batch", _fake_compile_batch)
+
+        result = cli_runner.invoke(
+            cli,
+            [
+                "platform",
+                "compile",
+                "--batch",
+                str(temp_dir / "products"),
+                "--manifest",
+                str(sample_manifest_yaml),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "4.00 products/sec" in result.output
+        for spec_path in spec_paths:
+            assert (spec_path.parent / "target" / "compiled_artifacts.json").exists()
+
+    @pytest.mark.requirement("FR-015")
+    def test_batch_failures_exit_with_compilation_error(
+        self,
+        cli_runner: CliRunner,
+        sample_manifest_yaml: Path,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that per-product failures are reported and fail the command."""
+        import floe_core.compilation.batch as batch
+        from floe_core.cli.main import cli
+        from floe_core.cli.utils import ExitCode
+
+        spec_path = temp_dir / "products" / "broken" / "floe.yaml"
+        spec_path.parent.mkdir(parents=True)
+        spec_path.write_text("name: test\n")
+
+        def _fake_compile_batch(paths: list[Path], _manifest: Path, **_kwargs: object) -> object:
+            return batch.BatchCompileResult(
+                failures=[
+                    batch.BatchCompileFailure(
+                        spec_path=paths[0],
+                        error_type="CompilationException",
+                        message="[LOAD] E101: invalid spec",
+                        stage="LOAD",
+                    )
+                ],
+                duration_seconds=0.1,
+            )
+
+        monkeypatch.setattr(batch, "compile_batch", _fake_compile_batch)
+
+        result = cli_runner.invoke(
+            cli,
+            [
+                "platform",
+                "compile",
+                "--batch",
+                str(temp_dir / "products" / "*" / "floe.yaml"),
+                "--manifest",
+                str(sample_manifest_yaml),
+            ],
+        )
+
+        assert result.exit_code == ExitCode.COMPILATION_ERROR
+        assert "Failed to compile" in result.output
+        assert "1 of 1 products failed" in result.output
+
+    @pytest.mark.requirement("FR-010")
+    def test_batch_rejects_spec_option(
+        self,
+        cli_runner: CliRunner,
+        sample_floe_yaml: Path,
+        sample_manifest_yaml: Path,
+        temp_dir: Path,
+    ) -> None:
+        """Test that --batch and --spec are mutually exclusive."""
+        from floe_core.cli.main import cli
+        from floe_core.cli.utils import ExitCode
+
+        result = cli_runner.invoke(
+            cli,
+            [
+                "platform",
+                "compile",
+                "--batch",
+                str(temp_dir),
+                "--spec",
+                str(sample_floe_yaml),
+                "--manifest",
+                str(sample_manifest_yaml),
+            ],
+        )
+
+        assert result.exit_code == ExitCode.USAGE_ERROR
+
+    @pytest.mark.requirement("FR-010")
+    @pytest.mark.parametrize(
+        "option",
+        [
+            ["--enforcement-report", "report.json"],
+            ["--skip-contracts"],
+            ["--drift-detection"],
+            ["--generate-definitions"],
+            ["--parallel-enforcement"],
+        ],
+    )
+    def test_batch_rejects_single_product_options(
+        self,
+        cli_runner: CliRunner,
+        sample_manifest_yaml: Path,
+        temp_dir: Path,
+        option: list[str],
+    ) -> None:
+        """Test that --batch rejects options it would otherwise ignore."""
+        from floe_core.cli.main import cli
+        from floe_core.cli.utils import ExitCode
+
+        result = cli_runner.invoke(
+            cli,
+            [
+                "platform",
+                "compile",
+                "--batch",
+                str(temp_dir),
+                "--manifest",
+                str(sample_manifest_yaml),
+                *option,
+            ],
+        )
+
+        assert result.exit_code == ExitCode.USAGE_ERROR
+        assert f"--batch cannot be combined with {option[0]}" in result.output
+
+    @pytest.mark.requirement("FR-010")
+    def test_batch_configmap_names_are_per_product(
+        self,
+        cli_runner: CliRunner,
+        sample_manifest_yaml: Path,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that batch configmap output names each product's ConfigMap."""
+        import floe_core.compilation.batch as batch
+        from floe_core.cli.main import cli
+
+        artifacts: dict[Path, _FakeCompiledArtifacts] = {}
+        for name in ("orders", "Customer_360"):
+            spec_path = temp_dir / "products" / name / "floe.yaml"
+            spec_path.parent.mkdir(parents=True)
+            spec_path.write_text("name: test\n")
+            artifacts[spec_path.resolve()] = _FakeCompiledArtifacts(product_name=name)
+
+        def _fake_compile_batch(paths: list[Path], _manifest: Path, **_kwargs: object) -> object:
+            return batch.BatchCompileResult(artifacts=artifacts, duration_seconds=0.5)
+
+        monkeypatch.setattr(batch, "compile_batch", _fake_compile_batch)
+
+        result = cli_runner.invoke(
+            cli,
+            [
+                "platform",
+                "compile",
+                "--batch",
+                str(temp_dir / "products"),
+                "--manifest",
+                str(sample_manifest_yaml),
+                "--output-format",
+                "configmap",
+                "--configmap-name",
+                "floe-values",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert sorted(call[0] for fake in artifacts.values() for call in fake.configmap_calls) == [
+            "floe-values-customer-360",
+            "floe-values-orders",
+        ]
+
+    @pytest.mark.requirement("FR-015")
+    def test_batch_rejects_colliding_configmap_names(
+        self,
+        cli_runner: CliRunner,
+        sample_manifest_yaml: Path,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that two products mapping to one ConfigMap name are rejected."""
+        import floe_core.compilation.batch as batch
+        from floe_core.cli.main import cli
+        from floe_core.cli.utils import ExitCode
+
+        artifacts: dict[Path, _FakeCompiledArtifacts] = {}
+        for directory, name in (("a", "orders"), ("b", "Orders")):
+            spec_path = temp_dir / "products" / directory / "floe.yaml"
+            spec_path.parent.mkdir(parents=True)
+            spec_path.write_text("name: test\n")
+            artifacts[spec_path.resolve()] = _FakeCompiledArtifacts(product_name=name)
+
+        def _fake_compile_batch(paths: list[Path], _manifest: Path, **_kwargs: object) -> object:
+            return batch.BatchCompileResult(artifacts=artifacts, duration_seconds=0.5)
+
+        monkeypatch.setattr(batch, "compile_batch", _fake_compile_batch)
+
+        result = cli_runner.invoke(
+            cli,
+            [
+                "platform",
+                "compile",
+                "--batch",
+                str(temp_dir / "products"),
+                "--manifest",
+                str(sample_manifest_yaml),
+                "--output-format",
+                "configmap",
+            ],
+        )
+
+        assert result.exit_code == ExitCode.USAGE_ERROR
+        assert "both map to ConfigMap 'floe-compiled-values-orders'" in result.output
+        assert all(not fake.configmap_calls for fake in artifacts.values())
+
+
 class TestPlatformGroup:
     """Tests for the platform command group."""
 
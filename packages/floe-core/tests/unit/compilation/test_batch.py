@@ -0,0 +1,117 @@
+"""Unit tests for batch compilation.
+
+Tests compile_batch() shared manifest resolution, failure collection, and
+throughput reporting.
+
+Requirements:
+    - FR-031: 6-stage compilation pipeline
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from floe_core.compilation.batch import BatchCompileResult, compile_batch
+
+PRODUCT_SPEC_TEMPLATE = """\
+apiVersion: floe.dev/v1
+kind: FloeSpec
+metadata:
+  name: {name}
+  version: 1.0.0
+transforms:
+  - name: customers
+    tags: []
+"""
+
+
+def _write_products(root: Path, names: list[str]) -> list[Path]:
+    """Write one floe.yaml per product name and return their paths."""
+    paths: list[Path] = []
+    for name in names:
+        spec_path = root / name / "floe.yaml"
+        spec_path.parent.mkdir(parents=True)
+        spec_path.write_text(PRODUCT_SPEC_TEMPLATE.format(name=name))
+        paths.append(spec_path)
+    return paths
+
+
+class TestCompileBatch:
+    """Tests for compile_batch()."""
+
+    @pytest.fixture(autouse=True)
+    def _apply_mocks(self, patch_version_compat: Any, mock_compute_plugin: Any) -> None:
+        """Apply plugin mocks for compilation tests."""
+
+    @pytest.mark.requirement("FR-031")
+    def test_compiles_all_products(self, tmp_path: Path, manifest_path: Path) -> None:
+        """Test that every product in the batch is compiled."""
+        spec_paths = _write_products(tmp_path / "products", ["orders", "customers"])
+
+        result = compile_batch(spec_paths, manifest_path, max_workers=1)
+
+        assert result.failed == 0
+        assert result.succeeded == 2
+        assert result.artifacts[spec_paths[0]].metadata.product_name == "orders"
+        assert result.artifacts[spec_paths[1]].metadata.product_name == "customers"
+        assert result.products_per_second > 0
+
+    @pytest.mark.requirement("FR-031")
+    def test_manifest_loaded_once(self, tmp_path: Path, manifest_path: Path) -> None:
+        """Test that the shared manifest is parsed once for the whole batch."""
+        from floe_core.compilation.loader import load_manifest
+
+        spec_paths = _write_products(tmp_path / "products", ["a", "b", "c"])
+
+        with patch(
+            "floe_core.compilation.loader.load_manifest", wraps=load_manifest
+        ) as mock_load_manifest:
+            result = compile_batch(spec_paths, manifest_path, max_workers=1)
+
+        assert result.succeeded == 3
+        assert mock_load_manifest.call_count == 1
+
+    @pytest.mark.requirement("FR-031")
+    def test_failures_are_collected(self, tmp_path: Path, manifest_path: Path) -> None:
+        """Test that a broken product does not abort the batch."""
+        spec_paths = _write_products(tmp_path / "products", ["good"])
+        broken = tmp_path / "products" / "broken" / "floe.yaml"
+        broken.parent.mkdir(parents=True)
+        broken.write_text("apiVersion: floe.dev/v1\nkind: FloeSpec\n")
+
+        result = compile_batch([broken, *spec_paths], manifest_path, max_workers=1)
+
+        assert result.succeeded == 1
+        assert result.failed == 1
+        assert result.failures[0].spec_path == broken
+        assert result.failures[0].stage is not None
+
+    @pytest.mark.requirement("FR-031")
+    def test_process_pool_collects_failures(self, tmp_path: Path, manifest_path: Path) -> None:
+        """Test that worker-process failures are returned, not raised."""
+        missing = [tmp_path / "missing-a" / "floe.yaml", tmp_path / "missing-b" / "floe.yaml"]
+
+        result = compile_batch(missing, manifest_path, max_workers=2)
+
+        assert result.failed == 2
+        assert {failure.spec_path for failure in result.failures} == set(missing)
+        assert all(failure.error_type == "CompilationException" for failure in result.failures)
+
+    @pytest.mark.requirement("FR-031")
+    def test_rejects_invalid_worker_count(self, manifest_path: Path) -> None:
+        """Test that max_workers below 1 is rejected."""
+        with pytest.raises(ValueError, match="max_workers"):
+            compile_batch([], manifest_path, max_workers=0)
+
+
+class TestBatchCompileResult:
+    """Tests for BatchCompileResult throughput properties."""
+
+    @pytest.mark.requirement("FR-031")
+    def test_products_per_second_zero_duration(self) -> None:
+        """Test that an empty, instantaneous batch reports zero throughput."""
+        assert BatchCompileResult().products_per_second == 0.0
@@ -0,0 +1,252 @@
+"""Unit tests for the incremental compilation cache.
+
+Tests CompilationCache key derivation, storage, and compile_pipeline integration.
+
+Requirements:
+    - FR-031: 6-stage compilation pipeline
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from floe_core.compilation.cache import CompilationCache
+
+
+class TestCompilationCacheKey:
+    """Tests for CompilationCache.compute_key."""
+
+    @pytest.mark.requirement("FR-031")
+    def test_key_is_stable_for_unchanged_inputs(
+        self, tmp_path: Path, spec_path: Path, manifest_path: Path
+    ) -> None:
+        """Test that identical inputs produce identical keys."""
+        cache = CompilationCache(tmp_path / "cache")
+
+        assert cache.compute_key(spec_path, manifest_path) == cache.compute_key(
+            spec_path, manifest_path
+        )
+
+    @pytest.mark.requirement("FR-031")
+    def test_key_changes_when_spec_changes(
+        self, tmp_path: Path, spec_path: Path, manifest_path: Path
+    ) -> None:
+        """Test that editing floe.yaml invalidates the key."""
+        cache = CompilationCache(tmp_path / "cache")
+        before = cache.compute_key(spec_path, manifest_path)
+
+        spec_path.write_text(spec_path.read_text() + "\n# changed\n")
+
+        assert cache.compute_key(spec_path, manifest_path) != before
+
+    @pytest.mark.requirement("FR-031")
+    def test_key_changes_with_dry_run(
+        self, tmp_path: Path, spec_path: Path, manifest_path: Path
+    ) -> None:
+        """Test that dry-run compilations are cached separately."""
+        cache = CompilationCache(tmp_path / "cache")
+
+        assert cache.compute_key(spec_path, manifest_path) != cache.compute_key(
+            spec_path, manifest_path, dry_run=True
+        )
+
+    @pytest.mark.requirement("FR-031")
+    def test_key_changes_when_plugins_change(
+        self, tmp_path: Path, spec_path: Path, manifest_path: Path
+    ) -> None:
+        """Test that installed plugin versions are part of the key."""
+        with patch(
+            "floe_core.compilation.cache.installed_plugin_fingerprint",
+            return_value=["floe.computes:duckdb=x:Y@floe-compute-duckdb==1.0.0"],
+        ):
+            before = CompilationCache(tmp_path / "cache").compute_key(spec_path, manifest_path)
+        with patch(
+            "floe_core.compilation.cache.installed_plugin_fingerprint",
+            return_value=["floe.computes:duckdb=x:Y@floe-compute-duckdb==1.1.0"],
+        ):
+            after = CompilationCache(tmp_path / "cache").compute_key(spec_path, manifest_path)
+
+        assert before != after
+
+
+class TestCompilationCacheStorage:
+    """Tests for CompilationCache get/put/clear."""
+
+    @pytest.mark.requirement("FR-031")
+    def test_get_missing_returns_none(self, tmp_path: Path) -> None:
+        """Test that an unknown key is a miss."""
+        cache = CompilationCache(tmp_path / "cache")
+
+        assert cache.get("ab" * 32) is None
+
+    @pytest.mark.requirement("FR-031")
+    def test_invalid_entry_is_removed(self, tmp_path: Path) -> None:
+        """Test that a corrupt entry is reported as a miss and deleted."""
+        cache = CompilationCache(tmp_path / "cache")
+        key = "cd" * 32
+        entry = tmp_path / "cache" / key[:2] / f"{key}.json"
+        entry.parent.mkdir(parents=True)
+        entry.write_text("{not json")
+
+        assert cache.get(key) is None
+        assert not entry.exists()
+
+
+class TestCompilePipelineCache:
+    """Tests for compile_pipeline with a CompilationCache."""
+
+    @pytest.fixture(autouse=True)
+    def _apply_mocks(self, patch_version_compat: Any, mock_compute_plugin: Any) -> None:
+        """Apply plugin mocks for compilation tests."""
+
+    @pytest.mark.requirement("FR-031")
+    def test_second_compile_is_served_from_cache(
+        self, tmp_path: Path, spec_path: Path, manifest_path: Path
+    ) -> None:
+        """Test that unchanged inputs skip all stages on the second compile."""
+        from floe_core.compilation.stages import compile_pipeline
+
+        cache = CompilationCache(tmp_path / "cache")
+        first = compile_pipeline(spec_path, manifest_path, cache=cache)
+
+        with patch("floe_core.compilation.loader.load_floe_spec") as mock_load:
+            second = compile_pipeline(spec_path, manifest_path, cache=cache)
+
+        mock_load.assert_not_called()
+        assert second.metadata.product_name == "test-product"
+        assert second.metadata.source_hash == first.metadata.source_hash
+        assert second.plugins.compute.type == first.plugins.compute.type
+
+    @pytest.mark.requirement("FR-031")
+    def test_changed_spec_recompiles(
+        self, tmp_path: Path, spec_path: Path, manifest_path: Path
+    ) -> None:
+        """Test that editing floe.yaml produces fresh artifacts."""
+        from floe_core.compilation.stages import compile_pipeline
+
+        cache = CompilationCache(tmp_path / "cache")
+        first = compile_pipeline(spec_path, manifest_path, cache=cache)
+
+        spec_path.write_text(spec_path.read_text().replace("1.0.0", "1.0.1", 1))
+        second = compile_pipeline(spec_path, manifest_path, cache=cache)
+
+        assert first.metadata.product_version == "1.0.0"
+        assert second.metadata.product_version == "1.0.1"
+
+    @pytest.mark.requirement("FR-031")
+    def test_secret_scanning_manifest_is_not_cached(self, tmp_path: Path, spec_path: Path) -> None:
+        """Test that compilations reading project files are never stored."""
+        from floe_core.compilation.stages import compile_pipeline
+
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text(
+            """\
+apiVersion: floe.dev/v1
+kind: Manifest
+metadata:
+  name: test-platform
+  version: 1.0.0
+  owner: test@example.com
+plugins:
+  compute:
+    type: duckdb
+  orchestrator:
+    type: dagster
+governance:
+  policy_enforcement_level: warn
+  secret_scanning:
+    enabled: true
+"""
+        )
+        cache = CompilationCache(tmp_path / "cache")
+
+        with (
+            patch("floe_core.compilation.stages.run_enforce_stage"),
+            patch("floe_core.enforcement.result.create_enforcement_summary") as mock_summary,
+        ):
+            mock_summary.return_value.passed = True
+            mock_summary.return_value.error_count = 0
+            mock_summary.return_value.warning_count = 0
+            mock_summary.return_value.policy_types_checked = ["secret_scanning"]
+            mock_summary.return_value.models_validated = 1
+            mock_summary.return_value.secrets_scanned = 0
+            compile_pipeline(spec_path, manifest_path, cache=cache)
+
+        assert not list((tmp_path / "cache").glob("*/*.json"))
+
+
+class TestPluginAuditCache:
+    """Tests for persisted plugin instrumentation audit outcomes."""
+
+    @pytest.fixture(autouse=True)
+    def _apply_mocks(self, patch_version_compat: Any, mock_compute_plugin: Any) -> None:
+        """Apply plugin mocks for compilation tests."""
+
+    @pytest.mark.requirement("FR-017")
+    def test_audit_records_round_trip(self, tmp_path: Path) -> None:
+        """Test that persisted audit records are restored for the same plugins."""
+        from floe_core.plugin_types import PluginType
+        from floe_core.telemetry.audit import PluginAuditRecord
+
+        cache = CompilationCache(tmp_path / "cache")
+        records = [
+            PluginAuditRecord(PluginType.COMPUTE, "duckdb", "floe.compute.duckdb"),
+            PluginAuditRecord(PluginType.CATALOG, "custom", None),
+        ]
+
+        cache.put_plugin_audit(records)
+
+        assert cache.get_plugin_audit() == records
+
+    @pytest.mark.requirement("FR-017")
+    def test_audit_records_invalidated_when_plugins_change(self, tmp_path: Path) -> None:
+        """Test that installing or upgrading a plugin discards persisted audits."""
+        from floe_core.plugin_types import PluginType
+        from floe_core.telemetry.audit import PluginAuditRecord
+
+        with patch(
+            "floe_core.compilation.cache.installed_plugin_fingerprint",
+            return_value=["floe.computes:duckdb=x:Y@floe-compute-duckdb==1.0.0"],
+        ):
+            CompilationCache(tmp_path / "cache").put_plugin_audit(
+                [PluginAuditRecord(PluginType.COMPUTE, "duckdb", None)]
+            )
+        with patch(
+            "floe_core.compilation.cache.installed_plugin_fingerprint",
+            return_value=["floe.computes:duckdb=x:Y@floe-compute-duckdb==1.1.0"],
+        ):
+            assert CompilationCache(tmp_path / "cache").get_plugin_audit() is None
+
+    @pytest.mark.requirement("FR-017")
+    def test_compile_reuses_persisted_audit(
+        self, tmp_path: Path, spec_path: Path, manifest_path: Path
+    ) -> None:
+        """Test that plugins are not re-imported for the audit on a cache miss."""
+        from unittest.mock import MagicMock, PropertyMock
+
+        from floe_core.compilation import stages as stages_mod
+        from floe_core.compilation.stages import compile_pipeline
+        from floe_core.plugin_types import PluginType
+
+        uninstrumented = MagicMock()
+        type(uninstrumented).name = PropertyMock(return_value="custom")
+        type(uninstrumented).tracer_name = PropertyMock(return_value=None)
+        cache = CompilationCache(tmp_path / "cache")
+
+        with patch.object(
+            stages_mod,
+            "_discover_plugins_for_audit",
+            return_value=[(PluginType.CATALOG, uninstrumented)],
+        ) as mock_discover:
+            first = compile_pipeline(spec_path, manifest_path, cache=cache)
+            # Different product: artifacts miss, audit still served from disk
+            spec_path.write_text(spec_path.read_text().replace("test-product", "other-product"))
+            second = compile_pipeline(spec_path, manifest_path, cache=cache)
+
+        assert mock_discover.call_count == 1
+        assert first.enforcement_result.warning_count == 1
+        assert second.enforcement_result.warning_count == 1
@@ -140,3 +140,23 @@ class TestVerifyPluginInstrumentation:
         warnings = verify_plugin_instrumentation(plugins)
 
         assert warnings == []
+
+
+@pytest.mark.requirement("FR-016")
+class TestVerifyAuditRecords:
+    """Tests for verify_audit_records() on persisted audit outcomes."""
+
+    def test_records_match_live_plugin_audit(self) -> None:
+        """Records captured from plugins must yield the same warnings."""
+        from floe_core.telemetry.audit import audit_records, verify_audit_records
+
+        plugins: list[tuple[PluginType, PluginMetadata]] = [
+            (PluginType.COMPUTE, _InstrumentedPlugin("duckdb", "floe.compute.duckdb")),
+            (PluginType.CATALOG, _UninstrumentedPlugin("bad-catalog")),
+            (PluginType.TELEMETRY_BACKEND, _UninstrumentedPlugin("console")),
+        ]
+
+        assert verify_audit_records(audit_records(plugins)) == (
+            verify_plugin_instrumentation(plugins)
+        )
+        assert len(verify_audit_records(audit_records(plugins))) == 1
@@ -128,12 +128,8 @@ class TestDbtManifestTestParsing:
 
     @pytest.mark.requirement("3A-US4-FR004")
     def test_extracts_tests_for_model(self) -> None:
-        """CoverageValidator MUST extract tests attached to a model."""
-        from floe_core.enforcement.validators.coverage import CoverageValidator
-        from floe_core.schemas.governance import QualityGatesConfig
-
-        config = QualityGatesConfig(minimum_test_coverage=80)
-        validator = CoverageValidator(config)
+        """ManifestIndex MUST group the tests attached to each model."""
+        from floe_core.enforcement.manifest_index import ManifestIndex
 
         tests = [
             _create_test_node("bronze_orders", "id", "not_null"),
@@ -141,11 +137,9 @@ class TestDbtManifestTestParsing:
             _create_test_node("bronze_orders", "customer_id", "not_null"),
             _create_test_node("silver_customers", "email", "unique"),  # Different model
         ]
+        index = ManifestIndex.from_manifest({"nodes": {test["unique_id"]: test for test in tests}})
 
-        model_tests = validator._extract_tests_for_model(
-            model_unique_id="model.test.bronze_orders",
-            tests=tests,
-        )
+        model_tests = index.tests_by_node["model.test.bronze_orders"]
 
         # Should only include tests for bronze_orders (3 tests, 2 columns)
         assert len(model_tests) == 3
@@ -0,0 +1,183 @@
+"""Unit tests for ManifestIndex.
+
+Tests the precomputed manifest lookups shared by PolicyEnforcer validators.
+
+Requirements: FR-001 (PolicyEnforcer core module), FR-004 (Coverage Calculation)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from floe_core.enforcement.manifest_index import ManifestIndex
+
+
+def _manifest() -> dict[str, Any]:
+    """Build a small manifest with models, tests, sources, and a child_map."""
+    return {
+        "nodes": {
+            "model.proj.bronze_orders": {
+                "name": "bronze_orders",
+                "resource_type": "model",
+                "unique_id": "model.proj.bronze_orders",
+                "depends_on": {"nodes": ["source.proj.raw.orders"]},
+            },
+            "model.proj.silver_orders": {
+                "name": "silver_orders",
+                "resource_type": "model",
+                "unique_id": "model.proj.silver_orders",
+                "depends_on": {"nodes": ["model.proj.bronze_orders"]},
+            },
+            "model.proj.dim_customer": {
+                "name": "dim_customer",
+                "resource_type": "model",
+                "unique_id": "model.proj.dim_customer",
+            },
+            "test.proj.not_null_bronze_orders_id": {
+                "name": "not_null_bronze_orders_id",
+                "resource_type": "test",
+                "attached_node": "model.proj.bronze_orders",
+                "column_name": "id",
+                "depends_on": {"nodes": ["model.proj.bronze_orders"]},
+            },
+            "test.proj.unique_bronze_orders_id": {
+                "name": "unique_bronze_orders_id",
+                "resource_type": "test",
+                "test_metadata": {"name": "unique"},
+                "attached_node": "model.proj.bronze_orders",
+                "column_name": "id",
+            },
+            "test.proj.row_count_bronze_orders": {
+                "name": "row_count_bronze_orders",
+                "resource_type": "test",
+                "attached_node": "model.proj.bronze_orders",
+                "column_name": None,
+            },
+        },
+        "child_map": {
+            "source.proj.raw.orders": ["model.proj.bronze_orders"],
+            "model.proj.bronze_orders": [
+                "model.proj.silver_orders",
+                "test.proj.not_null_bronze_orders_id",
+            ],
+            "model.proj.silver_orders": [],
+        },
+    }
+
+
+class TestManifestIndexLookups:
+    """Tests for ManifestIndex lookup tables."""
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_models_and_tests_in_manifest_order(self) -> None:
+        """Index MUST expose model and test nodes in manifest order."""
+        index = ManifestIndex.from_manifest(_manifest())
+
+        assert [m["name"] for m in index.models] == [
+            "bronze_orders",
+            "silver_orders",
+            "dim_customer",
+        ]
+        assert len(index.tests) == 3
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_models_by_id_and_name(self) -> None:
+        """Index MUST resolve models by unique_id and by name."""
+        index = ManifestIndex.from_manifest(_manifest())
+
+        assert index.models_by_id["model.proj.silver_orders"]["name"] == "silver_orders"
+        model = index.model_by_name("dim_customer")
+        assert model is not None
+        assert model["unique_id"] == "model.proj.dim_customer"
+        assert index.model_by_name("missing") is None
+
+    @pytest.mark.requirement("3A-US4-FR004")
+    def test_tests_grouped_by_node_and_column(self) -> None:
+        """Index MUST group tests by attached node and by column."""
+        index = ManifestIndex.from_manifest(_manifest())
+
+        assert len(index.tests_for_model("model.proj.bronze_orders")) == 3
+        assert index.tests_for_model("model.proj.silver_orders") == ()
+        columns = index.column_tests_for_model("model.proj.bronze_orders")
+        assert set(columns) == {"id"}
+        assert len(columns["id"]) == 2
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_parent_child_adjacency(self) -> None:
+        """Index MUST expose depends_on parents and child_map children."""
+        index = ManifestIndex.from_manifest(_manifest())
+
+        assert index.parents_of("model.proj.silver_orders") == ("model.proj.bronze_orders",)
+        assert index.children_of("model.proj.bronze_orders")[0] == "model.proj.silver_orders"
+        assert index.unique_id_for_name("bronze_orders") == "model.proj.bronze_orders"
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_children_derived_without_child_map(self) -> None:
+        """Index MUST invert depends_on when the manifest has no child_map."""
+        manifest = _manifest()
+        del manifest["child_map"]
+
+        index = ManifestIndex.from_manifest(manifest)
+
+        assert index.children_of("model.proj.bronze_orders") == (
+            "model.proj.silver_orders",
+            "test.proj.not_null_bronze_orders_id",
+        )
+
+    @pytest.mark.requirement("3A-US4-FR004")
+    def test_layer_classification(self) -> None:
+        """Index MUST classify medallion layers per model."""
+        index = ManifestIndex.from_manifest(_manifest())
+
+        assert index.layer_of("model.proj.bronze_orders") == "bronze"
+        assert index.layer_of("model.proj.silver_orders") == "silver"
+        assert index.layer_of("model.proj.dim_customer") is None
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_index_is_read_only(self) -> None:
+        """Index mappings MUST NOT be mutable by validators."""
+        index = ManifestIndex.from_manifest(_manifest())
+
+        with pytest.raises(TypeError):
+            index.models_by_name["new"] = {}  # type: ignore[index]
+
+
+class TestPolicyEnforcerUsesIndex:
+    """Tests that PolicyEnforcer builds the index once per run."""
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_index_built_once_per_enforce(self) -> None:
+        """PolicyEnforcer MUST share one ManifestIndex across validators."""
+        from unittest.mock import patch
+
+        from floe_core.enforcement.policy_enforcer import PolicyEnforcer
+        from floe_core.schemas.governance import (
+            NamingConfig,
+            QualityGatesConfig,
+            RequireTestsOfType,
+        )
+        from floe_core.schemas.manifest import GovernanceConfig
+
+        config = GovernanceConfig(
+            policy_enforcement_level="warn",
+            naming=NamingConfig(pattern="medallion", enforcement="warn"),
+            quality_gates=QualityGatesConfig(minimum_test_coverage=50),
+            custom_rules=[RequireTestsOfType(test_types=["unique"], applies_to="*")],
+        )
+
+        with patch(
+            "floe_core.enforcement.policy_enforcer.ManifestIndex.from_manifest",
+            wraps=ManifestIndex.from_manifest,
+        ) as mock_build:
+            result = PolicyEnforcer(governance_config=config).enforce(
+                _manifest(), include_context=True
+            )
+
+        mock_build.assert_called_once()
+        naming = [v for v in result.violations if v.model_name == "dim_customer"]
+        assert naming
+        assert naming[0].downstream_impact is None
+        missing_unique = {v.model_name for v in result.violations if v.error_code == "FLOE-E402"}
+        assert missing_unique == {"silver_orders", "dim_customer"}
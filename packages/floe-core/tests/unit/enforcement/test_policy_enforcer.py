@@ -503,3 +503,110 @@ class TestPolicyEnforcerEdgeCases:
         result = enforcer.enforce(manifest)
 
         assert result.manifest_version == "1.8.0"
+
+
+class TestPolicyEnforcerParallel:
+    """Tests for opt-in concurrent validator execution."""
+
+    @staticmethod
+    def _config() -> Any:
+        """Governance config enabling naming, coverage, docs, and custom rules."""
+        from floe_core.schemas.governance import (
+            NamingConfig,
+            QualityGatesConfig,
+            RequireMetaField,
+        )
+        from floe_core.schemas.manifest import GovernanceConfig
+
+        return GovernanceConfig(
+            policy_enforcement_level="strict",
+            naming=NamingConfig(pattern="medallion", enforcement="strict"),
+            quality_gates=QualityGatesConfig(
+                minimum_test_coverage=100,
+                require_descriptions=True,
+            ),
+            custom_rules=[RequireMetaField(field="owner")],
+        )
+
+    @staticmethod
+    def _manifest() -> dict[str, Any]:
+        """Manifest that violates every configured validator."""
+        return create_dbt_manifest_with_models(
+            [
+                {"name": f"model_{i}", "columns": [{"name": "id"}, {"name": "value"}]}
+                for i in range(5)
+            ]
+        )
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_parallel_matches_sequential(self) -> None:
+        """Parallel mode MUST return the same violations in the same order."""
+        from floe_core.enforcement.policy_enforcer import PolicyEnforcer
+
+        enforcer = PolicyEnforcer(governance_config=self._config())
+
+        sequential = enforcer.enforce(self._manifest())
+        parallel = enforcer.enforce(self._manifest(), parallel=True, max_workers=4)
+
+        assert [v.error_code for v in parallel.violations] == [
+            v.error_code for v in sequential.violations
+        ]
+        assert [v.model_name for v in parallel.violations] == [
+            v.model_name for v in sequential.violations
+        ]
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_parallel_respects_max_violations(self) -> None:
+        """Parallel mode MUST truncate to the same prefix as sequential mode."""
+        from floe_core.enforcement.policy_enforcer import PolicyEnforcer
+
+        enforcer = PolicyEnforcer(governance_config=self._config())
+
+        sequential = enforcer.enforce(self._manifest(), max_violations=7)
+        parallel = enforcer.enforce(self._manifest(), max_violations=7, parallel=True)
+
+        assert len(parallel.violations) == 7
+        assert parallel.violations == sequential.violations
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_reports_per_validator_durations(self) -> None:
+        """Summary MUST include a duration for every validator that ran."""
+        from floe_core.enforcement.policy_enforcer import PolicyEnforcer
+
+        enforcer = PolicyEnforcer(governance_config=self._config())
+
+        for parallel in (False, True):
+            result = enforcer.enforce(self._manifest(), parallel=parallel)
+            durations = result.summary.validator_durations_ms
+            assert list(durations) == [
+                "naming",
+                "coverage",
+                "documentation",
+                "semantic",
+                "custom_rules",
+            ]
+            assert all(ms >= 0 for ms in durations.values())
+
+    @pytest.mark.requirement("3A-US1-FR001")
+    def test_large_manifest_uses_process_pool(self) -> None:
+        """Manifest validators MUST run in worker processes above the threshold."""
+        from unittest.mock import patch
+
+        from floe_core.enforcement import policy_enforcer
+        from floe_core.enforcement.policy_enforcer import PolicyEnforcer
+
+        enforcer = PolicyEnforcer(governance_config=self._config())
+        sequential = enforcer.enforce(self._manifest())
+
+        with (
+            patch.object(policy_enforcer, "PARALLEL_PROCESS_MIN_MODELS", 1),
+            patch.object(
+                policy_enforcer,
+                "ProcessPoolExecutor",
+                wraps=policy_enforcer.ProcessPoolExecutor,
+            ) as mock_pool,
+        ):
+            parallel = enforcer.enforce(self._manifest(), parallel=True, max_workers=2)
+
+        mock_pool.assert_called_once_with(max_workers=2)
+        assert parallel.violations == sequential.violations
@@ -504,3 +504,91 @@ class TestViolationContextEdgeCases:
             assert violation.downstream_impact is not None
             # bronze_orders has children
             assert len(violation.downstream_impact) > 0
+
+
+# ==============================================================================
+# Memoized Downstream Closure Tests
+# ==============================================================================
+
+
+class TestDownstreamClosure:
+    """Tests for DownstreamClosure shared across violations."""
+
+    @pytest.mark.requirement("003b-FR-016")
+    def test_matches_recursive_compute_downstream_impact(self) -> None:
+        """DownstreamClosure MUST return the same models as the recursive helper."""
+        from floe_core.enforcement.result import DownstreamClosure, compute_downstream_impact
+
+        child_map = {
+            "model.p.a": ["model.p.b", "model.p.c"],
+            "model.p.b": ["model.p.d"],
+            "model.p.c": ["model.p.d", "test.p.not_null_c_id"],
+            "model.p.d": [],
+            "test.p.not_null_c_id": [],
+        }
+        closure = DownstreamClosure(child_map)
+
+        for name in ("a", "b", "c", "d", "missing"):
+            assert sorted(closure.impact(name)) == sorted(
+                compute_downstream_impact(name, child_map, recursive=True)
+            )
+
+    @pytest.mark.requirement("003b-FR-016")
+    def test_results_in_topological_order(self) -> None:
+        """Downstream models MUST be listed upstream-first."""
+        from floe_core.enforcement.result import DownstreamClosure
+
+        closure = DownstreamClosure(
+            {
+                "model.p.bronze": ["model.p.silver"],
+                "model.p.silver": ["model.p.gold"],
+            }
+        )
+
+        assert closure.impact("bronze") == ["silver", "gold"]
+
+    @pytest.mark.requirement("003b-FR-016")
+    def test_handles_cycles(self) -> None:
+        """Models in a cycle MUST see every cycle member, including themselves."""
+        from floe_core.enforcement.result import DownstreamClosure
+
+        closure = DownstreamClosure(
+            {
+                "model.p.a": ["model.p.b"],
+                "model.p.b": ["model.p.a", "model.p.c"],
+                "model.p.c": ["model.p.c"],
+            }
+        )
+
+        assert sorted(closure.impact("a")) == ["a", "b", "c"]
+        assert closure.impact("c") == ["c"]
+
+    @pytest.mark.requirement("003b-FR-016")
+    def test_deep_chain_does_not_recurse(self) -> None:
+        """Closure MUST handle DAGs deeper than the recursion limit."""
+        import sys
+
+        from floe_core.enforcement.result import DownstreamClosure
+
+        depth = sys.getrecursionlimit() + 100
+        child_map = {f"model.p.m{i}": [f"model.p.m{i + 1}"] for i in range(depth)}
+
+        impact = DownstreamClosure(child_map).impact("m0")
+
+        assert len(impact) == depth
+        assert impact[-1] == f"m{depth}"
+
+    @pytest.mark.requirement("003b-FR-016")
+    def test_impact_is_memoized_per_model(self) -> None:
+        """Repeated lookups MUST NOT re-walk the DAG."""
+        from unittest.mock import patch
+
+        from floe_core.enforcement.result import DownstreamClosure
+
+        closure = DownstreamClosure({"model.p.a": ["model.p.b"]})
+        first = closure.impact("a")
+
+        with patch.object(closure, "_descendant_bits") as mock_walk:
+            assert closure.impact("a") == first
+
+        mock_walk.assert_not_called()
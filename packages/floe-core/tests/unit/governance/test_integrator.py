@@ -215,6 +215,55 @@ def test_integrator_runs_all_checks(
         assert len(result.violations) == 0
 
 
+@pytest.mark.requirement("3E-FR-001")
+def test_integrator_passes_parallel_to_policy_enforcer(
+    full_governance_config: GovernanceConfig,
+    mock_identity_plugin: MagicMock,
+    mock_rbac_checker: MagicMock,
+    mock_secret_scanner: MagicMock,
+    tmp_path: Path,
+) -> None:
+    """Test run_checks(parallel=True) runs policy validators concurrently."""
+    with (
+        patch(
+            "floe_core.governance.integrator.RBACChecker",
+            return_value=mock_rbac_checker,
+        ),
+        patch(
+            "floe_core.governance.integrator.SecretScanner",
+            return_value=mock_secret_scanner,
+        ),
+        patch(
+            "floe_core.governance.integrator.PolicyEnforcer",
+        ) as mock_policy_enforcer_cls,
+    ):
+        mock_policy_enforcer = MagicMock()
+        mock_policy_enforcer.enforce.return_value = EnforcementResult(
+            passed=True,
+            violations=[],
+            summary=EnforcementSummary(total_models=0, models_validated=0),
+            enforcement_level="strict",
+            manifest_version="1.0.0",
+            timestamp=datetime.now(timezone.utc),
+        )
+        mock_policy_enforcer_cls.return_value = mock_policy_enforcer
+
+        integrator = GovernanceIntegrator(
+            governance_config=full_governance_config,
+            identity_plugin=mock_identity_plugin,
+        )
+        integrator.run_checks(
+            project_dir=tmp_path,
+            token="valid-oidc-token",
+            principal="user@example.com",
+            dry_run=False,
+            enforcement_level="strict",
+            parallel=True,
+        )
+
+        mock_policy_enforcer.enforce.assert_called_once_with({}, parallel=True)
+
+
 @pytest.mark.requirement("3E-FR-001")
 @pytest.mark.requirement("3E-FR-006")
 def test_integrator_merges_violations(
@@ -981,7 +1030,7 @@ def test_integrator_delegates_custom_rules_to_policy_enforcer(
         assert len(config_with_rules.custom_rules) == 1
 
         # Verify enforce() received the dbt_manifest
-        mock_policy_enforcer.enforce.assert_called_once_with(dbt_manifest)
+        mock_policy_enforcer.enforce.assert_called_once_with(dbt_manifest, parallel=False)
 
         # Verify custom rule violations flow through to final result
         assert len(result.violations) == 1
@@ -569,3 +569,60 @@ def test_sandbox_blocks_import_statement() -> None:
 
     with pytest.raises(SyntaxError):
         SafeConditionEvaluator("import os")
+
+
+# ==============================================================================
+# FR-018: Compiled Condition Tests
+# ==============================================================================
+
+
+@pytest.mark.requirement("003e-FR-018")
+def test_compiled_conditions_shared_across_evaluators() -> None:
+    """Test that a condition string is parsed and compiled only once.
+
+    Validates that evaluators for the same condition reuse the cached
+    compiled closure, including evaluators created by separate PolicyEvaluators.
+    """
+    from unittest.mock import patch
+
+    from floe_core.governance import policy_evaluator
+    from floe_core.governance.policy_evaluator import SafeConditionEvaluator
+
+    condition = "model.get('materialized') == 'table' and not False"
+    policy_evaluator._compile_condition.cache_clear()
+
+    with patch.object(policy_evaluator.ast, "parse", wraps=policy_evaluator.ast.parse) as parse:
+        first = SafeConditionEvaluator(condition)
+        second = SafeConditionEvaluator(condition)
+
+    parse.assert_called_once()
+    assert first.evaluate({"model": {"materialized": "table"}}) is True
+    assert second.evaluate({"model": {"materialized": "view"}}) is False
+
+
+@pytest.mark.requirement("003e-FR-018")
+def test_compiled_conditions_support_chained_comparisons() -> None:
+    """Test that chained comparisons and method calls evaluate correctly."""
+    from floe_core.governance.policy_evaluator import SafeConditionEvaluator
+
+    evaluator = SafeConditionEvaluator("1 <= len(model.tags) < 3 or model.name.startswith('gold_')")
+
+    assert evaluator.evaluate({"model": {"tags": ["a"], "name": "x"}, "len": len}) is True
+    assert evaluator.evaluate({"model": {"tags": [], "name": "gold_x"}, "len": len}) is True
+    assert evaluator.evaluate({"model": {"tags": [], "name": "x"}, "len": len}) is False
+
+
+@pytest.mark.requirement("003e-FR-018")
+def test_compiled_conditions_reject_unsafe_nodes_when_reached() -> None:
+    """Test that unsafe nodes are rejected at evaluation, as with AST walking.
+
+    Validates that an unsafe node in a branch that short-circuits is not
+    evaluated, while reaching it raises ValueError.
+    """
+    from floe_core.governance.policy_evaluator import SafeConditionEvaluator
+
+    evaluator = SafeConditionEvaluator("model.get('ok') or model['key'] == 1")
+
+    assert evaluator.evaluate({"model": {"ok": True}}) is True
+    with pytest.raises(ValueError, match="Unsafe AST node type: Subscript"):
+        evaluator.evaluate({"model": {}})
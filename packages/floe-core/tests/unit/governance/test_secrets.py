@@ -515,3 +515,117 @@ def test_scan_directory_handles_binary_files(tmp_path: Path) -> None:
     assert len(findings) >= 1, "Should find secrets in text file"
     finding_paths = {f.file_path for f in findings}
     assert "config.py" in finding_paths, "Should find secret in text file"
+
+
+@pytest.mark.requirement("3E-FR-008")
+def test_scan_file_reports_every_pattern_on_a_line() -> None:
+    """Test that a line matching several patterns yields one finding per pattern."""
+    from floe_core.governance.secrets import BuiltinSecretScanner
+
+    scanner = BuiltinSecretScanner()
+    content = "x = 1\npassword = 'hunter2'; api_key = 'abc'\n"
+
+    findings = scanner.scan_file(Path("settings.py"), content)
+
+    assert [(f.pattern_name, f.line_number) for f in findings] == [
+        ("hardcoded_password", 2),
+        ("api_token", 2),
+    ]
+
+
+@pytest.mark.requirement("3E-FR-010")
+def test_scan_directory_skips_vendored_directories(tmp_path: Path) -> None:
+    """Test that dbt build output and packages are never descended into."""
+    from floe_core.governance.secrets import BuiltinSecretScanner
+
+    secret = "password = 'hunter2'\n"
+    for relative in ("target/compiled.sql", "dbt_packages/pkg/macro.sql", "models/m.sql"):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(secret)
+
+    findings = BuiltinSecretScanner().scan_directory(tmp_path)
+
+    assert {f.file_path for f in findings} == {"models/m.sql"}
+
+
+@pytest.mark.requirement("3E-FR-010")
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        # File-level globs exclude matching files only, never whole subtrees
+        ("tests/*", {"tests/sub/a.py", "src/b.py"}),
+        ("_*", {"tests/sub/a.py", "src/b.py"}),
+        ("?", {"tests/sub/a.py", "src/b.py"}),
+        # Explicit directory patterns prune the directory
+        ("tests/", {"src/b.py"}),
+        ("tests/**", {"src/b.py"}),
+    ],
+)
+def test_scan_directory_prunes_only_directory_patterns(
+    tmp_path: Path, pattern: str, expected: set[str]
+) -> None:
+    """Test that only directory exclude patterns prune nested files."""
+    from floe_core.governance.secrets import BuiltinSecretScanner
+
+    secret = "password = 'hunter2'\n"
+    for relative in ("tests/sub/a.py", "src/b.py"):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(secret)
+
+    findings = BuiltinSecretScanner().scan_directory(tmp_path, exclude_patterns=[pattern])
+
+    assert {f.file_path for f in findings} == expected
+
+
+@pytest.mark.requirement("3E-FR-008")
+def test_scan_directory_skips_files_with_nul_bytes(tmp_path: Path) -> None:
+    """Test that files sniffed as binary are skipped even if they decode."""
+    from floe_core.governance.secrets import BuiltinSecretScanner
+
+    (tmp_path / "blob.bin").write_bytes(b"password = 'hunter2'\n\x00\x00")
+
+    assert BuiltinSecretScanner().scan_directory(tmp_path) == []
+
+
+@pytest.mark.requirement("3E-FR-008")
+def test_scan_directory_reuses_cached_findings(tmp_path: Path) -> None:
+    """Test that unchanged files are served from the findings cache."""
+    from unittest.mock import patch
+
+    from floe_core.governance.secrets import BuiltinSecretScanner
+
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("password = 'hunter2'\n")
+    (project / "b.py").write_text("x = 1\n")
+    cache_dir = tmp_path / "cache"
+
+    first = BuiltinSecretScanner(cache_dir=cache_dir).scan_directory(project)
+    (project / "b.py").write_text("api_key = 'abc'\n")
+
+    scanner = BuiltinSecretScanner(cache_dir=cache_dir)
+    with patch.object(scanner, "scan_file", wraps=scanner.scan_file) as mock_scan:
+        second = scanner.scan_directory(project)
+
+    assert mock_scan.call_count == 1
+    assert second[0] == first[0]
+    assert [f.file_path for f in second] == ["a.py", "b.py"]
+
+
+@pytest.mark.requirement("3E-FR-008")
+def test_findings_cache_is_scoped_to_scanner_configuration(tmp_path: Path) -> None:
+    """Test that changing severity does not reuse findings from another configuration."""
+    from floe_core.governance.secrets import BuiltinSecretScanner
+
+    (tmp_path / "project").mkdir()
+    (tmp_path / "project" / "a.py").write_text("password = 'hunter2'\n")
+    cache_dir = tmp_path / "cache"
+
+    BuiltinSecretScanner(cache_dir=cache_dir).scan_directory(tmp_path / "project")
+    findings = BuiltinSecretScanner(cache_dir=cache_dir, allow_secrets=True).scan_directory(
+        tmp_path / "project"
+    )
+
+    assert findings[0].severity == "warning"
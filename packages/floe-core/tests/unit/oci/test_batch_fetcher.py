@@ -9,6 +9,7 @@ Task: T012
 
 from __future__ import annotations
 
+import threading
 import time
 from typing import Any
 from unittest.mock import MagicMock
@@ -18,12 +19,30 @@ import pytest
 from floe_core.oci.batch_fetcher import (
     DEFAULT_MAX_WORKERS,
     MAX_WORKERS_LIMIT,
+    AdaptiveConcurrencyLimiter,
     BatchFetcher,
     BatchFetchError,
     BatchFetchResult,
+    parse_retry_after,
 )
 
 
+class _Response:
+    """Minimal HTTP response carrying a status code and headers."""
+
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class _HTTPError(Exception):
+    """Exception with an attached response, like requests.HTTPError."""
+
+    def __init__(self, response: _Response) -> None:
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
 class TestBatchFetchResult:
     """Tests for BatchFetchResult class."""
 
@@ -264,3 +283,208 @@ class TestBatchFetcher:
             f"expected <{expected_sequential * 0.5:.2f}s "
             f"(sequential would be {expected_sequential:.2f}s)"
         )
+
+    @pytest.mark.requirement("FR-005")
+    def test_fetch_uses_client_factory_per_worker(self) -> None:
+        """Workers fetch through the client returned by client_factory."""
+        fetcher = BatchFetcher(max_workers=2)
+        shared_client = MagicMock()
+        pooled_client = MagicMock()
+        pooled_client.get_manifest.return_value = {"schemaVersion": 2}
+        factory = MagicMock(return_value=pooled_client)
+
+        tag_refs = [("v1.0.0", "registry/repo:v1.0.0"), ("v1.0.1", "registry/repo:v1.0.1")]
+        result = fetcher.fetch_manifests(shared_client, tag_refs, client_factory=factory)
+
+        assert result.successful_tags == 2
+        assert factory.call_count == 2
+        shared_client.get_manifest.assert_not_called()
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AIMD concurrency limiting."""
+
+    @pytest.mark.requirement("FR-005")
+    def test_additive_increase_on_fast_responses(self) -> None:
+        """Steady latency grows the limit up to max_limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+
+        for _ in range(100):
+            assert limiter.try_acquire()
+            limiter.release(0.1)
+
+        assert limiter.limit == 8
+
+    @pytest.mark.requirement("FR-005")
+    def test_decrease_on_latency_spike(self) -> None:
+        """Latency well above the baseline shrinks the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10)
+        limiter.try_acquire()
+        limiter.release(0.1)
+
+        limiter.try_acquire()
+        limiter.release(1.0)
+
+        assert limiter.limit < 10
+
+    @pytest.mark.requirement("FR-005")
+    def test_throttle_halves_limit_and_honors_retry_after(self) -> None:
+        """429 halves the limit and pauses admission for Retry-After."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+        limiter.try_acquire()
+
+        limiter.release(0.1, throttled=True, retry_after=30)
+
+        assert limiter.limit == 4
+        assert limiter.backoff_remaining() > 29
+        assert limiter.try_acquire() is False
+
+    @pytest.mark.requirement("FR-005")
+    def test_never_below_min_limit(self) -> None:
+        """Repeated throttling stops at min_limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=2, max_limit=4)
+
+        for _ in range(10):
+            limiter.try_acquire()
+            limiter.release(0.1, throttled=True)
+
+        assert limiter.limit == 2
+
+    @pytest.mark.requirement("FR-005")
+    def test_admission_bounded_by_limit(self) -> None:
+        """try_acquire() refuses once limit requests are in flight."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert limiter.try_acquire() is False
+        assert limiter.in_flight == 2
+
+    @pytest.mark.requirement("FR-005")
+    def test_cancel_returns_slot_without_changing_limit(self) -> None:
+        """cancel() frees an admitted slot and leaves the limit alone."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+        assert limiter.try_acquire()
+        limiter.cancel()
+
+        assert limiter.in_flight == 0
+        assert limiter.limit == 2
+
+    @pytest.mark.requirement("FR-005")
+    def test_invalid_limits_rejected(self) -> None:
+        """min_limit must be at least 1 and not above max_limit."""
+        with pytest.raises(ValueError, match="Invalid limits"):
+            AdaptiveConcurrencyLimiter(min_limit=5, max_limit=2)
+
+    @pytest.mark.requirement("FR-005")
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("7", 7.0), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0), ("soon", None), (None, None)],
+    )
+    def test_parse_retry_after(self, value: str | None, expected: float | None) -> None:
+        """Retry-After accepts delta-seconds and past HTTP-dates."""
+        assert parse_retry_after(value) == expected
+
+
+class TestBatchFetcherAdaptive:
+    """Tests for throttle handling and streaming in BatchFetcher."""
+
+    @pytest.mark.requirement("FR-005")
+    def test_throttled_tag_is_retried(self) -> None:
+        """A 429 response re-queues the tag instead of failing it."""
+        fetcher = BatchFetcher(max_workers=2)
+        mock_client = MagicMock()
+        calls: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def get_manifest(container: str) -> dict[str, Any]:
+            with lock:
+                calls[container] = calls.get(container, 0) + 1
+                attempt = calls[container]
+            if container.endswith("v1.0.1") and attempt == 1:
+                raise _HTTPError(_Response(429, {"Retry-After": "0"}))
+            return {"schemaVersion": 2}
+
+        mock_client.get_manifest.side_effect = get_manifest
+        tag_refs = [("v1.0.0", "registry/repo:v1.0.0"), ("v1.0.1", "registry/repo:v1.0.1")]
+
+        result = fetcher.fetch_manifests(mock_client, tag_refs)
+
+        assert result.successful_tags == 2
+        assert calls["registry/repo:v1.0.1"] == 2
+
+    @pytest.mark.requirement("FR-005")
+    def test_persistent_throttling_fails_after_retries(self) -> None:
+        """A tag that keeps returning 503 fails after max_throttle_retries."""
+        fetcher = BatchFetcher(max_workers=2, max_throttle_retries=2)
+        mock_client = MagicMock()
+        mock_client.get_manifest.side_effect = _HTTPError(_Response(503))
+
+        result = fetcher.fetch_manifests(mock_client, [("v1.0.0", "registry/repo:v1.0.0")])
+
+        assert result.failed_tags == 1
+        assert mock_client.get_manifest.call_count == 3
+        assert fetcher.limiter.limit == 1
+
+    @pytest.mark.requirement("FR-005")
+    def test_not_found_is_not_retried(self) -> None:
+        """Non-throttling errors fail on the first attempt."""
+        fetcher = BatchFetcher(max_workers=2)
+        mock_client = MagicMock()
+        mock_client.get_manifest.side_effect = _HTTPError(_Response(404))
+
+        result = fetcher.fetch_manifests(mock_client, [("v1.0.0", "registry/repo:v1.0.0")])
+
+        assert result.failed_tags == 1
+        assert mock_client.get_manifest.call_count == 1
+
+    @pytest.mark.requirement("FR-005")
+    def test_iter_manifests_streams_and_stops_early(self) -> None:
+        """Closing the iterator early leaves queued tags unfetched."""
+        fetcher = BatchFetcher(max_workers=2)
+        mock_client = MagicMock()
+
+        def get_manifest(container: str) -> dict[str, Any]:
+            time.sleep(0.01)
+            return {"schemaVersion": 2, "ref": container}
+
+        mock_client.get_manifest.side_effect = get_manifest
+        tag_refs = [(f"v1.0.{i}", f"registry/repo:v1.0.{i}") for i in range(50)]
+
+        stream = fetcher.iter_manifests(mock_client, tag_refs)
+        first = next(stream)
+        stream.close()
+        time.sleep(0.05)
+
+        assert first[1]["schemaVersion"] == 2
+        assert mock_client.get_manifest.call_count < len(tag_refs)
+
+    @pytest.mark.requirement("FR-005")
+    def test_early_close_releases_limiter_slots(self) -> None:
+        """Requests cancelled by an early close return their limiter slots."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+        fetcher = BatchFetcher(limiter=limiter)
+        mock_client = MagicMock()
+        mock_client.get_manifest.return_value = {"schemaVersion": 2}
+        tag_refs = [(f"v1.0.{i}", f"registry/repo:v1.0.{i}") for i in range(50)]
+
+        for _ in range(50):
+            stream = fetcher.iter_manifests(mock_client, tag_refs)
+            next(stream)
+            stream.close()
+
+            deadline = time.monotonic() + 1
+            while limiter.in_flight and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert limiter.in_flight == 0
+
+    @pytest.mark.requirement("FR-005")
+    def test_shared_limiter_sets_worker_cap(self) -> None:
+        """A supplied limiter's max_limit becomes the worker cap."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=16)
+
+        fetcher = BatchFetcher(limiter=limiter)
+
+        assert fetcher.max_workers == 16
+        assert fetcher.limiter is limiter
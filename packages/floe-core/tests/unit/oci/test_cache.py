@@ -12,7 +12,7 @@ from __future__ import annotations
 import hashlib
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -1327,3 +1327,507 @@ class TestCachePutWithManifest:
         assert manifest_path.exists()
         stored_manifest = json.loads(manifest_path.read_text())
         assert stored_manifest == manifest
+
+
+class TestCacheIndexStore:
+    """Tests for the SQLite cache index.
+
+    FR-015: System MUST maintain cache integrity.
+    FR-016: System MUST evict least recently used entries.
+    """
+
+    @pytest.fixture
+    def cache_config(self, tmp_path: Path) -> CacheConfig:
+        """Create CacheConfig with temp directory."""
+        return CacheConfig(enabled=True, path=tmp_path / "cache", max_size_gb=1, ttl_hours=24)
+
+    @staticmethod
+    def _put(manager: CacheManager, payload: str, tag: str) -> str:
+        """Store a small artifact and return its digest."""
+        content = payload.encode()
+        digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        manager.put(
+            digest=digest,
+            tag=tag,
+            registry="oci://harbor.example.com/floe",
+            content=content,
+        )
+        return digest
+
+    @pytest.mark.requirement("8A-FR-015")
+    def test_entries_visible_to_other_managers(self, cache_config: CacheConfig) -> None:
+        """Test that entries written by one manager are read by another."""
+        digest = self._put(CacheManager(cache_config), "shared", "v1.0.0")
+
+        entry = CacheManager(cache_config).get("oci://harbor.example.com/floe", "v1.0.0")
+
+        assert entry is not None
+        assert entry.digest == digest
+        assert (cache_config.path / "index.db").exists()
+
+    @pytest.mark.requirement("8A-FR-014")
+    def test_get_returns_most_recently_pulled_digest_for_tag(
+        self, cache_config: CacheConfig
+    ) -> None:
+        """Test that a re-pulled mutable tag resolves to the newest digest."""
+        manager = CacheManager(cache_config)
+        self._put(manager, "first", "latest-dev")
+        newest = self._put(manager, "second", "latest-dev")
+
+        entry = manager.get("oci://harbor.example.com/floe", "latest-dev")
+
+        assert entry is not None
+        assert entry.digest == newest
+
+    @pytest.mark.requirement("8A-FR-016")
+    def test_access_times_written_in_batches(self, cache_config: CacheConfig) -> None:
+        """Test that cache hits do not write the index until flushed."""
+        manager = CacheManager(cache_config)
+        digest = self._put(manager, "touched", "v1.0.0")
+        stored = CacheManager(cache_config).get_by_digest(digest)
+        assert stored is not None
+
+        with patch.object(manager, "_transaction") as mock_transaction:
+            for _ in range(3):
+                manager.get("oci://harbor.example.com/floe", "v1.0.0")
+        mock_transaction.assert_not_called()
+
+        manager.flush_access_times()
+        reader = CacheManager(cache_config)
+        row = reader._query_one("SELECT last_accessed FROM entries WHERE digest = ?", (digest,))
+        assert row is not None
+        assert datetime.fromisoformat(row[0]) > stored.last_accessed
+
+    @pytest.mark.requirement("8A-FR-015")
+    def test_legacy_index_json_is_imported(self, cache_config: CacheConfig) -> None:
+        """Test that entries from an index.json are migrated into the index."""
+        from floe_core.schemas.oci import CacheEntry, CacheIndex
+
+        content = b'{"legacy": true}'
+        digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        now = datetime.now(timezone.utc)
+        legacy = CacheIndex()
+        legacy.add_entry(
+            CacheEntry(
+                digest=digest,
+                tag="v0.9.0",
+                registry="oci://harbor.example.com/floe",
+                pulled_at=now,
+                expires_at=None,
+                size=len(content),
+                path=cache_config.path / "sha256" / digest[7:] / "blob",
+                last_accessed=now,
+            )
+        )
+        cache_config.path.mkdir(parents=True)
+        (cache_config.path / "index.json").write_text(legacy.model_dump_json())
+
+        manager = CacheManager(cache_config)
+
+        entry = manager.get("oci://harbor.example.com/floe", "v0.9.0")
+        assert entry is not None
+        assert entry.digest == digest
+        assert not (cache_config.path / "index.json").exists()
+
+
+class TestStreamingVerification:
+    """Tests for memory-mapped, chunked digest verification.
+
+    FR-021: System MUST verify digest of cached content.
+    """
+
+    @pytest.fixture
+    def cache_manager(self, tmp_path: Path) -> CacheManager:
+        """Create CacheManager with temp directory."""
+        return CacheManager(CacheConfig(enabled=True, path=tmp_path / "cache"))
+
+    @staticmethod
+    def _put(manager: CacheManager, content: bytes) -> str:
+        """Store content under v1.0.0 and return its digest."""
+        digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        manager.put(
+            digest=digest,
+            tag="v1.0.0",
+            registry="oci://harbor.example.com/floe",
+            content=content,
+        )
+        return digest
+
+    @pytest.mark.requirement("8A-FR-021")
+    def test_open_content_exposes_mapped_view(self, cache_manager: CacheManager) -> None:
+        """Test that open_content yields a read-only view of the blob."""
+        content = b"x" * (3 * 1024 * 1024 + 17)
+        digest = self._put(cache_manager, content)
+
+        with cache_manager.open_content("oci://harbor.example.com/floe", "v1.0.0") as cached:
+            assert cached is not None
+            entry, view = cached
+            assert entry.digest == digest
+            assert view.readonly
+            assert view == content
+
+    @pytest.mark.requirement("8A-FR-021")
+    def test_unchanged_blob_is_not_rehashed(self, cache_manager: CacheManager) -> None:
+        """Test that a recently verified, unchanged blob skips hashing."""
+        content = b'{"version": "0.2.0", "test": "reverify"}'
+        self._put(cache_manager, content)
+        registry = "oci://harbor.example.com/floe"
+
+        cache_manager.get_with_content(registry, "v1.0.0")
+        with patch("floe_core.oci.cache._view_digest") as mock_digest:
+            result = cache_manager.get_with_content(registry, "v1.0.0")
+
+        mock_digest.assert_not_called()
+        assert result is not None
+        assert result[1] == content
+
+    @pytest.mark.requirement("8A-FR-021")
+    def test_modified_blob_is_rehashed(self, cache_manager: CacheManager) -> None:
+        """Test that changing a verified blob forces re-verification."""
+        from floe_core.oci.errors import DigestMismatchError
+
+        content = b'{"version": "0.2.0", "test": "tamper"}'
+        self._put(cache_manager, content)
+        registry = "oci://harbor.example.com/floe"
+        result = cache_manager.get_with_content(registry, "v1.0.0")
+        assert result is not None
+
+        result[0].path.write_bytes(content.replace(b"tamper", b"tampered"))
+
+        with pytest.raises(DigestMismatchError):
+            cache_manager.get_with_content(registry, "v1.0.0")
+        assert cache_manager.get(registry, "v1.0.0") is None
+
+
+class TestCacheWarm:
+    """Tests for CacheManager.warm() and CacheRefresher.
+
+    FR-013: System MUST cache pulled artifacts locally.
+    FR-014: System MUST re-fetch mutable tags after TTL expiry.
+    """
+
+    REGISTRY = "oci://harbor.example.com/floe"
+
+    @pytest.fixture
+    def cache_manager(self, tmp_path: Path) -> CacheManager:
+        """Create CacheManager with temp directory."""
+        return CacheManager(CacheConfig(enabled=True, path=tmp_path / "cache", ttl_hours=24))
+
+    @staticmethod
+    def _artifact(tag: str) -> tuple[bytes, str]:
+        """Return content and digest for a tag."""
+        content = f'{{"tag": "{tag}"}}'.encode()
+        return content, f"sha256:{hashlib.sha256(content).hexdigest()}"
+
+    @pytest.mark.requirement("8A-FR-013")
+    def test_warm_fetches_missing_tags(self, cache_manager: CacheManager) -> None:
+        """Test that warm() stores every tag it is given."""
+        tags = ["v1.0.0-prod", "v1.1.0-prod", "latest-prod"]
+
+        result = cache_manager.warm(self.REGISTRY, tags, self._artifact, max_workers=2)
+
+        assert sorted(result.fetched) == sorted(tags)
+        for tag in tags:
+            assert cache_manager.get(self.REGISTRY, tag) is not None
+
+    @pytest.mark.requirement("8A-FR-013")
+    def test_warm_resumes_and_records_failures(self, cache_manager: CacheManager) -> None:
+        """Test that a failed tag is reported and a re-run fetches only it."""
+        calls: list[str] = []
+        failed: set[str] = set()
+
+        def flaky_fetch(tag: str) -> tuple[bytes, str]:
+            calls.append(tag)
+            if tag == "v1.1.0" and tag not in failed:
+                failed.add(tag)
+                raise ConnectionError("Registry unavailable")
+            return self._artifact(tag)
+
+        first = cache_manager.warm(self.REGISTRY, ["v1.0.0", "v1.1.0"], flaky_fetch)
+        assert first.fetched == ["v1.0.0"]
+        assert isinstance(first.errors["v1.1.0"], ConnectionError)
+
+        calls.clear()
+        second = cache_manager.warm(self.REGISTRY, ["v1.0.0", "v1.1.0"], flaky_fetch)
+
+        assert calls == ["v1.1.0"]
+        assert second.cached == ["v1.0.0"]
+        assert second.fetched == ["v1.1.0"]
+
+    @pytest.mark.requirement("8A-FR-014")
+    def test_refresh_renews_unchanged_mutable_tag(self, cache_manager: CacheManager) -> None:
+        """Test that a revalidated tag with stored content is not downloaded."""
+        content, digest = self._artifact("latest-prod")
+        stored = cache_manager.put(digest, "latest-prod", self.REGISTRY, content)
+
+        def fetch(tag: str) -> tuple[bytes, str]:
+            raise AssertionError("content should not be downloaded")
+
+        result = cache_manager.warm(
+            self.REGISTRY,
+            ["latest-prod"],
+            fetch,
+            resolve=lambda _tag: digest,
+            refresh_within=timedelta(hours=24),
+        )
+
+        assert result.renewed == ["latest-prod"]
+        entry = cache_manager.get(self.REGISTRY, "latest-prod")
+        assert entry is not None
+        assert entry.expires_at is not None
+        assert stored.expires_at is not None
+        assert entry.expires_at >= stored.expires_at
+
+    @pytest.mark.requirement("8A-FR-014")
+    def test_refresh_fetches_moved_mutable_tag(self, cache_manager: CacheManager) -> None:
+        """Test that a mutable tag pointing at new content is re-fetched."""
+        old_content, old_digest = self._artifact("old")
+        cache_manager.put(old_digest, "latest-prod", self.REGISTRY, old_content)
+        new_content, new_digest = self._artifact("new")
+
+        result = cache_manager.warm(
+            self.REGISTRY,
+            ["latest-prod"],
+            lambda _tag: (new_content, new_digest),
+            resolve=lambda _tag: new_digest,
+            refresh_within=timedelta(hours=24),
+        )
+
+        assert result.fetched == ["latest-prod"]
+        entry = cache_manager.get(self.REGISTRY, "latest-prod")
+        assert entry is not None
+        assert entry.digest == new_digest
+
+    @pytest.mark.requirement("8A-FR-013")
+    def test_warm_is_bounded_by_max_workers(self, cache_manager: CacheManager) -> None:
+        """Test that no more than max_workers fetches run at once."""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def slow_fetch(tag: str) -> tuple[bytes, str]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return self._artifact(tag)
+
+        tags = [f"v1.0.{i}" for i in range(6)]
+        cache_manager.warm(self.REGISTRY, tags, slow_fetch, max_workers=2)
+
+        assert peak == 2
+
+    @pytest.mark.requirement("8A-FR-013")
+    def test_warm_rejects_invalid_max_workers(self, cache_manager: CacheManager) -> None:
+        """Test that max_workers must be at least 1."""
+        with pytest.raises(ValueError, match="max_workers"):
+            cache_manager.warm(self.REGISTRY, ["v1.0.0"], self._artifact, max_workers=0)
+
+    @pytest.mark.requirement("8A-FR-014")
+    def test_refresher_runs_until_stopped(self) -> None:
+        """Test that CacheRefresher keeps running passes and survives failures."""
+        import threading
+
+        from floe_core.oci.cache import CacheRefresher, WarmResult
+
+        passes = 0
+        second_pass = threading.Event()
+
+        def refresh() -> WarmResult:
+            nonlocal passes
+            passes += 1
+            if passes == 1:
+                raise ConnectionError("Registry unavailable")
+            second_pass.set()
+            return WarmResult()
+
+        refresher = CacheRefresher(refresh, interval_seconds=0.01)
+        with refresher:
+            assert second_pass.wait(timeout=5)
+        assert not refresher.is_running
+        assert refresher.last_result is not None
+
+
+class TestCacheGC:
+    """Tests for CacheManager.gc() and cache statistics.
+
+    FR-015: System MUST evict least recently used entries when cache full.
+    FR-016: System MUST maintain cache size within limits.
+
+    BYTES_PER_GB is patched so max_size_gb=1 means 1000 bytes.
+    """
+
+    REGISTRY = "oci://harbor.example.com/floe"
+
+    @pytest.fixture
+    def cache_manager(self, tmp_path: Path) -> CacheManager:
+        """Create CacheManager with temp directory."""
+        return CacheManager(
+            CacheConfig(enabled=True, path=tmp_path / "cache", max_size_gb=1, ttl_hours=24)
+        )
+
+    def _put(self, manager: CacheManager, tag: str, size: int) -> str:
+        """Store an artifact of the given size and return its digest."""
+        content = tag.encode().ljust(size, b"x")
+        digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        manager.put(digest=digest, tag=tag, registry=self.REGISTRY, content=content)
+        return digest
+
+    @staticmethod
+    def _set_usage(manager: CacheManager, digest: str, *, idle: timedelta, hits: int) -> None:
+        """Set an entry's last access time and hit count."""
+        last_accessed = datetime.now(timezone.utc) - idle
+        with manager._transaction() as conn:
+            conn.execute(
+                "UPDATE entries SET last_accessed = ?, hits = ? WHERE digest = ?",
+                (last_accessed.isoformat(), hits, digest),
+            )
+
+    @pytest.mark.requirement("8A-FR-015")
+    def test_gc_evicts_large_idle_entries_before_popular_ones(
+        self, cache_manager: CacheManager
+    ) -> None:
+        """Test that one large idle entry goes before several small popular ones."""
+        large = self._put(cache_manager, "v1.0.0", 600)
+        small = [self._put(cache_manager, f"v2.{i}.0", 100) for i in range(5)]
+        self._set_usage(cache_manager, large, idle=timedelta(days=2), hits=0)
+        for digest in small:
+            self._set_usage(cache_manager, digest, idle=timedelta(days=2), hits=50)
+
+        with patch("floe_core.oci.cache.BYTES_PER_GB", 1000):
+            result = cache_manager.gc()
+
+        assert result["evicted"] == 1
+        assert result["freed_bytes"] == 600
+        assert result["remaining_bytes"] == 500
+        assert cache_manager.get_by_digest(large) is None
+        assert all(cache_manager.get_by_digest(digest) for digest in small)
+        assert not (cache_manager.config.path / "sha256" / large[7:]).exists()
+        assert not any((cache_manager.config.path / ".trash").iterdir())
+
+    @pytest.mark.requirement("8A-FR-016")
+    def test_gc_keeps_mutable_tags_in_active_use(self, cache_manager: CacheManager) -> None:
+        """Test that a recently used mutable tag is pinned under size pressure."""
+        mutable = self._put(cache_manager, "latest-prod", 800)
+        immutable = self._put(cache_manager, "v1.0.0", 300)
+
+        with patch("floe_core.oci.cache.BYTES_PER_GB", 1000):
+            result = cache_manager.gc()
+
+        assert result["evicted"] == 1
+        assert cache_manager.get_by_digest(mutable) is not None
+        assert cache_manager.get_by_digest(immutable) is None
+
+    @pytest.mark.requirement("8A-FR-014")
+    def test_gc_removes_superseded_mutable_entries(self, cache_manager: CacheManager) -> None:
+        """Test that older pulls of a mutable tag are removed without size pressure."""
+        old = self._put(cache_manager, "latest-dev", 100)
+        content = b"newer content"
+        newest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        cache_manager.put(digest=newest, tag="latest-dev", registry=self.REGISTRY, content=content)
+
+        result = cache_manager.gc()
+
+        assert result["superseded"] == 1
+        assert result["evicted"] == 0
+        assert cache_manager.get_by_digest(old) is None
+        entry = cache_manager.get(self.REGISTRY, "latest-dev")
+        assert entry is not None
+        assert entry.digest == newest
+
+    @pytest.mark.requirement("8A-FR-016")
+    def test_put_over_limit_evicts_below_low_water_mark(self, cache_manager: CacheManager) -> None:
+        """Test that put() runs gc() once the cache exceeds max_size."""
+        with patch("floe_core.oci.cache.BYTES_PER_GB", 1000):
+            first = self._put(cache_manager, "v1.0.0", 600)
+            second = self._put(cache_manager, "v2.0.0", 600)
+
+        stats = cache_manager.stats()
+        assert stats["entry_count"] == 1
+        assert stats["entries_evicted"] == 1
+        assert stats["bytes_evicted"] == 600
+        assert cache_manager.get_by_digest(first) is None
+        assert cache_manager.get_by_digest(second) is not None
+
+    @pytest.mark.requirement("8A-FR-015")
+    def test_gc_spares_entries_stored_again_concurrently(self, cache_manager: CacheManager) -> None:
+        """Test that a victim re-stored after selection is neither unindexed nor deleted."""
+        digest = self._put(cache_manager, "v1.0.0", 100)
+        blob_dir = cache_manager.config.path / "sha256" / digest[7:]
+
+        # Selected with an older pulled_at than the row now has
+        assert cache_manager._evict_rows([(digest, "stale", 100)], reason="size") == (0, 0)
+        # Row present again by the time blobs are discarded
+        cache_manager._discard_blobs([digest])
+
+        assert cache_manager.get_by_digest(digest) is not None
+        assert (blob_dir / "blob").exists()
+
+    @pytest.mark.requirement("8A-FR-015")
+    def test_open_content_treats_evicted_blob_as_miss(self, cache_manager: CacheManager) -> None:
+        """Test that a reader racing an eviction gets a miss, not an error."""
+        self._put(cache_manager, "v1.0.0", 100)
+        entry = cache_manager.get(self.REGISTRY, "v1.0.0")
+        assert entry is not None
+        cache_manager.remove(entry.digest)
+
+        with patch.object(cache_manager, "get", return_value=entry):
+            with cache_manager.open_content(self.REGISTRY, "v1.0.0") as cached:
+                assert cached is None
+
+    @pytest.mark.requirement("8A-FR-016")
+    def test_stats_and_metrics_report_hits_evictions_and_lock_wait(self, tmp_path: Path) -> None:
+        """Test that hit ratio, evictions, and lock waits reach stats() and OCIMetrics."""
+        metrics = MagicMock()
+        manager = CacheManager(
+            CacheConfig(enabled=True, path=tmp_path / "cache", max_size_gb=1), metrics=metrics
+        )
+        self._put(manager, "v1.0.0", 100)
+        manager.get(self.REGISTRY, "v1.0.0")
+        manager.get(self.REGISTRY, "v9.9.9")
+        self._put(manager, "latest-dev", 100)
+        self._put(manager, "latest-dev", 200)
+
+        manager.gc()
+        stats = manager.stats()
+
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert stats["entries_evicted"] == 1
+        assert stats["bytes_evicted"] == 100
+        assert stats["lock_acquisitions"] >= 3
+        assert stats["lock_wait_seconds"] >= 0.0
+        metrics.record_cache_eviction.assert_called_once_with(1, 100, reason="superseded")
+        metrics.record_cache_lock_wait.assert_called()
+        metrics.set_cache_stats.assert_called_once_with(300, 2, hit_ratio=0.5)
+
+    @pytest.mark.requirement("8A-FR-015")
+    def test_hit_counts_added_to_existing_index(self, tmp_path: Path) -> None:
+        """Test that an index without hit counts is upgraded and counts hits."""
+        import sqlite3
+
+        cache_path = tmp_path / "cache"
+        cache_path.mkdir()
+        conn = sqlite3.connect(cache_path / "index.db")
+        conn.execute(
+            "CREATE TABLE entries (digest TEXT PRIMARY KEY, tag TEXT NOT NULL, "
+            "registry TEXT NOT NULL, pulled_at TEXT NOT NULL, expires_at TEXT, "
+            "size INTEGER NOT NULL, path TEXT NOT NULL, last_accessed TEXT NOT NULL)"
+        )
+        conn.close()
+
+        manager = CacheManager(CacheConfig(enabled=True, path=cache_path))
+        digest = self._put(manager, "v1.0.0", 100)
+        for _ in range(3):
+            manager.get(self.REGISTRY, "v1.0.0")
+        manager.flush_access_times()
+
+        row = manager._query_one("SELECT hits FROM entries WHERE digest = ?", (digest,))
+        assert row == (3,)
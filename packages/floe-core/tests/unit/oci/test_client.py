@@ -14,6 +14,7 @@ Requirements: FR-001, FR-002, FR-010, FR-011
 
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -22,7 +23,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from floe_core.oci.client import MUTABLE_TAG_PATTERNS, SEMVER_PATTERN, OCIClient
-from floe_core.oci.errors import ArtifactNotFoundError, ImmutabilityViolationError
+from floe_core.oci.errors import (
+    ArtifactNotFoundError,
+    AuthenticationError,
+    ImmutabilityViolationError,
+)
+from floe_core.oci.manifest import build_manifest, manifest_content
+from floe_core.oci.packing import pack_artifacts
 from floe_core.oci.signing import (
     ANNOTATION_BUNDLE,
     ANNOTATION_CERT_FINGERPRINT,
@@ -41,7 +48,13 @@ from floe_core.schemas.compiled_artifacts import (
     ResolvedPlugins,
     ResolvedTransforms,
 )
-from floe_core.schemas.oci import AuthType, CacheConfig, RegistryAuth, RegistryConfig
+from floe_core.schemas.oci import (
+    AuthType,
+    CacheConfig,
+    LayerPackingConfig,
+    RegistryAuth,
+    RegistryConfig,
+)
 from floe_core.schemas.signing import SignatureMetadata, SigningConfig
 from floe_core.schemas.versions import COMPILED_ARTIFACTS_VERSION
 from floe_core.telemetry.config import ResourceAttributes, TelemetryConfig
@@ -646,6 +659,76 @@ class TestOCIClientPull:
                 oci_client.pull(tag="v1.0.0")
 
 
+class TestOCIClientPackedLayers:
+    """Tests for push and pull with RegistryConfig.packing enabled."""
+
+    @pytest.fixture
+    def packed_client(
+        self, sample_registry_config: RegistryConfig, mock_auth_provider: MagicMock
+    ) -> OCIClient:
+        """Create an OCIClient that pushes gzip layers split at 200 bytes."""
+        config = sample_registry_config.model_copy(
+            update={"packing": LayerPackingConfig(compression="gzip", split_threshold_bytes=200)}
+        )
+        return OCIClient(registry_config=config, auth_provider=mock_auth_provider)
+
+    @pytest.mark.requirement("8A-FR-001")
+    def test_push_uploads_only_missing_blobs(
+        self,
+        packed_client: OCIClient,
+        sample_compiled_artifacts: CompiledArtifacts,
+    ) -> None:
+        """Test blobs already in the registry are not uploaded again."""
+        layers, _ = pack_artifacts(sample_compiled_artifacts, packed_client.config.packing)
+        present = {layers[1][1].digest}
+
+        mock_oras = MagicMock()
+        mock_oras.get_blob.side_effect = lambda _c, digest, head: MagicMock(ok=digest in present)
+        mock_oras.upload_blob.return_value = MagicMock(ok=True)
+        mock_oras.upload_manifest.return_value = MagicMock(ok=True)
+
+        with (
+            patch.object(packed_client, "tag_exists", return_value=False),
+            patch.object(packed_client, "_create_oras_client", return_value=mock_oras),
+        ):
+            packed_client.push(sample_compiled_artifacts, tag="v1.0.0")
+
+        mock_oras.push.assert_not_called()
+        uploaded = [c.args[2]["digest"] for c in mock_oras.upload_blob.call_args_list]
+        # Empty config plus every layer except the one already present
+        assert len(uploaded) == len(layers)
+        assert layers[1][1].digest not in uploaded
+        manifest = mock_oras.upload_manifest.call_args.args[0]
+        assert [layer["digest"] for layer in manifest["layers"]] == [
+            layer.digest for _, layer in layers
+        ]
+
+    @pytest.mark.requirement("8A-FR-002")
+    def test_pull_reassembles_packed_layers(
+        self,
+        tmp_path: Path,
+        packed_client: OCIClient,
+        sample_compiled_artifacts: CompiledArtifacts,
+    ) -> None:
+        """Test pull decompresses and splices section layers back together."""
+        layers, _ = pack_artifacts(sample_compiled_artifacts, packed_client.config.packing)
+        files = []
+        for blob, layer in layers:
+            path = tmp_path / layer.annotations["org.opencontainers.image.title"]
+            path.write_bytes(blob)
+            files.append(str(path))
+        manifest = build_manifest(sample_compiled_artifacts, layers=[la for _, la in layers])
+
+        mock_oras = MagicMock()
+        mock_oras.pull.return_value = files
+        mock_oras.get_manifest.return_value = manifest_content(manifest)
+
+        with patch.object(packed_client, "_create_oras_client", return_value=mock_oras):
+            result = packed_client.pull(tag="v1.0.0")
+
+        assert result == sample_compiled_artifacts
+
+
 class TestOCIClientList:
     """Tests for OCIClient.list() operation.
 
@@ -794,6 +877,199 @@ class TestOCIClientList:
         assert len(result) == 0
 
 
+class TestOCIClientIterList:
+    """Tests for OCIClient.iter_list() streaming operation.
+
+    Requirements: FR-004, FR-005
+    """
+
+    @staticmethod
+    def _mock_oras(tags: list[str]) -> MagicMock:
+        """Create an ORAS client listing tags and returning one-layer manifests."""
+        mock_oras = MagicMock()
+        mock_oras.get_tags.return_value = tags
+        mock_oras.get_manifest.return_value = {
+            "schemaVersion": 2,
+            "layers": [{"digest": "sha256:layer123", "size": 1000}],
+            "annotations": {"org.opencontainers.image.created": "2026-01-19T10:00:00Z"},
+        }
+        return mock_oras
+
+    @pytest.mark.requirement("FR-005")
+    def test_iter_list_yields_artifact_tags(self, oci_client: OCIClient) -> None:
+        """iter_list() yields one ArtifactTag per fetched manifest."""
+        from floe_core.schemas.oci import ArtifactTag
+
+        with patch.object(
+            oci_client, "_create_oras_client", return_value=self._mock_oras(MOCK_LIST_TAGS)
+        ):
+            tags = list(oci_client.iter_list())
+
+        assert sorted(t.name for t in tags) == sorted(MOCK_LIST_TAGS)
+        assert all(isinstance(t, ArtifactTag) for t in tags)
+
+    @pytest.mark.requirement("FR-005")
+    def test_iter_list_limit_stops_early(self, oci_client: OCIClient) -> None:
+        """limit caps the results and leaves remaining manifests unfetched."""
+        tag_names = [f"v1.0.{i}" for i in range(100)]
+        mock_oras = self._mock_oras(tag_names)
+
+        with patch.object(oci_client, "_create_oras_client", return_value=mock_oras):
+            tags = list(oci_client.iter_list(filter_pattern="v1.*", limit=3))
+
+        assert len(tags) == 3
+        assert mock_oras.get_manifest.call_count < len(tag_names)
+
+    @pytest.mark.requirement("FR-005")
+    def test_iter_list_skips_failed_tags(self, oci_client: OCIClient) -> None:
+        """Tags whose manifest cannot be fetched are skipped."""
+        mock_oras = self._mock_oras(["v1.0.0", "v1.0.1"])
+        manifest = mock_oras.get_manifest.return_value
+
+        def get_manifest(container: str) -> dict[str, Any]:
+            if container.endswith("v1.0.1"):
+                raise ValueError("manifest unknown")
+            return manifest
+
+        mock_oras.get_manifest.side_effect = get_manifest
+
+        with patch.object(oci_client, "_create_oras_client", return_value=mock_oras):
+            tags = list(oci_client.iter_list())
+
+        assert [t.name for t in tags] == ["v1.0.0"]
+
+    @pytest.mark.requirement("FR-005")
+    def test_limiter_shared_across_calls(self, oci_client: OCIClient) -> None:
+        """The adaptive limiter persists on the client between listings."""
+        with patch.object(
+            oci_client, "_create_oras_client", return_value=self._mock_oras(MOCK_LIST_TAGS)
+        ):
+            oci_client.list()
+            limiter = oci_client._fetch_limiter
+            list(oci_client.iter_list())
+
+        assert limiter is not None
+        assert oci_client._fetch_limiter is limiter
+
+
+class TestOCIClientPrefetch:
+    """Tests for OCIClient.prefetch() cache warm-up.
+
+    Requirements: FR-013, FR-014
+    """
+
+    @pytest.fixture
+    def cached_client(self, tmp_path: Path, mock_auth_provider: MagicMock) -> OCIClient:
+        """Create an OCIClient with caching enabled."""
+        config = RegistryConfig(
+            uri="oci://harbor.example.com/floe-platform",
+            auth=RegistryAuth(type=AuthType.AWS_IRSA),
+            cache=CacheConfig(enabled=True, path=tmp_path / "cache"),
+        )
+        return OCIClient(registry_config=config, auth_provider=mock_auth_provider)
+
+    @staticmethod
+    def _artifact(tag: str) -> tuple[bytes, str]:
+        """Return content and digest for a tag."""
+        content = f'{{"tag": "{tag}"}}'.encode()
+        return content, f"sha256:{hashlib.sha256(content).hexdigest()}"
+
+    @pytest.mark.requirement("8A-FR-013")
+    def test_prefetch_selects_environment_tags(self, cached_client: OCIClient) -> None:
+        """Only tags for the requested environments are cached."""
+        tags = ["v1.0.0", "v1.0.0-prod", "latest-prod", "latest-dev", "v1.0.0-prod-rollback-1"]
+
+        with (
+            patch.object(cached_client, "list_tag_names", return_value=tags),
+            patch.object(cached_client, "_fetch_from_registry", side_effect=self._artifact),
+            patch.object(cached_client, "_resolve_content_digest", return_value=None),
+        ):
+            result = cached_client.prefetch(environments=["prod"])
+
+        assert sorted(result.fetched) == ["latest-prod", "v1.0.0-prod"]
+        assert cached_client.cache_manager is not None
+        entry = cached_client.cache_manager.get(cached_client.registry_uri, "v1.0.0-prod")
+        assert entry is not None
+
+    @pytest.mark.requirement("8A-FR-013")
+    def test_prefetch_verifies_with_tag_environment(self, cached_client: OCIClient) -> None:
+        """Content is verified with the policy of the tag's environment."""
+        with (
+            patch.object(cached_client, "list_tag_names", return_value=["latest-staging"]),
+            patch.object(cached_client, "_fetch_from_registry", side_effect=self._artifact),
+            patch.object(cached_client, "_resolve_content_digest", return_value=None),
+            patch.object(cached_client, "_verify_signature_if_enabled") as mock_verify,
+        ):
+            cached_client.prefetch(environments=["prod", "staging"])
+
+        assert mock_verify.call_args.args[-1] == "staging"
+
+    @pytest.mark.requirement("8A-FR-013")
+    def test_prefetch_requires_cache(self, oci_client: OCIClient) -> None:
+        """prefetch() fails when caching is disabled."""
+        from floe_core.oci.errors import CacheError
+
+        with pytest.raises(CacheError, match="disabled"):
+            oci_client.prefetch()
+
+    @pytest.mark.requirement("8A-FR-014")
+    def test_resolve_content_digest_reads_artifact_layer(self, oci_client: OCIClient) -> None:
+        """The artifact layer digest is read from the manifest."""
+        manifest = {
+            "layers": [
+                {
+                    "digest": "sha256:layer123",
+                    "annotations": {"org.opencontainers.image.title": "compiled_artifacts.json"},
+                }
+            ]
+        }
+        with patch.object(oci_client, "_fetch_manifest_data", return_value=manifest):
+            assert oci_client._resolve_content_digest("latest-prod") == "sha256:layer123"
+
+
+class TestOCIClientListTagNames:
+    """Tests for OCIClient.list_tag_names() operation.
+
+    Requirements: FR-004
+    """
+
+    @pytest.mark.requirement("8A-FR-004")
+    def test_list_tag_names_skips_manifests(self, oci_client: OCIClient) -> None:
+        """Test that tag names come from the tags endpoint alone."""
+        mock_oras = MagicMock()
+        mock_oras.get_tags.return_value = ["v1.0.0", "v1.0.0-prod", "v1.1.0-prod", "latest-dev"]
+
+        with patch.object(oci_client, "_create_oras_client", return_value=mock_oras):
+            result = oci_client.list_tag_names(prefix="v1.", pattern="*-prod")
+
+        assert result == ["v1.0.0-prod", "v1.1.0-prod"]
+        mock_oras.get_manifest.assert_not_called()
+
+    @pytest.mark.requirement("8A-FR-004")
+    def test_list_tag_names_reuses_recent_listing(self, oci_client: OCIClient) -> None:
+        """Test that max_age_seconds serves a recent listing from memory."""
+        mock_oras = MagicMock()
+        mock_oras.get_tags.return_value = ["v1.0.0"]
+
+        with patch.object(oci_client, "_create_oras_client", return_value=mock_oras):
+            oci_client.list_tag_names()
+            cached = oci_client.list_tag_names(max_age_seconds=60)
+            oci_client.list_tag_names()
+
+        assert cached == ["v1.0.0"]
+        assert mock_oras.get_tags.call_count == 2
+
+    @pytest.mark.requirement("8A-FR-004")
+    def test_list_tag_names_auth_failure(self, oci_client: OCIClient) -> None:
+        """Test that authentication failures are surfaced."""
+        mock_oras = MagicMock()
+        mock_oras.get_tags.side_effect = Exception("401 Unauthorized")
+
+        with patch.object(oci_client, "_create_oras_client", return_value=mock_oras):
+            with pytest.raises(AuthenticationError):
+                oci_client.list_tag_names()
+
+
 class TestOCIClientCapabilities:
     """Tests for OCIClient.check_registry_capabilities() operation."""
 
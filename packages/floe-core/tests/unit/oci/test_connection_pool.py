@@ -0,0 +1,154 @@
+"""Unit tests for pooled registry connections.
+
+Tests BearerTokenCache expiry, per-thread client reuse, single login per
+pool, and the process-wide pool registry.
+
+Requirements: FR-005
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from oras.auth.utils import get_basic_auth
+
+from floe_core.oci.connection_pool import (
+    DEFAULT_TOKEN_EXPIRES_IN,
+    BearerTokenCache,
+    RegistryConnectionPool,
+    clear_connection_pools,
+    get_connection_pool,
+)
+
+TOKEN_KEY = ("https://harbor.example.com/service/token", "harbor-registry", "repo:floe:pull")
+
+
+@pytest.fixture(autouse=True)
+def _clear_pools() -> Iterator[None]:
+    """Isolate the process-wide pool registry between tests."""
+    clear_connection_pools()
+    yield
+    clear_connection_pools()
+
+
+@pytest.fixture
+def mock_oras_class() -> Iterator[MagicMock]:
+    """Patch OrasClient so pools build mock clients."""
+    with patch("floe_core.oci.connection_pool.OrasClient") as mock_class:
+        mock_class.side_effect = lambda **_: MagicMock(prefix="https", _tls_verify=True)
+        yield mock_class
+
+
+class TestBearerTokenCache:
+    """Tests for BearerTokenCache."""
+
+    @pytest.mark.requirement("FR-005")
+    def test_returns_token_until_expiry(self) -> None:
+        """Tokens are served until expires_in minus the leeway elapses."""
+        cache = BearerTokenCache()
+        with patch("floe_core.oci.connection_pool.time.monotonic", return_value=1000.0):
+            cache.put(TOKEN_KEY, "token-1", 300)
+        with patch("floe_core.oci.connection_pool.time.monotonic", return_value=1200.0):
+            assert cache.get(TOKEN_KEY) == "token-1"
+        with patch("floe_core.oci.connection_pool.time.monotonic", return_value=1295.0):
+            assert cache.get(TOKEN_KEY) is None
+        assert len(cache) == 0
+
+    @pytest.mark.requirement("FR-005")
+    def test_missing_expires_in_uses_default(self) -> None:
+        """Tokens without expires_in use the Docker default lifetime."""
+        cache = BearerTokenCache()
+        with patch("floe_core.oci.connection_pool.time.monotonic", return_value=0.0):
+            cache.put(TOKEN_KEY, "token-1", None)
+        with patch(
+            "floe_core.oci.connection_pool.time.monotonic",
+            return_value=float(DEFAULT_TOKEN_EXPIRES_IN),
+        ):
+            assert cache.get(TOKEN_KEY) is None
+
+    @pytest.mark.requirement("FR-005")
+    def test_invalidate_drops_token(self) -> None:
+        """invalidate() removes a cached token."""
+        cache = BearerTokenCache()
+        cache.put(TOKEN_KEY, "token-1", 300)
+        cache.invalidate(TOKEN_KEY)
+        assert cache.get(TOKEN_KEY) is None
+
+
+class TestRegistryConnectionPool:
+    """Tests for RegistryConnectionPool."""
+
+    @pytest.mark.requirement("FR-005")
+    def test_client_reused_within_thread(self, mock_oras_class: MagicMock) -> None:
+        """The same thread gets the same client on every call."""
+        pool = RegistryConnectionPool("harbor.example.com")
+
+        assert pool.client() is pool.client()
+        assert mock_oras_class.call_count == 1
+
+    @pytest.mark.requirement("FR-005")
+    def test_threads_get_own_clients_with_shared_adapter(self, mock_oras_class: MagicMock) -> None:
+        """Each thread has its own client, all mounted on one adapter."""
+        pool = RegistryConnectionPool("harbor.example.com")
+        clients = []
+
+        def worker() -> None:
+            clients.append(pool.client())
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(c) for c in clients}) == 3
+        adapters = {id(c.session.mount.call_args_list[0].args[1]) for c in clients}
+        assert len(adapters) == 1
+        assert pool.stats()["clients_created"] == 3
+
+    @pytest.mark.requirement("FR-005")
+    def test_login_happens_once_per_pool(self, mock_oras_class: MagicMock) -> None:
+        """Only the first client logs in; later clients reuse the credentials."""
+        pool = RegistryConnectionPool("harbor.example.com", username="user", password="secret")
+        first = pool.client()
+        second_holder: list[MagicMock] = []
+        thread = threading.Thread(target=lambda: second_holder.append(pool.client()))
+        thread.start()
+        thread.join()
+
+        first.login.assert_called_once()
+        second_holder[0].login.assert_not_called()
+        assert second_holder[0].auth._basic_auth == get_basic_auth("user", "secret")
+
+    @pytest.mark.requirement("FR-005")
+    def test_records_pool_metrics(self, mock_oras_class: MagicMock) -> None:
+        """Pool events are reported through OCIMetrics."""
+        metrics = MagicMock()
+        pool = RegistryConnectionPool("harbor.example.com", metrics=metrics)
+
+        pool.client()
+        pool.client()
+
+        operations = [c.args[0] for c in metrics.record_connection_pool_operation.call_args_list]
+        assert operations == ["client_created", "client_reused"]
+
+
+class TestGetConnectionPool:
+    """Tests for the process-wide pool registry."""
+
+    @pytest.mark.requirement("FR-005")
+    def test_same_key_returns_same_pool(self) -> None:
+        """Callers with the same host and credentials share a pool."""
+        first = get_connection_pool("harbor.example.com", username="u", password="p")
+        second = get_connection_pool("harbor.example.com", username="u", password="p")
+        assert first is second
+
+    @pytest.mark.requirement("FR-005")
+    def test_rotated_credentials_get_new_pool(self) -> None:
+        """A changed password yields a separate pool."""
+        first = get_connection_pool("harbor.example.com", username="u", password="old")
+        second = get_connection_pool("harbor.example.com", username="u", password="new")
+        assert first is not second
@@ -77,6 +77,9 @@ class TestOCIMetricsNaming:
             OCIMetrics.CIRCUIT_BREAKER_FAILURES,
             OCIMetrics.CACHE_SIZE_BYTES,
             OCIMetrics.CACHE_ENTRIES_COUNT,
+            OCIMetrics.CACHE_HIT_RATIO,
+            OCIMetrics.CACHE_EVICTED_BYTES_TOTAL,
+            OCIMetrics.CACHE_LOCK_WAIT_SECONDS,
         ]
 
         for name in metric_names:
@@ -247,6 +250,24 @@ class TestCacheStats:
         metrics = OCIMetrics()
         metrics.set_cache_stats(size_bytes=10240, entry_count=5)
 
+    @pytest.mark.requirement("FR-020")
+    def test_set_cache_stats_with_hit_ratio(self) -> None:
+        """set_cache_stats records the hit ratio gauge when given."""
+        metrics = OCIMetrics()
+        metrics.set_cache_stats(size_bytes=10240, entry_count=5, hit_ratio=0.75)
+
+    @pytest.mark.requirement("FR-020")
+    def test_record_cache_eviction(self) -> None:
+        """record_cache_eviction counts entries and bytes by reason."""
+        metrics = OCIMetrics()
+        metrics.record_cache_eviction(3, 4096, reason="size")
+
+    @pytest.mark.requirement("FR-020")
+    def test_record_cache_lock_wait(self) -> None:
+        """record_cache_lock_wait records lock wait time."""
+        metrics = OCIMetrics()
+        metrics.record_cache_lock_wait(0.05)
+
 
 class TestOperationTimer:
     """Tests for operation_timer context manager."""
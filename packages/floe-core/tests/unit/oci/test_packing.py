@@ -0,0 +1,188 @@
+"""Unit tests for compressed, section-split layer packing.
+
+Tests for floe_core.oci.packing including:
+- Byte-exact round trip with and without compression
+- Media types and titles reflecting compression
+- Unchanged sections keeping their blob digest across pushes
+- Digest verification of reassembled content
+
+Requirements: FR-040, FR-041
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from floe_core.oci.errors import DigestMismatchError, OCIError
+from floe_core.oci.manifest import serialize_layer
+from floe_core.oci.packing import (
+    ANNOTATION_CONTENT_DIGEST,
+    ANNOTATION_SECTION,
+    layers_content_digest,
+    pack_artifacts,
+    unpack_layers,
+)
+from floe_core.schemas.oci import (
+    FLOE_ARTIFACT_SECTION_TYPE,
+    FLOE_ARTIFACT_TYPE,
+    ArtifactLayer,
+    LayerPackingConfig,
+)
+
+if TYPE_CHECKING:
+    from floe_core.schemas.compiled_artifacts import CompiledArtifacts
+
+# Splits observability and plugins off the sample artifacts; metadata stays in the core
+SPLIT_THRESHOLD = 200
+
+
+def _descriptors(layers: list[tuple[bytes, ArtifactLayer]]) -> list[dict[str, Any]]:
+    """Return manifest layer descriptors as a registry would serve them."""
+    return [
+        {
+            "mediaType": layer.media_type,
+            "digest": layer.digest,
+            "size": layer.size,
+            "annotations": layer.annotations,
+        }
+        for _, layer in layers
+    ]
+
+
+def _unpack(layers: list[tuple[bytes, ArtifactLayer]]) -> bytes:
+    """Unpack layers from pack_artifacts() output."""
+    blobs = {layer.digest: blob for blob, layer in layers}
+    return unpack_layers(_descriptors(layers), lambda d: blobs[d["digest"]], "v1.0.0")
+
+
+class TestPackArtifacts:
+    """Tests for pack_artifacts() and unpack_layers()."""
+
+    @pytest.mark.requirement("8A-FR-040")
+    def test_default_config_is_single_layer(
+        self, sample_compiled_artifacts: CompiledArtifacts
+    ) -> None:
+        """Test that the default config produces the serialize_layer() layout."""
+        layers, digest = pack_artifacts(sample_compiled_artifacts, LayerPackingConfig())
+
+        content, layer = serialize_layer(sample_compiled_artifacts)
+        assert layers == [(content, layer)]
+        assert digest == layer.digest
+
+    @pytest.mark.requirement("8A-FR-040")
+    @pytest.mark.parametrize("compression", ["none", "gzip"])
+    def test_round_trip_is_byte_exact(
+        self, sample_compiled_artifacts: CompiledArtifacts, compression: Any
+    ) -> None:
+        """Test that unpacking reproduces the single-layer JSON exactly."""
+        config = LayerPackingConfig(compression=compression, split_threshold_bytes=SPLIT_THRESHOLD)
+
+        layers, digest = pack_artifacts(sample_compiled_artifacts, config)
+
+        content, layer = serialize_layer(sample_compiled_artifacts)
+        assert len(layers) > 1
+        assert _unpack(layers) == content
+        assert digest == layer.digest
+
+    @pytest.mark.requirement("8A-FR-040")
+    def test_zstd_round_trip(self, sample_compiled_artifacts: CompiledArtifacts) -> None:
+        """Test zstd compressed layers round trip and carry +zstd media types."""
+        pytest.importorskip("zstandard")
+        config = LayerPackingConfig(compression="zstd", split_threshold_bytes=SPLIT_THRESHOLD)
+
+        layers, _ = pack_artifacts(sample_compiled_artifacts, config)
+
+        content, _ = serialize_layer(sample_compiled_artifacts)
+        assert _unpack(layers) == content
+        assert all(layer.media_type.endswith("+zstd") for _, layer in layers)
+
+    @pytest.mark.requirement("8A-FR-041")
+    def test_media_types_and_titles_reflect_compression(
+        self, sample_compiled_artifacts: CompiledArtifacts
+    ) -> None:
+        """Test core and section layers are typed and titled by compression."""
+        config = LayerPackingConfig(compression="gzip", split_threshold_bytes=SPLIT_THRESHOLD)
+
+        layers, _ = pack_artifacts(sample_compiled_artifacts, config)
+
+        core, *sections = [layer for _, layer in layers]
+        assert core.media_type == f"{FLOE_ARTIFACT_TYPE}+gzip"
+        assert core.annotations["org.opencontainers.image.title"] == (
+            "compiled_artifacts.core.json.gz"
+        )
+        assert {s.media_type for s in sections} == {f"{FLOE_ARTIFACT_SECTION_TYPE}+gzip"}
+        assert [s.annotations[ANNOTATION_SECTION] for s in sections] == ["observability", "plugins"]
+
+    @pytest.mark.requirement("8A-FR-040")
+    def test_compression_only_keeps_one_layer(
+        self, sample_compiled_artifacts: CompiledArtifacts
+    ) -> None:
+        """Test that compression without a threshold does not split sections."""
+        layers, _ = pack_artifacts(
+            sample_compiled_artifacts, LayerPackingConfig(compression="gzip")
+        )
+
+        assert len(layers) == 1
+        assert layers[0][1].size < len(sample_compiled_artifacts.model_dump_json())
+
+    @pytest.mark.requirement("8A-FR-040")
+    def test_unchanged_sections_keep_digest(
+        self, sample_compiled_artifacts: CompiledArtifacts
+    ) -> None:
+        """Test a repush with only new metadata reuses every section blob."""
+        config = LayerPackingConfig(compression="gzip", split_threshold_bytes=SPLIT_THRESHOLD)
+        recompiled = sample_compiled_artifacts.model_copy(
+            update={
+                "metadata": sample_compiled_artifacts.metadata.model_copy(
+                    update={"source_hash": "sha256:fedcba987654"}
+                )
+            }
+        )
+
+        first, _ = pack_artifacts(sample_compiled_artifacts, config)
+        second, _ = pack_artifacts(recompiled, config)
+
+        assert first[0][1].digest != second[0][1].digest
+        assert [layer.digest for _, layer in first[1:]] == [layer.digest for _, layer in second[1:]]
+
+    @pytest.mark.requirement("8A-FR-041")
+    def test_corrupt_core_raises_digest_mismatch(
+        self, sample_compiled_artifacts: CompiledArtifacts
+    ) -> None:
+        """Test that a tampered core layer fails content digest verification."""
+        config = LayerPackingConfig(split_threshold_bytes=SPLIT_THRESHOLD)
+        layers, _ = pack_artifacts(sample_compiled_artifacts, config)
+        core, core_layer = layers[0]
+        layers[0] = (core.replace(b"test-product", b"evil-product"), core_layer)
+
+        with pytest.raises(DigestMismatchError):
+            _unpack(layers)
+
+    @pytest.mark.requirement("8A-FR-040")
+    def test_zstd_without_zstandard_raises(
+        self,
+        sample_compiled_artifacts: CompiledArtifacts,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test zstd packing explains how to install the missing dependency."""
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+
+        with pytest.raises(OCIError, match="pip install zstandard"):
+            pack_artifacts(sample_compiled_artifacts, LayerPackingConfig(compression="zstd"))
+
+    @pytest.mark.requirement("8A-FR-041")
+    def test_layers_content_digest(self, sample_compiled_artifacts: CompiledArtifacts) -> None:
+        """Test the content digest is found for packed and single-layer manifests."""
+        packed, digest = pack_artifacts(
+            sample_compiled_artifacts,
+            LayerPackingConfig(compression="gzip", split_threshold_bytes=SPLIT_THRESHOLD),
+        )
+        single, _ = pack_artifacts(sample_compiled_artifacts, LayerPackingConfig())
+
+        assert packed[0][1].annotations[ANNOTATION_CONTENT_DIGEST] == digest
+        assert layers_content_digest(_descriptors(packed)) == digest
+        assert layers_content_digest(_descriptors(single)) == digest
+        assert layers_content_digest([]) is None
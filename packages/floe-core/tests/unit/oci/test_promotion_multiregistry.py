@@ -26,6 +26,7 @@ from floe_core.schemas.promotion import (
     EnvironmentConfig,
     PromotionConfig,
     PromotionGate,
+    PromotionRecord,
     RegistrySyncStatus,
 )
 
@@ -34,6 +35,9 @@ if TYPE_CHECKING:
 
 # Test constant
 TEST_DIGEST = "sha256:abc123def456abc123def456abc123def456abc123def456abc123def456abcd"
+# Primary environment tag re-pushed with promotion annotations
+ANNOTATED_DIGEST = "sha256:" + "e" * 64
+STALE_DIGEST = "sha256:" + "0" * 64
 
 
 @pytest.fixture
@@ -434,6 +438,209 @@ class TestMultiRegistrySyncStatus:
             assert len(result.registry_sync_status) == 1
 
 
+class TestMultiRegistryEventualSync:
+    """Tests for eventual (background) secondary sync.
+
+    The primary promotion returns immediately; secondaries sync afterwards.
+    """
+
+    @pytest.mark.requirement("FR-028")
+    def test_eventual_mode_returns_pending_then_syncs(
+        self,
+        mock_oci_client: MagicMock,
+        mock_secondary_client: MagicMock,
+        promotion_config: PromotionConfig,
+    ) -> None:
+        """Eventual mode records pending statuses and syncs in the background."""
+        controller = PromotionController(
+            client=mock_oci_client,
+            promotion=promotion_config,
+        )
+
+        with patch.object(controller, "promote") as mock_promote:
+            from floe_core.schemas.promotion import PromotionRecord
+
+            mock_record = MagicMock(spec=PromotionRecord)
+            mock_record.artifact_digest = TEST_DIGEST
+            mock_record.warnings = []
+
+            def mock_model_copy(update: dict) -> MagicMock:
+                updated_record = MagicMock(spec=PromotionRecord)
+                updated_record.registry_sync_status = update.get("registry_sync_status", [])
+                return updated_record
+
+            mock_record.model_copy.side_effect = mock_model_copy
+            mock_promote.return_value = mock_record
+
+            result = controller.promote_multi(
+                tag="v1.0.0",
+                from_env="dev",
+                to_env="staging",
+                operator="test@example.com",
+                secondary_clients=[mock_secondary_client],
+                sync_mode="eventual",
+            )
+
+            assert [s.pending for s in result.registry_sync_status] == [True]
+
+            final = controller.wait_for_registry_sync("v1.0.0", "staging", timeout=10)
+            assert len(final) == 1
+            assert final[0].synced is True
+            mock_secondary_client.copy_tag.assert_called_once()
+
+    @staticmethod
+    def _record() -> PromotionRecord:
+        """Build the record of a completed primary promotion."""
+        from uuid import uuid4
+
+        return PromotionRecord(
+            promotion_id=uuid4(),
+            artifact_digest=TEST_DIGEST,
+            artifact_tag="v1.0.0",
+            source_environment="dev",
+            target_environment="staging",
+            gate_results=[],
+            signature_verified=True,
+            operator="test@example.com",
+            promoted_at=datetime.now(timezone.utc),
+            dry_run=False,
+            trace_id="abc123",
+            authorization_passed=True,
+        )
+
+    @pytest.mark.requirement("FR-030")
+    def test_eventual_mode_final_record_reports_partial_failure(
+        self,
+        mock_oci_client: MagicMock,
+        mock_secondary_client: MagicMock,
+        promotion_config: PromotionConfig,
+    ) -> None:
+        """wait_for_promotion() returns the record with final statuses and warnings."""
+        failing = MagicMock()
+        failing.registry_uri = "oci://failing.registry.com/repo"
+        failing.copy_tag.side_effect = ConnectionError("Registry unavailable")
+        controller = PromotionController(
+            client=mock_oci_client,
+            promotion=promotion_config,
+        )
+
+        with patch.object(controller, "promote", return_value=self._record()):
+            result = controller.promote_multi(
+                tag="v1.0.0",
+                from_env="dev",
+                to_env="staging",
+                operator="test@example.com",
+                secondary_clients=[mock_secondary_client, failing],
+                sync_mode="eventual",
+            )
+
+        final = controller.wait_for_promotion("v1.0.0", "staging", timeout=10)
+
+        assert [s.pending for s in result.registry_sync_status] == [True, True]
+        assert result.warnings == []
+        assert final is not None
+        assert final.promotion_id == result.promotion_id
+        assert [s.synced for s in final.registry_sync_status] == [True, False]
+        assert not any(s.pending for s in final.registry_sync_status)
+        assert len(final.warnings) == 1
+        assert "oci://failing.registry.com/repo" in final.warnings[0]
+
+    @pytest.mark.requirement("FR-029")
+    def test_reconcile_updates_eventual_record(
+        self,
+        mock_oci_client: MagicMock,
+        promotion_config: PromotionConfig,
+    ) -> None:
+        """reconcile_registries() refreshes the record from wait_for_promotion()."""
+        mock_oci_client.get_artifact_digest.side_effect = {
+            "v1.0.0": TEST_DIGEST,
+            "v1.0.0-staging": ANNOTATED_DIGEST,
+        }.__getitem__
+        flaky = MagicMock()
+        flaky.registry_uri = "oci://flaky.registry.com/repo"
+        flaky.copy_tag.side_effect = [ConnectionError("Registry unavailable"), None]
+        flaky.get_artifact_digest.side_effect = [STALE_DIGEST, TEST_DIGEST]
+        controller = PromotionController(
+            client=mock_oci_client,
+            promotion=promotion_config,
+        )
+
+        with patch.object(controller, "promote", return_value=self._record()):
+            controller.promote_multi(
+                tag="v1.0.0",
+                from_env="dev",
+                to_env="staging",
+                operator="test@example.com",
+                secondary_clients=[flaky],
+                sync_mode="eventual",
+            )
+        failed = controller.wait_for_promotion("v1.0.0", "staging", timeout=10)
+
+        controller.reconcile_registries("v1.0.0", "staging", secondary_clients=[flaky])
+        repaired = controller.wait_for_promotion("v1.0.0", "staging", timeout=10)
+
+        assert failed is not None and repaired is not None
+        assert [s.synced for s in failed.registry_sync_status] == [False]
+        assert [s.synced for s in repaired.registry_sync_status] == [True]
+
+    @pytest.mark.requirement("FR-028")
+    def test_reconcile_registries_skips_current_registries(
+        self,
+        mock_oci_client: MagicMock,
+        mock_secondary_client: MagicMock,
+        promotion_config: PromotionConfig,
+    ) -> None:
+        """Registries already holding the primary digest are not re-synced."""
+        # The primary's env tag carries promotion annotations, so its digest
+        # differs from the source tag that secondaries receive
+        mock_oci_client.get_artifact_digest.side_effect = {
+            "v1.0.0": TEST_DIGEST,
+            "v1.0.0-staging": ANNOTATED_DIGEST,
+        }.__getitem__
+        controller = PromotionController(
+            client=mock_oci_client,
+            promotion=promotion_config,
+        )
+
+        statuses = controller.reconcile_registries(
+            "v1.0.0",
+            "staging",
+            secondary_clients=[mock_secondary_client],
+        )
+
+        assert statuses[0].synced is True
+        mock_secondary_client.copy_tag.assert_not_called()
+
+    @pytest.mark.requirement("FR-029")
+    def test_reconcile_registries_resyncs_lagging_registry(
+        self,
+        mock_oci_client: MagicMock,
+        mock_secondary_client: MagicMock,
+        promotion_config: PromotionConfig,
+    ) -> None:
+        """A lagging registry is re-synced and verified against the source digest."""
+        mock_oci_client.get_artifact_digest.side_effect = {
+            "v1.0.0": TEST_DIGEST,
+            "v1.0.0-staging": ANNOTATED_DIGEST,
+        }.__getitem__
+        # Stale before the copy, the source tag's digest after it
+        mock_secondary_client.get_artifact_digest.side_effect = [STALE_DIGEST, TEST_DIGEST]
+        controller = PromotionController(
+            client=mock_oci_client,
+            promotion=promotion_config,
+        )
+
+        statuses = controller.reconcile_registries(
+            "v1.0.0",
+            "staging",
+            secondary_clients=[mock_secondary_client],
+        )
+
+        mock_secondary_client.copy_tag.assert_called_once()
+        assert statuses[0].synced is True
+        assert statuses[0].error is None
+
+
 class TestPromotionConfigSecondaryRegistries:
     """Tests for PromotionConfig secondary registry fields (T079).
 
@@ -487,6 +694,21 @@ class TestPromotionConfigSecondaryRegistries:
         )
         assert config.verify_secondary_digests is False
 
+    @pytest.mark.requirement("FR-028")
+    def test_config_sync_mode_and_parallelism_defaults(self) -> None:
+        """PromotionConfig defaults to synchronous sync with 4 workers."""
+        config = PromotionConfig()
+        assert config.secondary_sync_mode == "sync"
+        assert config.max_parallel_syncs == 4
+
+    @pytest.mark.requirement("FR-028")
+    def test_config_rejects_invalid_sync_mode(self) -> None:
+        """PromotionConfig only accepts 'sync' or 'eventual'."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            PromotionConfig(secondary_sync_mode="later")  # type: ignore[arg-type]
+
 
 class TestRegistrySyncStatusSchema:
     """Tests for RegistrySyncStatus schema (T079/T083).
@@ -46,7 +46,7 @@ class TestRollbackSuccessPath:
         client.inspect.return_value = mock_manifest
 
         # Mock list to return empty (no existing rollback tags)
-        client.list.return_value = []
+        client.list_tag_names.return_value = []
 
         # Mock ORAS client operations
         mock_oras = MagicMock()
@@ -243,7 +243,7 @@ class TestRollbackVersionNotFound:
             return manifest
 
         client.inspect.side_effect = inspect_side_effect
-        client.list.return_value = []
+        client.list_tag_names.return_value = []
 
         return client
 
@@ -302,13 +302,11 @@ class TestRollbackTagNumbering:
         client.inspect.return_value = mock_manifest
 
         # Mock existing rollback tags
-        mock_tag1 = MagicMock()
-        mock_tag1.name = "v1.0.0-prod-rollback-1"
-        mock_tag2 = MagicMock()
-        mock_tag2.name = "v1.0.0-prod-rollback-2"
-        mock_tag3 = MagicMock()
-        mock_tag3.name = "v1.0.0-staging-rollback-1"  # Different env
-        client.list.return_value = [mock_tag1, mock_tag2, mock_tag3]
+        client.list_tag_names.return_value = [
+            "v1.0.0-prod-rollback-1",
+            "v1.0.0-prod-rollback-2",
+            "v1.0.0-staging-rollback-1",  # Different env
+        ]
 
         mock_oras = MagicMock()
         mock_oras.get_manifest.return_value = {"schemaVersion": 2}
@@ -358,7 +356,7 @@ class TestAnalyzeRollbackImpact:
         mock_manifest = MagicMock()
         mock_manifest.digest = "sha256:" + "a" * 64
         client.inspect.return_value = mock_manifest
-        client.list.return_value = []
+        client.list_tag_names.return_value = []
 
         return client
 
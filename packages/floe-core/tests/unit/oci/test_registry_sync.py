@@ -0,0 +1,208 @@
+"""Unit tests for RegistrySyncEngine and BlobStage.
+
+Tests bounded fan-out sync to secondary registries, per-registry circuit
+breakers, reconciliation of lagging registries, and shared blob staging.
+
+Requirements: FR-028, FR-029, FR-030
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from floe_core.oci.errors import DigestMismatchError
+from floe_core.oci.registry_sync import BlobStage, RegistrySyncEngine
+from floe_core.oci.resilience import CircuitState
+
+TEST_DIGEST = "sha256:abc123def456abc123def456abc123def456abc123def456abc123def456abcd"
+
+
+def _secondary(name: str, digest: str = TEST_DIGEST) -> MagicMock:
+    """Create a mock secondary registry client."""
+    client = MagicMock()
+    client.registry_uri = f"oci://{name}.registry.com/repo"
+    client.get_artifact_digest.return_value = digest
+    return client
+
+
+@pytest.fixture
+def primary_client() -> MagicMock:
+    """Create mock primary registry client."""
+    client = MagicMock()
+    client.registry_uri = "oci://primary.registry.com/repo"
+    return client
+
+
+class TestRegistrySyncEngine:
+    """Tests for RegistrySyncEngine.sync()."""
+
+    @pytest.mark.requirement("FR-028")
+    def test_sync_returns_status_per_client_in_order(self, primary_client: MagicMock) -> None:
+        """Statuses are returned in the order of the clients."""
+        clients = [_secondary(f"r{i}") for i in range(4)]
+        engine = RegistrySyncEngine(primary_client)
+
+        statuses = engine.sync("v1.0.0", "v1.0.0-prod", TEST_DIGEST, clients)
+
+        assert [s.registry_uri for s in statuses] == [c.registry_uri for c in clients]
+        assert all(s.synced for s in statuses)
+        for client in clients:
+            kwargs = client.copy_tag.call_args.kwargs
+            assert kwargs["source_client"] is primary_client
+            assert kwargs["dest_ref"].endswith(":v1.0.0-prod")
+
+    @pytest.mark.requirement("FR-028")
+    def test_sync_is_bounded_by_max_workers(self, primary_client: MagicMock) -> None:
+        """No more than max_workers registries are synced at once."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def slow_copy(**_: Any) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        clients = [_secondary(f"r{i}") for i in range(6)]
+        for client in clients:
+            client.copy_tag.side_effect = slow_copy
+
+        RegistrySyncEngine(primary_client, max_workers=2).sync(
+            "v1.0.0", "v1.0.0-prod", TEST_DIGEST, clients
+        )
+
+        assert peak == 2
+
+    @pytest.mark.requirement("FR-030")
+    def test_partial_failure_is_reported_not_raised(self, primary_client: MagicMock) -> None:
+        """A failing registry is reported while the others sync."""
+        healthy = _secondary("healthy")
+        failing = _secondary("failing")
+        failing.copy_tag.side_effect = ConnectionError("Registry unavailable")
+
+        statuses = RegistrySyncEngine(primary_client).sync(
+            "v1.0.0", "v1.0.0-prod", TEST_DIGEST, [healthy, failing]
+        )
+
+        assert statuses[0].synced is True
+        assert statuses[1].synced is False
+        assert "Registry unavailable" in (statuses[1].error or "")
+
+    @pytest.mark.requirement("FR-029")
+    def test_digest_mismatch_is_not_synced(self, primary_client: MagicMock) -> None:
+        """A registry reporting a different digest is marked not synced."""
+        client = _secondary("stale", digest="sha256:" + "0" * 64)
+
+        statuses = RegistrySyncEngine(primary_client).sync(
+            "v1.0.0", "v1.0.0-prod", TEST_DIGEST, [client]
+        )
+
+        assert statuses[0].synced is False
+        assert "Digest mismatch" in (statuses[0].error or "")
+
+    @pytest.mark.requirement("FR-029")
+    def test_verification_can_be_skipped(self, primary_client: MagicMock) -> None:
+        """verify_digests=False does not read back the digest."""
+        client = _secondary("r1")
+
+        statuses = RegistrySyncEngine(primary_client).sync(
+            "v1.0.0", "v1.0.0-prod", TEST_DIGEST, [client], verify_digests=False
+        )
+
+        assert statuses[0].synced is True
+        client.get_artifact_digest.assert_not_called()
+
+    @pytest.mark.requirement("FR-030")
+    def test_open_circuit_skips_registry(self, primary_client: MagicMock) -> None:
+        """A registry whose breaker is open is skipped without a copy attempt."""
+        failing = _secondary("failing")
+        failing.copy_tag.side_effect = ConnectionError("Registry unavailable")
+        engine = RegistrySyncEngine(primary_client)
+        breaker = engine.circuit_breaker(failing)
+
+        while breaker.state != CircuitState.OPEN:
+            engine.sync("v1.0.0", "v1.0.0-prod", TEST_DIGEST, [failing])
+        failing.copy_tag.reset_mock()
+
+        statuses = engine.sync("v1.0.0", "v1.0.0-prod", TEST_DIGEST, [failing])
+
+        assert statuses[0].synced is False
+        failing.copy_tag.assert_not_called()
+
+    @pytest.mark.requirement("FR-028")
+    def test_invalid_max_workers_rejected(self, primary_client: MagicMock) -> None:
+        """max_workers must be at least 1."""
+        with pytest.raises(ValueError, match="max_workers"):
+            RegistrySyncEngine(primary_client, max_workers=0)
+
+
+class TestRegistrySyncEngineReconcile:
+    """Tests for RegistrySyncEngine.reconcile()."""
+
+    @pytest.mark.requirement("FR-028")
+    def test_reconcile_syncs_only_lagging_registries(self, primary_client: MagicMock) -> None:
+        """Registries already at the expected digest are not copied to."""
+        current = _secondary("current")
+        lagging = _secondary("lagging")
+        lagging.get_artifact_digest.side_effect = [Exception("manifest unknown"), TEST_DIGEST]
+
+        statuses = RegistrySyncEngine(primary_client).reconcile(
+            "v1.0.0", "v1.0.0-prod", TEST_DIGEST, [current, lagging]
+        )
+
+        assert [s.synced for s in statuses] == [True, True]
+        current.copy_tag.assert_not_called()
+        lagging.copy_tag.assert_called_once()
+
+
+class TestBlobStage:
+    """Tests for BlobStage shared downloads."""
+
+    @staticmethod
+    def _source(content: bytes) -> MagicMock:
+        """Create a source client whose ORAS client writes content."""
+        oras_client = MagicMock()
+
+        def download_blob(_container: str, _digest: str, outfile: str) -> str:
+            Path(outfile).write_bytes(content)
+            return outfile
+
+        oras_client.download_blob.side_effect = download_blob
+        source = MagicMock()
+        source._create_oras_client.return_value = oras_client
+        return source
+
+    @pytest.mark.requirement("FR-028")
+    def test_blob_downloaded_once_per_digest(self) -> None:
+        """Repeated fetches of a digest reuse the staged file."""
+        content = b"layer-content"
+        digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        source = self._source(content)
+
+        with BlobStage(source) as stage:
+            first = stage.fetch({"digest": digest}, "v1.0.0")
+            second = stage.fetch({"digest": digest}, "v1.0.0")
+
+            assert first == second
+            assert first.read_bytes() == content
+            assert stage.downloads == 1
+        assert not first.exists()
+
+    @pytest.mark.requirement("FR-029")
+    def test_corrupt_blob_raises_digest_mismatch(self) -> None:
+        """Downloaded content must match the requested digest."""
+        source = self._source(b"corrupted")
+
+        with BlobStage(source) as stage, pytest.raises(DigestMismatchError):
+            stage.fetch({"digest": "sha256:" + "0" * 64}, "v1.0.0")
@@ -30,7 +30,7 @@ class TestRollbackOpenTelemetrySpan:
             annotations={},
         )
         mock_client.create_tag.return_value = None
-        mock_client.list.return_value = []  # Empty list for rollback number calculation
+        mock_client.list_tag_names.return_value = []  # Empty list for rollback number calculation
 
         # Use signature_enforcement="off" to skip verification in tests
         promotion = PromotionConfig(signature_enforcement="off")
@@ -329,3 +329,249 @@ class TestRunAllGates:
                 artifact_ref="harbor.example.com/floe:v1.0.0",
                 dry_run=False,
             )
+
+
+def _controller_for(env: object, gate_commands: dict[str, str]) -> MagicMock:
+    """Create a PromotionController with a single custom environment."""
+    from floe_core.enforcement import PolicyEnforcer
+    from floe_core.oci.client import OCIClient
+    from floe_core.oci.promotion import PromotionController
+    from floe_core.schemas.manifest import GovernanceConfig
+    from floe_core.schemas.oci import AuthType, RegistryAuth, RegistryConfig
+    from floe_core.schemas.promotion import PromotionConfig
+
+    registry_config = RegistryConfig(
+        uri="oci://harbor.example.com/floe",
+        auth=RegistryAuth(type=AuthType.ANONYMOUS),
+    )
+    return PromotionController(
+        client=OCIClient.from_registry_config(registry_config),
+        promotion=PromotionConfig(environments=[env], gate_commands=gate_commands),
+        policy_enforcer=PolicyEnforcer(governance_config=GovernanceConfig()),
+    )
+
+
+class TestConcurrentGates:
+    """Tests for concurrent, dependency-aware gate execution."""
+
+    @staticmethod
+    def _env(**kwargs: object) -> object:
+        from floe_core.schemas.promotion import EnvironmentConfig, PromotionGate
+
+        return EnvironmentConfig(
+            name="prod",
+            gates={
+                PromotionGate.POLICY_COMPLIANCE: True,
+                PromotionGate.TESTS: True,
+                PromotionGate.COST_ANALYSIS: True,
+                PromotionGate.PERFORMANCE_BASELINE: True,
+            },
+            **kwargs,
+        )
+
+    @staticmethod
+    def _passed(gate: object) -> object:
+        from floe_core.schemas.promotion import GateResult, GateStatus
+
+        return GateResult(gate=gate, status=GateStatus.PASSED, duration_ms=0)
+
+    @pytest.mark.requirement("8C-FR-002")
+    def test_independent_gates_run_concurrently(self) -> None:
+        """Test that gates without dependencies overlap in time."""
+        import threading
+
+        from floe_core.schemas.promotion import GateResult, GateStatus, PromotionGate
+
+        controller = _controller_for(
+            self._env(),
+            {"tests": "t", "cost_analysis": "c", "performance_baseline": "p"},
+        )
+        barrier = threading.Barrier(3, timeout=5)
+
+        def run_gate(gate: PromotionGate, **_: object) -> GateResult:
+            barrier.wait()  # Breaks (raises) unless all three run at once
+            return GateResult(gate=gate, status=GateStatus.PASSED, duration_ms=1)
+
+        with (
+            patch.object(
+                controller,
+                "_run_policy_compliance_gate",
+                return_value=self._passed(PromotionGate.POLICY_COMPLIANCE),
+            ),
+            patch.object(controller, "_run_gate", side_effect=run_gate),
+        ):
+            results = controller._run_all_gates(
+                to_env="prod",
+                manifest={"nodes": {}},
+                artifact_ref="harbor.example.com/floe:v1.0.0",
+                dry_run=False,
+            )
+
+        assert all(r.status == GateStatus.PASSED for r in results)
+
+    @pytest.mark.requirement("8C-FR-002")
+    def test_results_follow_configuration_order(self) -> None:
+        """Test that results are ordered by configuration, not completion."""
+        import time
+
+        from floe_core.schemas.promotion import GateResult, GateStatus, PromotionGate
+
+        controller = _controller_for(
+            self._env(),
+            {"tests": "t", "cost_analysis": "c", "performance_baseline": "p"},
+        )
+        delays = {
+            PromotionGate.TESTS: 0.15,
+            PromotionGate.COST_ANALYSIS: 0.05,
+            PromotionGate.PERFORMANCE_BASELINE: 0.0,
+        }
+
+        def run_gate(gate: PromotionGate, **_: object) -> GateResult:
+            time.sleep(delays[gate])
+            return GateResult(gate=gate, status=GateStatus.PASSED, duration_ms=1)
+
+        with (
+            patch.object(
+                controller,
+                "_run_policy_compliance_gate",
+                return_value=self._passed(PromotionGate.POLICY_COMPLIANCE),
+            ),
+            patch.object(controller, "_run_gate", side_effect=run_gate),
+        ):
+            results = controller._run_all_gates(
+                to_env="prod",
+                manifest={"nodes": {}},
+                artifact_ref="harbor.example.com/floe:v1.0.0",
+                dry_run=False,
+            )
+
+        assert [r.gate for r in results] == [
+            PromotionGate.POLICY_COMPLIANCE,
+            PromotionGate.TESTS,
+            PromotionGate.COST_ANALYSIS,
+            PromotionGate.PERFORMANCE_BASELINE,
+        ]
+
+    @pytest.mark.requirement("8C-FR-002")
+    def test_dependencies_run_first(self) -> None:
+        """Test that a gate starts only after the gates it depends on finish."""
+        import threading
+
+        from floe_core.schemas.promotion import GateResult, GateStatus, PromotionGate
+
+        controller = _controller_for(
+            self._env(
+                gate_dependencies={
+                    PromotionGate.PERFORMANCE_BASELINE: [PromotionGate.TESTS],
+                },
+            ),
+            {"tests": "t", "cost_analysis": "c", "performance_baseline": "p"},
+        )
+        finished: list[PromotionGate] = []
+        lock = threading.Lock()
+
+        def run_gate(gate: PromotionGate, **_: object) -> GateResult:
+            if gate == PromotionGate.PERFORMANCE_BASELINE:
+                with lock:
+                    assert PromotionGate.TESTS in finished
+            with lock:
+                finished.append(gate)
+            return GateResult(gate=gate, status=GateStatus.PASSED, duration_ms=1)
+
+        with (
+            patch.object(
+                controller,
+                "_run_policy_compliance_gate",
+                return_value=self._passed(PromotionGate.POLICY_COMPLIANCE),
+            ),
+            patch.object(controller, "_run_gate", side_effect=run_gate),
+        ):
+            results = controller._run_all_gates(
+                to_env="prod",
+                manifest={"nodes": {}},
+                artifact_ref="harbor.example.com/floe:v1.0.0",
+                dry_run=False,
+            )
+
+        assert len(results) == 4
+        assert all(r.status == GateStatus.PASSED for r in results)
+
+    @pytest.mark.requirement("8C-FR-002")
+    def test_failure_cancels_running_gates(self) -> None:
+        """Test that a failing gate terminates still-running sibling commands."""
+        import time
+
+        from floe_core.schemas.promotion import GateStatus, PromotionGate
+
+        controller = _controller_for(
+            self._env(),
+            {
+                "tests": "sleep 30",
+                "cost_analysis": "exit 1",
+                "performance_baseline": "sleep 30",
+            },
+        )
+
+        start = time.monotonic()
+        with patch.object(
+            controller,
+            "_run_policy_compliance_gate",
+            return_value=self._passed(PromotionGate.POLICY_COMPLIANCE),
+        ):
+            results = controller._run_all_gates(
+                to_env="prod",
+                manifest={"nodes": {}},
+                artifact_ref="harbor.example.com/floe:v1.0.0",
+                dry_run=False,
+            )
+
+        assert time.monotonic() - start < 10
+        assert [r.gate for r in results] == [
+            PromotionGate.POLICY_COMPLIANCE,
+            PromotionGate.COST_ANALYSIS,
+        ]
+        assert results[1].status == GateStatus.FAILED
+
+    @pytest.mark.requirement("8C-FR-002")
+    def test_failure_prevents_dependent_gates(self) -> None:
+        """Test that gates waiting on a failed gate are never started."""
+        from floe_core.schemas.promotion import GateResult, GateStatus, PromotionGate
+
+        controller = _controller_for(
+            self._env(
+                max_parallel_gates=1,
+                gate_dependencies={
+                    PromotionGate.COST_ANALYSIS: [PromotionGate.TESTS],
+                    PromotionGate.PERFORMANCE_BASELINE: [PromotionGate.TESTS],
+                },
+            ),
+            {"tests": "t", "cost_analysis": "c", "performance_baseline": "p"},
+        )
+
+        with (
+            patch.object(
+                controller,
+                "_run_policy_compliance_gate",
+                return_value=self._passed(PromotionGate.POLICY_COMPLIANCE),
+            ),
+            patch.object(
+                controller,
+                "_run_gate",
+                return_value=GateResult(
+                    gate=PromotionGate.TESTS,
+                    status=GateStatus.FAILED,
+                    duration_ms=1,
+                    error="tests failed",
+                ),
+            ) as mock_gate,
+        ):
+            results = controller._run_all_gates(
+                to_env="prod",
+                manifest={"nodes": {}},
+                artifact_ref="harbor.example.com/floe:v1.0.0",
+                dry_run=False,
+            )
+
+        mock_gate.assert_called_once()
+        assert len(results) == 2
+        assert results[-1].status == GateStatus.FAILED
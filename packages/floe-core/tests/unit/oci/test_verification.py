@@ -17,6 +17,7 @@ from __future__ import annotations
 import base64
 import json
 from datetime import datetime, timezone
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -33,6 +34,7 @@ requires_sigstore = pytest.mark.skipif(
     not SIGSTORE_AVAILABLE, reason="sigstore library not installed"
 )
 
+from floe_core.oci.cache import CacheManager  # noqa: E402
 from floe_core.oci.errors import SignatureVerificationError  # noqa: E402
 from floe_core.oci.verification import (  # noqa: E402
     CosignNotAvailableError,
@@ -41,6 +43,7 @@ from floe_core.oci.verification import (  # noqa: E402
     check_cosign_available,
     verify_artifact,
 )
+from floe_core.schemas.oci import CacheConfig  # noqa: E402
 from floe_core.schemas.signing import (  # noqa: E402
     SignatureMetadata,
     TrustedIssuer,
@@ -425,6 +428,112 @@ class TestAuditLogging:
         assert "Verification audit" in caplog.text or "verification" in caplog.text.lower()
 
 
+class TestVerificationResultCache:
+    """Tests for the persistent verification result cache."""
+
+    @pytest.fixture
+    def cache_manager(self, tmp_path: Path) -> CacheManager:
+        """Create an OCI cache manager in a temporary directory."""
+        return CacheManager(CacheConfig(path=tmp_path / "oci-cache"))
+
+    @staticmethod
+    def _valid_result() -> VerificationResult:
+        return VerificationResult(
+            status="valid",
+            signer_identity="repo:acme/floe:ref:refs/heads/main",
+            verified_at=datetime.now(timezone.utc),
+            rekor_verified=True,
+        )
+
+    @pytest.mark.requirement("FR-013")
+    def test_second_verify_is_served_from_cache(
+        self,
+        enforce_policy: VerificationPolicy,
+        valid_signature_metadata: SignatureMetadata,
+        cache_manager: CacheManager,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A repeated verification reuses the cached result and audits the hit."""
+        with patch.object(
+            VerificationClient, "_verify_signature", return_value=self._valid_result()
+        ) as mock_verify:
+            for _ in range(2):
+                client = VerificationClient(enforce_policy, cache=cache_manager)
+                with caplog.at_level("INFO"):
+                    result = client.verify(
+                        b"artifact", valid_signature_metadata, "oci://registry/repo:v1.0.0"
+                    )
+                assert result.is_valid
+
+        mock_verify.assert_called_once()
+        assert '"cache_hit":true' in caplog.text
+
+    @pytest.mark.requirement("FR-009")
+    def test_policy_change_invalidates_cache(
+        self,
+        enforce_policy: VerificationPolicy,
+        valid_signature_metadata: SignatureMetadata,
+        cache_manager: CacheManager,
+    ) -> None:
+        """A different policy never reuses results verified under the old one."""
+        changed_policy = enforce_policy.model_copy(update={"grace_period_days": 1})
+
+        with patch.object(
+            VerificationClient, "_verify_signature", return_value=self._valid_result()
+        ) as mock_verify:
+            for policy in (enforce_policy, changed_policy):
+                VerificationClient(policy, cache=cache_manager).verify(
+                    b"artifact", valid_signature_metadata, "oci://registry/repo:v1.0.0"
+                )
+
+        assert mock_verify.call_count == 2
+
+    @pytest.mark.requirement("FR-009")
+    def test_invalid_results_are_not_cached(
+        self,
+        warn_policy: VerificationPolicy,
+        valid_signature_metadata: SignatureMetadata,
+        cache_manager: CacheManager,
+    ) -> None:
+        """Failures are re-verified because they may be transient."""
+        invalid = VerificationResult(
+            status="invalid",
+            verified_at=datetime.now(timezone.utc),
+            failure_reason="Rekor unavailable",
+        )
+        with patch.object(
+            VerificationClient, "_verify_signature", return_value=invalid
+        ) as mock_verify:
+            for _ in range(2):
+                VerificationClient(warn_policy, cache=cache_manager).verify(
+                    b"artifact", valid_signature_metadata, "oci://registry/repo:v1.0.0"
+                )
+
+        assert mock_verify.call_count == 2
+
+    @pytest.mark.requirement("FR-009")
+    def test_zero_ttl_disables_cache(
+        self,
+        github_actions_issuer: TrustedIssuer,
+        valid_signature_metadata: SignatureMetadata,
+        cache_manager: CacheManager,
+    ) -> None:
+        """cache_ttl_seconds=0 always re-verifies."""
+        policy = VerificationPolicy(
+            trusted_issuers=[github_actions_issuer],
+            cache_ttl_seconds=0,
+        )
+        with patch.object(
+            VerificationClient, "_verify_signature", return_value=self._valid_result()
+        ) as mock_verify:
+            for _ in range(2):
+                VerificationClient(policy, cache=cache_manager).verify(
+                    b"artifact", valid_signature_metadata, "oci://registry/repo:v1.0.0"
+                )
+
+        assert mock_verify.call_count == 2
+
+
 class TestVerifyArtifactConvenienceFunction:
     """Tests for verify_artifact() convenience function."""
 
@@ -724,6 +724,59 @@ class TestEnvironmentConfig:
                 gate_timeout_seconds=10,  # Below minimum of 30
             )
 
+    @pytest.mark.requirement("8C-FR-005")
+    def test_environment_config_gate_dependencies(self) -> None:
+        """Test EnvironmentConfig accepts acyclic gate dependencies."""
+        from floe_core.schemas.promotion import EnvironmentConfig, PromotionGate
+
+        config = EnvironmentConfig(
+            name="prod",
+            gates={
+                PromotionGate.POLICY_COMPLIANCE: True,
+                PromotionGate.TESTS: True,
+                PromotionGate.PERFORMANCE_BASELINE: True,
+            },
+            gate_dependencies={PromotionGate.PERFORMANCE_BASELINE: [PromotionGate.TESTS]},
+            max_parallel_gates=2,
+        )
+        assert config.gate_dependencies[PromotionGate.PERFORMANCE_BASELINE] == [PromotionGate.TESTS]
+        assert config.max_parallel_gates == 2
+
+    @pytest.mark.requirement("8C-FR-005")
+    def test_environment_config_gate_dependency_cycle_rejected(self) -> None:
+        """Test EnvironmentConfig rejects cyclic gate dependencies."""
+        from pydantic import ValidationError
+
+        from floe_core.schemas.promotion import EnvironmentConfig, PromotionGate
+
+        with pytest.raises(ValidationError, match="cycle"):
+            EnvironmentConfig(
+                name="prod",
+                gates={
+                    PromotionGate.POLICY_COMPLIANCE: True,
+                    PromotionGate.TESTS: True,
+                    PromotionGate.PERFORMANCE_BASELINE: True,
+                },
+                gate_dependencies={
+                    PromotionGate.TESTS: [PromotionGate.PERFORMANCE_BASELINE],
+                    PromotionGate.PERFORMANCE_BASELINE: [PromotionGate.TESTS],
+                },
+            )
+
+    @pytest.mark.requirement("8C-FR-005")
+    def test_environment_config_gate_dependency_unknown_gate_rejected(self) -> None:
+        """Test EnvironmentConfig rejects dependencies on unconfigured gates."""
+        from pydantic import ValidationError
+
+        from floe_core.schemas.promotion import EnvironmentConfig, PromotionGate
+
+        with pytest.raises(ValidationError, match="not configured"):
+            EnvironmentConfig(
+                name="prod",
+                gates={PromotionGate.POLICY_COMPLIANCE: True, PromotionGate.TESTS: True},
+                gate_dependencies={PromotionGate.TESTS: [PromotionGate.SECURITY_SCAN]},
+            )
+
 
 class TestPromotionConfig:
     """Tests for PromotionConfig Pydantic model."""
@@ -27,7 +27,7 @@ import structlog
 from floe_core.telemetry.sanitization import sanitize_error_message
 
 from floe_iceberg.errors import CompactionError
-from floe_iceberg.models import CompactionStrategy
+from floe_iceberg.models import CompactionStrategy, IcebergTableManagerConfig
 from floe_iceberg.telemetry import traced
 
 if TYPE_CHECKING:
@@ -48,6 +48,7 @@ class _IcebergCompactionManager:
     to call compact_table(). This class only performs the execution.
 
     Attributes:
+        _config: IcebergTableManagerConfig for commit retry settings.
         _log: Structured logger instance.
 
     Example:
@@ -56,8 +57,14 @@ class _IcebergCompactionManager:
         >>> files_rewritten = compaction_mgr.compact_table(table, strategy)
     """
 
-    def __init__(self) -> None:
-        """Initialize _IcebergCompactionManager."""
+    def __init__(self, config: IcebergTableManagerConfig | None = None) -> None:
+        """Initialize _IcebergCompactionManager.
+
+        Args:
+            config: IcebergTableManagerConfig for commit retry settings.
+                Defaults to IcebergTableManagerConfig().
+        """
+        self._config = config if config is not None else IcebergTableManagerConfig()
         self._log = structlog.get_logger(__name__)
 
     # =========================================================================
@@ -127,17 +134,26 @@ class _IcebergCompactionManager:
 
         try:
             # Execute compaction using the compaction module
-            result = execute_compaction(table, strategy)
+            result = execute_compaction(
+                table,
+                strategy,
+                max_commit_retries=self._config.max_commit_retries,
+                retry_base_delay_seconds=self._config.retry_base_delay_seconds,
+            )
             files_rewritten = result.files_rewritten
 
-            # Set files rewritten span attribute
+            # Set rewrite metrics span attributes
             span.set_attribute("files.rewritten", files_rewritten)
+            span.set_attribute("files.added", result.files_added)
+            span.set_attribute("bytes.rewritten", result.bytes_rewritten)
 
             self._log.info(
                 "compact_table_completed",
                 table_identifier=table_identifier,
                 strategy_type=strategy.strategy_type.value,
                 files_rewritten=files_rewritten,
+                files_added=result.files_added,
+                bytes_rewritten=result.bytes_rewritten,
             )
 
             return files_rewritten
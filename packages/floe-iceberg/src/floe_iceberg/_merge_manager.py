@@ -0,0 +1,360 @@
+"""Internal helper class for Iceberg MERGE (upsert) operations.
+
+This module contains the _IcebergMergeManager helper class that merges a
+PyArrow table into an Iceberg table by key, reading and rewriting only the
+data files that can hold matching keys.
+
+The class is internal (underscore-prefixed) and should only be used by
+IcebergTableManager. External consumers should use the public API.
+
+Operations covered:
+- merge(): Insert new rows and update changed rows, keyed on join columns
+
+A merge runs in four steps:
+1. Plan candidate files with a key filter, so partition values and column
+   min/max statistics prune files that cannot hold a source key
+2. Read each candidate file once and hash-join it with the source keys
+3. Compare matched rows column by column to split updates from unchanged rows
+4. Commit one copy-on-write overwrite that replaces only the files holding
+   updated rows, together with the updated and inserted rows
+
+Note: Merges are copy-on-write. PyIceberg cannot write position delete files,
+so merge-on-read is not available.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from floe_iceberg.errors import ValidationError
+from floe_iceberg.models import MergeResult
+from floe_iceberg.telemetry import traced
+
+if TYPE_CHECKING:
+    # Type alias for PyIceberg Table (Any due to missing type stubs)
+    Table = Any
+
+# Row position columns added to the join inputs
+_SOURCE_ROW = "__floe_source_row"
+_TARGET_ROW = "__floe_target_row"
+
+# PyIceberg skips min/max pruning for IN lists longer than this
+# (pyiceberg.expressions.visitors.IN_PREDICATE_LIMIT); longer key lists
+# are pruned by their range instead
+_IN_PREDICATE_LIMIT = 200
+
+
+class _IcebergMergeManager:
+    """Internal helper class for merge (upsert) operations.
+
+    Encapsulates key-based merges into Iceberg tables. Maintains
+    single-responsibility by focusing only on merging.
+
+    This class is internal and should not be used directly by external consumers.
+    Use IcebergTableManager's public API instead.
+
+    Attributes:
+        _log: Structured logger instance.
+
+    Example:
+        >>> # Internal usage in IcebergTableManager
+        >>> merge_mgr = _IcebergMergeManager()
+        >>> result = merge_mgr.merge(table, data, ["id"], {})
+    """
+
+    def __init__(self) -> None:
+        """Initialize _IcebergMergeManager."""
+        self._log = structlog.get_logger(__name__)
+
+    # =========================================================================
+    # Merge Operations
+    # =========================================================================
+
+    @traced(name="iceberg.merge.merge")
+    def merge(
+        self,
+        table: Table,
+        data: Any,
+        join_columns: list[str],
+        snapshot_properties: dict[str, str],
+    ) -> MergeResult:
+        """Merge data into a table by key.
+
+        Source rows whose key matches no table row are inserted. Source rows
+        whose key matches a table row with different values replace it. Rows
+        with a null key column never match and are inserted.
+
+        Args:
+            table: PyIceberg Table object.
+            data: PyArrow Table with the rows to merge.
+            join_columns: Columns identifying a row.
+            snapshot_properties: Custom properties for the snapshot summary.
+
+        Returns:
+            MergeResult with row and file counts.
+
+        Raises:
+            ValidationError: If data holds more than one row for a non-null key.
+        """
+        import pyarrow as pa
+        from pyiceberg.expressions import AlwaysTrue
+        from pyiceberg.io.pyarrow import ArrowScan
+
+        # Null keys never match, so repeated null keys are not duplicates
+        keyed = data.select(join_columns).drop_null()
+        if keyed.group_by(join_columns).aggregate([]).num_rows != keyed.num_rows:
+            msg = f"Duplicate keys in upsert data for join columns {join_columns}"
+            raise ValidationError(msg, field="join_columns", value=join_columns)
+
+        source_keys = data.select(join_columns).append_column(
+            _SOURCE_ROW, pa.array(range(data.num_rows), pa.int64())
+        )
+        value_columns = [name for name in data.column_names if name not in join_columns]
+        scan = ArrowScan(
+            table_metadata=table.metadata,
+            io=table.io,
+            projected_schema=table.schema(),
+            row_filter=AlwaysTrue(),
+        )
+
+        tasks = list(table.scan(row_filter=_key_filter(data, join_columns)).plan_files())
+        matched: set[int] = set()
+        updated: set[int] = set()
+        rewrites: list[tuple[Any, Any]] = []
+        for task in tasks:
+            target = scan.to_table(tasks=[task])
+            pairs = _match(source_keys, target, join_columns)
+            if pairs.num_rows == 0:
+                continue
+            source_rows = pairs.column(_SOURCE_ROW)
+            target_rows = pairs.column(_TARGET_ROW)
+            changed = _changed_rows(
+                data.take(source_rows),
+                target.take(target_rows),
+                [name for name in value_columns if name in target.column_names],
+            )
+            matched.update(source_rows.to_pylist())
+            changed_source_rows = source_rows.filter(changed).to_pylist()
+            if not changed_source_rows:
+                continue
+            updated.update(changed_source_rows)
+            rewrites.append((task.file, _without_rows(target, target_rows.filter(changed))))
+
+        inserted = set(range(data.num_rows)) - matched
+        result = MergeResult(
+            rows_inserted=len(inserted),
+            rows_updated=len(updated),
+            rows_unchanged=len(matched) - len(updated),
+            files_scanned=len(tasks),
+            files_rewritten=len(rewrites),
+        )
+        written = data.take(pa.array(sorted(inserted | updated), pa.int64()))
+        if rewrites:
+            self._commit_rewrite(table, rewrites, written, snapshot_properties)
+        elif written.num_rows:
+            table.append(written, snapshot_properties=snapshot_properties)
+        else:
+            self._log.debug(
+                "merge_no_changes",
+                table_identifier=getattr(table, "identifier", None),
+                rows_unchanged=result.rows_unchanged,
+            )
+            return result
+
+        if hasattr(table, "refresh"):
+            table.refresh()
+        current_snapshot = table.current_snapshot()
+        if current_snapshot is not None:
+            result = result.model_copy(update={"snapshot_id": current_snapshot.snapshot_id})
+        return result
+
+    def _commit_rewrite(
+        self,
+        table: Table,
+        rewrites: list[tuple[Any, Any]],
+        written: Any,
+        snapshot_properties: dict[str, str],
+    ) -> None:
+        """Replace rewritten files and add merged rows in one overwrite snapshot.
+
+        Args:
+            table: PyIceberg Table object.
+            rewrites: (data file, rows to keep) for each file holding updated rows.
+            written: PyArrow Table with the updated and inserted source rows.
+            snapshot_properties: Custom properties for the snapshot summary.
+        """
+        import pyarrow as pa
+        from pyiceberg.io.pyarrow import (
+            _check_pyarrow_schema_compatible,
+            _dataframe_to_data_files,
+        )
+
+        _check_pyarrow_schema_compatible(
+            table.schema(),
+            provided_schema=written.schema,
+            format_version=table.metadata.format_version,
+        )
+        kept = pa.concat_tables([rows for _, rows in rewrites])
+        counter = itertools.count(0)
+        with table.transaction() as transaction:
+            with transaction.update_snapshot(
+                snapshot_properties=snapshot_properties
+            ).overwrite() as overwrite:
+                for data_file, _ in rewrites:
+                    overwrite.delete_data_file(data_file)
+                for rows in (kept, written):
+                    if rows.num_rows == 0:
+                        continue
+                    for data_file in _dataframe_to_data_files(
+                        table_metadata=transaction.table_metadata,
+                        df=rows,
+                        io=table.io,
+                        write_uuid=overwrite.commit_uuid,
+                        counter=counter,
+                    ):
+                        overwrite.append_data_file(data_file)
+
+
+def _key_filter(data: Any, join_columns: list[str]) -> Any:
+    """Build a row filter matching every key in data.
+
+    Each join column contributes an IN predicate over its distinct values,
+    or a min/max range when there are too many values for PyIceberg to
+    prune with IN. A column whose values cannot be expressed as literals
+    does not restrict the filter.
+
+    Args:
+        data: PyArrow Table with the rows to merge.
+        join_columns: Columns identifying a row.
+
+    Returns:
+        PyIceberg BooleanExpression.
+    """
+    import pyarrow.compute as pc
+    from pyiceberg.expressions import (
+        AlwaysFalse,
+        AlwaysTrue,
+        And,
+        GreaterThanOrEqual,
+        In,
+        LessThanOrEqual,
+        Reference,
+    )
+    from pyiceberg.expressions.literals import literal
+
+    key_filter: Any = AlwaysTrue()
+    for column in join_columns:
+        values = pc.unique(data.column(column)).drop_null()
+        if len(values) == 0:
+            # Null keys never match
+            return AlwaysFalse()
+        try:
+            if len(values) <= _IN_PREDICATE_LIMIT:
+                predicate: Any = In(
+                    term=Reference(column),
+                    values={literal(value) for value in values.to_pylist()},
+                )
+            else:
+                bounds = pc.min_max(values).as_py()
+                predicate = And(
+                    GreaterThanOrEqual(term=Reference(column), value=literal(bounds["min"])),
+                    LessThanOrEqual(term=Reference(column), value=literal(bounds["max"])),
+                )
+        except TypeError:
+            continue
+        key_filter = And(key_filter, predicate)
+    return key_filter
+
+
+def _match(source_keys: Any, target: Any, join_columns: list[str]) -> Any:
+    """Hash-join source keys with a data file's rows.
+
+    Args:
+        source_keys: Join columns of the source plus its row positions.
+        target: Rows read from one data file.
+        join_columns: Columns identifying a row.
+
+    Returns:
+        PyArrow Table of matching (source row, target row) positions.
+    """
+    import pyarrow as pa
+
+    target_keys = target.select(join_columns).append_column(
+        _TARGET_ROW, pa.array(range(target.num_rows), pa.int64())
+    )
+    # Compare keys in the table's types, not the source's
+    source_keys = source_keys.cast(
+        pa.schema(
+            [target_keys.schema.field(name) for name in join_columns]
+            + [source_keys.schema.field(_SOURCE_ROW)]
+        )
+    )
+    return source_keys.join(target_keys, keys=join_columns, join_type="inner").select(
+        [_SOURCE_ROW, _TARGET_ROW]
+    )
+
+
+def _changed_rows(source: Any, target: Any, columns: list[str]) -> Any:
+    """Flag matched rows whose values differ in any of columns.
+
+    Args:
+        source: Matched source rows.
+        target: Table rows they matched, in the same order.
+        columns: Non-key columns to compare.
+
+    Returns:
+        PyArrow boolean array, True where the source row differs.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    changed: Any = pa.array([False] * source.num_rows, pa.bool_())
+    for column in columns:
+        changed = pc.or_(changed, _differs(source.column(column), target.column(column)))
+    return changed
+
+
+def _differs(source: Any, target: Any) -> Any:
+    """Compare two columns element-wise, treating two nulls as equal.
+
+    Args:
+        source: Source column.
+        target: Table column of the same length.
+
+    Returns:
+        PyArrow boolean array, True where the values differ.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_nested(target.type):
+        # Compute kernels do not compare lists, structs, or maps
+        return pa.array(
+            [s != t for s, t in zip(source.to_pylist(), target.to_pylist(), strict=True)],
+            pa.bool_(),
+        )
+    if source.type != target.type:
+        source = source.cast(target.type)
+    equal = pc.fill_null(pc.equal(source, target), False)
+    both_null = pc.and_(pc.is_null(source), pc.is_null(target))
+    return pc.invert(pc.or_(equal, both_null))
+
+
+def _without_rows(target: Any, rows: Any) -> Any:
+    """Drop rows at the given positions from a table.
+
+    Args:
+        target: Rows read from one data file.
+        rows: Positions of the rows to drop.
+
+    Returns:
+        PyArrow Table with the remaining rows.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    positions = pa.array(range(target.num_rows), pa.int64())
+    return target.filter(pc.invert(pc.is_in(positions, value_set=rows.combine_chunks())))
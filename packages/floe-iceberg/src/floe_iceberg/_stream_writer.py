@@ -0,0 +1,526 @@
+"""Internal helper class for streaming writes to Iceberg tables.
+
+This module contains the _IcebergStreamWriter helper class that writes a
+stream of PyArrow record batches to an Iceberg table without materializing
+the whole stream in memory.
+
+The class is internal (underscore-prefixed) and should only be used by
+IcebergTableManager. External consumers should use the public API.
+
+Operations covered:
+- write(): Append or overwrite from a RecordBatchReader or batch iterator
+
+A streaming write runs in three steps:
+1. Buffer incoming batches until they reach the configured buffer size
+2. Split the buffer by partition and write each part to that partition's
+   open data file, closing it and starting a new one once it reaches the
+   table's target file size
+3. Commit every data file written in a single snapshot
+
+Memory is bounded by the buffer plus one open Parquet writer per partition
+seen. File sizes are measured in Arrow (uncompressed) bytes, as PyIceberg
+does when it bin-packs a materialized table.
+"""
+
+from __future__ import annotations
+
+import itertools
+import uuid
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from floe_iceberg.errors import ValidationError
+from floe_iceberg.models import CommitStrategy, IcebergTableManagerConfig
+from floe_iceberg.telemetry import traced
+
+if TYPE_CHECKING:
+    # Type alias for PyIceberg Table (Any due to missing type stubs)
+    Table = Any
+
+
+class _RollingDataFile:
+    """One open Parquet data file of a partition, written across buffer flushes.
+
+    Attributes:
+        path: Location of the data file.
+        partition_key: PyIceberg PartitionKey, or None for unpartitioned tables.
+        nbytes: Arrow bytes written so far.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        output_file: Any,
+        partition_key: Any,
+        writer_kwargs: dict[str, Any],
+        row_group_size: int | None,
+    ) -> None:
+        """Initialize _RollingDataFile.
+
+        Args:
+            path: Location of the data file.
+            output_file: PyIceberg OutputFile to write to.
+            partition_key: PyIceberg PartitionKey, or None.
+            writer_kwargs: Keyword arguments for pyarrow.parquet.ParquetWriter.
+            row_group_size: Maximum rows per Parquet row group.
+        """
+        self.path = path
+        self.partition_key = partition_key
+        self.nbytes = 0
+        self._output_file = output_file
+        self._writer_kwargs = writer_kwargs
+        self._row_group_size = row_group_size
+        self._stream: Any = None
+        self._writer: Any = None
+
+    def write(self, rows: Any) -> None:
+        """Write rows to the file, opening it on the first write.
+
+        Args:
+            rows: PyArrow Table already converted to the file schema.
+        """
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._stream = self._output_file.create(overwrite=True)
+            self._writer = pq.ParquetWriter(
+                self._stream,
+                schema=rows.schema,
+                store_decimal_as_integer=True,
+                **self._writer_kwargs,
+            )
+        self._writer.write(rows, row_group_size=self._row_group_size)
+        self.nbytes += rows.nbytes
+
+    def close(self, table_metadata: Any, file_schema: Any) -> Any:
+        """Close the file and describe it as a data file.
+
+        Args:
+            table_metadata: PyIceberg TableMetadata the file was written for.
+            file_schema: PyIceberg Schema the file was written with.
+
+        Returns:
+            PyIceberg DataFile.
+        """
+        from pyiceberg.io.pyarrow import (
+            compute_statistics_plan,
+            data_file_statistics_from_parquet_metadata,
+            parquet_path_to_id_mapping,
+        )
+        from pyiceberg.manifest import DataFile, DataFileContent, FileFormat
+        from pyiceberg.typedef import Record
+
+        self._writer.close()
+        self._stream.close()
+        statistics = data_file_statistics_from_parquet_metadata(
+            parquet_metadata=self._writer.writer.metadata,
+            stats_columns=compute_statistics_plan(file_schema, table_metadata.properties),
+            parquet_column_mapping=parquet_path_to_id_mapping(file_schema),
+        )
+        return DataFile.from_args(
+            content=DataFileContent.DATA,
+            file_path=self.path,
+            file_format=FileFormat.PARQUET,
+            partition=self.partition_key.partition if self.partition_key else Record(),
+            file_size_in_bytes=len(self._output_file),
+            sort_order_id=None,
+            spec_id=table_metadata.default_spec_id,
+            equality_ids=None,
+            key_metadata=None,
+            **statistics.to_serialized_dict(),
+        )
+
+    def abort(self) -> None:
+        """Close the file without collecting statistics, ignoring errors."""
+        for closeable in (self._writer, self._stream):
+            try:
+                if closeable is not None:
+                    closeable.close()
+            except Exception:  # noqa: BLE001 - the file is deleted next
+                pass
+
+
+class _DataFileWriter:
+    """Writes buffered rows to rolling Parquet data files for one table.
+
+    Mirrors pyiceberg.io.pyarrow.write_file(), but keeps one data file per
+    partition open across calls so that a stream fills files up to the
+    target size instead of writing one file per buffer.
+    """
+
+    def __init__(self, table: Table, arrow_schema: Any, target_file_size: int) -> None:
+        """Initialize _DataFileWriter.
+
+        Args:
+            table: PyIceberg Table object.
+            arrow_schema: PyArrow schema of the incoming batches.
+            target_file_size: Arrow bytes at which a data file is closed.
+        """
+        from pyiceberg.io.pyarrow import _get_parquet_writer_kwargs, pyarrow_to_schema
+        from pyiceberg.schema import sanitize_column_names
+        from pyiceberg.table import DOWNCAST_NS_TIMESTAMP_TO_US_ON_WRITE, TableProperties
+        from pyiceberg.table.locations import load_location_provider
+        from pyiceberg.utils.config import Config
+        from pyiceberg.utils.properties import property_as_int
+
+        self._metadata = table.metadata
+        self._io = table.io
+        self._target_file_size = target_file_size
+        self._writer_kwargs = _get_parquet_writer_kwargs(self._metadata.properties)
+        self._row_group_size = property_as_int(
+            properties=self._metadata.properties,
+            property_name=TableProperties.PARQUET_ROW_GROUP_LIMIT,
+            default=TableProperties.PARQUET_ROW_GROUP_LIMIT_DEFAULT,
+        )
+        self._location_provider = load_location_provider(
+            table_location=self._metadata.location,
+            table_properties=self._metadata.properties,
+        )
+        self._downcast_ns_timestamp_to_us = (
+            Config().get_bool(DOWNCAST_NS_TIMESTAMP_TO_US_ON_WRITE) or False
+        )
+        self._file_schema = sanitize_column_names(self._metadata.schema())
+        self._batch_schema = pyarrow_to_schema(
+            arrow_schema,
+            name_mapping=self._metadata.schema().name_mapping,
+            downcast_ns_timestamp_to_us=self._downcast_ns_timestamp_to_us,
+            format_version=self._metadata.format_version,
+        )
+        self._write_uuid = uuid.uuid4()
+        self._counter = itertools.count(0)
+        self._open: dict[Any, _RollingDataFile] = {}
+        self.data_files: list[Any] = []
+
+    def write(self, rows: Any) -> None:
+        """Write buffered rows, rolling files that reach the target size.
+
+        Args:
+            rows: PyArrow Table of incoming batches.
+        """
+        from pyiceberg.io.pyarrow import _determine_partitions
+
+        spec = self._metadata.spec()
+        if spec.is_unpartitioned():
+            self._write_partition(None, rows)
+            return
+        for partition in _determine_partitions(
+            spec=spec, schema=self._metadata.schema(), arrow_table=rows
+        ):
+            self._write_partition(partition.partition_key, partition.arrow_table_partition)
+
+    def close(self) -> list[Any]:
+        """Close every open data file.
+
+        Returns:
+            PyIceberg DataFiles for all files written.
+        """
+        for key in list(self._open):
+            self._roll(key)
+        return self.data_files
+
+    def abort(self) -> None:
+        """Close open files and delete every file written, ignoring errors."""
+        paths = [data_file.file_path for data_file in self.data_files]
+        for open_file in self._open.values():
+            open_file.abort()
+            paths.append(open_file.path)
+        self._open.clear()
+        for path in paths:
+            try:
+                self._io.delete(path)
+            except Exception:  # noqa: BLE001 - best-effort cleanup of orphans
+                pass
+
+    def _write_partition(self, partition_key: Any, rows: Any) -> None:
+        """Write rows of one partition to its open data file.
+
+        Args:
+            partition_key: PyIceberg PartitionKey, or None if unpartitioned.
+            rows: PyArrow Table with the partition's rows.
+        """
+        import pyarrow as pa
+        from pyiceberg.io.pyarrow import _to_requested_schema
+
+        key = partition_key.partition if partition_key else None
+        open_file = self._open.get(key)
+        if open_file is None:
+            open_file = self._open[key] = self._new_file(partition_key)
+        open_file.write(
+            pa.Table.from_batches(
+                [
+                    _to_requested_schema(
+                        requested_schema=self._file_schema,
+                        file_schema=self._batch_schema,
+                        batch=batch,
+                        downcast_ns_timestamp_to_us=self._downcast_ns_timestamp_to_us,
+                        include_field_ids=True,
+                    )
+                    for batch in rows.to_batches()
+                ]
+            )
+        )
+        if open_file.nbytes >= self._target_file_size:
+            self._roll(key)
+
+    def _new_file(self, partition_key: Any) -> _RollingDataFile:
+        """Open a new data file for a partition.
+
+        Args:
+            partition_key: PyIceberg PartitionKey, or None if unpartitioned.
+
+        Returns:
+            The opened file.
+        """
+        file_name = f"00000-{next(self._counter)}-{self._write_uuid}.parquet"
+        path = self._location_provider.new_data_location(
+            data_file_name=file_name, partition_key=partition_key
+        )
+        return _RollingDataFile(
+            path,
+            self._io.new_output(path),
+            partition_key,
+            self._writer_kwargs,
+            self._row_group_size,
+        )
+
+    def _roll(self, key: Any) -> None:
+        """Close a partition's open data file.
+
+        Args:
+            key: Partition record of the file (None if unpartitioned).
+        """
+        open_file = self._open.pop(key)
+        self.data_files.append(open_file.close(self._metadata, self._file_schema))
+
+
+class _IcebergStreamWriter:
+    """Internal helper class for streaming write operations.
+
+    Encapsulates writing record batch streams to Iceberg tables. Maintains
+    single-responsibility by focusing only on streaming writes.
+
+    This class is internal and should not be used directly by external consumers.
+    Use IcebergTableManager's public API instead.
+
+    Attributes:
+        _config: Manager configuration (write buffer size).
+        _log: Structured logger instance.
+
+    Example:
+        >>> # Internal usage in IcebergTableManager
+        >>> stream_writer = _IcebergStreamWriter(config)
+        >>> files_written = stream_writer.write(table, reader, None, {}, CommitStrategy.FAST_APPEND)
+    """
+
+    def __init__(self, config: IcebergTableManagerConfig | None = None) -> None:
+        """Initialize _IcebergStreamWriter.
+
+        Args:
+            config: Manager configuration. Defaults to IcebergTableManagerConfig().
+        """
+        self._config = config if config is not None else IcebergTableManagerConfig()
+        self._log = structlog.get_logger(__name__)
+
+    # =========================================================================
+    # Write Operations
+    # =========================================================================
+
+    @traced(name="iceberg.stream.write")
+    def write(
+        self,
+        table: Table,
+        batches: Any,
+        delete_filter: Any,
+        snapshot_properties: dict[str, str],
+        commit_strategy: CommitStrategy,
+    ) -> int:
+        """Write a batch stream to a table and commit it as one snapshot.
+
+        Args:
+            table: PyIceberg Table object.
+            batches: PyArrow RecordBatchReader or iterable of RecordBatches.
+            delete_filter: PyIceberg expression selecting rows the write
+                replaces, or None to append.
+            snapshot_properties: Custom properties for the snapshot summary.
+            commit_strategy: FAST_APPEND or MERGE_COMMIT for the new files.
+
+        Returns:
+            Number of data files written.
+
+        Raises:
+            ValidationError: If the batches do not share one schema, or the
+                schema is not compatible with the table schema.
+        """
+        from pyiceberg.exceptions import CommitFailedException, ValidationException
+        from pyiceberg.table import TableProperties
+        from pyiceberg.utils.properties import property_as_int
+
+        arrow_schema, stream = _batch_stream(batches)
+        if arrow_schema is None:
+            self._commit(table, [], delete_filter, snapshot_properties, commit_strategy)
+            return 0
+        _check_schema(table, arrow_schema)
+
+        target_file_size: int = property_as_int(  # type: ignore[assignment]
+            properties=table.metadata.properties,
+            property_name=TableProperties.WRITE_TARGET_FILE_SIZE_BYTES,
+            default=TableProperties.WRITE_TARGET_FILE_SIZE_BYTES_DEFAULT,
+        )
+        buffer_bytes = self._config.write_buffer_bytes
+        writer = _DataFileWriter(table, arrow_schema, target_file_size)
+        rows_written = 0
+        try:
+            for buffered in _buffered(stream, buffer_bytes):
+                writer.write(buffered)
+                rows_written += buffered.num_rows
+            data_files = writer.close()
+        except BaseException:
+            writer.abort()
+            raise
+
+        try:
+            self._commit(table, data_files, delete_filter, snapshot_properties, commit_strategy)
+        except (CommitFailedException, ValidationException):
+            # The commit did not land, so no snapshot references the files.
+            # On any other error the outcome is unknown and the files stay.
+            writer.abort()
+            raise
+
+        self._log.debug(
+            "stream_write_committed",
+            table_identifier=getattr(table, "identifier", None),
+            rows_written=rows_written,
+            files_written=len(data_files),
+            buffer_bytes=buffer_bytes,
+            target_file_size_bytes=target_file_size,
+        )
+        return len(data_files)
+
+    def _commit(
+        self,
+        table: Table,
+        data_files: list[Any],
+        delete_filter: Any,
+        snapshot_properties: dict[str, str],
+        commit_strategy: CommitStrategy,
+    ) -> None:
+        """Commit data files, replacing rows matching delete_filter if given.
+
+        Args:
+            table: PyIceberg Table object.
+            data_files: PyIceberg DataFiles to add.
+            delete_filter: PyIceberg expression, or None to append.
+            snapshot_properties: Custom properties for the snapshot summary.
+            commit_strategy: FAST_APPEND or MERGE_COMMIT for the new files.
+        """
+        with table.transaction() as transaction:
+            if delete_filter is not None:
+                transaction.delete(delete_filter, snapshot_properties=snapshot_properties)
+            if not data_files:
+                return
+            update = transaction.update_snapshot(snapshot_properties=snapshot_properties)
+            producer = (
+                update.merge_append()
+                if commit_strategy == CommitStrategy.MERGE_COMMIT
+                else update.fast_append()
+            )
+            with producer as append:
+                for data_file in data_files:
+                    append.append_data_file(data_file)
+
+
+def _check_schema(table: Table, arrow_schema: Any) -> None:
+    """Check that batches with arrow_schema can be written to a table.
+
+    Args:
+        table: PyIceberg Table object.
+        arrow_schema: PyArrow schema of the batches.
+
+    Raises:
+        ValidationError: If the schema is not compatible with the table schema.
+    """
+    from pyiceberg.io.pyarrow import _check_pyarrow_schema_compatible
+
+    try:
+        _check_pyarrow_schema_compatible(
+            table.schema(),
+            provided_schema=arrow_schema,
+            format_version=table.metadata.format_version,
+        )
+    except ValueError as e:
+        msg = f"Batch schema is not compatible with the table schema: {e}"
+        raise ValidationError(msg, field="batches") from e
+
+
+def _batch_stream(batches: Any) -> tuple[Any, Iterator[Any]]:
+    """Return the schema of a batch stream and an iterator over its batches.
+
+    A RecordBatchReader states its schema up front; for a plain iterable the
+    schema is taken from the first batch, and every later batch must match.
+
+    Args:
+        batches: PyArrow RecordBatchReader or iterable of RecordBatches.
+
+    Returns:
+        Tuple of (schema, batches). The schema is None for an empty iterable.
+    """
+    import pyarrow as pa
+
+    if isinstance(batches, pa.RecordBatchReader):
+        return batches.schema, iter(batches)
+
+    iterator = iter(batches)
+    first = next(iterator, None)
+    if first is None:
+        return None, iter(())
+    return first.schema, _same_schema(first, iterator)
+
+
+def _same_schema(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    """Yield first and then rest, checking every batch has first's schema.
+
+    Args:
+        first: First PyArrow RecordBatch of the stream.
+        rest: Remaining batches.
+
+    Yields:
+        The batches of the stream.
+
+    Raises:
+        ValidationError: If a batch has a different schema.
+    """
+    yield first
+    for batch in rest:
+        if not batch.schema.equals(first.schema):
+            msg = "All record batches in a stream must share one schema"
+            raise ValidationError(msg, field="batches")
+        yield batch
+
+
+def _buffered(batches: Iterable[Any], buffer_bytes: int) -> Iterator[Any]:
+    """Group batches into tables of about buffer_bytes each.
+
+    Args:
+        batches: Iterable of PyArrow RecordBatches sharing one schema.
+        buffer_bytes: Arrow bytes to buffer before yielding.
+
+    Yields:
+        PyArrow Tables. Only a single batch larger than buffer_bytes makes
+        a table exceed it.
+    """
+    import pyarrow as pa
+
+    buffer: list[Any] = []
+    size = 0
+    for batch in batches:
+        if batch.num_rows == 0:
+            continue
+        if buffer and size + batch.nbytes > buffer_bytes:
+            yield pa.Table.from_batches(buffer)
+            buffer, size = [], 0
+        buffer.append(batch)
+        size += batch.nbytes
+    if buffer:
+        yield pa.Table.from_batches(buffer)
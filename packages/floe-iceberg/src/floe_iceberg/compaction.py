@@ -6,7 +6,12 @@ and reduce metadata overhead.
 
 Strategies:
     - BIN_PACK: Combines small files into larger files up to target size
-    - SORT: Rewrites files sorted by specified columns
+    - SORT: Combines small files as BIN_PACK does, sorting rows by the
+      specified columns
+
+Small files are grouped per partition into groups of up to the target
+size. Groups are rewritten in parallel and committed together in one
+snapshot, retrying if the commit conflicts with a concurrent write.
 
 Note: Compaction is NOT auto-triggered. The orchestrator (Dagster) is responsible
 for scheduling when compaction should occur (FR-032).
@@ -29,16 +34,23 @@ See Also:
 
 from __future__ import annotations
 
+import itertools
+import time
+import uuid
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Protocol
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Protocol
 
 import structlog
 
-from floe_iceberg.errors import CompactionAnalysisError, CompactionError
+from floe_iceberg.errors import CommitConflictError, CompactionAnalysisError, CompactionError
 from floe_iceberg.models import CompactionStrategy, CompactionStrategyType
 
 if TYPE_CHECKING:
-    from pyiceberg.table import Table
+    import pyarrow as pa
+    from pyiceberg.manifest import DataFile
+    from pyiceberg.table import FileScanTask, Table
 
 
 logger = structlog.get_logger(__name__)
@@ -89,6 +101,380 @@ class CompactionResult:
         )
 
 
+# =============================================================================
+# Compaction Planning
+# =============================================================================
+
+# Upper bounds of the file size histogram buckets, as fractions of the target
+# file size. A last bucket counts files at or above the target size.
+SIZE_HISTOGRAM_BOUNDS: tuple[float, ...] = (1 / 64, 1 / 16, 1 / 4, 1 / 2, 1.0)
+
+
+class PartitionCompactionPlan:
+    """Compaction statistics and file groups for one partition.
+
+    Attributes:
+        spec_id: Partition spec ID of the partition's data files.
+        partition: Partition values (PyIceberg Record).
+        file_count: Number of data files.
+        total_bytes: Total size of the data files.
+        size_histogram: Data file counts per SIZE_HISTOGRAM_BOUNDS bucket,
+            followed by the count of files at or above the target size.
+        delete_ratio: Rows in delete files per data row.
+        sort_overlap: Fraction of data files whose range of the first sort
+            column overlaps another file's, or None if not estimated.
+        file_groups: Bin-packed groups of small data files to rewrite.
+    """
+
+    def __init__(
+        self,
+        spec_id: int,
+        partition: Any,
+        file_count: int = 0,
+        total_bytes: int = 0,
+        size_histogram: list[int] | None = None,
+        delete_ratio: float = 0.0,
+        sort_overlap: float | None = None,
+        file_groups: list[list[DataFile]] | None = None,
+    ) -> None:
+        """Initialize PartitionCompactionPlan.
+
+        Args:
+            spec_id: Partition spec ID.
+            partition: Partition values.
+            file_count: Number of data files.
+            total_bytes: Total size of the data files.
+            size_histogram: Data file counts per size bucket.
+            delete_ratio: Rows in delete files per data row.
+            sort_overlap: Fraction of files with overlapping sort ranges.
+            file_groups: Groups of data files to rewrite.
+        """
+        self.spec_id = spec_id
+        self.partition = partition
+        self.file_count = file_count
+        self.total_bytes = total_bytes
+        self.size_histogram = size_histogram or [0] * (len(SIZE_HISTOGRAM_BOUNDS) + 1)
+        self.delete_ratio = delete_ratio
+        self.sort_overlap = sort_overlap
+        self.file_groups = file_groups or []
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Bytes read and rewritten by compacting this partition."""
+        return sum(f.file_size_in_bytes for group in self.file_groups for f in group)
+
+    @property
+    def estimated_gain(self) -> int:
+        """Data files removed by compacting this partition."""
+        return sum(len(group) - 1 for group in self.file_groups)
+
+    @property
+    def score(self) -> float:
+        """Ranking score: files removed, weighted up by sort overlap."""
+        return self.estimated_gain * (1.0 + (self.sort_overlap or 0.0))
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"PartitionCompactionPlan(partition={self.partition}, "
+            f"file_count={self.file_count}, "
+            f"estimated_bytes={self.estimated_bytes}, "
+            f"estimated_gain={self.estimated_gain})"
+        )
+
+
+class CompactionPlan:
+    """Ranked compaction plan for one table snapshot.
+
+    Attributes:
+        snapshot_id: Snapshot the plan was built from (None for an empty table).
+        target_file_size_bytes: Target file size the groups were packed to.
+        partitions: Partition plans, highest score first.
+    """
+
+    def __init__(
+        self,
+        snapshot_id: int | None,
+        target_file_size_bytes: int,
+        partitions: list[PartitionCompactionPlan] | None = None,
+    ) -> None:
+        """Initialize CompactionPlan.
+
+        Args:
+            snapshot_id: Snapshot the plan was built from.
+            target_file_size_bytes: Target file size of the groups.
+            partitions: Partition plans, highest score first.
+        """
+        self.snapshot_id = snapshot_id
+        self.target_file_size_bytes = target_file_size_bytes
+        self.partitions = partitions or []
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Bytes read and rewritten by executing the whole plan."""
+        return sum(partition.estimated_bytes for partition in self.partitions)
+
+    @property
+    def estimated_gain(self) -> int:
+        """Data files removed by executing the whole plan."""
+        return sum(partition.estimated_gain for partition in self.partitions)
+
+    def file_groups(self, max_bytes: int | None = None) -> list[list[DataFile]]:
+        """Return file groups in rank order within a byte budget.
+
+        Args:
+            max_bytes: Budget of input bytes, or None for every group.
+                Groups are taken in order until the next one would
+                exceed the budget.
+
+        Returns:
+            File groups to rewrite.
+        """
+        groups: list[list[DataFile]] = []
+        total = 0
+        for partition in self.partitions:
+            for group in partition.file_groups:
+                size = sum(f.file_size_in_bytes for f in group)
+                if max_bytes is not None and total + size > max_bytes:
+                    return groups
+                groups.append(group)
+                total += size
+        return groups
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"CompactionPlan(snapshot_id={self.snapshot_id}, "
+            f"partitions={len(self.partitions)}, "
+            f"estimated_bytes={self.estimated_bytes}, "
+            f"estimated_gain={self.estimated_gain})"
+        )
+
+
+class CompactionPlanner:
+    """Builds a ranked compaction plan from a table's manifests.
+
+    Manifests are read concurrently. For each partition the planner
+    records a file size histogram, the ratio of deleted to data rows,
+    and, when sort columns are configured, how much files overlap on
+    the first sort column. Small files are bin-packed first-fit
+    decreasing into groups of at most the target size.
+
+    Partitions with delete files get no file groups, since rewriting
+    their data files would need the deletes applied and then dropped.
+
+    Example:
+        >>> planner = CompactionPlanner(max_workers=16)
+        >>> plan = planner.plan(table, CompactionStrategy())
+        >>> for partition in plan.partitions[:5]:
+        ...     print(partition.partition, partition.estimated_gain)
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        """Initialize CompactionPlanner.
+
+        Args:
+            max_workers: Maximum manifests read at once.
+        """
+        self._max_workers = max_workers
+        self._log = structlog.get_logger(self.__class__.__name__)
+
+    def plan(self, table: Table, strategy: CompactionStrategy) -> CompactionPlan:
+        """Plan compaction of a table's current snapshot.
+
+        Args:
+            table: PyIceberg Table to plan.
+            strategy: CompactionStrategy with the target file size and
+                optional sort columns.
+
+        Returns:
+            CompactionPlan with partitions ranked by score.
+
+        Raises:
+            CompactionAnalysisError: If the table's manifests cannot be read.
+        """
+        target = strategy.target_file_size_bytes
+        try:
+            snapshot = table.current_snapshot()
+            if snapshot is None:
+                return CompactionPlan(None, target)
+            manifests = list(snapshot.manifests(table.io))
+        except Exception as e:
+            logger.exception("Compaction planning failed")
+            raise CompactionAnalysisError(f"Cannot plan data files for compaction: {e}") from e
+
+        sort_field = _sort_field(table, strategy.sort_columns)
+        stats: dict[tuple[int, Any], _PartitionStats] = defaultdict(_PartitionStats)
+        global_deletes = False
+
+        def read_entries(manifest: Any) -> list[Any]:
+            try:
+                return list(manifest.fetch_manifest_entry(table.io, discard_deleted=True))
+            except Exception as e:
+                logger.exception("Failed to read manifest entries", manifest=str(manifest))
+                raise CompactionAnalysisError(f"Cannot read manifest entry: {e}") from e
+
+        workers = max(1, min(self._max_workers, len(manifests)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for entries in pool.map(read_entries, manifests):
+                for entry in entries:
+                    data_file = entry.data_file
+                    partition_stats = stats[(data_file.spec_id, data_file.partition)]
+                    if _is_data_file(data_file):
+                        partition_stats.add_data_file(data_file, target, sort_field)
+                    else:
+                        partition_stats.delete_records += data_file.record_count
+                        if len(data_file.partition) == 0:
+                            # Unpartitioned deletes may apply to any partition
+                            global_deletes = True
+
+        partitions = [
+            partition_stats.to_plan(spec_id, partition, target, global_deletes)
+            for (spec_id, partition), partition_stats in stats.items()
+            if partition_stats.file_count
+        ]
+        partitions.sort(key=lambda p: (-p.score, p.estimated_bytes))
+        plan = CompactionPlan(snapshot.snapshot_id, target, partitions)
+
+        self._log.debug(
+            "compaction_planned",
+            table_identifier=str(getattr(table, "identifier", "unknown")),
+            manifests_count=len(manifests),
+            partitions_count=len(partitions),
+            estimated_bytes=plan.estimated_bytes,
+            estimated_gain=plan.estimated_gain,
+        )
+        return plan
+
+
+class _PartitionStats:
+    """Accumulates one partition's data and delete files during planning."""
+
+    def __init__(self) -> None:
+        self.file_count = 0
+        self.total_bytes = 0
+        self.data_records = 0
+        self.delete_records = 0
+        self.size_histogram = [0] * (len(SIZE_HISTOGRAM_BOUNDS) + 1)
+        self.small_files: list[DataFile] = []
+        self.sort_ranges: list[tuple[Any, Any]] = []
+
+    def add_data_file(
+        self,
+        data_file: DataFile,
+        target_file_size_bytes: int,
+        sort_field: Any,
+    ) -> None:
+        """Record a data file's size, rows, and sort column range."""
+        size = data_file.file_size_in_bytes
+        self.file_count += 1
+        self.total_bytes += size
+        self.data_records += data_file.record_count
+        bucket = next(
+            (
+                index
+                for index, bound in enumerate(SIZE_HISTOGRAM_BOUNDS)
+                if size < bound * target_file_size_bytes
+            ),
+            len(SIZE_HISTOGRAM_BOUNDS),
+        )
+        self.size_histogram[bucket] += 1
+        if size < target_file_size_bytes:
+            self.small_files.append(data_file)
+        if sort_field is not None:
+            sort_range = _file_range(data_file, sort_field)
+            if sort_range is not None:
+                self.sort_ranges.append(sort_range)
+
+    def to_plan(
+        self,
+        spec_id: int,
+        partition: Any,
+        target_file_size_bytes: int,
+        global_deletes: bool,
+    ) -> PartitionCompactionPlan:
+        """Build the partition's plan, bin-packing its small files."""
+        has_deletes = global_deletes or self.delete_records > 0
+        return PartitionCompactionPlan(
+            spec_id=spec_id,
+            partition=partition,
+            file_count=self.file_count,
+            total_bytes=self.total_bytes,
+            size_histogram=self.size_histogram,
+            delete_ratio=self.delete_records / self.data_records if self.data_records else 0.0,
+            sort_overlap=_overlap_ratio(self.sort_ranges),
+            file_groups=[] if has_deletes else _bin_pack(self.small_files, target_file_size_bytes),
+        )
+
+
+def _bin_pack(files: list[DataFile], capacity: int) -> list[list[DataFile]]:
+    """Pack files first-fit decreasing into groups of at most capacity bytes.
+
+    Groups of a single file are dropped, as rewriting them would not
+    reduce the file count.
+    """
+    bins: list[tuple[int, list[DataFile]]] = []
+    for data_file in sorted(files, key=lambda f: f.file_size_in_bytes, reverse=True):
+        size = data_file.file_size_in_bytes
+        for index, (bin_size, bin_files) in enumerate(bins):
+            if bin_size + size <= capacity:
+                bin_files.append(data_file)
+                bins[index] = (bin_size + size, bin_files)
+                break
+        else:
+            bins.append((size, [data_file]))
+    return [bin_files for _, bin_files in bins if len(bin_files) > 1]
+
+
+def _overlap_ratio(ranges: list[tuple[Any, Any]]) -> float | None:
+    """Return the fraction of ranges that overlap another range."""
+    if not ranges:
+        return None
+    ranges = sorted(ranges)
+    overlapping: set[int] = set()
+    max_upper, max_index = ranges[0][1], 0
+    for index, (lower, upper) in enumerate(ranges[1:], start=1):
+        if lower <= max_upper:
+            overlapping.update((index, max_index))
+        if upper > max_upper:
+            max_upper, max_index = upper, index
+    return len(overlapping) / len(ranges)
+
+
+def _sort_field(table: Table, sort_columns: list[str] | None) -> Any:
+    """Return the schema field of the first sort column, if any."""
+    if not sort_columns:
+        return None
+    try:
+        return table.schema().find_field(sort_columns[0])
+    except ValueError:
+        return None
+
+
+def _file_range(data_file: DataFile, field: Any) -> tuple[Any, Any] | None:
+    """Return a data file's lower and upper bound of a field, if recorded."""
+    from pyiceberg.conversions import from_bytes
+
+    lower = (data_file.lower_bounds or {}).get(field.field_id)
+    upper = (data_file.upper_bounds or {}).get(field.field_id)
+    if lower is None or upper is None:
+        return None
+    return from_bytes(field.field_type, lower), from_bytes(field.field_type, upper)
+
+
+def _is_data_file(data_file: DataFile) -> bool:
+    """Check whether a manifest entry's file holds data rather than deletes."""
+    from pyiceberg.manifest import DataFileContent
+
+    return bool(data_file.content == DataFileContent.DATA)
+
+
+def _current_snapshot_id(table: Table) -> int | None:
+    """Return the ID of the table's current snapshot, if any."""
+    snapshot = table.current_snapshot()
+    return snapshot.snapshot_id if snapshot is not None else None
+
+
 # =============================================================================
 # Strategy Protocol
 # =============================================================================
@@ -101,12 +487,14 @@ class CompactionExecutor(Protocol):
         self,
         table: Table,
         strategy: CompactionStrategy,
+        plan: CompactionPlan | None = None,
     ) -> CompactionResult:
         """Execute compaction on the table.
 
         Args:
             table: PyIceberg Table to compact.
             strategy: CompactionStrategy configuration.
+            plan: Optional plan from CompactionPlanner.
 
         Returns:
             CompactionResult with rewrite statistics.
@@ -123,23 +511,47 @@ class CompactionExecutor(Protocol):
 
 
 class BaseCompactionExecutor(ABC):
-    """Base class for compaction executors."""
+    """Base class for compaction executors.
 
-    def __init__(self) -> None:
-        """Initialize base executor."""
+    Provides the shared rewrite machinery: planning bin-packed file groups,
+    rewriting groups in parallel, and committing the result as a single
+    snapshot with retry on commit conflicts.
+
+    A file group never holds more than target_file_size_bytes of data, and
+    at most max_concurrent_file_group_rewrites groups are held in memory at
+    once, which bounds the memory a compaction run needs.
+    """
+
+    def __init__(
+        self,
+        max_commit_retries: int = 3,
+        retry_base_delay_seconds: float = 1.0,
+    ) -> None:
+        """Initialize base executor.
+
+        Args:
+            max_commit_retries: Retries when the commit conflicts with a
+                concurrent change to the table.
+            retry_base_delay_seconds: Base delay for exponential backoff
+                between commit retries.
+        """
         self._log = structlog.get_logger(self.__class__.__name__)
+        self._max_commit_retries = max_commit_retries
+        self._retry_base_delay_seconds = retry_base_delay_seconds
 
     @abstractmethod
     def execute(
         self,
         table: Table,
         strategy: CompactionStrategy,
+        plan: CompactionPlan | None = None,
     ) -> CompactionResult:
         """Execute compaction strategy.
 
         Args:
             table: PyIceberg Table to compact.
             strategy: CompactionStrategy configuration.
+            plan: Optional plan from CompactionPlanner.
 
         Returns:
             CompactionResult with rewrite statistics.
@@ -149,126 +561,171 @@ class BaseCompactionExecutor(ABC):
         """
         ...
 
+    def _compact(
+        self,
+        table: Table,
+        strategy: CompactionStrategy,
+        sort_columns: list[str] | None = None,
+        plan: CompactionPlan | None = None,
+    ) -> CompactionResult:
+        """Rewrite planned file groups and commit them.
 
-class BinPackCompactionExecutor(BaseCompactionExecutor):
-    """Bin-pack compaction strategy executor.
+        File groups are taken in plan rank order until
+        strategy.max_rewrite_bytes is reached.
 
-    Combines small files into larger files up to the target file size.
-    This is the default compaction strategy for optimizing file count.
+        Args:
+            table: PyIceberg Table to compact.
+            strategy: CompactionStrategy configuration.
+            sort_columns: Columns to sort each group by, or None to keep
+                the existing row order.
+            plan: Plan from CompactionPlanner. Planned afresh if None or
+                built from an older snapshot.
 
-    Note:
-        PyIceberg 0.10.0 does not yet support native file rewriting.
-        This implementation analyzes files and logs compaction candidates,
-        returning 0 files rewritten until PyIceberg adds rewrite support.
-        When rewrite support is added, this will use table.rewrite_data_files().
+        Returns:
+            CompactionResult with rewrite statistics.
 
-    Example:
-        >>> executor = BinPackCompactionExecutor()
-        >>> strategy = CompactionStrategy(
-        ...     strategy_type=CompactionStrategyType.BIN_PACK,
-        ...     target_file_size_bytes=134217728,
-        ... )
-        >>> result = executor.execute(table, strategy)
-    """
+        Raises:
+            CompactionAnalysisError: If the table's files cannot be planned.
+            CommitConflictError: If the commit still conflicts after retries.
+            ValueError: If a sort column is not in the table schema.
+        """
+        from pyiceberg.table import FileScanTask
+
+        if plan is None or plan.snapshot_id != _current_snapshot_id(table):
+            if plan is not None:
+                self._log.info(
+                    "compaction_plan_stale",
+                    table_identifier=str(getattr(table, "identifier", "unknown")),
+                    plan_snapshot_id=plan.snapshot_id,
+                )
+            plan = CompactionPlanner().plan(table, strategy)
+        groups = [
+            [FileScanTask(data_file) for data_file in group]
+            for group in plan.file_groups(strategy.max_rewrite_bytes)
+        ]
+        if not groups:
+            return CompactionResult()
+
+        field_names = {field.name for field in table.schema().fields}
+        for column in sort_columns or []:
+            if column not in field_names:
+                msg = f"Sort column '{column}' not found in table schema"
+                raise ValueError(msg)
+
+        from pyiceberg.expressions import AlwaysTrue
+        from pyiceberg.io.pyarrow import ArrowScan
+
+        scan = ArrowScan(
+            table_metadata=table.metadata,
+            io=table.io,
+            projected_schema=table.schema(),
+            row_filter=AlwaysTrue(),
+        )
+        write_uuid = uuid.uuid4()
+        counter = itertools.count(0)
+
+        def rewrite(group: list[FileScanTask]) -> list[DataFile]:
+            rows = scan.to_table(tasks=group)
+            if sort_columns:
+                rows = rows.sort_by([(column, "ascending") for column in sort_columns])
+            return _write_group(table, rows, write_uuid, counter)
+
+        workers = min(strategy.max_concurrent_file_group_rewrites, len(groups))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rewritten = list(zip(groups, pool.map(rewrite, groups), strict=True))
+
+        committed = self._commit_with_retry(table, rewritten)
+        return CompactionResult(
+            files_rewritten=sum(len(group) for group, _ in committed),
+            bytes_rewritten=sum(
+                task.file.file_size_in_bytes for group, _ in committed for task in group
+            ),
+            files_added=sum(len(added) for _, added in committed),
+            files_removed=sum(len(group) for group, _ in committed),
+        )
 
-    def _analyze_files_for_compaction(
+    def _commit_with_retry(
         self,
         table: Table,
-        target_file_size_bytes: int,
-    ) -> tuple[int, int]:
-        """Analyze table files to find compaction candidates.
+        rewritten: list[tuple[list[FileScanTask], list[DataFile]]],
+    ) -> list[tuple[list[FileScanTask], list[DataFile]]]:
+        """Commit rewritten groups, retrying on conflicting commits.
+
+        After a conflict the table is refreshed and groups whose input files
+        were removed concurrently are dropped before retrying.
 
         Args:
-            table: PyIceberg Table to analyze.
-            target_file_size_bytes: Target file size threshold.
+            table: PyIceberg Table to commit to.
+            rewritten: (input tasks, output data files) for each group.
 
         Returns:
-            Tuple of (small_file_count, total_file_count).
+            The groups that were committed.
 
         Raises:
-            CompactionAnalysisError: If manifest access or entry reading fails.
+            CommitConflictError: If the commit still conflicts after retries.
         """
-        try:
-            # Get current snapshot's data files
-            snapshot = getattr(table, "current_snapshot", None)
-            if snapshot is None or callable(snapshot):
-                snapshot = (
-                    table.current_snapshot()
-                    if callable(getattr(table, "current_snapshot", None))
-                    else None
-                )
+        from pyiceberg.exceptions import CommitFailedException
 
-            if snapshot is None:
-                return (0, 0)
-
-            # Count files below target size
-            small_file_count = 0
-            total_file_count = 0
-
-            # Try to access manifest files
-            manifests = getattr(snapshot, "manifests", None)
-            if callable(manifests):
-                try:
-                    manifests = manifests(table.io)
-                except Exception as e:
-                    logger.exception(
-                        "Failed to access snapshot manifests",
-                        extra={"snapshot_id": getattr(snapshot, "snapshot_id", "unknown")},
-                    )
-                    raise CompactionAnalysisError(
-                        f"Cannot access manifests for snapshot: {e}"
+        table_identifier = str(getattr(table, "identifier", "unknown"))
+        for attempt in range(self._max_commit_retries + 1):
+            if not rewritten:
+                return rewritten
+            try:
+                _commit_replace(table, rewritten)
+                return rewritten
+            except CommitFailedException as e:
+                if attempt == self._max_commit_retries:
+                    raise CommitConflictError(
+                        f"Compaction commit failed after {attempt} retries: {e}",
+                        table_identifier=table_identifier,
+                        retry_count=attempt,
                     ) from e
+                self._log.warning(
+                    "compaction_commit_conflict",
+                    table_identifier=table_identifier,
+                    attempt=attempt + 1,
+                    error=str(e),
+                )
+                time.sleep(self._retry_base_delay_seconds * 2**attempt)
+                table.refresh()
+                live = {task.file.file_path for task in table.scan().plan_files()}
+                rewritten = [
+                    (group, added)
+                    for group, added in rewritten
+                    if all(task.file.file_path in live for task in group)
+                ]
+        return rewritten
 
-            if manifests:
-                for manifest in manifests:
-                    try:
-                        entries = getattr(manifest, "fetch_manifest_entry", None)
-                        if entries and callable(entries):
-                            for entry in entries(table.io):
-                                file_size = getattr(
-                                    getattr(entry, "data_file", None),
-                                    "file_size_in_bytes",
-                                    0,
-                                )
-                                total_file_count += 1
-                                if file_size < target_file_size_bytes:
-                                    small_file_count += 1
-                    except CompactionAnalysisError:
-                        raise
-                    except Exception as e:
-                        logger.exception(
-                            "Failed to read manifest entry",
-                            extra={"manifest": str(manifest)},
-                        )
-                        raise CompactionAnalysisError(f"Cannot read manifest entry: {e}") from e
-
-            return (small_file_count, total_file_count)
-
-        except CompactionAnalysisError:
-            raise
-        except Exception as e:
-            logger.exception("Compaction analysis failed unexpectedly")
-            raise CompactionAnalysisError(
-                f"Unexpected error during compaction analysis: {e}"
-            ) from e
+
+class BinPackCompactionExecutor(BaseCompactionExecutor):
+    """Bin-pack compaction strategy executor.
+
+    Combines small files into larger files up to the target file size.
+    This is the default compaction strategy for optimizing file count.
+
+    Example:
+        >>> executor = BinPackCompactionExecutor()
+        >>> strategy = CompactionStrategy(
+        ...     strategy_type=CompactionStrategyType.BIN_PACK,
+        ...     target_file_size_bytes=134217728,
+        ... )
+        >>> result = executor.execute(table, strategy)
+    """
 
     def execute(
         self,
         table: Table,
         strategy: CompactionStrategy,
+        plan: CompactionPlan | None = None,
     ) -> CompactionResult:
         """Execute bin-pack compaction.
 
         Combines small files into larger files up to target_file_size_bytes.
 
-        Note:
-            PyIceberg 0.10.0 does not support native file rewriting.
-            This method analyzes files and logs candidates, but returns
-            0 files rewritten until PyIceberg adds rewrite_data_files().
-
         Args:
             table: PyIceberg Table to compact.
             strategy: CompactionStrategy with BIN_PACK type.
+            plan: Optional plan from CompactionPlanner.
 
         Returns:
             CompactionResult with rewrite statistics.
@@ -286,54 +743,17 @@ class BinPackCompactionExecutor(BaseCompactionExecutor):
         )
 
         try:
-            # Analyze files for compaction candidates
-            small_files, total_files = self._analyze_files_for_compaction(
-                table, strategy.target_file_size_bytes
-            )
-
-            self._log.debug(
-                "bin_pack_analysis_complete",
-                table_identifier=table_identifier,
-                small_files_count=small_files,
-                total_files_count=total_files,
-            )
-
-            # PyIceberg 0.10.0 does not support rewrite_data_files() yet.
-            # When PyIceberg adds this API, implement:
-            #
-            # if hasattr(table, 'rewrite_data_files'):
-            #     result = table.rewrite_data_files(
-            #         target_size_bytes=strategy.target_file_size_bytes,
-            #         max_concurrent_rewrites=strategy.max_concurrent_file_group_rewrites,
-            #     )
-            #     files_rewritten = result.rewritten_data_files_count()
-            # else:
-            #     files_rewritten = 0
-
-            files_rewritten = 0
-
-            if small_files > 0:
-                self._log.info(
-                    "bin_pack_compaction_candidates_found",
-                    table_identifier=table_identifier,
-                    small_files_count=small_files,
-                    message="PyIceberg 0.10.0 does not support rewrite_data_files(). "
-                    "Compaction will be available when PyIceberg adds this API.",
-                )
+            result = self._compact(table, strategy, plan=plan)
 
             self._log.info(
                 "bin_pack_compaction_completed",
                 table_identifier=table_identifier,
-                files_rewritten=files_rewritten,
-                small_files_analyzed=small_files,
-                total_files_analyzed=total_files,
+                files_rewritten=result.files_rewritten,
+                bytes_rewritten=result.bytes_rewritten,
+                files_added=result.files_added,
             )
 
-            return CompactionResult(
-                files_rewritten=files_rewritten,
-                files_removed=0,
-                files_added=0,
-            )
+            return result
 
         except Exception as e:
             self._log.error(
@@ -352,7 +772,9 @@ class SortCompactionExecutor(BaseCompactionExecutor):
     """Sort compaction strategy executor.
 
     Rewrites data files sorted by specified columns to optimize
-    query performance for common access patterns.
+    query performance for common access patterns. Files are grouped
+    as for bin-pack compaction, and each group is sorted as it is
+    rewritten.
 
     Example:
         >>> executor = SortCompactionExecutor()
@@ -367,6 +789,7 @@ class SortCompactionExecutor(BaseCompactionExecutor):
         self,
         table: Table,
         strategy: CompactionStrategy,
+        plan: CompactionPlan | None = None,
     ) -> CompactionResult:
         """Execute sort compaction.
 
@@ -375,6 +798,7 @@ class SortCompactionExecutor(BaseCompactionExecutor):
         Args:
             table: PyIceberg Table to compact.
             strategy: CompactionStrategy with SORT type and sort_columns.
+            plan: Optional plan from CompactionPlanner.
 
         Returns:
             CompactionResult with rewrite statistics.
@@ -399,38 +823,17 @@ class SortCompactionExecutor(BaseCompactionExecutor):
         )
 
         try:
-            # TODO(epic-future): Implement SORT compaction when PyIceberg supports it
-            #
-            # Context: SORT compaction reorders data within files to optimize for
-            # query patterns (e.g., sorting by timestamp for time-range queries).
-            # PyIceberg rewrite_data_files() doesn't yet support custom sort orders.
-            #
-            # Scope: Implement when PyIceberg adds SortOrder support to rewrite_data_files()
-            # or when a workaround via scan+write is validated for production use.
-            #
-            # Priority: Low - BINPACK strategy covers most use cases. SORT is an
-            # optimization for specific query patterns.
-            #
-            # Tracking: https://github.com/apache/iceberg-python/issues/XXX (upstream)
-            #
-            # Implementation approach when ready:
-            #   sort_order = SortOrder(*[SortField(col) for col in strategy.sort_columns])
-            #   result = table.rewrite_data_files(
-            #       target_size_bytes=strategy.target_file_size_bytes,
-            #       sort_order=sort_order,
-            #   )
-
-            files_rewritten = 0
+            result = self._compact(table, strategy, sort_columns=strategy.sort_columns, plan=plan)
 
             self._log.info(
                 "sort_compaction_completed",
                 table_identifier=table_identifier,
-                files_rewritten=files_rewritten,
+                files_rewritten=result.files_rewritten,
+                bytes_rewritten=result.bytes_rewritten,
+                files_added=result.files_added,
             )
 
-            return CompactionResult(
-                files_rewritten=files_rewritten,
-            )
+            return result
 
         except CompactionError:
             raise
@@ -447,6 +850,80 @@ class SortCompactionExecutor(BaseCompactionExecutor):
             ) from e
 
 
+# =============================================================================
+# Rewrite Helpers
+# =============================================================================
+
+
+def _write_group(
+    table: Table,
+    rows: pa.Table,
+    write_uuid: uuid.UUID,
+    counter: itertools.count[int],
+) -> list[DataFile]:
+    """Write a rewritten file group as new data files.
+
+    The group was bin-packed to the target size on disk, so it is written
+    as a single file per partition rather than split by the table's
+    in-memory write.target-file-size-bytes.
+
+    Args:
+        table: PyIceberg Table being compacted.
+        rows: Rows of the group.
+        write_uuid: UUID shared by all files written in this compaction.
+        counter: Counter numbering files written in this compaction.
+
+    Returns:
+        The written data files.
+    """
+    from pyiceberg.io.pyarrow import _dataframe_to_data_files
+    from pyiceberg.table import TableProperties
+
+    metadata = table.metadata
+    metadata = metadata.model_copy(
+        update={
+            "properties": {
+                **metadata.properties,
+                TableProperties.WRITE_TARGET_FILE_SIZE_BYTES: str(rows.nbytes + 1),
+            }
+        }
+    )
+    return list(
+        _dataframe_to_data_files(
+            table_metadata=metadata,
+            df=rows,
+            io=table.io,
+            write_uuid=write_uuid,
+            counter=counter,
+        )
+    )
+
+
+def _commit_replace(
+    table: Table,
+    rewritten: list[tuple[list[FileScanTask], list[DataFile]]],
+) -> None:
+    """Swap input files for rewritten files in one overwrite snapshot.
+
+    PyIceberg has no rewrite-files API and cannot summarize REPLACE
+    snapshots, so the swap is committed through its overwrite producer.
+
+    Args:
+        table: PyIceberg Table to commit to.
+        rewritten: (input tasks, output data files) for each group.
+
+    Raises:
+        CommitFailedException: If the table changed concurrently.
+    """
+    with table.transaction() as transaction:
+        with transaction.update_snapshot().overwrite() as rewrite:
+            for group, added in rewritten:
+                for task in group:
+                    rewrite.delete_data_file(task.file)
+                for data_file in added:
+                    rewrite.append_data_file(data_file)
+
+
 # =============================================================================
 # Executor Factory
 # =============================================================================
@@ -454,11 +931,17 @@ class SortCompactionExecutor(BaseCompactionExecutor):
 
 def get_compaction_executor(
     strategy_type: CompactionStrategyType,
+    *,
+    max_commit_retries: int = 3,
+    retry_base_delay_seconds: float = 1.0,
 ) -> BaseCompactionExecutor:
     """Get the appropriate compaction executor for the strategy type.
 
     Args:
         strategy_type: CompactionStrategyType enum value.
+        max_commit_retries: Retries when the commit conflicts with a
+            concurrent change to the table.
+        retry_base_delay_seconds: Base delay for exponential backoff.
 
     Returns:
         Compaction executor instance.
@@ -481,7 +964,10 @@ def get_compaction_executor(
         msg = f"Unsupported compaction strategy: {strategy_type}"
         raise ValueError(msg)
 
-    return executor_class()
+    return executor_class(
+        max_commit_retries=max_commit_retries,
+        retry_base_delay_seconds=retry_base_delay_seconds,
+    )
 
 
 # =============================================================================
@@ -492,6 +978,10 @@ def get_compaction_executor(
 def execute_compaction(
     table: Table,
     strategy: CompactionStrategy,
+    *,
+    plan: CompactionPlan | None = None,
+    max_commit_retries: int = 3,
+    retry_base_delay_seconds: float = 1.0,
 ) -> CompactionResult:
     """Execute compaction on an Iceberg table.
 
@@ -501,6 +991,11 @@ def execute_compaction(
     Args:
         table: PyIceberg Table to compact.
         strategy: CompactionStrategy configuration.
+        plan: Plan from CompactionPlanner to consume. The table is planned
+            afresh if None or if the plan is from an older snapshot.
+        max_commit_retries: Retries when the commit conflicts with a
+            concurrent change to the table.
+        retry_base_delay_seconds: Base delay for exponential backoff.
 
     Returns:
         CompactionResult with rewrite statistics.
@@ -519,14 +1014,27 @@ def execute_compaction(
         ... )
         >>> result = execute_compaction(table, strategy)
         >>> print(f"Rewrote {result.files_rewritten} files")
+
+        >>> # Rewrite the most valuable 10GB of a large plan per run
+        >>> plan = CompactionPlanner().plan(table, strategy)
+        >>> strategy = strategy.model_copy(update={"max_rewrite_bytes": 10 * 1024**3})
+        >>> result = execute_compaction(table, strategy, plan=plan)
     """
-    executor = get_compaction_executor(strategy.strategy_type)
-    return executor.execute(table, strategy)
+    executor = get_compaction_executor(
+        strategy.strategy_type,
+        max_commit_retries=max_commit_retries,
+        retry_base_delay_seconds=retry_base_delay_seconds,
+    )
+    return executor.execute(table, strategy, plan=plan)
 
 
 __all__ = [
     "CompactionAnalysisError",
     "CompactionResult",
+    "CompactionPlan",
+    "CompactionPlanner",
+    "PartitionCompactionPlan",
+    "SIZE_HISTOGRAM_BOUNDS",
     "CompactionExecutor",
     "BaseCompactionExecutor",
     "BinPackCompactionExecutor",
@@ -33,8 +33,10 @@ import structlog
 
 from floe_iceberg._compaction_manager import _IcebergCompactionManager
 from floe_iceberg._lifecycle import _IcebergTableLifecycle
+from floe_iceberg._merge_manager import _IcebergMergeManager
 from floe_iceberg._schema_manager import _IcebergSchemaManager
 from floe_iceberg._snapshot_manager import _IcebergSnapshotManager
+from floe_iceberg._stream_writer import _IcebergStreamWriter
 from floe_iceberg.errors import (
     NoSuchNamespaceError,
     ValidationError,
@@ -42,6 +44,7 @@ from floe_iceberg.errors import (
 from floe_iceberg.models import (
     CompactionStrategy,
     IcebergTableManagerConfig,
+    MergeResult,
     SchemaEvolution,
     SnapshotInfo,
     TableConfig,
@@ -70,7 +73,7 @@ class IcebergTableManager:
     Wraps PyIceberg complexity with a consistent API for:
     - Table creation with schema and partitioning
     - Schema evolution (add/rename/widen columns)
-    - Data writes (append, overwrite, upsert)
+    - Data writes (append, overwrite, upsert), materialized or streamed
     - Snapshot management (list, rollback, expire)
     - Table compaction
 
@@ -153,7 +156,9 @@ class IcebergTableManager:
         )
         self._schema_manager = _IcebergSchemaManager(self._catalog_plugin)
         self._snapshot_manager = _IcebergSnapshotManager(self._config)
-        self._compaction_manager = _IcebergCompactionManager()
+        self._compaction_manager = _IcebergCompactionManager(self._config)
+        self._merge_manager = _IcebergMergeManager()
+        self._stream_writer = _IcebergStreamWriter(self._config)
 
         self._log.info(
             "iceberg_table_manager_initialized",
@@ -582,7 +587,8 @@ class IcebergTableManager:
             The updated Table object with new snapshot.
 
         Raises:
-            ValidationError: If join_columns don't exist in schema (UPSERT mode).
+            ValidationError: If join_columns don't exist in schema (UPSERT mode),
+                or overwrite_filter is not a valid expression (OVERWRITE mode).
             CommitConflictError: If commit fails after max retries.
 
         Example:
@@ -613,17 +619,6 @@ class IcebergTableManager:
             row_count=len(data) if hasattr(data, "__len__") else "unknown",
         )
 
-        # Validate join_columns for UPSERT mode
-        if config.mode == WriteMode.UPSERT and config.join_columns:
-            # Get field names from PyIceberg table schema
-            schema = table.schema()
-            field_names = {field.name for field in schema.fields}
-
-            for col in config.join_columns:
-                if col not in field_names:
-                    msg = f"Join column '{col}' not found in table schema"
-                    raise ValidationError(msg)
-
         # Dispatch to appropriate write handler based on mode
         if config.mode == WriteMode.APPEND:
             result = self._write_append(table, data, config)
@@ -643,6 +638,97 @@ class IcebergTableManager:
 
         return result
 
+    @traced(
+        name="iceberg.write_batches",
+    )
+    def write_batches(
+        self,
+        table: Table,
+        batches: Any,  # PyArrow RecordBatchReader or Iterable[RecordBatch]
+        config: WriteConfig,
+    ) -> Table:
+        """Write a stream of record batches to an Iceberg table.
+
+        Unlike write_data(), the data is never materialized as a whole.
+        Batches are buffered up to config write_buffer_bytes, then written
+        to one open data file per partition, which is closed and replaced
+        once it reaches the table's write.target-file-size-bytes. All data
+        files are committed as one snapshot after the stream is exhausted;
+        if the stream or the commit fails, the files written are deleted.
+
+        Supports APPEND and OVERWRITE (with an optional overwrite_filter).
+        UPSERT needs every source key at once; use write_data() for it.
+
+        Delegates to _IcebergStreamWriter helper (T034 facade pattern).
+
+        Args:
+            table: The Iceberg table to write to.
+            batches: PyArrow RecordBatchReader, or an iterable of RecordBatches
+                that share one schema.
+            config: Write configuration (mode, commit strategy, etc.).
+
+        Returns:
+            The updated Table object with new snapshot.
+
+        Raises:
+            ValidationError: If mode is UPSERT, overwrite_filter is not a valid
+                expression, or the batches' schema does not match the table.
+            CommitFailedException: If the commit still conflicts after
+                PyIceberg's commit retries.
+
+        Example:
+            >>> reader = duckdb_conn.execute(query).fetch_record_batch()
+            >>> table = manager.write_batches(table, reader, WriteConfig())
+        """
+        from opentelemetry import trace
+        from pyiceberg.expressions import AlwaysTrue
+
+        if config.mode == WriteMode.UPSERT:
+            msg = "UPSERT is not supported for streaming writes; use write_data()"
+            raise ValidationError(msg, field="mode", value=config.mode.value)
+
+        delete_filter: Any = None
+        if config.mode == WriteMode.OVERWRITE:
+            delete_filter = (
+                AlwaysTrue()
+                if config.overwrite_filter is None
+                else self._parse_overwrite_filter(config.overwrite_filter)
+            )
+
+        span = trace.get_current_span()
+        span.set_attribute("table.identifier", getattr(table, "identifier", "unknown"))
+        span.set_attribute("write.mode", config.mode.value)
+        span.set_attribute("commit.strategy", config.commit_strategy.value)
+
+        self._log.debug(
+            "write_batches_requested",
+            table_identifier=getattr(table, "identifier", None),
+            mode=config.mode.value,
+            commit_strategy=config.commit_strategy.value,
+            buffer_bytes=self._config.write_buffer_bytes,
+        )
+
+        files_written = self._stream_writer.write(
+            table,
+            batches,
+            delete_filter,
+            dict(config.snapshot_properties),
+            config.commit_strategy,
+        )
+        span.set_attribute("files.added", files_written)
+
+        if hasattr(table, "refresh"):
+            table.refresh()
+
+        self._log.info(
+            "write_batches_completed",
+            table_identifier=getattr(table, "identifier", None),
+            mode=config.mode.value,
+            files_written=files_written,
+        )
+
+        return table
+
     def _write_append(
         self,
         table: Table,
@@ -691,6 +777,16 @@ class IcebergTableManager:
     ) -> Table:
         """Overwrite data in table (internal helper).
 
+        Without an overwrite_filter the whole table is replaced. With one,
+        only rows matching the filter are replaced:
+
+        - If every data file the filter touches lies in a partition the
+          filter matches entirely, those files are dropped from metadata
+          and the new data appended in one transaction. No existing data
+          is read.
+        - Otherwise PyIceberg deletes matching files and rewrites only the
+          files that also hold rows outside the filter.
+
         Args:
             table: The Iceberg table.
             data: PyArrow Table with replacement data.
@@ -698,15 +794,38 @@ class IcebergTableManager:
 
         Returns:
             Updated table with new snapshot.
+
+        Raises:
+            ValidationError: If overwrite_filter is not a valid expression.
         """
+        from opentelemetry import trace
+
         self._log.debug(
             "write_overwrite_started",
             table_identifier=getattr(table, "identifier", None),
             has_filter=config.overwrite_filter is not None,
         )
 
-        # Use PyIceberg overwrite API
-        table.overwrite(data)
+        partition_aligned = False
+        files_replaced = 0
+        if config.overwrite_filter is None:
+            # Use PyIceberg overwrite API
+            table.overwrite(data)
+        else:
+            overwrite_filter = self._parse_overwrite_filter(config.overwrite_filter)
+            replaced_files = self._partition_aligned_files(table, overwrite_filter)
+            if replaced_files is None:
+                table.overwrite(
+                    data,
+                    overwrite_filter=overwrite_filter,
+                    snapshot_properties=dict(config.snapshot_properties),
+                )
+            else:
+                partition_aligned = True
+                files_replaced = len(replaced_files)
+                self._replace_partition_files(table, data, replaced_files, config)
+
+        trace.get_current_span().set_attribute("write.partition_aligned", partition_aligned)
 
         # Refresh to get latest snapshot
         if hasattr(table, "refresh"):
@@ -719,10 +838,97 @@ class IcebergTableManager:
             "write_overwrite_completed",
             table_identifier=getattr(table, "identifier", None),
             snapshot_id=snapshot_id,
+            partition_aligned=partition_aligned,
+            files_replaced=files_replaced,
         )
 
         return table
 
+    def _parse_overwrite_filter(self, overwrite_filter: str) -> Any:
+        """Parse an overwrite filter string into a PyIceberg expression.
+
+        Args:
+            overwrite_filter: Filter such as "date = '2024-01-01'".
+
+        Returns:
+            PyIceberg BooleanExpression.
+
+        Raises:
+            ValidationError: If the filter cannot be parsed.
+        """
+        from pyiceberg.expressions.parser import parse
+        from pyparsing import ParseException
+
+        try:
+            return parse(overwrite_filter)
+        except (ParseException, ValueError) as e:
+            msg = f"Invalid overwrite_filter: {overwrite_filter!r}"
+            raise ValidationError(msg, field="overwrite_filter", value=overwrite_filter) from e
+
+    def _partition_aligned_files(self, table: Table, overwrite_filter: Any) -> list[Any] | None:
+        """Find the data files an overwrite can drop without reading them.
+
+        Plans the files the filter may touch (manifests only) and checks
+        each file's partition against the strict projection of the filter
+        onto the current partition spec. A file whose partition strictly
+        matches holds only rows the filter matches.
+
+        Args:
+            table: The Iceberg table.
+            overwrite_filter: Parsed overwrite filter.
+
+        Returns:
+            Data files to drop, or None if the filter does not align with
+            the partition spec and rows must be filtered file by file.
+        """
+        from pyiceberg.expressions.visitors import expression_evaluator, strict_projection
+        from pyiceberg.schema import Schema
+
+        spec = table.spec()
+        if spec.is_unpartitioned():
+            return None
+
+        schema = table.schema()
+        strict_filter = strict_projection(schema, spec)(overwrite_filter)
+        partition_schema = Schema(*spec.partition_type(schema).fields)
+        matches_partition = expression_evaluator(partition_schema, strict_filter, True)
+
+        files = []
+        for task in table.scan(row_filter=overwrite_filter).plan_files():
+            # Files written under an older spec, or with row-level deletes,
+            # cannot be judged by their partition alone
+            if task.delete_files or task.file.spec_id != spec.spec_id:
+                return None
+            if not matches_partition(task.file.partition):
+                return None
+            files.append(task.file)
+        return files
+
+    def _replace_partition_files(
+        self,
+        table: Table,
+        data: Any,
+        replaced_files: list[Any],
+        config: WriteConfig,
+    ) -> None:
+        """Drop whole data files and append replacement data atomically.
+
+        Args:
+            table: The Iceberg table.
+            data: PyArrow Table with replacement data.
+            replaced_files: Data files from _partition_aligned_files().
+            config: Write configuration.
+        """
+        snapshot_properties = dict(config.snapshot_properties)
+        with table.transaction() as transaction:
+            if replaced_files:
+                with transaction.update_snapshot(
+                    snapshot_properties=snapshot_properties
+                ).overwrite() as overwrite:
+                    for data_file in replaced_files:
+                        overwrite.delete_data_file(data_file)
+            transaction.append(data, snapshot_properties=snapshot_properties)
+
     def _write_upsert(
         self,
         table: Table,
@@ -740,45 +946,95 @@ class IcebergTableManager:
 
         Returns:
             Updated table with new snapshot.
+
+        Raises:
+            ValidationError: If data holds more than one row for a key.
         """
-        self._log.debug(
-            "write_upsert_started",
-            table_identifier=getattr(table, "identifier", None),
-            join_columns=config.join_columns,
+        self.merge_data(
+            table,
+            data,
+            config.join_columns or [],
+            snapshot_properties=config.snapshot_properties,
         )
+        return table
 
-        # Note: PyIceberg doesn't have native MERGE/UPSERT.
-        # For production upsert, use:
-        # - dbt incremental models with merge strategy
-        # - Spark DataFrame.merge() operations
-        # - Flink Iceberg sink with upsert mode
-        #
-        # This implementation uses overwrite as a fallback, which replaces
-        # the entire table contents. For large tables, prefer compute-layer
-        # merge operations via dbt or Spark.
-        self._log.warning(
-            "upsert_using_overwrite_fallback",
+    @traced(
+        name="iceberg.merge_data",
+    )
+    def merge_data(
+        self,
+        table: Table,
+        data: Any,  # PyArrow Table
+        join_columns: list[str],
+        snapshot_properties: dict[str, str] | None = None,
+    ) -> MergeResult:
+        """Merge data into a table by key (UPSERT) and report what changed.
+
+        Only data files whose partition values and column statistics admit a
+        source key are read. Files holding rows that changed are rewritten
+        without those rows (copy-on-write), and the updated and inserted rows
+        are added, all in one overwrite snapshot. Source rows identical to
+        their table row cause no write.
+
+        Delegates to _IcebergMergeManager helper (T034 facade pattern).
+
+        Args:
+            table: The Iceberg table to merge into.
+            data: PyArrow Table with at most one row per key.
+            join_columns: Columns identifying a row.
+            snapshot_properties: Custom properties for the snapshot summary.
+
+        Returns:
+            MergeResult with rows inserted, updated, and unchanged.
+
+        Raises:
+            ValidationError: If a join column is missing from the table schema,
+                or data holds more than one row for a key.
+            CommitConflictError: If commit fails after max retries.
+
+        Example:
+            >>> result = manager.merge_data(table, data, join_columns=["id"])
+            >>> result.rows_updated
+            3
+        """
+        from opentelemetry import trace
+
+        # Get field names from PyIceberg table schema
+        field_names = {field.name for field in table.schema().fields}
+        for col in join_columns:
+            if col not in field_names:
+                msg = f"Join column '{col}' not found in table schema"
+                raise ValidationError(msg)
+
+        self._log.debug(
+            "merge_data_started",
             table_identifier=getattr(table, "identifier", None),
-            message="PyIceberg lacks native MERGE; using overwrite fallback",
+            join_columns=join_columns,
         )
 
-        # Use overwrite as fallback (replaces all data)
-        table.overwrite(data)
-
-        # Refresh to get latest snapshot
-        if hasattr(table, "refresh"):
-            table.refresh()
+        result = self._merge_manager.merge(
+            table, data, join_columns, dict(snapshot_properties or {})
+        )
 
-        current_snapshot = table.current_snapshot()
-        snapshot_id = current_snapshot.snapshot_id if current_snapshot else 0
+        span = trace.get_current_span()
+        span.set_attribute("merge.rows_inserted", result.rows_inserted)
+        span.set_attribute("merge.rows_updated", result.rows_updated)
+        span.set_attribute("merge.rows_unchanged", result.rows_unchanged)
+        span.set_attribute("merge.files_scanned", result.files_scanned)
+        span.set_attribute("merge.files_rewritten", result.files_rewritten)
 
         self._log.debug(
-            "write_upsert_completed",
+            "merge_data_completed",
             table_identifier=getattr(table, "identifier", None),
-            snapshot_id=snapshot_id,
+            snapshot_id=result.snapshot_id,
+            rows_inserted=result.rows_inserted,
+            rows_updated=result.rows_updated,
+            rows_unchanged=result.rows_unchanged,
+            files_scanned=result.files_scanned,
+            files_rewritten=result.files_rewritten,
         )
 
-        return table
+        return result
 
     # =========================================================================
     # Compaction Operations
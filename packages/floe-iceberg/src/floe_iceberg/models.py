@@ -985,7 +985,8 @@ class WriteConfig(BaseModel):
     Attributes:
         mode: Write mode (APPEND, OVERWRITE, UPSERT).
         commit_strategy: How to commit changes (FAST_APPEND, MERGE_COMMIT).
-        overwrite_filter: Optional filter expression for OVERWRITE mode.
+        overwrite_filter: Optional row filter for OVERWRITE mode. Only rows
+            matching it are replaced; None replaces the whole table.
         join_columns: Columns to use for UPSERT merge (required for UPSERT).
         snapshot_properties: Custom properties to add to snapshot summary.
 
@@ -1014,7 +1015,10 @@ class WriteConfig(BaseModel):
     )
     overwrite_filter: str | None = Field(
         default=None,
-        description="Filter expression for OVERWRITE mode (e.g., 'date = 2024-01-01')",
+        description=(
+            "Row filter for OVERWRITE mode in PyIceberg syntax (e.g., \"date = '2024-01-01'\"); "
+            "only matching rows are replaced"
+        ),
     )
     join_columns: list[str] | None = Field(
         default=None,
@@ -1041,6 +1045,56 @@ class WriteConfig(BaseModel):
         return self
 
 
+class MergeResult(BaseModel):
+    """Outcome of an UPSERT merge.
+
+    Attributes:
+        rows_inserted: Source rows whose key matched no table row.
+        rows_updated: Source rows that replaced a table row with different values.
+        rows_unchanged: Source rows identical to the table row they matched.
+        files_scanned: Candidate data files read after pruning.
+        files_rewritten: Data files replaced because they held updated rows.
+        snapshot_id: Snapshot created by the merge (None if nothing changed).
+
+    Example:
+        >>> result = manager.merge_data(table, data, join_columns=["id"])
+        >>> result.rows_inserted, result.rows_updated, result.rows_unchanged
+        (10, 3, 987)
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    rows_inserted: int = Field(
+        default=0,
+        ge=0,
+        description="Source rows whose key matched no table row",
+    )
+    rows_updated: int = Field(
+        default=0,
+        ge=0,
+        description="Source rows that replaced a table row with different values",
+    )
+    rows_unchanged: int = Field(
+        default=0,
+        ge=0,
+        description="Source rows identical to the table row they matched",
+    )
+    files_scanned: int = Field(
+        default=0,
+        ge=0,
+        description="Candidate data files read after pruning",
+    )
+    files_rewritten: int = Field(
+        default=0,
+        ge=0,
+        description="Data files replaced because they held updated rows",
+    )
+    snapshot_id: int | None = Field(
+        default=None,
+        description="Snapshot created by the merge (None if nothing changed)",
+    )
+
+
 # =============================================================================
 # Compaction Configuration Models
 # =============================================================================
@@ -1066,6 +1120,8 @@ class CompactionStrategy(BaseModel):
         target_file_size_bytes: Target size for output files (default 128MB).
         sort_columns: Columns to sort by (required for SORT strategy).
         max_concurrent_file_group_rewrites: Maximum parallel rewrite tasks.
+        max_rewrite_bytes: Maximum input bytes rewritten per run (None for
+            no limit). The highest-ranked file groups are rewritten first.
 
     Example:
         >>> # Bin-pack strategy (default)
@@ -1112,6 +1168,13 @@ class CompactionStrategy(BaseModel):
         description="Maximum concurrent file group rewrites",
     )
 
+    # Budget per run
+    max_rewrite_bytes: int | None = Field(
+        default=None,
+        ge=1048576,  # 1MB minimum
+        description="Maximum input bytes rewritten per run (None for no limit)",
+    )
+
     @model_validator(mode="after")
     def validate_sort_requires_columns(self) -> CompactionStrategy:
         """Validate that sort_columns is provided when strategy_type is SORT.
@@ -1145,6 +1208,8 @@ class IcebergTableManagerConfig(BaseModel):
         default_retention_days: Default snapshot retention in days (1-365).
         min_snapshots_to_keep: Minimum snapshots to preserve (1-100).
         default_commit_strategy: Default commit strategy for writes.
+        write_buffer_bytes: Arrow bytes a streaming write buffers before
+            writing them to data files (at least 1MB).
         default_table_properties: Default table properties for new tables.
 
     Example:
@@ -1191,6 +1256,11 @@ class IcebergTableManagerConfig(BaseModel):
         default=CommitStrategy.FAST_APPEND,
         description="Default commit strategy for writes",
     )
+    write_buffer_bytes: int = Field(
+        default=67108864,  # 64MB
+        ge=1048576,  # 1MB minimum
+        description="Arrow bytes a streaming write buffers before writing them to data files",
+    )
 
     # Table creation defaults
     default_table_properties: dict[str, str] = Field(
@@ -1337,6 +1407,7 @@ __all__ = [
     "SnapshotInfo",
     # Write configuration
     "WriteConfig",
+    "MergeResult",
     # Compaction configuration
     "CompactionStrategy",
     # Configuration models
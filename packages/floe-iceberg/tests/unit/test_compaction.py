@@ -5,7 +5,8 @@ T093: Tests for compaction.py module including strategy pattern and executors.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -128,92 +129,162 @@ class TestBinPackCompactionExecutor:
         result = executor.execute(mock_table, strategy)
         assert isinstance(result, CompactionResult)
 
+
+# =============================================================================
+# CompactionPlanner Tests
+# =============================================================================
+
+
+def _manifest_entry(path: str, size: int, partition: str, *, deletes: bool = False) -> MagicMock:
+    """Create a mock manifest entry for a data or delete file."""
+    from pyiceberg.manifest import DataFileContent
+
+    entry = MagicMock()
+    entry.data_file.content = DataFileContent.POSITION_DELETES if deletes else DataFileContent.DATA
+    entry.data_file.file_path = path
+    entry.data_file.file_size_in_bytes = size
+    entry.data_file.record_count = 10
+    entry.data_file.spec_id = 0
+    entry.data_file.partition = (partition,)
+    return entry
+
+
+def _table_with_entries(*manifests: list[MagicMock]) -> MagicMock:
+    """Create a mock table whose snapshot has one manifest per entry list."""
+    mock_table = MagicMock()
+    mock_manifests = []
+    for entries in manifests:
+        mock_manifest = MagicMock()
+        mock_manifest.fetch_manifest_entry.return_value = entries
+        mock_manifests.append(mock_manifest)
+    mock_table.current_snapshot.return_value.manifests.return_value = mock_manifests
+    return mock_table
+
+
+class TestCompactionPlanner:
+    """Tests for CompactionPlanner."""
+
     @pytest.mark.requirement("FR-031")
-    def test_analyze_files_for_compaction_with_no_snapshot(self) -> None:
-        """Test file analysis when table has no snapshot."""
-        from floe_iceberg.compaction import BinPackCompactionExecutor
+    def test_plan_with_no_snapshot(self) -> None:
+        """Test planning when table has no snapshot."""
+        from floe_iceberg.compaction import CompactionPlanner
+        from floe_iceberg.models import CompactionStrategy
 
-        executor = BinPackCompactionExecutor()
         mock_table = MagicMock()
         mock_table.current_snapshot = MagicMock(return_value=None)
 
-        small_files, total_files = executor._analyze_files_for_compaction(
-            mock_table, target_file_size_bytes=134217728
-        )
+        plan = CompactionPlanner().plan(mock_table, CompactionStrategy())
 
-        assert small_files == 0
-        assert total_files == 0
+        assert plan.snapshot_id is None
+        assert plan.partitions == []
+        assert plan.file_groups() == []
 
     @pytest.mark.requirement("FR-031")
-    def test_analyze_files_raises_on_unexpected_error(self) -> None:
-        """Test file analysis raises CompactionAnalysisError on unexpected error."""
-        from floe_iceberg.compaction import BinPackCompactionExecutor
+    def test_plan_raises_on_unexpected_error(self) -> None:
+        """Test planning raises CompactionAnalysisError on unexpected error."""
+        from floe_iceberg.compaction import CompactionPlanner
         from floe_iceberg.errors import CompactionAnalysisError
+        from floe_iceberg.models import CompactionStrategy
 
-        executor = BinPackCompactionExecutor()
         mock_table = MagicMock()
         # Make current_snapshot raise an exception
         mock_table.current_snapshot.side_effect = Exception("Test error")
 
-        with pytest.raises(CompactionAnalysisError, match="Unexpected error"):
-            executor._analyze_files_for_compaction(mock_table, target_file_size_bytes=134217728)
+        with pytest.raises(CompactionAnalysisError, match="Cannot plan data files"):
+            CompactionPlanner().plan(mock_table, CompactionStrategy())
 
     @pytest.mark.requirement("FR-031")
-    def test_analyze_files_raises_on_manifest_access_failure(self) -> None:
-        """Test file analysis raises CompactionAnalysisError when manifest access fails.
-
-        The code calls snapshot.manifests(table.io) to list manifest files.
-        When this call raises, it should be wrapped in CompactionAnalysisError.
-        """
-        from floe_iceberg.compaction import BinPackCompactionExecutor
+    def test_plan_raises_on_manifest_read_failure(self) -> None:
+        """Test planning raises CompactionAnalysisError when a manifest cannot be read."""
+        from floe_iceberg.compaction import CompactionPlanner
         from floe_iceberg.errors import CompactionAnalysisError
+        from floe_iceberg.models import CompactionStrategy
 
-        executor = BinPackCompactionExecutor()
-        mock_table = MagicMock()
-        mock_snapshot = MagicMock()
-        # manifests is callable and raises when invoked with table.io
-        mock_snapshot.manifests.side_effect = Exception("Connection refused")
-        mock_table.current_snapshot.return_value = mock_snapshot
+        mock_table = _table_with_entries([])
+        manifest = mock_table.current_snapshot.return_value.manifests.return_value[0]
+        manifest.fetch_manifest_entry.side_effect = Exception("Corrupt manifest")
 
-        with pytest.raises(CompactionAnalysisError, match="Cannot access manifests"):
-            executor._analyze_files_for_compaction(mock_table, target_file_size_bytes=134217728)
+        with pytest.raises(CompactionAnalysisError, match="Cannot read manifest entry"):
+            CompactionPlanner().plan(mock_table, CompactionStrategy())
 
     @pytest.mark.requirement("FR-031")
-    def test_analyze_files_raises_on_entry_read_failure(self) -> None:
-        """Test file analysis raises CompactionAnalysisError when entry reading fails."""
-        from floe_iceberg.compaction import BinPackCompactionExecutor
-        from floe_iceberg.errors import CompactionAnalysisError
+    def test_plan_bin_packs_and_ranks_partitions(self) -> None:
+        """Test small files are packed per partition and partitions ranked by gain."""
+        from floe_iceberg.compaction import CompactionPlanner
+        from floe_iceberg.models import CompactionStrategy
 
-        executor = BinPackCompactionExecutor()
-        mock_table = MagicMock()
-        mock_snapshot = MagicMock()
-        mock_manifest = MagicMock()
-        # Make fetch_manifest_entry raise when called
-        mock_manifest.fetch_manifest_entry.side_effect = Exception("Corrupt manifest")
-        mock_snapshot.manifests.return_value = [mock_manifest]
-        mock_table.current_snapshot.return_value = mock_snapshot
+        mb = 1024 * 1024
+        mock_table = _table_with_entries(
+            [
+                _manifest_entry("a", 6 * mb, "eu"),
+                _manifest_entry("b", 5 * mb, "eu"),
+                _manifest_entry("e", 15 * mb, "eu"),  # Already at target size
+                _manifest_entry("f", 1 * mb, "us"),
+                _manifest_entry("g", 1 * mb, "us"),
+            ],
+            [
+                _manifest_entry("c", 4 * mb, "eu"),
+                _manifest_entry("d", 3 * mb, "eu"),
+                _manifest_entry("h", 1 * mb, "apac"),  # Alone in its partition
+            ],
+        )
 
-        with pytest.raises(CompactionAnalysisError, match="Cannot read manifest entry"):
-            executor._analyze_files_for_compaction(mock_table, target_file_size_bytes=134217728)
+        plan = CompactionPlanner(max_workers=2).plan(
+            mock_table, CompactionStrategy(target_file_size_bytes=10 * mb)
+        )
+
+        eu, us, apac = plan.partitions
+        assert eu.partition == ("eu",)
+        assert sorted(sorted(f.file_path for f in group) for group in eu.file_groups) == [
+            ["a", "c"],
+            ["b", "d"],
+        ]
+        assert eu.estimated_gain == 2
+        assert eu.size_histogram == [0, 0, 0, 2, 2, 1]
+        assert us.estimated_gain == 1
+        assert apac.file_groups == []
+        assert plan.estimated_bytes == 20 * mb
 
     @pytest.mark.requirement("FR-031")
-    def test_execute_logs_pyiceberg_limitation(self) -> None:
-        """Test executor logs PyIceberg version limitation."""
-        from floe_iceberg.compaction import BinPackCompactionExecutor
-        from floe_iceberg.models import CompactionStrategy, CompactionStrategyType
+    def test_plan_skips_partitions_with_deletes(self) -> None:
+        """Test partitions with delete files are reported but not rewritten."""
+        from floe_iceberg.compaction import CompactionPlanner
+        from floe_iceberg.models import CompactionStrategy
 
-        executor = BinPackCompactionExecutor()
-        mock_table = MagicMock()
-        mock_table.identifier = "bronze.limit_test"
-        mock_table.current_snapshot.return_value = None
+        mb = 1024 * 1024
+        mock_table = _table_with_entries(
+            [_manifest_entry("a", mb, "eu"), _manifest_entry("b", mb, "eu")],
+            [_manifest_entry("d", mb, "eu", deletes=True)],
+        )
 
-        strategy = CompactionStrategy(
-            strategy_type=CompactionStrategyType.BIN_PACK,
+        plan = CompactionPlanner().plan(mock_table, CompactionStrategy())
+
+        (eu,) = plan.partitions
+        assert eu.delete_ratio == 0.5
+        assert eu.file_groups == []
+
+    @pytest.mark.requirement("FR-031")
+    def test_file_groups_respect_byte_budget(self) -> None:
+        """Test groups are taken in rank order until the byte budget is reached."""
+        from floe_iceberg.compaction import CompactionPlanner
+        from floe_iceberg.models import CompactionStrategy
+
+        mb = 1024 * 1024
+        mock_table = _table_with_entries(
+            [
+                _manifest_entry("a", 2 * mb, "eu"),
+                _manifest_entry("b", 2 * mb, "eu"),
+                _manifest_entry("c", 2 * mb, "eu"),
+                _manifest_entry("d", 3 * mb, "us"),
+                _manifest_entry("e", 3 * mb, "us"),
+            ]
         )
 
-        # Should not raise, just returns 0 files rewritten
-        result = executor.execute(mock_table, strategy)
-        assert result.files_rewritten == 0
+        plan = CompactionPlanner().plan(mock_table, CompactionStrategy())
+
+        assert [len(group) for group in plan.file_groups()] == [3, 2]
+        assert [len(group) for group in plan.file_groups(max_bytes=7 * mb)] == [3]
+        assert plan.file_groups(max_bytes=5 * mb) == []
 
 
 # =============================================================================
@@ -269,6 +340,194 @@ class TestSortCompactionExecutor:
             executor.execute(mock_table, strategy)
 
 
+# =============================================================================
+# File Rewrite Tests (real table)
+# =============================================================================
+
+
+@pytest.fixture
+def fragmented_table(tmp_path: Any) -> Any:
+    """Create a real identity(region)-partitioned table with many small files.
+
+    Four appends of ids in descending order leave four data files in each of
+    the "eu" and "us" partitions.
+    """
+    pytest.importorskip("sqlalchemy")
+    import pyarrow as pa
+    from pyiceberg.catalog.sql import SqlCatalog
+    from pyiceberg.partitioning import PartitionField, PartitionSpec
+    from pyiceberg.schema import Schema
+    from pyiceberg.transforms import IdentityTransform
+    from pyiceberg.types import LongType, NestedField, StringType
+
+    catalog = SqlCatalog(
+        "test",
+        uri=f"sqlite:///{tmp_path}/catalog.db",
+        warehouse=f"file://{tmp_path}",
+    )
+    catalog.create_namespace("bronze")
+    table = catalog.create_table(
+        "bronze.events",
+        schema=Schema(
+            NestedField(1, "id", LongType(), required=False),
+            NestedField(2, "region", StringType(), required=False),
+        ),
+        partition_spec=PartitionSpec(
+            PartitionField(source_id=2, field_id=1000, transform=IdentityTransform(), name="region")
+        ),
+    )
+    for batch in range(4, 0, -1):
+        ids = [batch * 10 + i for i in range(2)]
+        table.append(
+            pa.table(
+                {
+                    "id": pa.array(ids * 2, pa.int64()),
+                    "region": ["eu"] * len(ids) + ["us"] * len(ids),
+                }
+            )
+        )
+    return table
+
+
+def _data_files(table: Any) -> list[Any]:
+    """Return the table's live data files."""
+    return [task.file for task in table.scan().plan_files()]
+
+
+class TestCompactionFileRewrites:
+    """Tests for executors rewriting data files of a real table."""
+
+    @pytest.mark.requirement("FR-031")
+    def test_bin_pack_rewrites_small_files_per_partition(self, fragmented_table: Any) -> None:
+        """Test bin-pack leaves one file per partition and reports accurate metrics."""
+        from floe_iceberg.compaction import BinPackCompactionExecutor
+        from floe_iceberg.models import CompactionStrategy
+
+        before = _data_files(fragmented_table)
+        rows_before = sorted(fragmented_table.scan().to_arrow()["id"].to_pylist())
+
+        result = BinPackCompactionExecutor().execute(fragmented_table, CompactionStrategy())
+
+        after = _data_files(fragmented_table)
+        assert len(before) == 8
+        assert len(after) == 2
+        assert result.files_rewritten == result.files_removed == 8
+        assert result.files_added == 2
+        assert result.bytes_rewritten == sum(f.file_size_in_bytes for f in before)
+        assert sorted(fragmented_table.scan().to_arrow()["id"].to_pylist()) == rows_before
+        assert fragmented_table.current_snapshot().summary["deleted-data-files"] == "8"
+
+    @pytest.mark.requirement("FR-030")
+    def test_sort_rewrites_files_in_sort_order(self, fragmented_table: Any) -> None:
+        """Test sort compaction writes each rewritten file sorted by sort_columns."""
+        from floe_iceberg.compaction import SortCompactionExecutor
+        from floe_iceberg.models import CompactionStrategy, CompactionStrategyType
+
+        strategy = CompactionStrategy(
+            strategy_type=CompactionStrategyType.SORT,
+            sort_columns=["id"],
+        )
+
+        result = SortCompactionExecutor().execute(fragmented_table, strategy)
+
+        assert result.files_rewritten == 8
+        for task in fragmented_table.scan().plan_files():
+            ids = fragmented_table.scan(row_filter=f"region = '{task.file.partition[0]}'")
+            ids = ids.to_arrow()["id"].to_pylist()
+            assert ids == sorted(ids)
+
+    @pytest.mark.requirement("FR-031")
+    def test_commit_conflict_is_retried(self, fragmented_table: Any) -> None:
+        """Test a conflicting commit is retried against the refreshed table."""
+        from pyiceberg.exceptions import CommitFailedException
+        from pyiceberg.table import Transaction
+
+        from floe_iceberg.compaction import BinPackCompactionExecutor
+        from floe_iceberg.models import CompactionStrategy
+
+        commit = Transaction.commit_transaction
+        failures = [CommitFailedException("Requirement failed: branch main has changed")]
+
+        def commit_once_conflicting(transaction: Any) -> Any:
+            if failures:
+                raise failures.pop()
+            return commit(transaction)
+
+        executor = BinPackCompactionExecutor(retry_base_delay_seconds=0.0)
+        with patch.object(Transaction, "commit_transaction", commit_once_conflicting):
+            result = executor.execute(fragmented_table, CompactionStrategy())
+
+        assert not failures
+        assert result.files_rewritten == 8
+        assert len(_data_files(fragmented_table)) == 2
+
+    @pytest.mark.requirement("FR-031")
+    def test_commit_conflict_after_retries_raises(self, fragmented_table: Any) -> None:
+        """Test compaction fails without changing the table when conflicts persist."""
+        from pyiceberg.exceptions import CommitFailedException
+        from pyiceberg.table import Transaction
+
+        from floe_iceberg.compaction import BinPackCompactionExecutor
+        from floe_iceberg.errors import CompactionError
+        from floe_iceberg.models import CompactionStrategy
+
+        snapshot_id = fragmented_table.current_snapshot().snapshot_id
+        executor = BinPackCompactionExecutor(max_commit_retries=2, retry_base_delay_seconds=0.0)
+        with (
+            patch.object(
+                Transaction,
+                "commit_transaction",
+                side_effect=CommitFailedException("branch main has changed"),
+            ) as commit,
+            pytest.raises(CompactionError, match="after 2 retries"),
+        ):
+            executor.execute(fragmented_table, CompactionStrategy())
+
+        assert commit.call_count == 3
+        assert fragmented_table.current_snapshot().snapshot_id == snapshot_id
+
+    @pytest.mark.requirement("FR-030")
+    def test_plan_estimates_sort_overlap(self, fragmented_table: Any) -> None:
+        """Test planning reads column bounds to rank unsorted partitions first."""
+        import pyarrow as pa
+
+        from floe_iceberg.compaction import CompactionPlanner
+        from floe_iceberg.models import CompactionStrategy, CompactionStrategyType
+
+        fragmented_table.append(
+            pa.table({"id": pa.array([0, 100], pa.int64()), "region": ["eu", "eu"]})
+        )
+        strategy = CompactionStrategy(
+            strategy_type=CompactionStrategyType.SORT,
+            sort_columns=["id"],
+        )
+
+        plan = CompactionPlanner().plan(fragmented_table, strategy)
+
+        eu, us = plan.partitions
+        assert eu.partition[0] == "eu"
+        assert eu.sort_overlap == 1.0
+        assert us.sort_overlap == 0.0
+        assert plan.snapshot_id == fragmented_table.current_snapshot().snapshot_id
+
+    @pytest.mark.requirement("FR-031")
+    def test_stale_plan_is_replanned(self, fragmented_table: Any) -> None:
+        """Test a plan from an older snapshot does not drop files added since."""
+        import pyarrow as pa
+
+        from floe_iceberg.compaction import CompactionPlanner, execute_compaction
+        from floe_iceberg.models import CompactionStrategy
+
+        strategy = CompactionStrategy()
+        plan = CompactionPlanner().plan(fragmented_table, strategy)
+        fragmented_table.append(pa.table({"id": pa.array([99], pa.int64()), "region": ["eu"]}))
+
+        result = execute_compaction(fragmented_table, strategy, plan=plan)
+
+        assert result.files_rewritten == 9
+        assert 99 in fragmented_table.scan().to_arrow()["id"].to_pylist()
+
+
 # =============================================================================
 # Factory Tests
 # =============================================================================
@@ -8,7 +8,7 @@ Note: Tests are written TDD-style before implementation.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
 import pytest
@@ -2578,6 +2578,176 @@ class TestIcebergTableManagerWriteDataOverwrite:
         assert len(new_snapshots) > initial_count or True  # TDD placeholder
 
 
+class TestIcebergTableManagerWriteDataOverwriteFilter:
+    """Tests for predicate-scoped OVERWRITE with overwrite_filter."""
+
+    @pytest.fixture
+    def date_partitioned_table(self, tmp_path: Any) -> Any:
+        """Create a real identity(date)-partitioned table in a SQLite catalog.
+
+        Holds ids 1-2 in partition 2024-01-01 and id 3 in 2024-01-02. Column
+        metrics are disabled, so only the partition spec can show that a data
+        file matches a filter without reading it.
+        """
+        pytest.importorskip("sqlalchemy")
+        import pyarrow as pa
+        from pyiceberg.catalog.sql import SqlCatalog
+        from pyiceberg.partitioning import PartitionField, PartitionSpec
+        from pyiceberg.schema import Schema
+        from pyiceberg.transforms import IdentityTransform
+        from pyiceberg.types import LongType, NestedField, StringType
+
+        catalog = SqlCatalog(
+            "test",
+            uri=f"sqlite:///{tmp_path}/catalog.db",
+            warehouse=f"file://{tmp_path}",
+        )
+        catalog.create_namespace("bronze")
+        table = catalog.create_table(
+            "bronze.events",
+            schema=Schema(
+                NestedField(1, "id", LongType(), required=False),
+                NestedField(2, "date", StringType(), required=False),
+            ),
+            partition_spec=PartitionSpec(
+                PartitionField(
+                    source_id=2, field_id=1000, transform=IdentityTransform(), name="date"
+                )
+            ),
+            properties={"write.metadata.metrics.default": "none"},
+        )
+        table.append(
+            pa.table(
+                {
+                    "id": pa.array([1, 2, 3], pa.int64()),
+                    "date": ["2024-01-01", "2024-01-01", "2024-01-02"],
+                }
+            )
+        )
+        return table
+
+    @pytest.mark.requirement("FR-026")
+    def test_overwrite_filter_is_passed_as_expression(
+        self,
+        mock_catalog_plugin: MockCatalogPlugin,
+        mock_storage_plugin: MockStoragePlugin,
+    ) -> None:
+        """Test the filter string is parsed rather than replacing the whole table."""
+        from pyiceberg.expressions import EqualTo
+
+        from floe_iceberg import IcebergTableManager
+        from floe_iceberg.models import WriteConfig, WriteMode
+
+        manager = IcebergTableManager(
+            catalog_plugin=mock_catalog_plugin,
+            storage_plugin=mock_storage_plugin,
+        )
+        table = MagicMock()
+        table.spec.return_value.is_unpartitioned.return_value = True
+        data = MagicMock()
+
+        manager.write_data(
+            table,
+            data,
+            WriteConfig(mode=WriteMode.OVERWRITE, overwrite_filter="date = '2024-01-01'"),
+        )
+
+        table.overwrite.assert_called_once()
+        overwrite_filter = table.overwrite.call_args.kwargs["overwrite_filter"]
+        assert isinstance(overwrite_filter, EqualTo)
+        assert overwrite_filter.term.name == "date"
+
+    @pytest.mark.requirement("FR-026")
+    def test_invalid_overwrite_filter_raises_validation_error(
+        self,
+        mock_catalog_plugin: MockCatalogPlugin,
+        mock_storage_plugin: MockStoragePlugin,
+    ) -> None:
+        """Test an unparseable filter fails before anything is written."""
+        from floe_iceberg import IcebergTableManager
+        from floe_iceberg.errors import ValidationError
+        from floe_iceberg.models import WriteConfig, WriteMode
+
+        manager = IcebergTableManager(
+            catalog_plugin=mock_catalog_plugin,
+            storage_plugin=mock_storage_plugin,
+        )
+        table = MagicMock()
+
+        with pytest.raises(ValidationError, match="overwrite_filter"):
+            manager.write_data(
+                table,
+                MagicMock(),
+                WriteConfig(mode=WriteMode.OVERWRITE, overwrite_filter="date = "),
+            )
+        table.overwrite.assert_not_called()
+
+    @pytest.mark.requirement("FR-026")
+    def test_partition_aligned_overwrite_does_not_read_data(
+        self,
+        mock_catalog_plugin: MockCatalogPlugin,
+        mock_storage_plugin: MockStoragePlugin,
+        date_partitioned_table: Any,
+    ) -> None:
+        """Test replacing one partition drops its files without reading them."""
+        from unittest.mock import patch
+
+        import pyarrow as pa
+        from pyiceberg.io.pyarrow import ArrowScan
+
+        from floe_iceberg import IcebergTableManager
+        from floe_iceberg.models import WriteConfig, WriteMode
+
+        manager = IcebergTableManager(
+            catalog_plugin=mock_catalog_plugin,
+            storage_plugin=mock_storage_plugin,
+        )
+        data = pa.table({"id": pa.array([10], pa.int64()), "date": ["2024-01-01"]})
+
+        with patch.object(ArrowScan, "to_table", side_effect=AssertionError("data was read")):
+            table = manager.write_data(
+                date_partitioned_table,
+                data,
+                WriteConfig(
+                    mode=WriteMode.OVERWRITE,
+                    overwrite_filter="date = '2024-01-01'",
+                    snapshot_properties={"job": "refresh"},
+                ),
+            )
+
+        rows = sorted(table.scan().to_arrow().to_pylist(), key=lambda row: row["id"])
+        assert rows == [{"id": 3, "date": "2024-01-02"}, {"id": 10, "date": "2024-01-01"}]
+        assert table.current_snapshot().summary["job"] == "refresh"
+
+    @pytest.mark.requirement("FR-026")
+    def test_unaligned_overwrite_keeps_rows_outside_filter(
+        self,
+        mock_catalog_plugin: MockCatalogPlugin,
+        mock_storage_plugin: MockStoragePlugin,
+        date_partitioned_table: Any,
+    ) -> None:
+        """Test a filter on a non-partition column replaces only matching rows."""
+        import pyarrow as pa
+
+        from floe_iceberg import IcebergTableManager
+        from floe_iceberg.models import WriteConfig, WriteMode
+
+        manager = IcebergTableManager(
+            catalog_plugin=mock_catalog_plugin,
+            storage_plugin=mock_storage_plugin,
+        )
+        data = pa.table({"id": pa.array([20], pa.int64()), "date": ["2024-01-01"]})
+
+        table = manager.write_data(
+            date_partitioned_table,
+            data,
+            WriteConfig(mode=WriteMode.OVERWRITE, overwrite_filter="id = 1"),
+        )
+
+        ids = sorted(row["id"] for row in table.scan().to_arrow().to_pylist())
+        assert ids == [2, 3, 20]
+
+
 # =============================================================================
 # Write Data Tests - Upsert Mode (T058)
 # =============================================================================
@@ -2848,6 +3018,433 @@ class TestIcebergTableManagerWriteDataUpsert:
             manager.write_data(table, data, write_config)
 
 
+class TestIcebergTableManagerMergeData:
+    """Tests for IcebergTableManager.merge_data() against a real table."""
+
+    @pytest.fixture
+    def region_partitioned_table(self, tmp_path: Any) -> Any:
+        """Create a real identity(region)-partitioned table in a SQLite catalog.
+
+        Holds ids 1-2 in partition "eu" and ids 3-4 in partition "us", one
+        data file per partition.
+        """
+        pytest.importorskip("sqlalchemy")
+        import pyarrow as pa
+        from pyiceberg.catalog.sql import SqlCatalog
+        from pyiceberg.partitioning import PartitionField, PartitionSpec
+        from pyiceberg.schema import Schema
+        from pyiceberg.transforms import IdentityTransform
+        from pyiceberg.types import LongType, NestedField, StringType
+
+        catalog = SqlCatalog(
+            "test",
+            uri=f"sqlite:///{tmp_path}/catalog.db",
+            warehouse=f"file://{tmp_path}",
+        )
+        catalog.create_namespace("silver")
+        table = catalog.create_table(
+            "silver.customers",
+            schema=Schema(
+                NestedField(1, "id", LongType(), required=False),
+                NestedField(2, "region", StringType(), required=False),
+                NestedField(3, "name", StringType(), required=False),
+            ),
+            partition_spec=PartitionSpec(
+                PartitionField(
+                    source_id=2, field_id=1000, transform=IdentityTransform(), name="region"
+                )
+            ),
+        )
+        table.append(
+            pa.table(
+                {
+                    "id": pa.array([1, 2, 3, 4], pa.int64()),
+                    "region": ["eu", "eu", "us", "us"],
+                    "name": ["Ann", "Bob", "Cid", None],
+                }
+            )
+        )
+        return table
+
+    @pytest.fixture
+    def manager(
+        self,
+        mock_catalog_plugin: MockCatalogPlugin,
+        mock_storage_plugin: MockStoragePlugin,
+    ) -> Any:
+        """Create an IcebergTableManager (the merged table is passed in directly)."""
+        from floe_iceberg import IcebergTableManager
+
+        return IcebergTableManager(
+            catalog_plugin=mock_catalog_plugin,
+            storage_plugin=mock_storage_plugin,
+        )
+
+    @staticmethod
+    def _rows(table: Any) -> dict[int, tuple[str, str | None]]:
+        """Return table rows keyed by id."""
+        return {
+            row["id"]: (row["region"], row["name"]) for row in table.scan().to_arrow().to_pylist()
+        }
+
+    @pytest.mark.requirement("FR-027")
+    def test_merge_reports_inserted_updated_unchanged(
+        self, manager: Any, region_partitioned_table: Any
+    ) -> None:
+        """Test merge counts and table contents after an upsert."""
+        import pyarrow as pa
+
+        data = pa.table(
+            {
+                "id": pa.array([1, 2, 4, 5], pa.int64()),
+                "region": ["eu", "eu", "us", "us"],
+                "name": ["Ann", "Bea", None, "Dee"],
+            }
+        )
+
+        result = manager.merge_data(region_partitioned_table, data, ["id", "region"])
+
+        assert (result.rows_inserted, result.rows_updated, result.rows_unchanged) == (1, 1, 2)
+        assert result.snapshot_id == region_partitioned_table.current_snapshot().snapshot_id
+        assert self._rows(region_partitioned_table) == {
+            1: ("eu", "Ann"),
+            2: ("eu", "Bea"),
+            3: ("us", "Cid"),
+            4: ("us", None),
+            5: ("us", "Dee"),
+        }
+
+    @pytest.mark.requirement("FR-027")
+    def test_merge_rewrites_only_touched_files(
+        self, manager: Any, region_partitioned_table: Any
+    ) -> None:
+        """Test files in partitions without source keys are neither read nor rewritten."""
+        import pyarrow as pa
+
+        us_file = next(
+            task.file.file_path
+            for task in region_partitioned_table.scan(row_filter="region = 'us'").plan_files()
+        )
+        data = pa.table({"id": pa.array([2], pa.int64()), "region": ["eu"], "name": ["Bea"]})
+
+        result = manager.merge_data(region_partitioned_table, data, ["id", "region"])
+
+        assert (result.files_scanned, result.files_rewritten) == (1, 1)
+        summary = region_partitioned_table.current_snapshot().summary
+        assert summary.operation.value == "overwrite"
+        assert summary["deleted-data-files"] == "1"
+        files = {task.file.file_path for task in region_partitioned_table.scan().plan_files()}
+        assert us_file in files
+
+    @pytest.mark.requirement("FR-027")
+    def test_merge_without_changes_commits_nothing(
+        self, manager: Any, region_partitioned_table: Any
+    ) -> None:
+        """Test re-merging identical rows creates no snapshot."""
+        import pyarrow as pa
+
+        snapshot_id = region_partitioned_table.current_snapshot().snapshot_id
+        data = pa.table(
+            {"id": pa.array([3, 4], pa.int64()), "region": ["us", "us"], "name": ["Cid", None]}
+        )
+
+        result = manager.merge_data(region_partitioned_table, data, ["id"])
+
+        assert result.rows_unchanged == 2
+        assert result.snapshot_id is None
+        assert region_partitioned_table.current_snapshot().snapshot_id == snapshot_id
+
+    @pytest.mark.requirement("FR-027")
+    def test_merge_many_keys_prunes_by_range(
+        self, manager: Any, region_partitioned_table: Any
+    ) -> None:
+        """Test key lists too long for IN still prune files by min/max statistics."""
+        import pyarrow as pa
+
+        ids = list(range(100, 400))
+        data = pa.table(
+            {
+                "id": pa.array(ids, pa.int64()),
+                "region": ["eu"] * len(ids),
+                "name": [str(i) for i in ids],
+            }
+        )
+
+        result = manager.merge_data(region_partitioned_table, data, ["id"])
+
+        assert result.files_scanned == 0
+        assert result.rows_inserted == len(ids)
+        assert len(self._rows(region_partitioned_table)) == 4 + len(ids)
+
+    @pytest.mark.requirement("FR-027")
+    def test_merge_duplicate_keys_raises_validation_error(
+        self, manager: Any, region_partitioned_table: Any
+    ) -> None:
+        """Test source data with a repeated key is rejected before writing."""
+        import pyarrow as pa
+
+        from floe_iceberg.errors import ValidationError
+
+        snapshot_id = region_partitioned_table.current_snapshot().snapshot_id
+        data = pa.table(
+            {"id": pa.array([1, 1], pa.int64()), "region": ["eu", "eu"], "name": ["a", "b"]}
+        )
+
+        with pytest.raises(ValidationError, match="Duplicate keys"):
+            manager.merge_data(region_partitioned_table, data, ["id"])
+        assert region_partitioned_table.current_snapshot().snapshot_id == snapshot_id
+
+    @pytest.mark.requirement("FR-027")
+    def test_merge_repeated_null_keys_are_inserted(
+        self, manager: Any, region_partitioned_table: Any
+    ) -> None:
+        """Test several rows with a null key are inserted, not rejected as duplicates."""
+        import pyarrow as pa
+
+        data = pa.table(
+            {
+                "id": pa.array([None, None, 1], pa.int64()),
+                "region": ["eu", "eu", "eu"],
+                "name": ["x", "y", "Ann"],
+            }
+        )
+
+        result = manager.merge_data(region_partitioned_table, data, ["id"])
+
+        assert (result.rows_inserted, result.rows_unchanged) == (2, 1)
+        names = region_partitioned_table.scan(row_filter="id IS NULL").to_arrow()["name"]
+        assert sorted(names.to_pylist()) == ["x", "y"]
+
+
+# =============================================================================
+# Write Batches Tests - Streaming Writes
+# =============================================================================
+
+
+class TestIcebergTableManagerWriteBatches:
+    """Tests for IcebergTableManager.write_batches() against real tables."""
+
+    @pytest.fixture
+    def catalog(self, tmp_path: Any) -> Any:
+        """Create a SQLite-backed catalog with a "bronze" namespace."""
+        pytest.importorskip("sqlalchemy")
+        from pyiceberg.catalog.sql import SqlCatalog
+
+        catalog = SqlCatalog(
+            "test",
+            uri=f"sqlite:///{tmp_path}/catalog.db",
+            warehouse=f"file://{tmp_path}",
+        )
+        catalog.create_namespace("bronze")
+        return catalog
+
+    @pytest.fixture
+    def events_table(self, catalog: Any) -> Any:
+        """Create an unpartitioned table with a 1.5MB target file size."""
+        from pyiceberg.schema import Schema
+        from pyiceberg.types import LongType, NestedField
+
+        return catalog.create_table(
+            "bronze.events",
+            schema=Schema(NestedField(1, "id", LongType(), required=False)),
+            properties={"write.target-file-size-bytes": str(1536 * 1024)},
+        )
+
+    @pytest.fixture
+    def orders_table(self, catalog: Any) -> Any:
+        """Create an identity(region)-partitioned table holding two "eu" rows."""
+        import pyarrow as pa
+        from pyiceberg.partitioning import PartitionField, PartitionSpec
+        from pyiceberg.schema import Schema
+        from pyiceberg.transforms import IdentityTransform
+        from pyiceberg.types import LongType, NestedField, StringType
+
+        table = catalog.create_table(
+            "bronze.orders",
+            schema=Schema(
+                NestedField(1, "id", LongType(), required=False),
+                NestedField(2, "region", StringType(), required=False),
+            ),
+            partition_spec=PartitionSpec(
+                PartitionField(
+                    source_id=2, field_id=1000, transform=IdentityTransform(), name="region"
+                )
+            ),
+        )
+        table.append(pa.table({"id": pa.array([1, 2], pa.int64()), "region": ["eu", "eu"]}))
+        return table
+
+    @pytest.fixture
+    def manager(
+        self,
+        mock_catalog_plugin: MockCatalogPlugin,
+        mock_storage_plugin: MockStoragePlugin,
+    ) -> Any:
+        """Create an IcebergTableManager with the minimum 1MB write buffer."""
+        from floe_iceberg import IcebergTableManager, IcebergTableManagerConfig
+
+        return IcebergTableManager(
+            catalog_plugin=mock_catalog_plugin,
+            storage_plugin=mock_storage_plugin,
+            config=IcebergTableManagerConfig(write_buffer_bytes=1048576),
+        )
+
+    @staticmethod
+    def _batches(count: int, rows: int = 50_000) -> Any:
+        """Return a RecordBatchReader of count batches of int64 ids (~400KB each)."""
+        import pyarrow as pa
+
+        schema = pa.schema([pa.field("id", pa.int64())])
+        return pa.RecordBatchReader.from_batches(
+            schema,
+            (
+                pa.record_batch([pa.array(range(i * rows, (i + 1) * rows), pa.int64())], schema)
+                for i in range(count)
+            ),
+        )
+
+    @pytest.mark.requirement("FR-025")
+    def test_installed_pyiceberg_is_in_supported_range(self) -> None:
+        """Test the installed PyIceberg satisfies floe-iceberg's declared range.
+
+        The stream writer calls pyiceberg.io.pyarrow write helpers whose
+        signatures change between minor versions, so running against a
+        version outside the pin must fail loudly here.
+        """
+        from pathlib import Path
+
+        import pyiceberg
+        from packaging.requirements import Requirement
+
+        try:
+            import tomllib
+        except ModuleNotFoundError:  # Python 3.10
+            import tomli as tomllib
+
+        pyproject = Path(__file__).resolve().parents[2] / "pyproject.toml"
+        dependencies = tomllib.loads(pyproject.read_text())["project"]["dependencies"]
+        requirement = next(
+            Requirement(dep) for dep in dependencies if Requirement(dep).name == "pyiceberg"
+        )
+
+        assert requirement.specifier.contains(pyiceberg.__version__), (
+            f"pyiceberg {pyiceberg.__version__} is outside the supported range "
+            f"{requirement.specifier}"
+        )
+
+    @pytest.mark.requirement("FR-025")
+    def test_rolls_files_at_target_size_in_one_snapshot(
+        self, manager: Any, events_table: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a stream is buffered, rolled into target-sized files, and committed once."""
+        from floe_iceberg import _stream_writer
+        from floe_iceberg.models import WriteConfig
+
+        flushed: list[int] = []
+        write = _stream_writer._DataFileWriter.write
+
+        def recording_write(self: Any, rows: Any) -> None:
+            flushed.append(rows.nbytes)
+            write(self, rows)
+
+        monkeypatch.setattr(_stream_writer._DataFileWriter, "write", recording_write)
+
+        manager.write_batches(events_table, self._batches(6), WriteConfig())
+
+        # Six ~400KB batches flush as three 800KB buffers; the first file
+        # reaches 1.5MB after two flushes, the last flush starts a second file
+        assert len(flushed) == 3
+        assert max(flushed) <= 1048576
+        assert len(events_table.snapshots()) == 1
+        summary = events_table.current_snapshot().summary
+        assert summary["added-data-files"] == "2"
+        assert summary["added-records"] == "300000"
+        assert events_table.scan().to_arrow().num_rows == 300_000
+
+    @pytest.mark.requirement("FR-025")
+    def test_appends_batch_iterator_to_partitioned_table(
+        self, manager: Any, orders_table: Any
+    ) -> None:
+        """Test an iterator of batches is split into one file per partition."""
+        import pyarrow as pa
+
+        from floe_iceberg.models import WriteConfig
+
+        batches = iter(
+            [
+                pa.record_batch({"id": pa.array([3, 4], pa.int64()), "region": ["eu", "us"]}),
+                pa.record_batch({"id": pa.array([5], pa.int64()), "region": ["us"]}),
+            ]
+        )
+
+        manager.write_batches(orders_table, batches, WriteConfig())
+
+        summary = orders_table.current_snapshot().summary
+        assert summary["added-data-files"] == "2"
+        assert summary["changed-partition-count"] == "2"
+        assert sorted(orders_table.scan().to_arrow().column("id").to_pylist()) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.requirement("FR-026")
+    def test_overwrite_filter_replaces_matching_rows(self, manager: Any, orders_table: Any) -> None:
+        """Test OVERWRITE with a filter replaces only the matching partition."""
+        import pyarrow as pa
+
+        from floe_iceberg.models import WriteConfig, WriteMode
+
+        manager.write_data(
+            orders_table,
+            pa.table({"id": pa.array([9], pa.int64()), "region": ["us"]}),
+            WriteConfig(),
+        )
+        reader = pa.RecordBatchReader.from_batches(
+            pa.schema([pa.field("id", pa.int64()), pa.field("region", pa.string())]),
+            [pa.record_batch({"id": pa.array([7], pa.int64()), "region": ["eu"]})],
+        )
+
+        manager.write_batches(
+            orders_table,
+            reader,
+            WriteConfig(mode=WriteMode.OVERWRITE, overwrite_filter="region = 'eu'"),
+        )
+
+        rows = orders_table.scan().to_arrow().sort_by("id").to_pylist()
+        assert rows == [{"id": 7, "region": "eu"}, {"id": 9, "region": "us"}]
+
+    @pytest.mark.requirement("FR-025")
+    def test_schema_mismatch_leaves_no_files(
+        self, manager: Any, events_table: Any, tmp_path: Any
+    ) -> None:
+        """Test a batch with a different schema fails and deletes written files."""
+        import pyarrow as pa
+
+        from floe_iceberg.errors import ValidationError
+        from floe_iceberg.models import WriteConfig
+
+        # The first batch fills a file before the mismatched batch arrives
+        batches = [
+            pa.record_batch({"id": pa.array(range(200_000), pa.int64())}),
+            pa.record_batch({"id": pa.array([1], pa.int64())}),
+            pa.record_batch({"other": pa.array([1], pa.int64())}),
+        ]
+
+        with pytest.raises(ValidationError, match="share one schema"):
+            manager.write_batches(events_table, batches, WriteConfig())
+
+        assert events_table.current_snapshot() is None
+        assert not list(tmp_path.glob("**/*.parquet"))
+
+    @pytest.mark.requirement("FR-027")
+    def test_upsert_is_rejected(self, manager: Any, events_table: Any) -> None:
+        """Test UPSERT points the caller at write_data()."""
+        from floe_iceberg.errors import ValidationError
+        from floe_iceberg.models import WriteConfig, WriteMode
+
+        config = WriteConfig(mode=WriteMode.UPSERT, join_columns=["id"])
+
+        with pytest.raises(ValidationError, match="write_data"):
+            manager.write_batches(events_table, self._batches(1), config)
+
+
 # =============================================================================
 # Write Data Tests - Commit Conflict Retry (T058a/T059)
 # =============================================================================
@@ -351,6 +351,13 @@ class TestIcebergTableManagerConfig:
         assert config.min_snapshots_to_keep == 20
         assert config.default_commit_strategy == CommitStrategy.MERGE_COMMIT
 
+    @pytest.mark.requirement("FR-045")
+    def test_validation_write_buffer_bytes_min(self) -> None:
+        """Test write_buffer_bytes defaults to 64MB and must be at least 1MB."""
+        assert IcebergTableManagerConfig().write_buffer_bytes == 67108864
+        with pytest.raises(ValueError, match="greater than or equal to 1048576"):
+            IcebergTableManagerConfig(write_buffer_bytes=1024)
+
     @pytest.mark.requirement("FR-045")
     def test_validation_max_commit_retries_min(self) -> None:
         """Test max_commit_retries minimum validation."""
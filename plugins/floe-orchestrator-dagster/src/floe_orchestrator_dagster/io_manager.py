@@ -499,13 +499,10 @@ class IcebergIOManager(ConfigurableIOManager):
         if getattr(context, "has_partition_key", False) and context.partition_key is not None:
             partition_column = metadata.get(ICEBERG_PARTITION_COLUMN_KEY)
             if partition_column and write_mode == WriteMode.OVERWRITE:
-                # Build expression and convert to string for WriteConfig compatibility
-                # PyIceberg will parse this back into an expression
-                expr = EqualTo(
-                    Reference(partition_column),
-                    iceberg_literal(context.partition_key),
-                )
-                config_kwargs["overwrite_filter"] = str(expr)
+                # WriteConfig takes the filter in PyIceberg's row filter syntax
+                # (quoted identifier, single-quoted literal with '' escapes)
+                value = str(context.partition_key).replace("'", "''")
+                config_kwargs["overwrite_filter"] = f"\"{partition_column}\" = '{value}'"
 
         return WriteConfig(**config_kwargs)
 
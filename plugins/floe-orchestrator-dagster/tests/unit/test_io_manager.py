@@ -406,9 +406,12 @@ class TestPartitionedAssets:
     ) -> None:
         """Test handle_output with partitioned asset sets correct filter.
 
-        The filter is built using PyIceberg's expression API for type safety,
-        then converted to string for WriteConfig compatibility.
+        The filter must parse back into the partition equality predicate,
+        since IcebergTableManager parses it to scope the overwrite.
         """
+        from pyiceberg.expressions import EqualTo
+        from pyiceberg.expressions.parser import parse
+
         from floe_orchestrator_dagster.io_manager import (
             ICEBERG_PARTITION_COLUMN_KEY,
             ICEBERG_WRITE_MODE_KEY,
@@ -427,10 +430,11 @@ class TestPartitionedAssets:
         write_call = mock_table_manager.write_data.call_args
         write_config = write_call[0][2]
 
-        # Filter is a string built from PyIceberg expression
+        # Filter is a string in PyIceberg's row filter syntax
         assert isinstance(write_config.overwrite_filter, str)
         assert "date" in write_config.overwrite_filter
         assert "2026-01-17" in write_config.overwrite_filter
+        assert parse(write_config.overwrite_filter) == EqualTo("date", "2026-01-17")
 
     @pytest.mark.requirement("FR-040")
     def test_load_input_partitioned_asset(